@@ -0,0 +1,401 @@
+#!/usr/bin/env python3
+"""
+🕸️ DAG планувальник фаз та секцій DEV_PLAN
+
+Будує граф залежностей секцій DEV_PLAN.md та виконує незалежні секції
+одночасно, починаючи з тих, що лежать на критичному шляху. Секції, залежність
+яких завершилась помилкою або невдалим результатом, не запускаються.
+
+Залежності беруться з анотацій ``depends:`` у DEV_PLAN.md або
+виводяться з нумерації фаз/секцій.
+"""
+
+import asyncio
+import heapq
+import logging
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+# Посилання на фазу: "Phase 8" або "8"; на секцію: "8.1"
+PHASE_REF_PATTERN = re.compile(r"^(?:phase\s+)?(\d+)$", re.IGNORECASE)
+SECTION_REF_PATTERN = re.compile(r"^(\d+\.\d+)$")
+
+
+@dataclass
+class SectionNode:
+    """Вузол графа - одна секція DEV_PLAN"""
+
+    key: str
+    phase_name: str
+    section_id: str
+    title: str
+    weight: float = 1.0
+    depends: Set[str] = field(default_factory=set)
+    dependents: Set[str] = field(default_factory=set)
+    priority: float = 0.0
+
+
+@dataclass
+class SectionRun:
+    """Результат виконання однієї секції"""
+
+    key: str
+    result: Any
+    started_at: float
+    finished_at: float
+    error: Optional[Exception] = None
+    # Секцію пропущено через невдалу залежність (ключ цієї залежності)
+    blocked_by: Optional[str] = None
+
+    @property
+    def duration(self) -> float:
+        return self.finished_at - self.started_at
+
+    @property
+    def skipped(self) -> bool:
+        return self.blocked_by is not None
+
+
+class SectionDAG:
+    """
+    Граф залежностей секцій DEV_PLAN
+
+    Режими виведення залежностей (``infer``):
+    - "phase": секції без анотацій залежать від усіх секцій попередньої фази
+    - "none": секції без анотацій не мають залежностей
+    """
+
+    def __init__(self, nodes: Dict[str, SectionNode]):
+        self.nodes = nodes
+        self._link_dependents()
+        self._check_acyclic()
+        self._compute_priorities()
+
+    @classmethod
+    def from_phases(cls, phases: Dict[str, Any], infer: str = "phase") -> "SectionDAG":
+        """
+        Побудова графа з результату парсингу DEV_PLAN
+
+        Args:
+            phases: Фази у форматі DevPlanExecutorPlugin
+            infer: Режим виведення залежностей ("phase" або "none")
+
+        Returns:
+            SectionDAG: Граф секцій
+        """
+        logger = logging.getLogger("SectionDAG")
+        nodes: Dict[str, SectionNode] = {}
+        # Секції за індексом фази; номер фази -> індекси (номери можуть повторюватись)
+        phase_sections: List[List[str]] = []
+        phase_indexes: Dict[str, List[int]] = {}
+        section_keys: Dict[str, List[str]] = {}
+
+        for phase_index, (phase_name, phase) in enumerate(phases.items()):
+            keys = []
+            for section_id, section in phase.get("sections", {}).items():
+                key = f"{phase_name}/{section_id}"
+                pending = sum(
+                    1 for task in section.get("tasks", []) if not task.get("completed")
+                )
+                nodes[key] = SectionNode(
+                    key=key,
+                    phase_name=phase_name,
+                    section_id=section_id,
+                    title=section.get("title", ""),
+                    weight=float(max(1, pending)),
+                )
+                keys.append(key)
+                section_keys.setdefault(section_id, []).append(key)
+            phase_sections.append(keys)
+            phase_indexes.setdefault(
+                _phase_number(phase_name) or phase_name, []
+            ).append(phase_index)
+
+        def resolve(reference: str, owner: str) -> List[str]:
+            reference = reference.strip()
+            section_match = SECTION_REF_PATTERN.match(reference)
+            if section_match:
+                resolved = section_keys.get(section_match.group(1), [])
+            else:
+                phase_match = PHASE_REF_PATTERN.match(reference)
+                resolved = [
+                    key
+                    for index in (
+                        phase_indexes.get(phase_match.group(1), [])
+                        if phase_match
+                        else []
+                    )
+                    for key in phase_sections[index]
+                ]
+            if not resolved:
+                logger.warning(f"Невідома залежність '{reference}' у {owner}")
+            return resolved
+
+        previous_phase_keys: List[str] = []
+        for phase_index, (phase_name, phase) in enumerate(phases.items()):
+            phase_depends = phase.get("depends", [])
+            current_keys = phase_sections[phase_index]
+
+            for section_id, section in phase.get("sections", {}).items():
+                key = f"{phase_name}/{section_id}"
+                explicit = list(phase_depends) + list(section.get("depends", []))
+
+                if explicit:
+                    depends = {
+                        dep
+                        for ref in explicit
+                        for dep in resolve(ref, key)
+                        if dep != key
+                    }
+                elif infer == "phase":
+                    depends = set(previous_phase_keys)
+                else:
+                    depends = set()
+
+                nodes[key].depends = depends
+
+            if current_keys:
+                previous_phase_keys = current_keys
+
+        return cls(nodes)
+
+    def _link_dependents(self):
+        """Заповнення зворотних посилань"""
+        for node in self.nodes.values():
+            node.dependents.clear()
+        for node in self.nodes.values():
+            for dep in node.depends:
+                self.nodes[dep].dependents.add(node.key)
+
+    def _check_acyclic(self):
+        """Перевірка відсутності циклів"""
+        order = self.topological_order()
+        if len(order) != len(self.nodes):
+            cyclic = sorted(set(self.nodes) - set(order))
+            raise ValueError(f"Циклічні залежності між секціями: {', '.join(cyclic)}")
+
+    def topological_order(self) -> List[str]:
+        """
+        Топологічний порядок секцій (алгоритм Кана)
+
+        Returns:
+            List[str]: Ключі секцій
+        """
+        remaining = {key: len(node.depends) for key, node in self.nodes.items()}
+        queue = [key for key, count in remaining.items() if count == 0]
+        order = []
+
+        while queue:
+            key = queue.pop(0)
+            order.append(key)
+            for dependent in sorted(self.nodes[key].dependents):
+                remaining[dependent] -= 1
+                if remaining[dependent] == 0:
+                    queue.append(dependent)
+
+        return order
+
+    def _compute_priorities(self):
+        """Пріоритет вузла - довжина найдовшого шляху від нього до кінця"""
+        for key in reversed(self.topological_order()):
+            node = self.nodes[key]
+            node.priority = node.weight + max(
+                (self.nodes[dep].priority for dep in node.dependents), default=0.0
+            )
+
+    def critical_path(
+        self, durations: Optional[Dict[str, float]] = None
+    ) -> Tuple[float, List[str]]:
+        """
+        Обчислення критичного шляху
+
+        Args:
+            durations: Фактичні тривалості секцій (за замовчуванням - ваги)
+
+        Returns:
+            Tuple[float, List[str]]: Довжина та ключі секцій шляху
+        """
+        lengths: Dict[str, float] = {}
+        previous: Dict[str, Optional[str]] = {}
+
+        for key in self.topological_order():
+            node = self.nodes[key]
+            cost = durations.get(key, 0.0) if durations is not None else node.weight
+            best = max(node.depends, key=lambda dep: lengths[dep], default=None)
+            lengths[key] = cost + (lengths[best] if best else 0.0)
+            previous[key] = best
+
+        if not lengths:
+            return 0.0, []
+
+        end: Optional[str] = max(lengths, key=lambda k: lengths[k])
+        path = []
+        while end is not None:
+            path.append(end)
+            end = previous[end]
+
+        return lengths[path[0]], list(reversed(path))
+
+
+class DAGScheduler:
+    """
+    Виконавець графа секцій
+
+    Готові секції запускаються одразу (до ``max_concurrency`` одночасно),
+    серед готових першими йдуть секції з найбільшим пріоритетом критичного шляху.
+    Якщо секція впала або повернула невдалий результат, усі її транзитивні
+    залежні секції позначаються пропущеними і не виконуються.
+    """
+
+    def __init__(self, dag: SectionDAG, max_concurrency: int = 4):
+        self.dag = dag
+        self.max_concurrency = max(1, max_concurrency)
+        self.logger = logging.getLogger("DAGScheduler")
+
+    async def run(
+        self,
+        execute: Callable[[SectionNode], Awaitable[Any]],
+        is_success: Optional[Callable[[Any], bool]] = None,
+        on_finished: Optional[Callable[[SectionRun], Awaitable[None]]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Виконання всіх секцій з урахуванням залежностей
+
+        Args:
+            execute: Корутина виконання секції
+            is_success: Чи успішний результат секції (за замовчуванням -
+                атрибут або ключ ``success``, інакше успіх)
+            on_finished: Корутина, що викликається для кожної виконаної
+                або пропущеної секції одразу після її завершення
+
+        Returns:
+            Dict: Результати секцій та звіт критичного шляху
+        """
+        is_success = is_success or _result_success
+        nodes = self.dag.nodes
+        remaining = {key: len(node.depends) for key, node in nodes.items()}
+        ready: List[Tuple[float, int, str]] = []
+        sequence = 0
+
+        for key in self.dag.topological_order():
+            if remaining[key] == 0:
+                heapq.heappush(ready, (-nodes[key].priority, sequence, key))
+                sequence += 1
+
+        runs: Dict[str, SectionRun] = {}
+        running: Dict[asyncio.Task, str] = {}
+        start_time = time.monotonic()
+
+        while ready or running:
+            while ready and len(running) < self.max_concurrency:
+                _, _, key = heapq.heappop(ready)
+                self.logger.info(f"▶️ Старт секції {key}")
+                task = asyncio.ensure_future(self._run_node(nodes[key], execute))
+                running[task] = key
+
+            done, _ = await asyncio.wait(
+                list(running), return_when=asyncio.FIRST_COMPLETED
+            )
+
+            for task in done:
+                key = running.pop(task)
+                run = runs[key] = task.result()
+
+                if run.error is not None or not is_success(run.result):
+                    skipped = self._skip_dependents(key, runs)
+                    if on_finished is not None:
+                        for finished_key in [key, *skipped]:
+                            await on_finished(runs[finished_key])
+                    continue
+
+                if on_finished is not None:
+                    await on_finished(run)
+
+                for dependent in nodes[key].dependents:
+                    if dependent in runs:
+                        continue  # Пропущена через іншу залежність
+                    remaining[dependent] -= 1
+                    if remaining[dependent] == 0:
+                        heapq.heappush(
+                            ready, (-nodes[dependent].priority, sequence, dependent)
+                        )
+                        sequence += 1
+
+        wall_time = time.monotonic() - start_time
+        durations = {key: run.duration for key, run in runs.items() if not run.skipped}
+        critical_length, critical_path = self.dag.critical_path(durations)
+        estimated_length, estimated_path = self.dag.critical_path()
+
+        report = {
+            "sections": len(nodes),
+            "max_concurrency": self.max_concurrency,
+            "wall_time": round(wall_time, 3),
+            "serial_time": round(sum(durations.values()), 3),
+            "failed": sorted(
+                key
+                for key, run in runs.items()
+                if not run.skipped
+                and (run.error is not None or not is_success(run.result))
+            ),
+            "skipped": sorted(key for key, run in runs.items() if run.skipped),
+            "critical_path": critical_path,
+            "critical_path_length": round(critical_length, 3),
+            "estimated_critical_path": estimated_path,
+            "estimated_critical_path_weight": estimated_length,
+            "critical_path_efficiency": (
+                round(critical_length / wall_time, 3) if wall_time > 0 else 1.0
+            ),
+        }
+
+        self.logger.info(
+            f"🕸️ DAG: критичний шлях {report['critical_path_length']}с, "
+            f"фактичний час {report['wall_time']}с"
+        )
+
+        return {"runs": runs, "report": report}
+
+    def _skip_dependents(
+        self, failed_key: str, runs: Dict[str, SectionRun]
+    ) -> List[str]:
+        """Позначення транзитивних залежних секцій пропущеними"""
+        now = time.monotonic()
+        skipped = []
+        pending = list(self.dag.nodes[failed_key].dependents)
+        while pending:
+            key = pending.pop()
+            if key in runs:
+                continue
+            runs[key] = SectionRun(key, None, now, now, blocked_by=failed_key)
+            skipped.append(key)
+            self.logger.warning(
+                f"⏭️ Секцію {key} пропущено: залежність {failed_key} не виконана"
+            )
+            pending.extend(self.dag.nodes[key].dependents)
+        return skipped
+
+    async def _run_node(
+        self, node: SectionNode, execute: Callable[[SectionNode], Awaitable[Any]]
+    ) -> SectionRun:
+        """Виконання однієї секції з фіксацією часу"""
+        started_at = time.monotonic()
+        try:
+            result = await execute(node)
+            return SectionRun(node.key, result, started_at, time.monotonic())
+        except Exception as e:
+            self.logger.error(f"Помилка виконання секції {node.key}: {e}")
+            return SectionRun(node.key, None, started_at, time.monotonic(), error=e)
+
+
+def _result_success(result: Any) -> bool:
+    """Успішність результату секції (PluginResult, dict або інше значення)"""
+    if isinstance(result, dict):
+        return bool(result.get("success", True))
+    return bool(getattr(result, "success", True))
+
+
+def _phase_number(phase_name: str) -> Optional[str]:
+    """Номер фази з її назви ("Phase 8" -> "8")"""
+    match = re.search(r"(\d+)", phase_name)
+    return match.group(1) if match else None
@@ -13,20 +13,24 @@
 import asyncio
 import logging
 import sys
+import time
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List, Tuple
 
 # Додаємо шлях до кореневої директорії проекту
 project_root = Path(__file__).parent.parent
 sys.path.append(str(project_root))
 
 try:
+    from plugins.base_plugin import PluginResult
     from plugins.dev_plan_executor_plugin import DevPlanExecutorPlugin
     from plugins.plugin_manager import PluginManager
 except ImportError as e:
     print(f"Помилка імпорту плагінів: {e}")
     sys.exit(1)
 
+from Core.dag_scheduler import DAGScheduler, SectionDAG, SectionNode, SectionRun
+
 
 class NIMDAPluginSystemRunner:
     """
@@ -36,18 +40,44 @@ class NIMDAPluginSystemRunner:
     - Автоматичне завантаження плагінів
     - Управління життєвим циклом
     - Інтелектуальне планування завдань
+    - DAG режим: паралельне виконання незалежних секцій
     - Моніторинг продуктивності
     - GUI інтеграція
     """
 
-    def __init__(self, workspace_path: str = "."):
-        """Ініціалізація системи"""
+    def __init__(
+        self,
+        workspace_path: str = ".",
+        dag_mode: bool = False,
+        max_concurrent_sections: int = 4,
+        infer_dependencies: str = "phase",
+        warm_plugins: bool = False,
+    ):
+        """
+        Ініціалізація системи
+
+        Args:
+            workspace_path: Шлях до робочого простору
+            dag_mode: Виконувати секції за графом залежностей
+            max_concurrent_sections: Максимум одночасних секцій у DAG режимі
+            infer_dependencies: Виведення залежностей без анотацій ("phase"/"none")
+            warm_plugins: Імпортувати відкладені плагіни та запускати пул
+                процесів під час ініціалізації, а не на першому завданні
+        """
         self.workspace_path = Path(workspace_path)
+        self.dag_mode = dag_mode
+        self.max_concurrent_sections = max_concurrent_sections
+        self.infer_dependencies = infer_dependencies
+        self.warm_plugins = warm_plugins
         self.setup_logging()
 
         # Ініціалізація менеджера плагінів
         plugins_dir = project_root / "plugins"
-        self.plugin_manager = PluginManager(plugins_dir=str(plugins_dir), max_workers=4)
+        self.plugin_manager = PluginManager(
+            plugins_dir=str(plugins_dir),
+            max_workers=4,
+            warm_process_workers=warm_plugins,
+        )
 
         # Налаштування логгера
         self.logger = logging.getLogger("NIMDAPluginSystem")
@@ -86,6 +116,9 @@ class NIMDAPluginSystemRunner:
 
             # Завантажуємо плагіни
             await self.plugin_manager.load_plugins()
+            if self.warm_plugins:
+                warmed = await self.plugin_manager.warm_plugins()
+                self.logger.info(f"🔥 Прогріто {warmed} відкладених плагінів")
 
             # Реєструємо основний плагін виконання DEV_PLAN
             dev_plan_plugin = DevPlanExecutorPlugin(
@@ -134,33 +167,22 @@ class NIMDAPluginSystemRunner:
             elif parse_result.data and isinstance(parse_result.data, dict):
                 phases = parse_result.data.get("phases", {})
             execution_results = []
+            dag_report = None
 
-            # 3. Виконання фаз по черзі
-            for phase_name, phase_data in phases.items():
-                self.logger.info(f"🎯 Виконання фази: {phase_name}")
-
-                phase_task = {
-                    "type": "execute_phase",
-                    "phase_name": phase_name,
-                    "description": f"Виконання фази {phase_name}: {phase_data['title']}",
-                }
-
-                phase_result = await self.plugin_manager.execute_task(phase_task)
-                execution_results.append(
-                    {
-                        "phase": phase_name,
-                        "result": phase_result,
-                        "title": phase_data["title"],
-                    }
-                )
-
-                if phase_result.success:
-                    self.logger.info(f"✅ Фаза {phase_name} виконана успішно")
-                else:
+            # 3. Виконання фаз: за графом залежностей або по черзі
+            if self.dag_mode:
+                try:
+                    execution_results, dag_report = await self._execute_phases_dag(
+                        phases
+                    )
+                except ValueError as e:
                     self.logger.warning(
-                        f"⚠️ Фаза {phase_name} завершена з помилками: {phase_result.message}"
+                        f"⚠️ DAG режим недоступний ({e}), послідовне виконання"
                     )
 
+            if dag_report is None:
+                execution_results = await self._execute_phases_sequential(phases)
+
             # 4. Отримання фінального прогресу
             progress_task = {
                 "type": "get_progress",
@@ -183,6 +205,9 @@ class NIMDAPluginSystemRunner:
                 "statistics": self.plugin_manager.get_system_statistics(),
             }
 
+            if dag_report is not None:
+                final_report["dag"] = dag_report
+
             self.logger.info(
                 f"🎊 Виконання DEV_PLAN завершено: {successful_phases}/{total_phases} фаз успішно"
             )
@@ -197,6 +222,144 @@ class NIMDAPluginSystemRunner:
                 "results": [],
             }
 
+    async def _execute_phases_sequential(
+        self, phases: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        """Виконання фаз по черзі"""
+        execution_results = []
+
+        for phase_name, phase_data in phases.items():
+            self.logger.info(f"🎯 Виконання фази: {phase_name}")
+
+            phase_task = {
+                "type": "execute_phase",
+                "phase_name": phase_name,
+                "description": f"Виконання фази {phase_name}: {phase_data['title']}",
+            }
+
+            phase_result = await self.plugin_manager.execute_task(phase_task)
+            execution_results.append(
+                {
+                    "phase": phase_name,
+                    "result": phase_result,
+                    "title": phase_data["title"],
+                }
+            )
+
+            if phase_result.success:
+                self.logger.info(f"✅ Фаза {phase_name} виконана успішно")
+            else:
+                self.logger.warning(
+                    f"⚠️ Фаза {phase_name} завершена з помилками: {phase_result.message}"
+                )
+
+        return execution_results
+
+    async def _execute_phases_dag(
+        self, phases: Dict[str, Any]
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Виконання секцій усіх фаз за графом залежностей
+
+        Args:
+            phases: Фази з результату парсингу DEV_PLAN
+
+        Returns:
+            Tuple: Результати по фазах та звіт критичного шляху
+        """
+        dag = SectionDAG.from_phases(phases, infer=self.infer_dependencies)
+        scheduler = DAGScheduler(dag, max_concurrency=self.max_concurrent_sections)
+
+        self.logger.info(
+            f"🕸️ DAG режим: {len(dag.nodes)} секцій, "
+            f"до {scheduler.max_concurrency} одночасно"
+        )
+
+        # Фаза починається з першою своєю секцією і завершується з останньою
+        phase_keys: Dict[str, List[str]] = {phase_name: [] for phase_name in phases}
+        for key, node in dag.nodes.items():
+            phase_keys[node.phase_name].append(key)
+        phase_runs: Dict[str, List[SectionRun]] = {name: [] for name in phases}
+        phase_started_at: Dict[str, float] = {}
+        phase_results: Dict[str, PluginResult] = {}
+
+        async def begin_phase(phase_name: str):
+            if phase_name in phase_started_at:
+                return
+            phase_started_at[phase_name] = time.monotonic()
+            self.logger.info(f"🎯 Виконання фази: {phase_name}")
+            await self.plugin_manager.execute_task(
+                {
+                    "type": "begin_phase",
+                    "phase_name": phase_name,
+                    "description": f"Початок фази {phase_name}",
+                }
+            )
+
+        async def finish_phase(phase_name: str):
+            await begin_phase(phase_name)
+            runs = phase_runs[phase_name]
+            skipped = [run.key for run in runs if run.skipped]
+            failed = [
+                run.key
+                for run in runs
+                if not run.skipped
+                and (run.error is not None or not (run.result and run.result.success))
+            ]
+            phase_results[phase_name] = await self.plugin_manager.execute_task(
+                {
+                    "type": "finish_phase",
+                    "phase_name": phase_name,
+                    "description": f"Завершення фази {phase_name}",
+                    "completed_sections": len(runs) - len(failed) - len(skipped),
+                    "failed_sections": len(failed),
+                    "skipped_sections": len(skipped),
+                    "execution_time": time.monotonic() - phase_started_at[phase_name],
+                }
+            )
+
+            if phase_results[phase_name].success:
+                self.logger.info(f"✅ Фаза {phase_name} виконана успішно")
+            else:
+                self.logger.warning(
+                    f"⚠️ Фаза {phase_name} завершена з помилками: "
+                    f"{', '.join(failed + skipped)}"
+                )
+
+        async def execute_section(node: SectionNode) -> PluginResult:
+            await begin_phase(node.phase_name)
+            section_task = {
+                "type": "execute_section",
+                "phase_name": node.phase_name,
+                "section_name": node.section_id,
+                "description": f"Виконання секції {node.section_id}: {node.title}",
+            }
+            return await self.plugin_manager.execute_task(section_task)
+
+        async def section_finished(run: SectionRun):
+            phase_name = dag.nodes[run.key].phase_name
+            phase_runs[phase_name].append(run)
+            if len(phase_runs[phase_name]) == len(phase_keys[phase_name]):
+                await finish_phase(phase_name)
+
+        outcome = await scheduler.run(execute_section, on_finished=section_finished)
+
+        # Фази без секцій
+        for phase_name in phases:
+            if phase_name not in phase_results:
+                await finish_phase(phase_name)
+
+        execution_results = [
+            {
+                "phase": phase_name,
+                "result": phase_results[phase_name],
+                "title": phase_data["title"],
+            }
+            for phase_name, phase_data in phases.items()
+        ]
+
+        return execution_results, outcome["report"]
+
     async def run_optimized_execution(self) -> Dict[str, Any]:
         """Запуск оптимізованого виконання з адаптивною продуктивністю"""
         try:
@@ -263,11 +426,40 @@ async def main():
         default="optimized",
         help="Режим виконання (за замовчуванням: optimized)",
     )
+    parser.add_argument(
+        "--dag",
+        action="store_true",
+        help="Паралельне виконання незалежних секцій за графом залежностей",
+    )
+    parser.add_argument(
+        "--max-concurrent-sections",
+        type=int,
+        default=4,
+        help="Максимум одночасних секцій у DAG режимі (за замовчуванням: 4)",
+    )
+    parser.add_argument(
+        "--infer-dependencies",
+        type=str,
+        choices=["phase", "none"],
+        default="phase",
+        help="Залежності секцій без анотацій depends: (за замовчуванням: phase)",
+    )
+    parser.add_argument(
+        "--warm-plugins",
+        action="store_true",
+        help="Завантажити всі плагіни та пул процесів під час старту",
+    )
 
     args = parser.parse_args()
 
     # Ініціалізація системи
-    runner = NIMDAPluginSystemRunner(args.workspace)
+    runner = NIMDAPluginSystemRunner(
+        args.workspace,
+        dag_mode=args.dag,
+        max_concurrent_sections=args.max_concurrent_sections,
+        infer_dependencies=args.infer_dependencies,
+        warm_plugins=args.warm_plugins,
+    )
 
     try:
         # Ініціалізація
@@ -299,6 +491,20 @@ async def main():
             print(
                 f"Статистика: {stats['total_tasks_executed']} завдань, {stats['total_execution_time']:.2f}с"
             )
+            for entry in stats.get("latency", []):
+                print(
+                    f"  {entry['plugin']}/{entry['task_type']}: "
+                    f"p50 {entry['p50']:.3f}с, p90 {entry['p90']:.3f}с, "
+                    f"p99 {entry['p99']:.3f}с, max {entry['max']:.3f}с "
+                    f"({entry['count']} завдань, {entry['errors']} помилок)"
+                )
+
+        if result.get("dag"):
+            dag = result["dag"]
+            print(
+                f"Критичний шлях: {dag['critical_path_length']:.2f}с, "
+                f"фактичний час: {dag['wall_time']:.2f}с"
+            )
 
         print("=" * 60)
 
@@ -250,6 +250,7 @@ class NIMDAMainWindow(QMainWindow):
         self.theme = NIMDATheme()
         self.gui_controller = GUIController()
         self.improvement_worker = None
+        self.dev_plan_manager = None
 
         self.setWindowTitle("🤖 NIMDA Agent - Intelligent Development Assistant")
         self.setGeometry(100, 100, 1400, 900)
@@ -615,8 +616,12 @@ class NIMDAMainWindow(QMainWindow):
     def _update_dev_plan_status(self):
         """Update dev plan status display"""
         try:
-            dev_manager = DevPlanManager(self.project_path)
-            status = dev_manager.get_plan_status()
+            # Keep one manager and re-parse only when DEV_PLAN.md changes
+            if self.dev_plan_manager is None:
+                self.dev_plan_manager = DevPlanManager(self.project_path)
+            else:
+                self.dev_plan_manager.reload_if_changed()
+            status = self.dev_plan_manager.get_plan_status()
 
             status_text = (
                 f"📊 Прогрес: {status['progress_percentage']:.1f}%\n"
@@ -8,6 +8,11 @@ import json
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from plugins.dev_plan_document import build_outline, get_document_service
+
+# Plan view name in the shared DEV_PLAN document service
+PHASES_VIEW = "advanced_task_manager:2"
+
 
 class AdvancedTaskManager:
     def __init__(self, project_path: str):
@@ -109,11 +114,12 @@ class AdvancedTaskManager:
         """Parse DEV_PLAN.md and expand with automatic subtasks"""
         print("🔍 Parsing DEV_PLAN.md and expanding with subtasks...")
 
-        with open(plan_path, "r", encoding="utf-8") as f:
-            content = f.read()
-
-        # Extract phases/sections from markdown
-        phases = self._extract_phases_from_markdown(content)
+        # Extract phases/sections from markdown (parsed once per plan change)
+        phases = get_document_service().view(
+            plan_path,
+            PHASES_VIEW,
+            lambda document: self._phases_from_outline(document.outline),
+        )
 
         # Expand each phase with 3 levels of subtasks
         expanded_phases = []
@@ -137,43 +143,38 @@ class AdvancedTaskManager:
 
     def _extract_phases_from_markdown(self, content: str) -> List[Dict[str, Any]]:
         """Extract main phases from DEV_PLAN.md"""
+        return self._phases_from_outline(build_outline(content))
+
+    def _phases_from_outline(self, outline: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Main phases from the normalized document outline"""
         phases = []
-        lines = content.split("\n")
         current_phase = None
 
-        for line in lines:
-            # Look for main sections (## 1. Project Initialization)
-            if line.startswith("## ") and any(char.isdigit() for char in line):
-                if current_phase:
-                    phases.append(current_phase)
+        for heading in outline["headings"]:
+            title = heading["title"].replace("#", "").strip()
 
-                # Extract phase info
-                title = line.replace("#", "").strip()
+            # Look for main sections (## 1. Project Initialization)
+            if heading["level"] == 2 and any(char.isdigit() for char in title):
                 phase_number = "".join(filter(str.isdigit, title.split(".")[0]))
-
                 current_phase = {
                     "number": int(phase_number) if phase_number else len(phases) + 1,
                     "title": title,
                     "description": "",
                     "subtasks": [],
                 }
+                phases.append(current_phase)
 
             # Look for subtasks (### 2.1. Core/main_controller.py)
-            elif line.startswith("### ") and current_phase:
-                subtask_title = line.replace("#", "").strip()
-                current_phase["subtasks"].append({"title": subtask_title, "items": []})
+            elif heading["level"] == 3 and current_phase:
+                current_phase["subtasks"].append({"title": title, "items": []})
 
             # Look for checklist items (- [ ] Create and activate...)
-            elif (
-                line.strip().startswith("- [ ]")
-                and current_phase
-                and current_phase["subtasks"]
-            ):
-                item = line.strip().replace("- [ ]", "").strip()
-                current_phase["subtasks"][-1]["items"].append(item)
-
-        if current_phase:
-            phases.append(current_phase)
+            if current_phase and current_phase["subtasks"]:
+                items = current_phase["subtasks"][-1]["items"]
+                for item in heading["tasks"]:
+                    for checkbox in (item, *item["subtasks"]):
+                        if not checkbox["checked"]:
+                            items.append(checkbox["text"])
 
         return phases
 
@@ -216,6 +216,7 @@ class NIMDAAgent:
             if task_number:
                 self.logger.info(f"Executing task #{task_number} from DEV_PLAN.md")
                 result = self.dev_plan_manager.execute_task(task_number)
+                self.dev_plan_manager.flush()
             else:
                 self.logger.info("Executing full DEV_PLAN.md")
 
@@ -272,6 +273,8 @@ class NIMDAAgent:
                 else "🤖 NIMDA: Automatic DEV_PLAN execution"
             )
 
+            # Journaled changelog entries belong in this commit
+            self.changelog_manager.flush()
             commit_result = self.git_manager.commit_changes(commit_message)
 
             push_result = (
@@ -411,6 +414,11 @@ class NIMDAAgent:
         """Agent shutdown"""
         self.logger.info("NIMDA Agent shutdown")
 
+        # Write pending DEV_PLAN.md and CHANGELOG.md changes
+        self.dev_plan_manager.close()
+        self.changelog_manager.flush()
+        self.git_manager.close()
+
         # Save configuration
         self.config["last_execution"] = datetime.now().isoformat()
         self._save_config()
@@ -0,0 +1,325 @@
+"""
+Async Git manager - GitManager operations on asyncio subprocesses
+"""
+
+import asyncio
+import logging
+import os
+import weakref
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from git_operations import (
+    DEFAULT_CONFIG,
+    HAS_CHANGES,
+    REMOTE_URL_COMMAND,
+    GitOperation,
+    GitOperations,
+    porcelain_status_command,
+)
+
+# Per event loop, per repository locks serializing mutating operations
+_REPO_LOCKS: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+class AsyncGitManager(GitOperations):
+    """
+    Asynchronous manager for Git repository operations
+
+    Runs the command sequences shared with GitManager (git_operations) as
+    coroutines on ``asyncio.create_subprocess_exec``:
+    - Mutating operations (commit, push, pull, branches, sync) are serialized
+      per repository
+    - Read-only queries (status, config, log) run concurrently
+    - Every command has a timeout; cancelling a call kills its git process
+    """
+
+    def __init__(
+        self,
+        project_path: Path,
+        command_timeout: float = 60.0,
+        network_timeout: float = 300.0,
+    ):
+        """
+        Initialize async Git manager
+
+        Args:
+            project_path: Path to project
+            command_timeout: Max seconds for a local git command
+            network_timeout: Max seconds for fetch, pull, push and ls-remote
+        """
+        self.project_path = project_path
+        self.command_timeout = command_timeout
+        self.network_timeout = network_timeout
+        self.logger = logging.getLogger("AsyncGitManager")
+
+        # Same configuration keys as GitManager
+        self.config = dict(DEFAULT_CONFIG)
+
+        # Fetches made through this manager (reported by get_status)
+        self._last_fetched_at: Optional[datetime] = None
+        self._fetch_failures = 0
+
+    def _repo_lock(self) -> asyncio.Lock:
+        """Lock shared by all managers of this repository on the running loop"""
+        loop = asyncio.get_running_loop()
+        locks = _REPO_LOCKS.setdefault(loop, {})
+        key = str(Path(self.project_path).resolve())
+        if key not in locks:
+            locks[key] = asyncio.Lock()
+        return locks[key]
+
+    async def _run_git_command(
+        self,
+        command: List[str],
+        capture_output: bool = True,
+        timeout: Optional[float] = None,
+    ) -> Optional[str]:
+        """
+        execution Git команди
+
+        Args:
+            command: Команда для execution
+            capture_output: Чи захоплювати вивід
+            timeout: Max seconds (default depends on the command)
+
+        Returns:
+            Вивід команди або None при помилці
+        """
+        if timeout is None:
+            timeout = (
+                self.network_timeout
+                if len(command) > 1
+                and command[1] in ("fetch", "pull", "push", "ls-remote")
+                else self.command_timeout
+            )
+
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *command,
+                cwd=self.project_path,
+                stdin=asyncio.subprocess.DEVNULL,
+                stdout=(
+                    asyncio.subprocess.PIPE
+                    if capture_output
+                    else asyncio.subprocess.DEVNULL
+                ),
+                stderr=asyncio.subprocess.PIPE,
+                env={**os.environ, "GIT_TERMINAL_PROMPT": "0"},
+            )
+        except OSError as e:
+            self.logger.error(f"Неочікувана Git error команди: {e}")
+            return None
+
+        try:
+            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout)
+        except asyncio.TimeoutError:
+            await self._kill(process)
+            self.logger.error(
+                f"Timeout executing command {' '.join(command)} after {timeout}s"
+            )
+            return None
+        except asyncio.CancelledError:
+            await asyncio.shield(self._kill(process))
+            raise
+
+        if process.returncode != 0:
+            self.logger.error(
+                f"Error executing command {' '.join(command)}: "
+                f"exit status {process.returncode}"
+            )
+            if stderr:
+                self.logger.error(f"STDERR: {stderr.decode(errors='replace')}")
+            return None
+
+        if capture_output:
+            return (stdout or b"").decode("utf-8", errors="replace").strip()
+
+        return "Success"
+
+    @staticmethod
+    async def _kill(process: asyncio.subprocess.Process):
+        """Kill a git process that is still running and reap it"""
+        if process.returncode is None:
+            try:
+                process.kill()
+            except ProcessLookupError:
+                pass
+            await process.wait()
+
+    async def _drive(self, operation: GitOperation) -> Dict[str, Any]:
+        """Run a shared command sequence with asyncio git processes"""
+        reply: Any = None
+        error: Optional[Exception] = None
+        try:
+            while True:
+                request = operation.throw(error) if error else operation.send(reply)
+                reply, error = None, None
+                try:
+                    if request is HAS_CHANGES:
+                        reply = await self.has_changes()
+                    else:
+                        reply = await self._run_git_command(request)
+                except Exception as e:
+                    error = e
+        except StopIteration as stop:
+            return stop.value
+
+    async def _drive_locked(self, operation: GitOperation) -> Dict[str, Any]:
+        """Run a command sequence that changes the repository under the repo lock"""
+        async with self._repo_lock():
+            return await self._drive(operation)
+
+    def _fetch_state(self) -> Tuple[Optional[datetime], int]:
+        """Last fetch made through this manager and consecutive failures"""
+        return self._last_fetched_at, self._fetch_failures
+
+    async def get_status(self) -> Dict[str, Any]:
+        """
+        Receiving статусу Git repository
+
+        The porcelain status, origin URL and last commit are queried
+        concurrently.
+
+        Returns:
+            status repository (same keys as GitManager.get_status)
+        """
+        try:
+            git_dir = self._git_dir()
+            if git_dir is None:
+                return {
+                    "initialized": False,
+                    "message": "Git repository not initialized",
+                }
+
+            output, remote_url, last_commit = await asyncio.gather(
+                self._run_git_command(porcelain_status_command(["--branch"])),
+                self._run_git_command(REMOTE_URL_COMMAND),
+                self._run_git_command(["git", "log", "-1", "--oneline"]),
+            )
+            if output is None:
+                return {
+                    "initialized": False,
+                    "message": "Error getting status repository",
+                }
+
+            status = self._parse_porcelain_status(output)
+            status.pop("oid")
+            status["remote_url"] = remote_url
+            status["last_commit"] = last_commit or None
+            return self._with_fetch_state(status, git_dir)
+
+        except Exception as e:
+            self.logger.error(f"Error getting status Git: {e}")
+            return {
+                "initialized": False,
+                "error": str(e),
+                "message": "Error getting status repository",
+            }
+
+    async def has_changes(self) -> bool:
+        """
+        Перевірка чи є незбережені changes
+
+        Returns:
+            True якщо є changes
+        """
+        output = await self._run_git_command(porcelain_status_command([]))
+        return bool(output)
+
+    async def commit_changes(
+        self, message: str, add_all: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Creating commit зі змінами
+
+        Args:
+            message: Повідомлення commit
+            add_all: Чи додавати all files автоматично
+
+        Returns:
+            Результат Creating commit
+        """
+        return await self._drive_locked(self._commit_ops(message, add_all))
+
+    async def push_changes(self, branch: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Sending changes до remote repository
+
+        Args:
+            branch: branch для push. Якщо None - current branch
+
+        Returns:
+            Результат відправки
+        """
+        return await self._drive_locked(self._push_ops(branch))
+
+    async def pull_changes(self) -> Dict[str, Any]:
+        """
+        Receiving changes з remote repository
+
+        Returns:
+            Результат Receiving changes
+        """
+        return await self._drive_locked(self._pull_ops())
+
+    async def fetch_changes(self) -> Dict[str, Any]:
+        """
+        Fetch remote refs
+
+        Returns:
+            Fetch result
+        """
+        async with self._repo_lock():
+            result = await self._run_git_command(["git", "fetch", "--quiet"])
+
+        if result is not None:
+            self._last_fetched_at = datetime.now()
+            self._fetch_failures = 0
+        else:
+            self._fetch_failures += 1
+
+        return {
+            "success": result is not None,
+            "message": (
+                "Remote refs fetched"
+                if result is not None
+                else "Error fetching changes"
+            ),
+            "last_fetched_at": (
+                self._last_fetched_at.isoformat() if self._last_fetched_at else None
+            ),
+        }
+
+    async def setup_github_remote(self, github_url: str) -> Dict[str, Any]:
+        """
+        configuration remote GitHub repository
+
+        Args:
+            github_url: URL GitHub repository
+
+        Returns:
+            Результат configuration
+        """
+        return await self._drive_locked(self._setup_remote_ops(github_url))
+
+    async def create_backup_branch(self) -> Dict[str, Any]:
+        """
+        Creating резервної branch
+
+        Returns:
+            Результат Creating резервної branch
+        """
+        return await self._drive_locked(self._backup_branch_ops())
+
+    async def sync_with_remote(self) -> Dict[str, Any]:
+        """
+        Повна synchronization з віддаленим репозиторієм
+
+        The pull, commit and push steps run as one serialized operation.
+
+        Returns:
+            Результат synchronization
+        """
+        return await self._drive_locked(self._sync_ops())
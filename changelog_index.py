@@ -0,0 +1,306 @@
+"""
+Changelog index - token postings, entries by date and counters for CHANGELOG.md
+"""
+
+import bisect
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+INDEX_VERSION = 1
+
+TOKEN_PATTERN = re.compile(r"\w+")
+ENTRY_TEXT_PATTERN = re.compile(r"- \[.\] (.+)")
+DATE_PATTERN = re.compile(r"\((\d{4}-\d{2}-\d{2} \d{2}:\d{2})\)")
+VERSION_PATTERN = re.compile(r"## \[(\d+\.\d+\.\d+)\]")
+
+
+class ChangelogIndex:
+    """
+    Persistent index of CHANGELOG.md entries
+
+    The index holds every ``- [`` entry line with its section, category,
+    status and date, token postings for substring search, entries sorted by
+    date and the counters behind the changelog statistics. It is rebuilt
+    only when the changelog's mtime or size changes and is persisted to
+    ``index_file`` for the next process.
+    """
+
+    def __init__(self, changelog_file: Path, index_file: Path):
+        """
+        Initialize index
+
+        Args:
+            changelog_file: Path to CHANGELOG.md
+            index_file: Path to the persisted index
+        """
+        self.changelog_file = changelog_file
+        self.index_file = index_file
+        self.logger = logging.getLogger("ChangelogIndex")
+
+        self._lock = threading.RLock()
+        self._signature: Optional[Tuple[int, int]] = None
+        self._entries: List[Dict[str, Any]] = []
+        self._lowered: List[str] = []
+        self._postings: Dict[str, List[int]] = {}
+        self._by_date: List[Tuple[str, int]] = []
+        self._stats: Dict[str, Any] = {}
+
+    def ensure_current(self) -> bool:
+        """
+        Bring the index in line with CHANGELOG.md
+
+        Returns:
+            False if CHANGELOG.md does not exist
+        """
+        with self._lock:
+            try:
+                stat = self.changelog_file.stat()
+            except FileNotFoundError:
+                return False
+
+            signature = (stat.st_mtime_ns, stat.st_size)
+            if signature == self._signature:
+                return True
+
+            if not self._load(signature):
+                self._build(self.changelog_file.read_text(encoding="utf-8"))
+                self._signature = signature
+                self._save()
+            return True
+
+    def search(self, query: str) -> List[Dict[str, Any]]:
+        """
+        Entries whose line contains the query (case-insensitive)
+
+        Args:
+            query: Search query
+
+        Returns:
+            Matching entries in file order
+        """
+        needle = query.lower()
+
+        with self._lock:
+            if not self.ensure_current():
+                return []
+
+            runs = TOKEN_PATTERN.findall(needle)
+            if not runs:
+                candidates = range(len(self._entries))
+            else:
+                # Every word run of the query lies inside one token of the line
+                candidates = None
+                for run in runs:
+                    matching = set()
+                    for token, postings in self._postings.items():
+                        if run in token:
+                            matching.update(postings)
+                    candidates = (
+                        matching if candidates is None else candidates & matching
+                    )
+                candidates = sorted(candidates)
+
+            return [
+                dict(self._entries[i]) for i in candidates if needle in self._lowered[i]
+            ]
+
+    def entries_between(
+        self,
+        start: Optional[Union[str, datetime]] = None,
+        end: Optional[Union[str, datetime]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Dated entries within a range (both ends inclusive)
+
+        Args:
+            start: Earliest date ("YYYY-MM-DD" or "YYYY-MM-DD HH:MM")
+            end: Latest date; a bare day includes the whole day
+
+        Returns:
+            Entries ordered by date
+        """
+        with self._lock:
+            if not self.ensure_current():
+                return []
+
+            low = 0
+            if start is not None:
+                low = bisect.bisect_left(self._by_date, (_date_key(start, False), -1))
+            high = len(self._by_date)
+            if end is not None:
+                high = bisect.bisect_right(
+                    self._by_date, (_date_key(end, True), len(self._entries))
+                )
+
+            return [dict(self._entries[i]) for _, i in self._by_date[low:high]]
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Changelog statistics from the index
+
+        Returns:
+            Counters, versions and per-version/category entry counts
+        """
+        with self._lock:
+            if not self.ensure_current():
+                return {}
+            return json.loads(json.dumps(self._stats))
+
+    def _build(self, content: str):
+        """Index the changelog in one pass"""
+        lines = content.split("\n")
+        entries = []
+        lowered = []
+        postings: Dict[str, List[int]] = {}
+        by_version: Dict[str, Dict[str, int]] = {}
+        by_category: Dict[str, int] = {}
+        last_modified = None
+        current_section = None
+        current_category = None
+
+        for i, line in enumerate(lines):
+            if last_modified is None and "(" in line and ")" in line:
+                date_match = DATE_PATTERN.search(line)
+                if date_match:
+                    last_modified = date_match.group(1)
+
+            if line.startswith("## ["):
+                current_section = line.strip()
+                continue
+
+            if line.startswith("### "):
+                current_category = line.strip()[4:]
+                continue
+
+            if not line.startswith("- ["):
+                continue
+
+            status = (
+                "completed"
+                if "[x]" in line
+                else "pending" if "[ ]" in line else "cancelled"
+            )
+
+            text_match = ENTRY_TEXT_PATTERN.search(line)
+            text = text_match.group(1) if text_match else line
+            date_match = DATE_PATTERN.search(text)
+            date = date_match.group(1) if date_match else None
+            if date:
+                text = re.sub(r" \(\d{4}-\d{2}-\d{2} \d{2}:\d{2}\)", "", text)
+
+            index = len(entries)
+            entries.append(
+                {
+                    "line_number": i + 1,
+                    "section": current_section,
+                    "category": current_category,
+                    "text": text.strip(),
+                    "status": status,
+                    "date": date,
+                    "full_line": line.strip(),
+                }
+            )
+            lowered.append(line.strip().lower())
+            for token in set(TOKEN_PATTERN.findall(lowered[-1])):
+                postings.setdefault(token, []).append(index)
+
+            version = _section_version(current_section)
+            category = current_category or "Uncategorized"
+            counts = by_version.setdefault(version, {})
+            counts[category] = counts.get(category, 0) + 1
+            by_category[category] = by_category.get(category, 0) + 1
+
+        completed_count = content.count("- [x]")
+        pending_count = content.count("- [ ]")
+        cancelled_count = content.count("- [-]")
+        versions = VERSION_PATTERN.findall(content)
+
+        self._entries = entries
+        self._lowered = lowered
+        self._postings = postings
+        self._by_date = sorted(
+            (entry["date"], i) for i, entry in enumerate(entries) if entry["date"]
+        )
+        self._stats = {
+            "completed_tasks": completed_count,
+            "pending_tasks": pending_count,
+            "cancelled_tasks": cancelled_count,
+            "total_tasks": completed_count + pending_count + cancelled_count,
+            "versions": versions,
+            "latest_version": versions[0] if versions else None,
+            "last_modified": last_modified,
+            "file_size": len(content),
+            "lines_count": len(lines),
+            "entries_by_version": by_version,
+            "entries_by_category": by_category,
+        }
+
+    def _load(self, signature: Tuple[int, int]) -> bool:
+        """Load the persisted index if it matches the changelog"""
+        try:
+            data = json.loads(self.index_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return False
+
+        if data.get("version") != INDEX_VERSION or tuple(
+            data.get("signature") or ()
+        ) != tuple(signature):
+            return False
+
+        self._entries = data["entries"]
+        self._lowered = [entry["full_line"].lower() for entry in self._entries]
+        self._postings = data["postings"]
+        self._by_date = [tuple(item) for item in data["by_date"]]
+        self._stats = data["stats"]
+        self._signature = signature
+        return True
+
+    def _save(self):
+        """Persist the index through a temporary file and rename"""
+        try:
+            self.index_file.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_name = tempfile.mkstemp(
+                dir=self.index_file.parent, prefix=".changelog_index.", suffix=".tmp"
+            )
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as temp_file:
+                    json.dump(
+                        {
+                            "version": INDEX_VERSION,
+                            "signature": list(self._signature),
+                            "entries": self._entries,
+                            "postings": self._postings,
+                            "by_date": self._by_date,
+                            "stats": self._stats,
+                        },
+                        temp_file,
+                        ensure_ascii=False,
+                    )
+                os.replace(temp_name, self.index_file)
+            except BaseException:
+                Path(temp_name).unlink(missing_ok=True)
+                raise
+        except OSError as e:
+            self.logger.warning(f"Could not save changelog index: {e}")
+
+
+def _section_version(section: Optional[str]) -> str:
+    """Version name of a "## [...]" section header"""
+    if not section:
+        return "Preamble"
+    end = section.find("]")
+    return section[4:end] if end > 4 else section
+
+
+def _date_key(value: Union[str, datetime], is_end: bool) -> str:
+    """Comparable date string; a bare day as an end covers the whole day"""
+    if isinstance(value, datetime):
+        return value.strftime("%Y-%m-%d %H:%M")
+    return f"{value} 23:59" if is_end and len(value) == 10 else value
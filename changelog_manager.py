@@ -2,11 +2,42 @@
 Changelog manager - maintaining CHANGELOG.md
 """
 
+import atexit
+import json
 import logging
+import os
 import re
+import tempfile
+import threading
+import weakref
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from changelog_index import ChangelogIndex
+
+try:
+    import fcntl
+except ImportError:  # Windows: journal access is only serialized in-process
+    fcntl = None
+
+# Entry for add_entries: a message or a dict with message/category/completed
+ChangelogEntry = Union[str, Dict[str, Any]]
+
+# Position in the journal up to which entries are rendered into CHANGELOG.md;
+# stored in the markdown itself so the render and the cursor move together
+JOURNAL_MARKER = re.compile(r"^<!-- journal-offset: (\d+) -->$", re.MULTILINE)
+
+# Managers whose journaled entries are rendered at interpreter exit
+_open_managers: "weakref.WeakSet[ChangelogManager]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_open_managers():
+    """Render journaled entries of managers still alive at exit"""
+    for manager in list(_open_managers):
+        manager.flush()
 
 
 class ChangelogManager:
@@ -18,23 +49,49 @@ class ChangelogManager:
     - Marking completed tasks
     - Updating project status
     - Supporting Keep a Changelog formatting
+
+    New entries are appended to a JSONL journal in ``.nimda_cache``, the
+    durable append-only log of changelog entries. CHANGELOG.md is rendered
+    from it on ``flush``: explicitly, before any read of the changelog, once
+    ``flush_threshold`` entries are pending and at interpreter exit. The
+    markdown records how far into the journal it is rendered, so a flush
+    renders only newer entries and a missing CHANGELOG.md is rebuilt from
+    the whole journal. Appends and flushes hold an exclusive lock on
+    ``changelog_journal.lock`` shared with other processes.
     """
 
-    def __init__(self, project_path: Path):
+    def __init__(self, project_path: Path, flush_threshold: int = 256):
         """
         Initialize changelog manager
 
         Args:
             project_path: Path to project
+            flush_threshold: Pending journal entries that trigger a flush
         """
         self.project_path = project_path
         self.changelog_file = project_path / "CHANGELOG.md"
+        self.journal_file = project_path / ".nimda_cache" / "changelog_journal.jsonl"
+        self.journal_lock_file = self.journal_file.with_suffix(".lock")
+        self.flush_threshold = max(1, flush_threshold)
         self.logger = logging.getLogger("ChangelogManager")
+        self.index = ChangelogIndex(
+            self.changelog_file, project_path / ".nimda_cache" / "changelog_index.json"
+        )
+
+        self._journal_lock = threading.RLock()
+        self._journal_lock_depth = 0
+        self._pending_entries = 0
+        # Journal size already rendered, to skip re-reading an unchanged file
+        self._rendered_journal_size: Optional[int] = None
+        _open_managers.add(self)
 
         # Check file existence
         if not self.changelog_file.exists():
             self._create_initial_changelog()
 
+        # Entries left by an interrupted run
+        self.flush()
+
     def _create_initial_changelog(self):
         """Create initial CHANGELOG.md"""
         initial_content = f"""# Changelog
@@ -92,90 +149,233 @@ and this project adheres to [Semantic Versioning](https://semver.org/spec/v2.0.0
         Returns:
             True if entry added successfully
         """
-        try:
-            # Read current content
-            if not self.changelog_file.exists():
-                self._create_initial_changelog()
-
-            content = self.changelog_file.read_text(encoding="utf-8")
-
-            # search секції "Unreleased"
-            unreleased_pattern = r"## \[Unreleased\]"
-            match = re.search(unreleased_pattern, content)
-
-            if not match:
-                self.logger.warning("Секція [Unreleased] не знайдена")
-                return False
-
-            # search відповідної категорії
-            category_pattern = f"### {category}"
-            category_start = content.find(category_pattern, match.start())
-
-            if category_start == -1:
-                # Якщо category не знайдена, додаємо її
-                self._add_category_section(category, message, completed)
-                return True
-
-            # Знаходимо місце для вставки нового запису
-            lines = content.split("\n")
-            category_line_idx = None
+        return self.add_entries(
+            [{"message": message, "category": category, "completed": completed}]
+        )
 
-            for i, line in enumerate(lines):
-                if line.strip() == f"### {category}":
-                    category_line_idx = i
-                    break
-
-            if category_line_idx is None:
-                return False
+    def add_entries(self, entries: Iterable[ChangelogEntry]) -> bool:
+        """
+        Add several entries with one journal append
 
-            # Форматування нового запису
-            status_mark = "[x]" if completed else "[ ]"
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
-            new_entry = f"- {status_mark} {message} ({timestamp})"
+        Args:
+            entries: Messages or dicts with message, category and completed
 
-            # Вставка нового запису після заголовка категорії
-            lines.insert(category_line_idx + 1, new_entry)
+        Returns:
+            True if entries added successfully
+        """
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
+        records = []
+        for entry in entries:
+            if isinstance(entry, str):
+                entry = {"message": entry}
+            records.append(
+                {
+                    "message": entry["message"],
+                    "category": entry.get("category", "Added"),
+                    "completed": entry.get("completed", True),
+                    "timestamp": timestamp,
+                }
+            )
 
-            # Saving оновленого вмісту
-            updated_content = "\n".join(lines)
-            self.changelog_file.write_text(updated_content, encoding="utf-8")
+        if not records:
+            return True
 
-            self.logger.info(f"Added entry to CHANGELOG: {message}")
+        try:
+            with self._locked_journal():
+                lines = "".join(
+                    json.dumps(record, ensure_ascii=False) + "\n" for record in records
+                )
+                with open(self.journal_file, "ab+") as journal:
+                    # A crash mid-append leaves a line without its newline;
+                    # terminate it so the new records stay parseable
+                    if journal.seek(0, os.SEEK_END):
+                        journal.seek(-1, os.SEEK_END)
+                        if journal.read(1) != b"\n":
+                            lines = "\n" + lines
+                    journal.write(lines.encode("utf-8"))
+                self._pending_entries += len(records)
+
+                for record in records:
+                    self.logger.info(f"Added entry to CHANGELOG: {record['message']}")
+
+                # Entries are saved in the journal even if rendering fails
+                if self._pending_entries >= self.flush_threshold:
+                    self.flush()
             return True
 
         except Exception as e:
             self.logger.error(f"Error adding entry to CHANGELOG: {e}")
             return False
 
-    def _add_category_section(self, category: str, message: str, completed: bool):
-        """Додавання нової секції категорії"""
+    @contextmanager
+    def _locked_journal(self):
+        """Thread lock plus exclusive file lock on the journal (reentrant)"""
+        with self._journal_lock:
+            if self._journal_lock_depth:
+                self._journal_lock_depth += 1
+                try:
+                    yield
+                finally:
+                    self._journal_lock_depth -= 1
+                return
+
+            self.journal_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.journal_lock_file, "a") as lock_file:
+                if fcntl is not None:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+                self._journal_lock_depth = 1
+                try:
+                    yield
+                finally:
+                    self._journal_lock_depth = 0
+                    if fcntl is not None:
+                        fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    def _read_journal(self, journal: str) -> List[Dict[str, Any]]:
+        """Parse journal lines, skipping a line torn by a crash mid-append"""
+        records = []
+        for number, line in enumerate(journal.splitlines(), 1):
+            if not line.strip():
+                continue
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                self.logger.warning(
+                    f"Skipping damaged CHANGELOG journal line {number}: {line[:80]}"
+                )
+        return records
+
+    def flush(self) -> bool:
+        """
+        Render journal entries newer than CHANGELOG.md into it
+
+        The journal is never truncated; entries that cannot be rendered (e.g.
+        there is no [Unreleased] section) are rendered by a later flush.
+
+        Returns:
+            True if the changelog is up to date
+        """
         try:
-            content = self.changelog_file.read_text(encoding="utf-8")
+            with self._locked_journal():
+                try:
+                    journal_size = self.journal_file.stat().st_size
+                except FileNotFoundError:
+                    self._pending_entries = 0
+                    return True
+                if journal_size == self._rendered_journal_size:
+                    self._pending_entries = 0
+                    return True
+
+                if not self.changelog_file.exists():
+                    self._create_initial_changelog()
+                content = self.changelog_file.read_text(encoding="utf-8")
+
+                # A journal shorter than the cursor was recreated: render all of it
+                offset = self._rendered_offset(content)
+                if offset > journal_size:
+                    offset = 0
+
+                with open(self.journal_file, "rb") as journal:
+                    journal.seek(offset)
+                    chunk = journal.read(journal_size - offset)
+
+                # A line torn by a crash mid-append is rendered once completed
+                rendered_end = offset + chunk.rfind(b"\n") + 1
+                if rendered_end > offset:
+                    records = self._read_journal(
+                        chunk[: rendered_end - offset].decode("utf-8")
+                    )
+                    updated_content = self._render_entries(content, records)
+
+                    if updated_content is None:
+                        self.logger.warning(
+                            "Секція [Unreleased] не знайдена, "
+                            f"{len(records)} entries left to render from the journal"
+                        )
+                        return False
+                    self._write_changelog(
+                        self._with_rendered_offset(updated_content, rendered_end)
+                    )
 
-            # search секції "Unreleased"
-            unreleased_pattern = r"(## \[Unreleased\])"
-            match = re.search(unreleased_pattern, content)
+                self._rendered_journal_size = rendered_end
+                self._pending_entries = 0
+                return True
 
-            if not match:
-                return False
+        except Exception as e:
+            self.logger.error(f"Error flushing CHANGELOG: {e}")
+            return False
 
-            # Creating нової секції
-            status_mark = "[x]" if completed else "[ ]"
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
-            new_section = f"""
-### {category}
-- {status_mark} {message} ({timestamp})
-"""
+    def _rendered_offset(self, content: str) -> int:
+        """Journal position up to which CHANGELOG.md is rendered"""
+        match = JOURNAL_MARKER.search(content)
+        return int(match.group(1)) if match else 0
+
+    def _with_rendered_offset(self, content: str, offset: int) -> str:
+        """CHANGELOG.md content with the journal cursor set to ``offset``"""
+        marker = f"<!-- journal-offset: {offset} -->"
+        if JOURNAL_MARKER.search(content):
+            return JOURNAL_MARKER.sub(marker, content, count=1)
+        separator = "" if content.endswith("\n") else "\n"
+        return f"{content}{separator}{marker}\n"
+
+    def _render_entries(
+        self, content: str, records: List[Dict[str, Any]]
+    ) -> Optional[str]:
+        """
+        Insert entries under their categories of the [Unreleased] section
 
-            # Вставка після заголовка "Unreleased"
-            insert_pos = match.end()
-            updated_content = content[:insert_pos] + new_section + content[insert_pos:]
+        Newest entries go first, right after the category header; a missing
+        category gets a new section right after the [Unreleased] header.
 
-            self.changelog_file.write_text(updated_content, encoding="utf-8")
-            self.logger.info(f"Added new category '{category}' до CHANGELOG")
+        Returns:
+            Updated content or None if there is no [Unreleased] section
+        """
+        lines = content.split("\n")
+        unreleased_index = next(
+            (i for i, line in enumerate(lines) if line.startswith("## [Unreleased]")),
+            None,
+        )
+        if unreleased_index is None:
+            return None
+
+        by_category: Dict[str, List[str]] = {}
+        for record in records:
+            status_mark = "[x]" if record["completed"] else "[ ]"
+            by_category.setdefault(record["category"], []).insert(
+                0, f"- {status_mark} {record['message']} ({record['timestamp']})"
+            )
 
-        except Exception as e:
-            self.logger.error(f"Error adding category: {e}")
+        headers: Dict[str, int] = {}
+        for i in range(unreleased_index + 1, len(lines)):
+            line = lines[i].strip()
+            if line.startswith("### ") and line[4:] in by_category:
+                headers.setdefault(line[4:], i)
+
+        # Bottom-up, so earlier insertion points stay valid
+        for category, index in sorted(headers.items(), key=lambda item: -item[1]):
+            lines[index + 1 : index + 1] = by_category[category]
+
+        for category, new_lines in by_category.items():
+            if category not in headers:
+                section = [f"### {category}", *new_lines, ""]
+                lines[unreleased_index + 1 : unreleased_index + 1] = section
+                self.logger.info(f"Added new category '{category}' до CHANGELOG")
+
+        return "\n".join(lines)
+
+    def _write_changelog(self, content: str):
+        """Write CHANGELOG.md through a temporary file and rename"""
+        fd, temp_name = tempfile.mkstemp(
+            dir=self.changelog_file.parent, prefix=".CHANGELOG.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as temp_file:
+                temp_file.write(content)
+            os.chmod(temp_name, self.changelog_file.stat().st_mode & 0o777)
+            os.replace(temp_name, self.changelog_file)
+        except BaseException:
+            Path(temp_name).unlink(missing_ok=True)
+            raise
 
     def mark_task_completed(self, task_info: Dict[str, Any]) -> bool:
         """
@@ -192,21 +392,21 @@ and this project adheres to [Semantic Versioning](https://semver.org/spec/v2.0.0
             task_number = task_info.get("number", "N/A")
 
             # Додавання запису про execution task
-            message = f"executed задачу #{task_number}: {task_title}"
-
-            # Додаємо до категорії "executed"
-            self.add_entry(message, "executed", completed=True)
+            messages = [f"executed задачу #{task_number}: {task_title}"]
 
             # Якщо є підзадачі, додаємо їх теж
             subtasks = task_info.get("subtasks", [])
-            completed_subtasks = [st for st in subtasks if st.get("completed", False)]
-
-            if completed_subtasks:
-                for subtask in completed_subtasks:
-                    subtask_message = f"  └─ {subtask['text']}"
-                    self.add_entry(subtask_message, "executed", completed=True)
+            messages.extend(
+                f"  └─ {subtask['text']}"
+                for subtask in subtasks
+                if subtask.get("completed", False)
+            )
 
-            return True
+            # Додаємо до категорії "executed" одним записом у журнал
+            return self.add_entries(
+                {"message": message, "category": "executed", "completed": True}
+                for message in messages
+            )
 
         except Exception as e:
             self.logger.error(f"Error marking task: {e}")
@@ -225,6 +425,7 @@ and this project adheres to [Semantic Versioning](https://semver.org/spec/v2.0.0
         Returns:
             True якщо версію створено Successfully
         """
+        self.flush()
         try:
             content = self.changelog_file.read_text(encoding="utf-8")
 
@@ -270,49 +471,13 @@ and this project adheres to [Semantic Versioning](https://semver.org/spec/v2.0.0
         Returns:
             statistics журналу changes
         """
+        self.flush()
         try:
             if not self.changelog_file.exists():
                 return {"exists": False, "message": "CHANGELOG.md does not exist"}
 
-            content = self.changelog_file.read_text(encoding="utf-8")
-
-            # Підрахунок записів
-            completed_pattern = r"- \[x\]"
-            pending_pattern = r"- \[ \]"
-            cancelled_pattern = r"- \[-\]"
-
-            completed_count = len(re.findall(completed_pattern, content))
-            pending_count = len(re.findall(pending_pattern, content))
-            cancelled_count = len(re.findall(cancelled_pattern, content))
-
-            # Підрахунок версій
-            version_pattern = r"## \[(\d+\.\d+\.\d+)\]"
-            versions = re.findall(version_pattern, content)
-
-            # Останнє Updating
-            lines = content.split("\n")
-            last_modified = None
-
-            for line in lines:
-                if "(" in line and ")" in line:
-                    # search дати в дужках
-                    date_match = re.search(r"\((\d{4}-\d{2}-\d{2} \d{2}:\d{2})\)", line)
-                    if date_match:
-                        last_modified = date_match.group(1)
-                        break
-
-            return {
-                "exists": True,
-                "completed_tasks": completed_count,
-                "pending_tasks": pending_count,
-                "cancelled_tasks": cancelled_count,
-                "total_tasks": completed_count + pending_count + cancelled_count,
-                "versions": versions,
-                "latest_version": versions[0] if versions else None,
-                "last_modified": last_modified,
-                "file_size": len(content),
-                "lines_count": len(lines),
-            }
+            # Лічильники з індексу, який перебудовується лише після зміни файлу
+            return {"exists": True, **self.index.get_statistics()}
 
         except Exception as e:
             self.logger.error(f"Error getting statistics: {e}")
@@ -332,61 +497,35 @@ and this project adheres to [Semantic Versioning](https://semver.org/spec/v2.0.0
         Returns:
             Список знайдених записів
         """
+        self.flush()
         try:
             if not self.changelog_file.exists():
                 return []
 
-            content = self.changelog_file.read_text(encoding="utf-8")
-            lines = content.split("\n")
-
-            results = []
-            current_section = None
-            current_category = None
+            return self.index.search(query)
 
-            for i, line in enumerate(lines):
-                # Визначення секцій
-                if line.startswith("## ["):
-                    current_section = line.strip()
-                    continue
+        except Exception as e:
+            self.logger.error(f"Error searching in CHANGELOG: {e}")
+            return []
 
-                if line.startswith("### "):
-                    current_category = line.strip()[4:]  # Видаляємо "### "
-                    continue
-
-                # search у записах
-                if line.startswith("- [") and query.lower() in line.lower():
-                    # Визначення статусу
-                    status = (
-                        "completed"
-                        if "[x]" in line
-                        else "pending"
-                        if "[ ]" in line
-                        else "cancelled"
-                    )
+    def search_entries_by_date(
+        self,
+        start: Optional[Union[str, datetime]] = None,
+        end: Optional[Union[str, datetime]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        search записів за діапазоном дат
 
-                    # Витягування тексту та дати
-                    text_match = re.search(r"- \[.\] (.+)", line)
-                    text = text_match.group(1) if text_match else line
-
-                    date_match = re.search(r"\((\d{4}-\d{2}-\d{2} \d{2}:\d{2})\)", text)
-                    date = date_match.group(1) if date_match else None
-
-                    if date:
-                        text = re.sub(r" \(\d{4}-\d{2}-\d{2} \d{2}:\d{2}\)", "", text)
-
-                    results.append(
-                        {
-                            "line_number": i + 1,
-                            "section": current_section,
-                            "category": current_category,
-                            "text": text.strip(),
-                            "status": status,
-                            "date": date,
-                            "full_line": line.strip(),
-                        }
-                    )
+        Args:
+            start: Найраніша дата ("YYYY-MM-DD" або "YYYY-MM-DD HH:MM")
+            end: Найпізніша дата; день без часу охоплюється повністю
 
-            return results
+        Returns:
+            Записи, впорядковані за датою
+        """
+        self.flush()
+        try:
+            return self.index.entries_between(start, end)
 
         except Exception as e:
             self.logger.error(f"Error searching in CHANGELOG: {e}")
@@ -399,6 +538,7 @@ and this project adheres to [Semantic Versioning](https://semver.org/spec/v2.0.0
         Returns:
             True якщо cleanup executed Successfully
         """
+        self.flush()
         try:
             if not self.changelog_file.exists():
                 return False
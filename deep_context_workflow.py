@@ -18,6 +18,7 @@ from typing import Any, Dict, List, Optional
 
 sys.path.append(str(Path(__file__).parent))
 
+from async_git_manager import AsyncGitManager
 from dev_plan_manager import DevPlanManager
 from focused_system_analyzer import FocusedSystemAnalyzer
 from universal_task_manager import UniversalTaskManager
@@ -37,6 +38,7 @@ class DeepContextWorkflowSystem:
         self.task_manager = UniversalTaskManager(str(self.project_path))
         self.analyzer = FocusedSystemAnalyzer(str(self.project_path))
         self.dev_manager = DevPlanManager(self.project_path)
+        self.git_manager = AsyncGitManager(self.project_path)
 
         # Deep analysis components
         self.context_analyzer = DeepContextAnalyzer(self.project_path)
@@ -114,7 +116,10 @@ class DeepContextWorkflowSystem:
 
         # Discover hidden patterns and requirements
         print("🔬 Discovering hidden patterns and requirements...")
-        hidden_patterns = await self.context_analyzer.discover_hidden_patterns()
+        hidden_patterns, git_status = await asyncio.gather(
+            self.context_analyzer.discover_hidden_patterns(),
+            self.git_manager.get_status(),
+        )
 
         await self.codex_interface.codex_pause("Understanding implicit requirements")
 
@@ -123,6 +128,7 @@ class DeepContextWorkflowSystem:
             "existing_structure": existing_structure,
             "dev_plan_insights": dev_plan_insights,
             "hidden_patterns": hidden_patterns,
+            "git_status": git_status,
             "discovery_timestamp": time.time(),
         }
 
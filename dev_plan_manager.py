@@ -2,12 +2,42 @@
 DEV_PLAN.md manager - reading, analyzing and executing development plan
 """
 
+import atexit
 import logging
 import os
+import random
 import re
+import tempfile
+import threading
+import time
+import weakref
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from plugins.dev_plan_document import (
+    DevPlanDocument,
+    build_outline,
+    get_document_service,
+)
+
+# Plan view name in the shared DEV_PLAN document service
+PLAN_VIEW = "dev_plan_manager:3"
+
+# Task heading: "### 1. Title"
+TASK_HEADING = re.compile(r"^(\d+)\.\s*(.*)")
+
+# Managers with possibly pending debounced writes, flushed at interpreter exit
+_open_managers: "weakref.WeakSet[DevPlanManager]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_open_managers():
+    """Write pending plan changes of managers still alive at exit"""
+    for manager in list(_open_managers):
+        manager.flush()
 
 
 class DevPlanManager:
@@ -21,18 +51,60 @@ class DevPlanManager:
     - Plan extension when needed
     """
 
-    def __init__(self, project_path: Path, max_retries: int = 3):
+    def __init__(
+        self,
+        project_path: Path,
+        max_retries: int = 3,
+        save_debounce: float = 1.0,
+        patch_checkboxes: bool = False,
+        subtask_workers: int = 1,
+        retry_backoff: float = 0.1,
+        max_retry_backoff: float = 5.0,
+    ):
         """
         Initialize manager
 
         Args:
             project_path: Path to project
+            max_retries: Attempts per subtask
+            save_debounce: Window in seconds for coalescing plan writes
+            patch_checkboxes: Patch checkbox characters in the loaded file
+                instead of regenerating the whole plan
+            subtask_workers: Threads for subtasks of tasks marked
+                ``<!-- parallel -->`` (1 - always in order)
+            retry_backoff: Base delay in seconds before a subtask retry
+            max_retry_backoff: Upper bound for the retry delay
         """
         self.project_path = project_path
         self.max_retries = max(1, max_retries)
+        self.subtask_workers = max(1, subtask_workers)
+        self.retry_backoff = max(0.0, retry_backoff)
+        self.max_retry_backoff = max(self.retry_backoff, max_retry_backoff)
+        self._subtask_executor: Optional[ThreadPoolExecutor] = None
         self.dev_plan_file = project_path / "DEV_PLAN.md"
         self.logger = logging.getLogger("DevPlanManager")
 
+        # Write-behind persistence
+        self.save_debounce = max(0.0, save_debounce)
+        self.patch_checkboxes = patch_checkboxes
+        self._save_lock = threading.RLock()
+        self._flush_timer: Optional[threading.Timer] = None
+        self._last_flush = 0.0
+        self._dirty = False
+        self._structure_changed = False
+        self._plan_content: Optional[str] = None
+        self._plan_signature: Optional[Tuple[int, int]] = None
+        self._plan_newline = "\n"
+        _open_managers.add(self)
+
+        # Plan indexes and progress counters
+        self._tasks_by_number: Dict[int, Dict[str, Any]] = {}
+        self._tasks_by_id: Dict[int, Dict[str, Any]] = {}
+        self._completed_task_ids: Set[int] = set()
+        self._task_done_counts: Dict[int, int] = {}
+        self._total_subtasks = 0
+        self._completed_subtasks = 0
+
         # Plan structure
         self.plan_structure = {
             "title": "",
@@ -53,10 +125,13 @@ class DevPlanManager:
             return
 
         try:
-            with open(self.dev_plan_file, "r", encoding="utf-8") as f:
-                content = f.read()
-
-            self.plan_structure = self._parse_plan(content)
+            document, self.plan_structure = get_document_service().load_with_view(
+                self.dev_plan_file, PLAN_VIEW, self._build_plan_view
+            )
+            self._index_plan()
+            self._plan_content = document.content
+            self._plan_signature = document.signature
+            self._plan_newline = document.newline
             self.logger.info(
                 f"DEV_PLAN.md завантажено. Знайдено {len(self.plan_structure['tasks'])} задач."
             )
@@ -105,6 +180,10 @@ class DevPlanManager:
         except Exception as e:
             self.logger.error(f"Error Creating шаблону: {e}")
 
+    def _build_plan_view(self, document: DevPlanDocument) -> Dict[str, Any]:
+        """Plan structure for the shared document service"""
+        return self._plan_from_outline(document.outline, document.lines)
+
     def _parse_plan(self, content: str) -> Dict[str, Any]:
         """
         Парсинг вмісту DEV_PLAN.md
@@ -112,6 +191,24 @@ class DevPlanManager:
         Args:
             content: Вміст file
 
+        Returns:
+            Структурована інформація про plan
+        """
+        return self._plan_from_outline(build_outline(content), content.split("\n"))
+
+    def _plan_from_outline(
+        self, outline: Dict[str, Any], lines: List[str]
+    ) -> Dict[str, Any]:
+        """
+        Plan structure from the normalized document outline
+
+        Tasks are "### N. Title" headings; every checkbox up to the next task
+        heading (nested ones included) is one of its subtasks.
+
+        Args:
+            outline: Result of ``build_outline``
+            lines: Document lines
+
         Returns:
             Структурована інформація про plan
         """
@@ -123,62 +220,63 @@ class DevPlanManager:
             "metadata": {},
         }
 
-        lines = content.split("\n")
         current_section = None
         current_task = None
-        task_counter = 0
+        description = []
 
-        for line in lines:
-            line = line.strip()
+        for heading in outline["headings"]:
+            level = heading["level"]
 
-            # Заголовок документа
-            if line.startswith("# "):
-                plan["title"] = line[2:].strip()
-                continue
-
-            # Розділи
-            if line.startswith("## "):
-                current_section = line[3:].strip().lower()
-                continue
+            # Заголовок документа та розділи
+            if level == 1:
+                plan["title"] = heading["title"]
+            elif level == 2:
+                current_section = heading["title"].lower()
 
             # task (заголовки з номерами)
-            task_match = re.match(r"^### (\d+)\.\s*(.*)", line)
+            task_match = TASK_HEADING.match(heading["title"]) if level == 3 else None
             if task_match:
-                task_counter += 1
                 current_task = {
-                    "id": task_counter,
+                    "id": len(plan["tasks"]) + 1,
                     "number": int(task_match.group(1)),
                     "title": task_match.group(2),
                     "subtasks": [],
                     "completed": False,
                     "priority": "medium",
+                    # Явний дозвіл паралельного виконання підзадач
+                    "parallel": False,
                 }
                 plan["tasks"].append(current_task)
-                continue
 
-            # Підзадачі (чекбокси)
-            subtask_match = re.match(r"^- \[([ x])\]\s*(.*)", line)
-            if subtask_match and current_task:
-                completed = subtask_match.group(1) == "x"
-                subtask = {
-                    "text": subtask_match.group(2),
-                    "completed": completed,
-                    "id": len(current_task["subtasks"]) + 1,
-                }
-                current_task["subtasks"].append(subtask)
-
-                # Якщо всі підзадачі виконані - позначити задачу як виконану
-                if all(st["completed"] for st in current_task["subtasks"]):
-                    current_task["completed"] = True
+            # Опис project
+            if current_section == "опис project":
+                description.extend(lines[index].strip() for index in heading["text"])
 
+            if current_task is None:
                 continue
 
-            # Опис project
-            if current_section == "опис project" and line:
-                plan["description"] += line + " "
+            current_task["parallel"] = current_task["parallel"] or heading["parallel"]
 
-        # cleanup опису
-        plan["description"] = plan["description"].strip()
+            # Підзадачі (чекбокси)
+            for item in heading["tasks"]:
+                for checkbox in (item, *item["subtasks"]):
+                    current_task["subtasks"].append(
+                        {
+                            "text": checkbox["text"],
+                            "completed": checkbox["checked"],
+                            "id": len(current_task["subtasks"]) + 1,
+                            # Offset of the checkbox character for in-place patching
+                            "offset": checkbox["offset"],
+                        }
+                    )
+
+            # task виконана, якщо виконані всі її підзадачі
+            subtasks = current_task["subtasks"]
+            current_task["completed"] = bool(subtasks) and all(
+                subtask["completed"] for subtask in subtasks
+            )
+
+        plan["description"] = " ".join(description)
 
         # Підрахунок виконаних задач
         plan["completed_tasks"] = [task for task in plan["tasks"] if task["completed"]]
@@ -192,36 +290,131 @@ class DevPlanManager:
         Returns:
             status plan
         """
-        total_tasks = len(self.plan_structure["tasks"])
-        completed_tasks = len(self.plan_structure["completed_tasks"])
-
-        total_subtasks = sum(
-            len(task["subtasks"]) for task in self.plan_structure["tasks"]
-        )
-        completed_subtasks = sum(
-            len([st for st in task["subtasks"] if st["completed"]])
-            for task in self.plan_structure["tasks"]
-        )
+        total_subtasks = self._total_subtasks
+        completed_subtasks = self._completed_subtasks
 
         progress_percentage = (
             (completed_subtasks / total_subtasks * 100) if total_subtasks > 0 else 0
         )
 
+        try:
+            mtime = self.dev_plan_file.stat().st_mtime
+        except OSError:
+            mtime = None
+
         return {
             "title": self.plan_structure["title"],
-            "total_tasks": total_tasks,
-            "completed_tasks": completed_tasks,
+            "total_tasks": len(self.plan_structure["tasks"]),
+            "completed_tasks": len(self._completed_task_ids),
             "total_subtasks": total_subtasks,
             "completed_subtasks": completed_subtasks,
             "progress_percentage": round(progress_percentage, 2),
-            "file_exists": self.dev_plan_file.exists(),
-            "last_modified": datetime.fromtimestamp(
-                os.path.getmtime(self.dev_plan_file)
-            ).isoformat()
-            if self.dev_plan_file.exists()
-            else None,
+            "file_exists": mtime is not None,
+            "last_modified": (
+                datetime.fromtimestamp(mtime).isoformat() if mtime is not None else None
+            ),
         }
 
+    def get_task(self, task_number: int) -> Optional[Dict[str, Any]]:
+        """
+        Task lookup by number
+
+        Args:
+            task_number: Task number from the plan
+
+        Returns:
+            Task or None if the plan has no such task
+        """
+        return self._tasks_by_number.get(task_number)
+
+    def get_task_by_id(self, task_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Task lookup by id
+
+        Args:
+            task_id: Sequential task id
+
+        Returns:
+            Task or None if the plan has no such task
+        """
+        return self._tasks_by_id.get(task_id)
+
+    def reload_if_changed(self) -> bool:
+        """
+        Reload the plan if DEV_PLAN.md changed on disk since it was read
+
+        Returns:
+            True if the plan was reloaded
+        """
+        with self._save_lock:
+            # Pending changes would be lost by a reload
+            if self._dirty:
+                return False
+            try:
+                stat = self.dev_plan_file.stat()
+            except OSError:
+                return False
+            if (stat.st_mtime_ns, stat.st_size) == self._plan_signature:
+                return False
+
+            self._load_plan()
+            return True
+
+    def _index_plan(self):
+        """Rebuild task indexes and progress counters from plan_structure"""
+        self._tasks_by_number = {}
+        self._tasks_by_id = {}
+        self._completed_task_ids = set()
+        self._task_done_counts = {}
+        self._total_subtasks = 0
+        self._completed_subtasks = 0
+
+        self.plan_structure["completed_tasks"] = []
+        for task in self.plan_structure["tasks"]:
+            self._index_task(task)
+
+    def _index_task(self, task: Dict[str, Any]):
+        """Add a task to the indexes and counters"""
+        # The first task with a number wins, as with a linear search
+        self._tasks_by_number.setdefault(task["number"], task)
+        self._tasks_by_id[task["id"]] = task
+
+        done = sum(1 for subtask in task["subtasks"] if subtask["completed"])
+        self._task_done_counts[task["id"]] = done
+        self._total_subtasks += len(task["subtasks"])
+        self._completed_subtasks += done
+
+        if task["completed"]:
+            self._completed_task_ids.add(task["id"])
+            self.plan_structure["completed_tasks"].append(task)
+
+    def _add_task(self, task: Dict[str, Any]):
+        """Append a new task to the plan"""
+        self.plan_structure["tasks"].append(task)
+        self._index_task(task)
+
+    def _complete_subtask(self, task: Dict[str, Any], subtask: Dict[str, Any]):
+        """Mark a subtask completed and update the counters"""
+        if subtask["completed"]:
+            return
+        subtask["completed"] = True
+        self._task_done_counts[task["id"]] += 1
+        self._completed_subtasks += 1
+
+    def _complete_task_if_done(self, task: Dict[str, Any]) -> bool:
+        """Mark a task completed once all its subtasks are done"""
+        if self._task_done_counts[task["id"]] < len(task["subtasks"]):
+            return False
+        task["completed"] = True
+        if task["id"] not in self._completed_task_ids:
+            self._completed_task_ids.add(task["id"])
+            self.plan_structure["completed_tasks"].append(task)
+        return True
+
+    def _all_tasks_completed(self) -> bool:
+        """Check whether every task of the plan is completed"""
+        return len(self._completed_task_ids) == len(self.plan_structure["tasks"])
+
     def execute_task(self, task_number: int) -> Dict[str, Any]:
         """
         execution конкретної task з plan
@@ -232,20 +425,21 @@ class DevPlanManager:
         Returns:
             Результат execution
         """
-        try:
-            # search task
-            target_task = None
-            for task in self.plan_structure["tasks"]:
-                if task["number"] == task_number:
-                    target_task = task
-                    break
-
-            if not target_task:
-                return {
-                    "success": False,
-                    "message": f"Задачу #{task_number} not found в плані",
-                }
+        # search task
+        target_task = self._tasks_by_number.get(task_number)
 
+        if not target_task:
+            return {
+                "success": False,
+                "message": f"Задачу #{task_number} not found в плані",
+            }
+
+        return self._execute_plan_task(target_task)
+
+    def _execute_plan_task(self, target_task: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute a task object of the plan"""
+        task_number = target_task["number"]
+        try:
             if target_task["completed"]:
                 return {
                     "success": True,
@@ -258,31 +452,18 @@ class DevPlanManager:
             # execution підзадач з повторами
             executed_subtasks = []
             failed_subtasks = []
-            for subtask in target_task["subtasks"]:
-                if subtask["completed"]:
-                    continue
-
-                attempts = 0
-                while attempts < self.max_retries and not subtask["completed"]:
-                    success = self._execute_subtask(subtask, target_task)
-                    if success:
-                        subtask["completed"] = True
-                        executed_subtasks.append(subtask)
-                    else:
-                        attempts += 1
-                        if attempts < self.max_retries:
-                            self.logger.warning(
-                                f"Повтор {attempts} для підзадачі: {subtask['text']}"
-                            )
-
-                if not subtask["completed"]:
+            pending = [st for st in target_task["subtasks"] if not st["completed"]]
+            outcomes = self._run_subtasks(pending, target_task)
+
+            for subtask, success in zip(pending, outcomes):
+                if success:
+                    self._complete_subtask(target_task, subtask)
+                    executed_subtasks.append(subtask)
+                else:
                     failed_subtasks.append(subtask)
 
             # Перевірка завершення task
-            if all(st["completed"] for st in target_task["subtasks"]):
-                target_task["completed"] = True
-                if target_task not in self.plan_structure["completed_tasks"]:
-                    self.plan_structure["completed_tasks"].append(target_task)
+            self._complete_task_if_done(target_task)
 
             # Saving оновленого plan
             self._save_plan()
@@ -322,42 +503,34 @@ class DevPlanManager:
             executed_tasks = []
             failed_tasks = []
 
-            attempt = 0
-            while True:
-                progress = False
-                for task in self.plan_structure["tasks"]:
-                    if task["completed"]:
-                        continue
-
-                    result = self.execute_task(task["number"])
-
-                    if result["success"]:
-                        executed_tasks.append(task)
-                        progress = True
-                    else:
-                        failed_tasks.append(
-                            {
-                                "task": task,
-                                "error": result.get("error", "Невідома Error"),
-                            }
-                        )
-                        if result.get("executed_subtasks") or result.get(
-                            "failed_subtasks"
-                        ):
-                            progress = True
-
-                if all(t["completed"] for t in self.plan_structure["tasks"]):
-                    break
-
-                attempt += 1
-                if not progress or attempt >= self.max_retries:
-                    break
-
-            success = all(t["completed"] for t in self.plan_structure["tasks"])
+            # Черга готових задач: невдала task повертається в кінець черги,
+            # лише якщо спроба просунула її вперед
+            ready = deque(
+                (task, 1)
+                for task in self.plan_structure["tasks"]
+                if not task["completed"]
+            )
+            while ready:
+                task, attempt = ready.popleft()
+                result = self._execute_plan_task(task)
+
+                if result["success"]:
+                    executed_tasks.append(task)
+                elif result.get("executed_subtasks") and attempt < self.max_retries:
+                    ready.append((task, attempt + 1))
+                else:
+                    failed_tasks.append(
+                        {
+                            "task": task,
+                            "error": result.get("error", "Невідома Error"),
+                        }
+                    )
+
+            success = self._all_tasks_completed()
 
             return {
                 "success": success,
-                "message": f"executed {len([t for t in self.plan_structure['tasks'] if t['completed']])}/{len(self.plan_structure['tasks'])} задач",
+                "message": f"executed {len(self._completed_task_ids)}/{len(self.plan_structure['tasks'])} задач",
                 "executed_tasks": executed_tasks,
                 "failed_tasks": failed_tasks,
                 "total_tasks": len(self.plan_structure["tasks"]),
@@ -370,6 +543,71 @@ class DevPlanManager:
                 "error": str(e),
                 "message": "critical Error execution plan",
             }
+        finally:
+            # Coalesced writes must reach the disk before the caller continues
+            self.flush()
+
+    def _run_subtasks(
+        self, subtasks: List[Dict[str, Any]], parent_task: Dict[str, Any]
+    ) -> List[bool]:
+        """
+        Run subtasks with retries and return their outcomes in order
+
+        Subtasks run in plan order unless the task is marked
+        ``<!-- parallel -->``; then they all run on the subtask pool.
+
+        Args:
+            subtasks: Subtasks to run
+            parent_task: Task the subtasks belong to
+
+        Returns:
+            Success flag for every subtask
+        """
+        if self.subtask_workers > 1 and parent_task.get("parallel"):
+            return self._run_subtask_batch(subtasks, parent_task)
+
+        return [self._run_subtask_with_retries(st, parent_task) for st in subtasks]
+
+    def _run_subtask_batch(
+        self, batch: List[Dict[str, Any]], parent_task: Dict[str, Any]
+    ) -> List[bool]:
+        """Run independent subtasks concurrently"""
+        if len(batch) <= 1:
+            return [self._run_subtask_with_retries(st, parent_task) for st in batch]
+
+        if self._subtask_executor is None:
+            self._subtask_executor = ThreadPoolExecutor(
+                max_workers=self.subtask_workers, thread_name_prefix="dev-plan-subtask"
+            )
+        futures = [
+            self._subtask_executor.submit(
+                self._run_subtask_with_retries, subtask, parent_task
+            )
+            for subtask in batch
+        ]
+        return [future.result() for future in futures]
+
+    def _run_subtask_with_retries(
+        self, subtask: Dict[str, Any], parent_task: Dict[str, Any]
+    ) -> bool:
+        """Run a subtask up to max_retries times with exponential backoff"""
+        for attempt in range(1, self.max_retries + 1):
+            if self._execute_subtask(subtask, parent_task):
+                return True
+
+            if attempt < self.max_retries:
+                delay = self._retry_delay(attempt)
+                self.logger.warning(
+                    f"Повтор {attempt} для підзадачі через {delay:.2f} с: {subtask['text']}"
+                )
+                time.sleep(delay)
+
+        return False
+
+    def _retry_delay(self, attempt: int) -> float:
+        """Backoff before retry number ``attempt``: half fixed, half jitter"""
+        delay = min(self.max_retry_backoff, self.retry_backoff * 2 ** (attempt - 1))
+        return delay / 2 + random.uniform(0, delay / 2)
 
     def _execute_subtask(
         self, subtask: Dict[str, Any], parent_task: Dict[str, Any]
@@ -499,12 +737,12 @@ class DevPlanManager:
             for suggestion in suggestions:
                 if self._should_add_task(suggestion):
                     new_task = self._create_task_from_suggestion(suggestion)
-                    self.plan_structure["tasks"].append(new_task)
+                    self._add_task(new_task)
                     added_tasks.append(new_task)
 
             # Saving оновленого plan
             if added_tasks:
-                self._save_plan()
+                self._save_plan(structure_changed=True)
 
             return {
                 "success": True,
@@ -622,18 +860,124 @@ class DevPlanManager:
             "created_at": datetime.now().isoformat(),
         }
 
-    def _save_plan(self):
-        """Saving оновленого plan в file"""
-        try:
-            content = self._generate_plan_content()
+    def _save_plan(self, structure_changed: bool = False):
+        """
+        Mark the plan as modified and schedule a write-behind flush
 
-            with open(self.dev_plan_file, "w", encoding="utf-8") as f:
-                f.write(content)
+        The first change after a quiet period is written immediately; further
+        changes within ``save_debounce`` seconds are coalesced into one write.
 
-            self.logger.info("DEV_PLAN.md Successfully збережено")
+        Args:
+            structure_changed: Tasks were added or removed, so checkbox
+                patching is not possible
+        """
+        with self._save_lock:
+            self._dirty = True
+            self._structure_changed = self._structure_changed or structure_changed
+
+            delay = self._last_flush + self.save_debounce - time.monotonic()
+            if delay <= 0:
+                self.flush()
+            elif self._flush_timer is None:
+                self._flush_timer = threading.Timer(delay, self.flush)
+                # A pending flush must not keep the interpreter alive
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def flush(self) -> bool:
+        """
+        Write pending plan changes to DEV_PLAN.md
 
-        except Exception as e:
-            self.logger.error(f"Error Saving plan: {e}")
+        Pending changes stay marked until a write succeeds, so a failed
+        flush is retried by the next save, flush, ``close()`` or at exit.
+
+        Returns:
+            True if the plan was written
+        """
+        with self._save_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+
+            if not self._dirty:
+                return False
+
+            self._last_flush = time.monotonic()
+            try:
+                content = self._patched_plan_content()
+                rewritten = content is None
+                if rewritten:
+                    content = self._generate_plan_content()
+
+                self._write_atomic(content)
+                # Offsets refer to the old text after a rewrite, so patching stops
+                self._plan_content = None if rewritten else content
+                self._dirty = False
+                self._structure_changed = False
+
+                stat = self.dev_plan_file.stat()
+                self._plan_signature = (stat.st_mtime_ns, stat.st_size)
+
+                self.logger.info("DEV_PLAN.md Successfully збережено")
+                return True
+
+            except Exception as e:
+                self.logger.error(f"Error Saving plan: {e}")
+                return False
+
+    def close(self):
+        """Flush pending plan changes and stop the subtask pool"""
+        self.flush()
+        if self._subtask_executor is not None:
+            self._subtask_executor.shutdown(wait=True)
+            self._subtask_executor = None
+
+    def _patched_plan_content(self) -> Optional[str]:
+        """Loaded plan text with updated checkboxes, or None if a rewrite is needed"""
+        if (
+            not self.patch_checkboxes
+            or self._structure_changed
+            or self._plan_content is None
+        ):
+            return None
+
+        # The file must be exactly the one the offsets were taken from
+        try:
+            stat = self.dev_plan_file.stat()
+        except OSError:
+            return None
+        if (stat.st_mtime_ns, stat.st_size) != self._plan_signature:
+            return None
+
+        chars = list(self._plan_content)
+        for task in self.plan_structure["tasks"]:
+            for subtask in task["subtasks"]:
+                offset = subtask.get("offset")
+                if offset is None or chars[offset] not in " xX":
+                    return None
+                chars[offset] = "x" if subtask["completed"] else " "
+        return "".join(chars)
+
+    def _write_atomic(self, content: str):
+        """Write the plan through a temporary file and rename (keeps CRLF files CRLF)"""
+        fd, temp_name = tempfile.mkstemp(
+            dir=self.dev_plan_file.parent, prefix=".DEV_PLAN.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(
+                fd, "w", encoding="utf-8", newline=self._plan_newline
+            ) as temp_file:
+                temp_file.write(content)
+            mode = (
+                self.dev_plan_file.stat().st_mode & 0o777
+                if self.dev_plan_file.exists()
+                else 0o644
+            )
+            os.chmod(temp_name, mode)
+            os.replace(temp_name, self.dev_plan_file)
+        except BaseException:
+            Path(temp_name).unlink(missing_ok=True)
+            raise
 
     def _generate_plan_content(self) -> str:
         """Генерація вмісту file DEV_PLAN.md"""
@@ -656,6 +1000,8 @@ class DevPlanManager:
         for task in self.plan_structure["tasks"]:
             # Заголовок task
             content.append(f"### {task['number']}. {task['title']}")
+            if task.get("parallel"):
+                content.append("<!-- parallel -->")
 
             # Підзадачі
             for subtask in task["subtasks"]:
@@ -708,6 +1054,7 @@ class DevPlanManager:
                     shutil.copy2(self.dev_plan_file, new_dev_plan)
 
                 # Update project path to new location
+                self.flush()
                 self.project_path = project_path
                 self.dev_plan_file = new_dev_plan
 
@@ -731,8 +1078,7 @@ class DevPlanManager:
     def _load_plan_content(self) -> str:
         """Load DEV_PLAN content"""
         if self.dev_plan_file.exists():
-            with open(self.dev_plan_file, "r", encoding="utf-8") as f:
-                return f.read()
+            return get_document_service().load(self.dev_plan_file).content
         return ""
 
     def _extract_project_info(self, content: str) -> Dict[str, Any]:
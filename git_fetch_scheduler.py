@@ -0,0 +1,185 @@
+"""
+Git fetch scheduler - background, deduplicated remote fetches
+"""
+
+import logging
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
+
+
+class GitFetchScheduler:
+    """
+    Background scheduler for ``git fetch``
+
+    Functions:
+    - Periodic fetch on a configurable interval
+    - Single-flight: concurrent callers share one running fetch
+    - Exponential backoff while the remote is unreachable
+    - Last fetch time and failure state for status reports
+    """
+
+    def __init__(
+        self,
+        fetch_fn: Callable[[], bool],
+        interval: float = 300.0,
+        max_backoff: float = 3600.0,
+    ):
+        """
+        Initialize fetch scheduler
+
+        Args:
+            fetch_fn: Runs one fetch and returns True on success
+            interval: Seconds between successful fetches
+            max_backoff: Upper bound of the delay after failed fetches
+        """
+        self.fetch_fn = fetch_fn
+        self.interval = interval
+        self.max_backoff = max(interval, max_backoff)
+        self.logger = logging.getLogger("GitFetchScheduler")
+
+        self._condition = threading.Condition()
+        self._in_flight = False
+        self._generation = 0
+        self._last_result = False
+        self._last_fetched_at: Optional[datetime] = None
+        self._last_attempt_at: Optional[datetime] = None
+        self._last_error: Optional[str] = None
+        self._failures = 0
+        self._next_fetch = 0.0
+
+        self._running = False
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the background thread is active"""
+        return self._running
+
+    @property
+    def last_fetched_at(self) -> Optional[datetime]:
+        """Time of the last successful fetch in this process"""
+        with self._condition:
+            return self._last_fetched_at
+
+    def start(self):
+        """Start periodic fetching in a background thread"""
+        with self._condition:
+            if self._running:
+                return
+            self._running = True
+            self._wake.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="GitFetchScheduler", daemon=True
+            )
+            self._thread.start()
+        self.logger.debug("Background fetch started")
+
+    def stop(self, timeout: float = 5.0):
+        """
+        Stop the background thread
+
+        Args:
+            timeout: Seconds to wait for a running fetch to finish
+        """
+        with self._condition:
+            self._running = False
+            thread = self._thread
+            self._thread = None
+        self._wake.set()
+        if thread and thread is not threading.current_thread():
+            thread.join(timeout=timeout)
+
+    def request_fetch(self):
+        """Ask the background thread to fetch now without waiting"""
+        with self._condition:
+            self._next_fetch = 0.0
+        self._wake.set()
+
+    def fetch_now(self, timeout: Optional[float] = None) -> bool:
+        """
+        Fetch now, or join the fetch that is already running
+
+        Args:
+            timeout: Max seconds to wait for a fetch started by another caller
+
+        Returns:
+            True if the fetch succeeded
+        """
+        with self._condition:
+            if self._in_flight:
+                generation = self._generation
+                self._condition.wait_for(
+                    lambda: self._generation != generation, timeout=timeout
+                )
+                return self._last_result and self._generation != generation
+            self._in_flight = True
+
+        success = False
+        error = None
+        try:
+            success = bool(self.fetch_fn())
+        except Exception as e:
+            error = str(e)
+            self.logger.warning(f"Fetch error: {e}")
+
+        with self._condition:
+            now = datetime.now()
+            self._last_attempt_at = now
+            self._last_result = success
+            if success:
+                self._last_fetched_at = now
+                self._last_error = None
+                self._failures = 0
+            else:
+                self._last_error = error or "fetch failed"
+                self._failures += 1
+            self._next_fetch = time.monotonic() + self._delay()
+            self._in_flight = False
+            self._generation += 1
+            self._condition.notify_all()
+        return success
+
+    def get_state(self) -> Dict[str, Any]:
+        """
+        Scheduler state
+
+        Returns:
+            Last fetch times, failure count and seconds until the next fetch
+        """
+        with self._condition:
+            return {
+                "running": self._running,
+                "in_flight": self._in_flight,
+                "interval": self.interval,
+                "last_fetched_at": (
+                    self._last_fetched_at.isoformat() if self._last_fetched_at else None
+                ),
+                "last_attempt_at": (
+                    self._last_attempt_at.isoformat() if self._last_attempt_at else None
+                ),
+                "last_error": self._last_error,
+                "consecutive_failures": self._failures,
+                "next_fetch_in": max(0.0, self._next_fetch - time.monotonic()),
+            }
+
+    def _delay(self) -> float:
+        """Delay before the next fetch (doubles per consecutive failure)"""
+        if not self._failures:
+            return self.interval
+        return min(self.interval * 2**self._failures, self.max_backoff)
+
+    def _run(self):
+        """Background loop: fetch when due, sleep until the next fetch"""
+        while self._running:
+            with self._condition:
+                wait = self._next_fetch - time.monotonic()
+            if wait > 0:
+                self._wake.wait(wait)
+                self._wake.clear()
+                continue
+            if not self._running:
+                break
+            self.fetch_now()
@@ -6,12 +6,41 @@ import json
 import logging
 import os
 import subprocess
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-
-
-class GitManager:
+from typing import Any, Dict, List, Optional, Tuple
+
+from git_fetch_scheduler import GitFetchScheduler
+from git_operations import (
+    DEFAULT_CONFIG,
+    HAS_CHANGES,
+    REMOTE_URL_COMMAND,
+    GitOperation,
+    GitOperations,
+    porcelain_status_command,
+)
+
+# Git commands that never change the repository (no status invalidation)
+READ_ONLY_GIT_COMMANDS = {
+    "branch",
+    "config",
+    "diff",
+    "log",
+    "ls-files",
+    "ls-remote",
+    "rev-list",
+    "rev-parse",
+    "show",
+    "status",
+}
+
+# Files under .git whose mtimes key the cached status
+STATUS_SIGNATURE_FILES = ("index", "HEAD", "FETCH_HEAD", "packed-refs", "config")
+
+
+class GitManager(GitOperations):
     """
     Manager for Git repository operations
 
@@ -23,25 +52,47 @@ class GitManager:
     - Branch management
     """
 
-    def __init__(self, project_path: Path):
+    def __init__(
+        self,
+        project_path: Path,
+        status_ttl: float = 2.0,
+        fetch_interval: Optional[float] = 300.0,
+        fetch_timeout: float = 60.0,
+    ):
         """
         Initialize Git manager
 
         Args:
             project_path: Path to project
+            status_ttl: Max age in seconds of a cached status whose .git
+                files are unchanged (bounds staleness of working tree edits)
+            fetch_interval: Seconds between background fetches once a remote
+                is configured (None disables background fetching)
+            fetch_timeout: Max seconds for one fetch
         """
         self.project_path = project_path
+        self.status_ttl = status_ttl
+        self.fetch_interval = fetch_interval
+        self.fetch_timeout = fetch_timeout
         self.logger = logging.getLogger("GitManager")
 
+        # Cached status keyed by mtimes of .git/index, HEAD and refs
+        self._status_lock = threading.RLock()
+        self._status_cache: Optional[Dict[str, Any]] = None
+        self._status_signature: Optional[Tuple] = None
+        self._status_time = 0.0
+        self._config_signature: Optional[int] = None
+        self._remote_url: Optional[str] = None
+        self._last_commit_oid: Optional[str] = None
+        self._last_commit: Optional[str] = None
+
+        # Remote refs are refreshed in the background, never by get_status
+        self.fetch_scheduler = GitFetchScheduler(
+            self._fetch_remote, interval=fetch_interval or 300.0
+        )
+
         # Configuration
-        self.config = {
-            "auto_commit": True,
-            "auto_push": True,
-            "auto_pull": True,
-            "commit_message_prefix": "🤖 NIMDA:",
-            "main_branch": "main",
-            "backup_branch": "nimda-backup",
-        }
+        self.config = dict(DEFAULT_CONFIG)
 
         # Check and initialize Git
         self._ensure_git_initialized()
@@ -166,76 +217,75 @@ node_modules/
         except Exception as e:
             self.logger.error(f"Неочікувана Git error команди: {e}")
             return None
-
-    def get_status(self) -> Dict[str, Any]:
+        finally:
+            # Failed commands may still have touched the repository
+            self._invalidate_after(command)
+
+    def _invalidate_after(self, command: List[str]):
+        """Drop the cached status after a command that may change the repo"""
+        if len(command) > 1 and command[1] not in READ_ONLY_GIT_COMMANDS:
+            self.invalidate_status()
+
+    def invalidate_status(self):
+        """Forget the cached status so the next get_status re-reads Git"""
+        with self._status_lock:
+            self._status_cache = None
+            self._status_signature = None
+
+    def get_status(self, force_refresh: bool = False) -> Dict[str, Any]:
         """
         Receiving статусу Git repository
 
+        Branch, upstream, ahead/behind and file states come from a single
+        ``git status --porcelain=v2 --branch -z`` call. The result is cached
+        until the mtimes of .git/index, HEAD, the branch ref, FETCH_HEAD or
+        config change, or ``status_ttl`` expires. Ahead/behind counts use the
+        last fetched remote-tracking refs; fetching runs in the background
+        (see ``fetch_scheduler``) and is reported as ``last_fetched_at``.
+
+        Args:
+            force_refresh: Ignore the cached status
+
         Returns:
             status repository
         """
         try:
             # Перевірка чи є Git repository
-            git_dir = self.project_path / ".git"
-            if not git_dir.exists():
+            git_dir = self._git_dir()
+            if git_dir is None:
                 return {
                     "initialized": False,
                     "message": "Git repository not initialized",
                 }
 
-            # current branch
-            current_branch = self._run_git_command(["git", "branch", "--show-current"])
-
-            # status files
-            status_output = self._run_git_command(["git", "status", "--porcelain"])
-
-            # Аналіз статусу
-            has_changes = bool(status_output)
-            staged_files = []
-            unstaged_files = []
-            untracked_files = []
-
-            if status_output:
-                for line in status_output.split("\n"):
-                    if line:
-                        status_code = line[:2]
-                        file_path = line[3:]
-
-                        if status_code[0] != " " and status_code[0] != "?":
-                            staged_files.append(file_path)
-
-                        if status_code[1] != " ":
-                            if status_code[0] == "?":
-                                untracked_files.append(file_path)
-                            else:
-                                unstaged_files.append(file_path)
-
-            # Інформація про remote repository
-            remote_url = self._run_git_command(
-                ["git", "config", "--get", "remote.origin.url"]
-            )
+            with self._status_lock:
+                signature = self._status_signature_for(git_dir)
+                if (
+                    not force_refresh
+                    and self._status_cache is not None
+                    and signature == self._status_signature
+                    and time.monotonic() - self._status_time < self.status_ttl
+                ):
+                    return self._with_fetch_state(self._status_cache, git_dir)
+
+                output = self._run_porcelain_status(["--branch"])
+                if output is None:
+                    return {
+                        "initialized": False,
+                        "message": "Error getting status repository",
+                    }
 
-            # last commit
-            last_commit = self._run_git_command(["git", "log", "-1", "--oneline"])
+                status = self._parse_porcelain_status(output)
+                status["remote_url"] = self._get_remote_url(git_dir)
+                status["last_commit"] = self._get_last_commit(status.pop("oid"))
 
-            # commit count ahead/behind
-            behind_ahead = self._get_behind_ahead_count()
+                self._status_cache = status
+                self._status_signature = signature
+                self._status_time = time.monotonic()
 
-            return {
-                "initialized": True,
-                "current_branch": current_branch,
-                "has_changes": has_changes,
-                "staged_files": staged_files,
-                "unstaged_files": unstaged_files,
-                "untracked_files": untracked_files,
-                "remote_url": remote_url,
-                "last_commit": last_commit,
-                "behind_count": behind_ahead.get("behind", 0),
-                "ahead_count": behind_ahead.get("ahead", 0),
-                "total_files": len(staged_files)
-                + len(unstaged_files)
-                + len(untracked_files),
-            }
+            if status["remote_url"] and self.fetch_interval is not None:
+                self.fetch_scheduler.start()
+            return self._with_fetch_state(status, git_dir)
 
         except Exception as e:
             self.logger.error(f"Error getting status Git: {e}")
@@ -245,36 +295,157 @@ node_modules/
                 "message": "Error getting status repository",
             }
 
-    def _get_behind_ahead_count(self) -> Dict[str, int]:
-        """Receiving кількості комітів behind/ahead віддаленої branch"""
+    def _status_signature_for(self, git_dir: Path) -> Tuple:
+        """Mtimes of the .git files that change with index, HEAD and refs"""
+        paths = [git_dir / name for name in STATUS_SIGNATURE_FILES]
+        try:
+            head = (git_dir / "HEAD").read_text(encoding="utf-8").strip()
+        except OSError:
+            head = ""
+        if head.startswith("ref:"):
+            paths.append(git_dir / head[4:].strip())
+
+        signature = [head]
+        for path in paths:
+            try:
+                stat = path.stat()
+                signature.append((stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                signature.append(None)
+        return tuple(signature)
+
+    def _run_porcelain_status(self, extra_args: List[str]) -> Optional[str]:
+        """Raw ``git status --porcelain=v2 -z`` output (None on error)"""
+        command = porcelain_status_command(extra_args)
         try:
-            # Спочатку fetch щоб отримати останню інформацію
-            self._run_git_command(["git", "fetch"], capture_output=False)
+            result = subprocess.run(
+                command,
+                cwd=self.project_path,
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+            return result.stdout
+        except (subprocess.CalledProcessError, OSError) as e:
+            self.logger.error(f"Error executing command {' '.join(command)}: {e}")
+            return None
 
-            # Отримуємо commit count
-            output = self._run_git_command(
-                ["git", "rev-list", "--left-right", "--count", "HEAD...@{u}"]
+    def _get_remote_url(self, git_dir: Path) -> Optional[str]:
+        """Origin URL, re-read only after .git/config changes"""
+        try:
+            config_mtime = (git_dir / "config").stat().st_mtime_ns
+        except OSError:
+            config_mtime = None
+
+        if config_mtime is None or config_mtime != self._config_signature:
+            self._remote_url = self._run_git_command(REMOTE_URL_COMMAND)
+            self._config_signature = config_mtime
+        return self._remote_url
+
+    def _get_last_commit(self, oid: Optional[str]) -> Optional[str]:
+        """One-line summary of HEAD, re-read only when HEAD moves"""
+        if oid is None:
+            return None
+        if oid != self._last_commit_oid:
+            self._last_commit = self._run_git_command(
+                ["git", "log", "-1", "--oneline", oid]
             )
+            self._last_commit_oid = oid
+        return self._last_commit
+
+    def _fetch_state(self) -> Tuple[Optional[datetime], int]:
+        """Last fetch by the background scheduler and its failure count"""
+        state = self.fetch_scheduler.get_state()
+        return self.fetch_scheduler.last_fetched_at, state["consecutive_failures"]
 
-            if output:
-                parts = output.split("\t")
-                if len(parts) == 2:
-                    return {"ahead": int(parts[0]), "behind": int(parts[1])}
+    def _fetch_remote(self) -> bool:
+        """Run one ``git fetch`` without prompting (used by the scheduler)"""
+        command = ["git", "fetch", "--quiet"]
+        try:
+            subprocess.run(
+                command,
+                cwd=self.project_path,
+                capture_output=True,
+                text=True,
+                check=True,
+                timeout=self.fetch_timeout,
+                env={**os.environ, "GIT_TERMINAL_PROMPT": "0"},
+            )
+            return True
+        except subprocess.TimeoutExpired:
+            self.logger.warning(f"git fetch timed out after {self.fetch_timeout}s")
+            return False
+        except (subprocess.CalledProcessError, OSError) as e:
+            self.logger.debug(f"git fetch failed: {e}")
+            return False
+        finally:
+            self.invalidate_status()
+
+    def fetch_changes(self, wait: bool = True) -> Dict[str, Any]:
+        """
+        Fetch remote refs now
 
-            return {"ahead": 0, "behind": 0}
+        Concurrent callers share one running fetch.
 
-        except Exception:
-            return {"ahead": 0, "behind": 0}
+        Args:
+            wait: Wait for the fetch; False only schedules it in the background
+
+        Returns:
+            Fetch result
+        """
+        if not wait:
+            threading.Thread(
+                target=self.fetch_scheduler.fetch_now, name="GitFetch", daemon=True
+            ).start()
+            return {"success": True, "scheduled": True, "message": "Fetch scheduled"}
+
+        success = self.fetch_scheduler.fetch_now(timeout=self.fetch_timeout)
+        state = self.fetch_scheduler.get_state()
+        return {
+            "success": success,
+            "message": "Remote refs fetched" if success else "Error fetching changes",
+            "last_fetched_at": state["last_fetched_at"],
+            "error": state["last_error"],
+        }
+
+    def close(self):
+        """Stop background fetching"""
+        self.fetch_scheduler.stop()
 
     def has_changes(self) -> bool:
         """
         Перевірка чи є незбережені changes
 
+        Always runs a plain porcelain status without branch, remote and
+        commit lookups: working tree edits don't change the .git mtimes
+        the get_status() cache is keyed on.
+
         Returns:
             True якщо є changes
         """
-        status = self.get_status()
-        return status.get("has_changes", False)
+        if self._git_dir() is None:
+            return False
+
+        output = self._run_porcelain_status([])
+        return bool(output)
+
+    def _drive(self, operation: GitOperation) -> Dict[str, Any]:
+        """Run a shared command sequence with blocking git calls"""
+        reply: Any = None
+        error: Optional[Exception] = None
+        try:
+            while True:
+                request = operation.throw(error) if error else operation.send(reply)
+                reply, error = None, None
+                try:
+                    if request is HAS_CHANGES:
+                        reply = self.has_changes()
+                    else:
+                        reply = self._run_git_command(request)
+                except Exception as e:
+                    error = e
+        except StopIteration as stop:
+            return stop.value
 
     def commit_changes(self, message: str, add_all: bool = True) -> Dict[str, Any]:
         """
@@ -287,53 +458,7 @@ node_modules/
         Returns:
             Результат Creating commit
         """
-        try:
-            if not self.has_changes():
-                return {
-                    "success": True,
-                    "message": "No changes to commit",
-                    "commit_hash": None,
-                }
-
-            # Додавання files
-            if add_all:
-                self._run_git_command(["git", "add", "."])
-
-            # Creating commit
-            full_message = f"{self.config['commit_message_prefix']} {message}"
-            result = self._run_git_command(["git", "commit", "-m", full_message])
-
-            if result is None:
-                return {"success": False, "message": "Error creating commit"}
-
-            # Receiving хешу commit
-            commit_hash = self._run_git_command(["git", "rev-parse", "HEAD"])
-
-            if commit_hash:
-                self.logger.info(f"Commit created: {commit_hash[:8]} - {full_message}")
-
-                # Автоматичний push якщо налаштовано
-                push_result = None
-                if self.config["auto_push"]:
-                    push_result = self.push_changes()
-
-                return {
-                    "success": True,
-                    "message": f"Commit created: {commit_hash[:8]}",
-                    "commit_hash": commit_hash,
-                    "commit_message": full_message,
-                    "push_result": push_result,
-                }
-            else:
-                return {"success": False, "message": "Error Receiving хешу commit"}
-
-        except Exception as e:
-            self.logger.error(f"Error creating commit: {e}")
-            return {
-                "success": False,
-                "error": str(e),
-                "message": "Error creating commit",
-            }
+        return self._drive(self._commit_ops(message, add_all))
 
     def push_changes(self, branch: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -345,52 +470,7 @@ node_modules/
         Returns:
             Результат відправки
         """
-        try:
-            if not branch:
-                branch = self._run_git_command(["git", "branch", "--show-current"])
-
-            if not branch:
-                return {
-                    "success": False,
-                    "message": "failed to визначити поточну гілку",
-                }
-
-            # Перевірка наявності remote repository
-            remote_url = self._run_git_command(
-                ["git", "config", "--get", "remote.origin.url"]
-            )
-            if not remote_url:
-                self.logger.warning(
-                    "Remote repository not configured - skipping push"
-                )
-                return {
-                    "success": True,
-                    "skipped": True,
-                    "message": "Remote repository not configured, skipping push",
-                }
-
-            # Push changes
-            result = self._run_git_command(["git", "push", "origin", branch])
-
-            if result is None:
-                return {"success": False, "message": "Error pushing changes"}
-
-            self.logger.info(f"Changes pushed to remote repository: {branch}")
-
-            return {
-                "success": True,
-                "message": f"changes відправлено до branch {branch}",
-                "branch": branch,
-                "remote_url": remote_url,
-            }
-
-        except Exception as e:
-            self.logger.error(f"Error pushing changes: {e}")
-            return {
-                "success": False,
-                "error": str(e),
-                "message": "Error pushing changes до remote repository",
-            }
+        return self._drive(self._push_ops(branch))
 
     def pull_changes(self) -> Dict[str, Any]:
         """
@@ -399,58 +479,7 @@ node_modules/
         Returns:
             Результат Receiving changes
         """
-        try:
-            # Перевірка наявності remote repository
-            remote_url = self._run_git_command(
-                ["git", "config", "--get", "remote.origin.url"]
-            )
-            if not remote_url:
-                return {
-                    "success": False,
-                    "message": "remote repository not configured",
-                }
-
-            # Saving local changes перед pull
-            if self.has_changes():
-                stash_result = self._run_git_command(
-                    ["git", "stash", "push", "-m", "NIMDA auto-stash before pull"]
-                )
-                if stash_result is None:
-                    return {
-                        "success": False,
-                        "message": "Error Saving local changes",
-                    }
-
-            # Pull changes
-            result = self._run_git_command(["git", "pull", "origin"])
-
-            if result is None:
-                return {"success": False, "message": "Error pulling changes"}
-
-            # Відновлення local changes якщо були
-            if "NIMDA auto-stash before pull" in str(result):
-                stash_pop_result = self._run_git_command(["git", "stash", "pop"])
-                if stash_pop_result is None:
-                    self.logger.warning(
-                        "failed to відновити local changes після pull"
-                    )
-
-            self.logger.info("Changes pulled from remote repository")
-
-            return {
-                "success": True,
-                "message": "Changes successfully received",
-                "pull_output": result,
-                "remote_url": remote_url,
-            }
-
-        except Exception as e:
-            self.logger.error(f"Error pulling changes: {e}")
-            return {
-                "success": False,
-                "error": str(e),
-                "message": "Error pulling changes з remote repository",
-            }
+        return self._drive(self._pull_ops())
 
     def setup_github_remote(self, github_url: str) -> Dict[str, Any]:
         """
@@ -462,54 +491,7 @@ node_modules/
         Returns:
             Результат configuration
         """
-        try:
-            # Перевірка існуючого remote
-            existing_remote = self._run_git_command(
-                ["git", "config", "--get", "remote.origin.url"]
-            )
-
-            if existing_remote:
-                # Updating існуючого remote
-                result = self._run_git_command(
-                    ["git", "remote", "set-url", "origin", github_url]
-                )
-            else:
-                # Додавання нового remote
-                result = self._run_git_command(
-                    ["git", "remote", "add", "origin", github_url]
-                )
-
-            if result is None:
-                return {
-                    "success": False,
-                    "message": "Error setting up remote repository",
-                }
-
-            # Перевірка з'єднання
-            test_result = self._run_git_command(["git", "ls-remote", "origin"])
-
-            if test_result is None:
-                return {
-                    "success": False,
-                    "message": "failed to підключитися до remote repository",
-                }
-
-            self.logger.info(f"Remote repository configured: {github_url}")
-
-            return {
-                "success": True,
-                "message": f"GitHub repository configured: {github_url}",
-                "remote_url": github_url,
-                "action": "updated" if existing_remote else "added",
-            }
-
-        except Exception as e:
-            self.logger.error(f"Error configuration GitHub: {e}")
-            return {
-                "success": False,
-                "error": str(e),
-                "message": "Error configuration GitHub repository",
-            }
+        return self._drive(self._setup_remote_ops(github_url))
 
     def create_backup_branch(self) -> Dict[str, Any]:
         """
@@ -518,57 +500,7 @@ node_modules/
         Returns:
             Результат Creating резервної branch
         """
-        try:
-            backup_branch_name = f"{self.config['backup_branch']}-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
-
-            # Creating нової branch
-            result = self._run_git_command(
-                ["git", "checkout", "-b", backup_branch_name]
-            )
-
-            if result is None:
-                return {
-                    "success": False,
-                    "message": "Error creating backup branch",
-                }
-
-            # commit поточного стану
-            if self.has_changes():
-                commit_result = self.commit_changes(
-                    "backup копія перед автоматичними змінами"
-                )
-                if not commit_result["success"]:
-                    return {
-                        "success": False,
-                        "message": "Error Creating резервного commit",
-                    }
-
-            # Повернення до основної branch
-            main_branch_result = self._run_git_command(
-                ["git", "checkout", self.config["main_branch"]]
-            )
-
-            if main_branch_result is None:
-                self.logger.warning(
-                    f"failed to повернутися до branch {self.config['main_branch']}"
-                )
-
-            self.logger.info(f"Backup branch created: {backup_branch_name}")
-
-            return {
-                "success": True,
-                "message": f"Backup branch created: {backup_branch_name}",
-                "backup_branch": backup_branch_name,
-                "current_branch": self.config["main_branch"],
-            }
-
-        except Exception as e:
-            self.logger.error(f"Error creating backup branch: {e}")
-            return {
-                "success": False,
-                "error": str(e),
-                "message": "Error creating backup branch",
-            }
+        return self._drive(self._backup_branch_ops())
 
     def sync_with_remote(self) -> Dict[str, Any]:
         """
@@ -577,42 +509,4 @@ node_modules/
         Returns:
             Результат synchronization
         """
-        try:
-            self.logger.info("Початок synchronization з віддаленим репозиторієм")
-
-            results = []
-
-            # 1. Receiving changes з remote repository
-            if self.config["auto_pull"]:
-                pull_result = self.pull_changes()
-                results.append(("pull", pull_result))
-
-            # 2. commit local changes
-            if self.has_changes() and self.config["auto_commit"]:
-                commit_result = self.commit_changes("Автоматична synchronization changes")
-                results.append(("commit", commit_result))
-
-            # 3. Sending changes
-            if self.config["auto_push"]:
-                push_result = self.push_changes()
-                results.append(("push", push_result))
-
-            # Аналіз результатів
-            all_successful = all(result[1]["success"] for result in results)
-
-            return {
-                "success": all_successful,
-                "message": "synchronization completed"
-                if all_successful
-                else "synchronization completed with errors",
-                "operations": results,
-                "timestamp": datetime.now().isoformat(),
-            }
-
-        except Exception as e:
-            self.logger.error(f"Synchronization error: {e}")
-            return {
-                "success": False,
-                "error": str(e),
-                "message": "critical Synchronization error",
-            }
+        return self._drive(self._sync_ops())
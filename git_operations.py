@@ -0,0 +1,446 @@
+"""
+Git operations shared by GitManager and AsyncGitManager
+
+Command sequences are generators: they yield a git command (list of
+arguments) and receive its output (None on error), or yield
+``HAS_CHANGES`` and receive a bool. Each manager drives them with its own
+command runner, so both managers issue the same commands and return the
+same result dicts.
+"""
+
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Generator, List, Optional, Tuple, Union
+
+# Request for the driver's has_changes() answer
+HAS_CHANGES = object()
+
+GitRequest = Union[List[str], object]
+GitOperation = Generator[GitRequest, Any, Dict[str, Any]]
+
+DEFAULT_CONFIG = {
+    "auto_commit": True,
+    "auto_push": True,
+    "auto_pull": True,
+    "commit_message_prefix": "🤖 NIMDA:",
+    "main_branch": "main",
+    "backup_branch": "nimda-backup",
+}
+
+REMOTE_URL_COMMAND = ["git", "config", "--get", "remote.origin.url"]
+
+
+def porcelain_status_command(extra_args: List[str]) -> List[str]:
+    """``git status --porcelain=v2 -z`` command without optional locks"""
+    return ["git", "--no-optional-locks", "status", "--porcelain=v2", "-z", *extra_args]
+
+
+class GitOperations:
+    """
+    Base for Git managers: status mapping and command sequences
+
+    Subclasses provide ``project_path``, ``logger``, ``config`` and
+    ``_fetch_state()``, and drive the ``_*_ops`` generators.
+    """
+
+    def _fetch_state(self) -> Tuple[Optional[datetime], int]:
+        """Last fetch time known to this manager and consecutive failures"""
+        raise NotImplementedError
+
+    def _git_dir(self) -> Optional[Path]:
+        """Git directory of the project (follows a "gitdir:" file)"""
+        git_path = self.project_path / ".git"
+        if git_path.is_dir():
+            return git_path
+        if git_path.is_file():
+            content = git_path.read_text(encoding="utf-8").strip()
+            if content.startswith("gitdir:"):
+                git_dir = Path(content[len("gitdir:") :].strip())
+                return git_dir if git_dir.is_absolute() else self.project_path / git_dir
+        return None
+
+    @staticmethod
+    def _parse_porcelain_status(output: str) -> Dict[str, Any]:
+        """Status fields from ``git status --porcelain=v2 --branch -z`` output"""
+        current_branch = ""
+        upstream = None
+        oid = None
+        ahead = behind = 0
+        staged_files = []
+        unstaged_files = []
+        untracked_files = []
+
+        records = iter(output.split("\0"))
+        for record in records:
+            if not record:
+                continue
+
+            kind = record[0]
+            if kind == "#":
+                key, _, value = record[2:].partition(" ")
+                if key == "branch.head":
+                    current_branch = "" if value == "(detached)" else value
+                elif key == "branch.oid":
+                    oid = None if value == "(initial)" else value
+                elif key == "branch.upstream":
+                    upstream = value
+                elif key == "branch.ab":
+                    ahead_text, _, behind_text = value.partition(" ")
+                    ahead = int(ahead_text.lstrip("+"))
+                    behind = int(behind_text.lstrip("-"))
+                continue
+
+            if kind == "?":
+                untracked_files.append(record[2:])
+                continue
+
+            if kind == "1":
+                fields = record.split(" ", 8)
+            elif kind == "2":
+                fields = record.split(" ", 9)
+                next(records, None)  # Шлях до перейменування
+            elif kind == "u":
+                fields = record.split(" ", 10)
+            else:
+                continue
+
+            xy, file_path = fields[1], fields[-1]
+            if xy[0] != ".":
+                staged_files.append(file_path)
+            if xy[1] != ".":
+                unstaged_files.append(file_path)
+
+        return {
+            "initialized": True,
+            "current_branch": current_branch,
+            "upstream": upstream,
+            "oid": oid,
+            "has_changes": bool(staged_files or unstaged_files or untracked_files),
+            "staged_files": staged_files,
+            "unstaged_files": unstaged_files,
+            "untracked_files": untracked_files,
+            "behind_count": behind,
+            "ahead_count": ahead,
+            "total_files": len(staged_files)
+            + len(unstaged_files)
+            + len(untracked_files),
+        }
+
+    def _with_fetch_state(
+        self, status: Dict[str, Any], git_dir: Path
+    ) -> Dict[str, Any]:
+        """Copy of a status with the current fetch state"""
+        result = {
+            key: list(value) if isinstance(value, list) else value
+            for key, value in status.items()
+        }
+
+        # FETCH_HEAD also covers fetches by other processes and managers
+        last_fetched_at, failures = self._fetch_state()
+        try:
+            fetch_head_time = datetime.fromtimestamp(
+                (git_dir / "FETCH_HEAD").stat().st_mtime
+            )
+            if last_fetched_at is None or fetch_head_time > last_fetched_at:
+                last_fetched_at = fetch_head_time
+        except OSError:
+            pass
+
+        result["last_fetched_at"] = (
+            last_fetched_at.isoformat() if last_fetched_at else None
+        )
+        result["fetch_failures"] = failures
+        return result
+
+    def _commit_ops(self, message: str, add_all: bool) -> GitOperation:
+        """Command sequence of commit_changes"""
+        try:
+            if not (yield HAS_CHANGES):
+                return {
+                    "success": True,
+                    "message": "No changes to commit",
+                    "commit_hash": None,
+                }
+
+            # Додавання files
+            if add_all:
+                yield ["git", "add", "."]
+
+            # Creating commit
+            full_message = f"{self.config['commit_message_prefix']} {message}"
+            result = yield ["git", "commit", "-m", full_message]
+
+            if result is None:
+                return {"success": False, "message": "Error creating commit"}
+
+            # Receiving хешу commit
+            commit_hash = yield ["git", "rev-parse", "HEAD"]
+
+            if commit_hash:
+                self.logger.info(f"Commit created: {commit_hash[:8]} - {full_message}")
+
+                # Автоматичний push якщо налаштовано
+                push_result = None
+                if self.config["auto_push"]:
+                    push_result = yield from self._push_ops(None)
+
+                return {
+                    "success": True,
+                    "message": f"Commit created: {commit_hash[:8]}",
+                    "commit_hash": commit_hash,
+                    "commit_message": full_message,
+                    "push_result": push_result,
+                }
+            else:
+                return {"success": False, "message": "Error Receiving хешу commit"}
+
+        except Exception as e:
+            self.logger.error(f"Error creating commit: {e}")
+            return {
+                "success": False,
+                "error": str(e),
+                "message": "Error creating commit",
+            }
+
+    def _push_ops(self, branch: Optional[str]) -> GitOperation:
+        """Command sequence of push_changes"""
+        try:
+            if not branch:
+                branch = yield ["git", "branch", "--show-current"]
+
+            if not branch:
+                return {
+                    "success": False,
+                    "message": "failed to визначити поточну гілку",
+                }
+
+            # Перевірка наявності remote repository
+            remote_url = yield REMOTE_URL_COMMAND
+            if not remote_url:
+                self.logger.warning("Remote repository not configured - skipping push")
+                return {
+                    "success": True,
+                    "skipped": True,
+                    "message": "Remote repository not configured, skipping push",
+                }
+
+            # Push changes
+            result = yield ["git", "push", "origin", branch]
+
+            if result is None:
+                return {"success": False, "message": "Error pushing changes"}
+
+            self.logger.info(f"Changes pushed to remote repository: {branch}")
+
+            return {
+                "success": True,
+                "message": f"changes відправлено до branch {branch}",
+                "branch": branch,
+                "remote_url": remote_url,
+            }
+
+        except Exception as e:
+            self.logger.error(f"Error pushing changes: {e}")
+            return {
+                "success": False,
+                "error": str(e),
+                "message": "Error pushing changes до remote repository",
+            }
+
+    def _pull_ops(self) -> GitOperation:
+        """Command sequence of pull_changes"""
+        try:
+            # Перевірка наявності remote repository
+            remote_url = yield REMOTE_URL_COMMAND
+            if not remote_url:
+                return {
+                    "success": False,
+                    "message": "remote repository not configured",
+                }
+
+            # Saving local changes перед pull
+            stashed = False
+            if (yield HAS_CHANGES):
+                stash_result = yield [
+                    "git",
+                    "stash",
+                    "push",
+                    "-m",
+                    "NIMDA auto-stash before pull",
+                ]
+                if stash_result is None:
+                    return {
+                        "success": False,
+                        "message": "Error Saving local changes",
+                    }
+                stashed = True
+
+            # Pull changes
+            result = yield ["git", "pull", "origin"]
+
+            if result is None:
+                return {"success": False, "message": "Error pulling changes"}
+
+            # Відновлення local changes якщо були
+            if stashed:
+                stash_pop_result = yield ["git", "stash", "pop"]
+                if stash_pop_result is None:
+                    self.logger.warning("failed to відновити local changes після pull")
+
+            self.logger.info("Changes pulled from remote repository")
+
+            return {
+                "success": True,
+                "message": "Changes successfully received",
+                "pull_output": result,
+                "remote_url": remote_url,
+            }
+
+        except Exception as e:
+            self.logger.error(f"Error pulling changes: {e}")
+            return {
+                "success": False,
+                "error": str(e),
+                "message": "Error pulling changes з remote repository",
+            }
+
+    def _setup_remote_ops(self, github_url: str) -> GitOperation:
+        """Command sequence of setup_github_remote"""
+        try:
+            # Перевірка існуючого remote
+            existing_remote = yield REMOTE_URL_COMMAND
+
+            if existing_remote:
+                # Updating існуючого remote
+                result = yield ["git", "remote", "set-url", "origin", github_url]
+            else:
+                # Додавання нового remote
+                result = yield ["git", "remote", "add", "origin", github_url]
+
+            if result is None:
+                return {
+                    "success": False,
+                    "message": "Error setting up remote repository",
+                }
+
+            # Перевірка з'єднання
+            test_result = yield ["git", "ls-remote", "origin"]
+
+            if test_result is None:
+                return {
+                    "success": False,
+                    "message": "failed to підключитися до remote repository",
+                }
+
+            self.logger.info(f"Remote repository configured: {github_url}")
+
+            return {
+                "success": True,
+                "message": f"GitHub repository configured: {github_url}",
+                "remote_url": github_url,
+                "action": "updated" if existing_remote else "added",
+            }
+
+        except Exception as e:
+            self.logger.error(f"Error configuration GitHub: {e}")
+            return {
+                "success": False,
+                "error": str(e),
+                "message": "Error configuration GitHub repository",
+            }
+
+    def _backup_branch_ops(self) -> GitOperation:
+        """Command sequence of create_backup_branch"""
+        try:
+            backup_branch_name = f"{self.config['backup_branch']}-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
+
+            # Creating нової branch
+            result = yield ["git", "checkout", "-b", backup_branch_name]
+
+            if result is None:
+                return {
+                    "success": False,
+                    "message": "Error creating backup branch",
+                }
+
+            # commit поточного стану
+            if (yield HAS_CHANGES):
+                commit_result = yield from self._commit_ops(
+                    "backup копія перед автоматичними змінами", True
+                )
+                if not commit_result["success"]:
+                    return {
+                        "success": False,
+                        "message": "Error Creating резервного commit",
+                    }
+
+            # Повернення до основної branch
+            main_branch_result = yield ["git", "checkout", self.config["main_branch"]]
+
+            if main_branch_result is None:
+                self.logger.warning(
+                    f"failed to повернутися до branch {self.config['main_branch']}"
+                )
+
+            self.logger.info(f"Backup branch created: {backup_branch_name}")
+
+            return {
+                "success": True,
+                "message": f"Backup branch created: {backup_branch_name}",
+                "backup_branch": backup_branch_name,
+                "current_branch": self.config["main_branch"],
+            }
+
+        except Exception as e:
+            self.logger.error(f"Error creating backup branch: {e}")
+            return {
+                "success": False,
+                "error": str(e),
+                "message": "Error creating backup branch",
+            }
+
+    def _sync_ops(self) -> GitOperation:
+        """Command sequence of sync_with_remote"""
+        try:
+            self.logger.info("Початок synchronization з віддаленим репозиторієм")
+
+            results = []
+
+            # 1. Receiving changes з remote repository
+            if self.config["auto_pull"]:
+                pull_result = yield from self._pull_ops()
+                results.append(("pull", pull_result))
+
+            # 2. commit local changes
+            if self.config["auto_commit"] and (yield HAS_CHANGES):
+                commit_result = yield from self._commit_ops(
+                    "Автоматична synchronization changes", True
+                )
+                results.append(("commit", commit_result))
+
+            # 3. Sending changes
+            if self.config["auto_push"]:
+                push_result = yield from self._push_ops(None)
+                results.append(("push", push_result))
+
+            # Аналіз результатів
+            all_successful = all(result[1]["success"] for result in results)
+
+            return {
+                "success": all_successful,
+                "message": (
+                    "synchronization completed"
+                    if all_successful
+                    else "synchronization completed with errors"
+                ),
+                "operations": results,
+                "timestamp": datetime.now().isoformat(),
+            }
+
+        except Exception as e:
+            self.logger.error(f"Synchronization error: {e}")
+            return {
+                "success": False,
+                "error": str(e),
+                "message": "critical Synchronization error",
+            }
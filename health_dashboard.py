@@ -9,12 +9,14 @@ import json
 import logging
 import socketserver
 import subprocess
+import threading
 import time
 import webbrowser
-from dataclasses import asdict, dataclass
+from concurrent.futures import Future, wait
+from dataclasses import asdict, dataclass, replace
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 # Setup logging
 logging.basicConfig(
@@ -33,6 +35,7 @@ class ComponentHealth:
     response_time_ms: float
     error_message: Optional[str] = None
     details: Optional[Dict[str, Any]] = None
+    stale: bool = False  # Cached result older than its TTL, refresh pending
 
 
 @dataclass
@@ -51,11 +54,170 @@ class SystemMetrics:
     uptime_hours: float
 
 
+# Seconds a check result is reused before the check runs again
+CHECK_TTLS = {
+    "git": 15.0,
+    "queue": 30.0,
+    "backup": 300.0,
+    "performance": 10.0,
+    "network": 60.0,
+}
+
+CHECK_NAMES = {
+    "git": "Git Repository",
+    "queue": "Offline Queue",
+    "backup": "Backup System",
+    "performance": "Performance Monitor",
+    "network": "Network Connectivity",
+}
+
+
 class HealthChecker:
     """Checks health of NIMDA components"""
 
-    def __init__(self):
+    def __init__(
+        self,
+        deadline: float = 10.0,
+        ttls: Optional[Dict[str, float]] = None,
+    ):
+        """
+        Args:
+            deadline: Seconds run_checks waits for checks without a cached result
+            ttls: Per-check result TTLs overriding CHECK_TTLS
+        """
         self.start_time = datetime.now()
+        self.deadline = deadline
+        self.ttls = {**CHECK_TTLS, **(ttls or {})}
+
+        self._lock = threading.Lock()
+        self._results: Dict[str, ComponentHealth] = {}
+        self._result_times: Dict[str, float] = {}
+        self._in_flight: Dict[str, Future] = {}
+        self._components: Dict[str, Any] = {}
+
+    def _checks(self) -> Dict[str, Callable[[], ComponentHealth]]:
+        """Check functions by key, in dashboard order"""
+        return {
+            "git": self.check_git_health,
+            "queue": self.check_queue_health,
+            "backup": self.check_backup_health,
+            "performance": self.check_performance_health,
+            "network": self.check_network_health,
+        }
+
+    def run_checks(self, deadline: Optional[float] = None) -> List[ComponentHealth]:
+        """
+        Run all checks concurrently under a shared deadline
+
+        Fresh cached results are reused. An expired result is returned marked
+        stale while the check refreshes in the background. Checks without any
+        result are waited for until the deadline; those still running then
+        are reported as "unknown" and fill the cache when they finish.
+
+        Args:
+            deadline: Seconds to wait (default: self.deadline)
+
+        Returns:
+            Component health in dashboard order
+        """
+        deadline = self.deadline if deadline is None else deadline
+        checks = self._checks()
+        now = time.monotonic()
+        results: Dict[str, ComponentHealth] = {}
+        pending: Dict[str, Future] = {}
+
+        with self._lock:
+            for key, check in checks.items():
+                cached = self._results.get(key)
+                if cached and now - self._result_times[key] < self.ttls[key]:
+                    results[key] = cached
+                    continue
+
+                future = self._in_flight.get(key)
+                if future is None:
+                    future = self._submit(key, check)
+
+                if cached:
+                    results[key] = replace(cached, stale=True)
+                else:
+                    pending[key] = future
+
+        if pending:
+            wait(list(pending.values()), timeout=deadline)
+
+        for key, future in pending.items():
+            if future.done():
+                results[key] = future.result()
+            else:
+                results[key] = ComponentHealth(
+                    name=CHECK_NAMES[key],
+                    status="unknown",
+                    last_check=datetime.now().isoformat(),
+                    response_time_ms=deadline * 1000,
+                    error_message=f"Check still running after {deadline:.1f}s",
+                )
+
+        return [results[key] for key in checks]
+
+    def invalidate(self, key: Optional[str] = None):
+        """
+        Drop cached check results
+
+        Args:
+            key: Check key (None - all checks)
+        """
+        with self._lock:
+            if key is None:
+                self._results.clear()
+                self._result_times.clear()
+            else:
+                self._results.pop(key, None)
+                self._result_times.pop(key, None)
+
+    def shutdown(self):
+        """Forget running checks (their daemon threads never block exit)"""
+        with self._lock:
+            self._in_flight.clear()
+
+    def _submit(self, key: str, check: Callable[[], ComponentHealth]) -> Future:
+        """
+        Start a check in a daemon thread (caller holds the lock)
+
+        At most one thread runs per check key. Daemon threads let a one-shot
+        run exit at its deadline even while a check is hung (a
+        ThreadPoolExecutor joins its workers at interpreter exit).
+        """
+        future: Future = Future()
+        future.set_running_or_notify_cancel()
+
+        def run():
+            try:
+                result = check()
+            except Exception as e:
+                result = ComponentHealth(
+                    name=CHECK_NAMES[key],
+                    status="critical",
+                    last_check=datetime.now().isoformat(),
+                    response_time_ms=0.0,
+                    error_message=str(e),
+                )
+            with self._lock:
+                self._results[key] = result
+                self._result_times[key] = time.monotonic()
+                if self._in_flight.get(key) is future:
+                    del self._in_flight[key]
+            future.set_result(result)
+
+        self._in_flight[key] = future
+        threading.Thread(target=run, name=f"HealthCheck-{key}", daemon=True).start()
+        return future
+
+    def _component(self, key: str, factory: Callable[[], Any]) -> Any:
+        """Component instance reused across checks"""
+        component = self._components.get(key)
+        if component is None:
+            component = self._components[key] = factory()
+        return component
 
     def check_git_health(self) -> ComponentHealth:
         """Check Git repository health"""
@@ -108,7 +270,9 @@ class HealthChecker:
         try:
             from offline_queue import OfflineQueue
 
-            queue = OfflineQueue()
+            queue = self._component("queue", OfflineQueue)
+            # Re-read the queue only after another process changes it
+            queue.reload_if_changed()
             status = queue.get_queue_stats()
 
             response_time = (time.time() - start_time) * 1000
@@ -149,7 +313,7 @@ class HealthChecker:
         try:
             from backup_rotation import BackupManager
 
-            backup_manager = BackupManager()
+            backup_manager = self._component("backup", BackupManager)
             backups = backup_manager.list_backups()
 
             response_time = (time.time() - start_time) * 1000
@@ -207,7 +371,7 @@ class HealthChecker:
         try:
             from performance_monitor import PerformanceMonitor
 
-            monitor = PerformanceMonitor()
+            monitor = self._component("performance", PerformanceMonitor)
             metrics = monitor.get_current_metrics()
 
             response_time = (time.time() - start_time) * 1000
@@ -283,20 +447,14 @@ class HealthDashboard:
 
     def __init__(self, port: int = 8080):
         self.port = port
-        self.checker = HealthChecker()
+        self.checker = get_health_checker()
         self.dashboard_dir = Path(".nimda_dashboard")
         self.dashboard_dir.mkdir(exist_ok=True)
 
     def generate_html_dashboard(self) -> str:
         """Generate HTML dashboard"""
         # Get health status for all components
-        components = [
-            self.checker.check_git_health(),
-            self.checker.check_queue_health(),
-            self.checker.check_backup_health(),
-            self.checker.check_performance_health(),
-            self.checker.check_network_health(),
-        ]
+        components = self.checker.run_checks()
 
         # Count statuses
         healthy = len([c for c in components if c.status == "healthy"])
@@ -326,6 +484,7 @@ class HealthDashboard:
         .status.healthy {{ background: #27ae60; }}
         .status.warning {{ background: #f39c12; }}
         .status.critical {{ background: #e74c3c; }}
+        .status.unknown {{ background: #7f8c8d; }}
         .details {{ color: #666; font-size: 14px; }}
         .refresh {{ position: fixed; bottom: 20px; right: 20px; background: #3498db; color: white; padding: 10px 20px; border: none; border-radius: 20px; cursor: pointer; }}
         .timestamp {{ color: #7f8c8d; font-size: 12px; }}
@@ -424,23 +583,28 @@ class HealthDashboard:
             print(f"❌ Error starting dashboard: {e}")
 
 
-def run_health_check() -> Dict[str, Any]:
-    """Run complete health check and return results"""
-    checker = HealthChecker()
+_default_checker: Optional[HealthChecker] = None
+_default_checker_lock = threading.Lock()
+
+
+def get_health_checker() -> HealthChecker:
+    """Process-wide HealthChecker, so repeated checks share cached results"""
+    global _default_checker
+    with _default_checker_lock:
+        if _default_checker is None:
+            _default_checker = HealthChecker()
+        return _default_checker
 
-    components = [
-        checker.check_git_health(),
-        checker.check_queue_health(),
-        checker.check_backup_health(),
-        checker.check_performance_health(),
-        checker.check_network_health(),
-    ]
 
-    # Calculate overall health
+def run_health_check(deadline: Optional[float] = None) -> Dict[str, Any]:
+    """Run complete health check and return results"""
+    components = get_health_checker().run_checks(deadline)
+
+    # Calculate overall health (a check that missed the deadline is a warning)
     statuses = [c.status for c in components]
     if "critical" in statuses:
         overall_status = "critical"
-    elif "warning" in statuses:
+    elif "warning" in statuses or "unknown" in statuses:
         overall_status = "warning"
     else:
         overall_status = "healthy"
@@ -452,6 +616,8 @@ def run_health_check() -> Dict[str, Any]:
             "healthy": len([s for s in statuses if s == "healthy"]),
             "warning": len([s for s in statuses if s == "warning"]),
             "critical": len([s for s in statuses if s == "critical"]),
+            "unknown": len([s for s in statuses if s == "unknown"]),
+            "stale": len([c for c in components if c.stale]),
             "total": len(components),
         },
         "timestamp": datetime.now().isoformat(),
@@ -477,6 +643,8 @@ def main():
         print(f"✅ Healthy: {results['summary']['healthy']}")
         print(f"⚠️  Warning: {results['summary']['warning']}")
         print(f"❌ Critical: {results['summary']['critical']}")
+        if results["summary"]["unknown"]:
+            print(f"❓ Unknown: {results['summary']['unknown']}")
 
         print("\n📋 Component Details:")
         for component in results["components"]:
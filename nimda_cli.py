@@ -5,6 +5,7 @@ Provides easy-to-use commands for all NIMDA operations
 """
 
 import argparse
+import asyncio
 import logging
 import shutil
 import subprocess
@@ -55,7 +56,8 @@ class NIMDACLI:
         # Initialize components
         try:
             self.agent = NIMDAAgent(str(self.project_path))
-            self.git_manager = GitManager(self.project_path)
+            # One-shot commands: no background fetch, status uses last known refs
+            self.git_manager = GitManager(self.project_path, fetch_interval=None)
             self.dev_plan_manager = DevPlanManager(self.project_path)
             self.changelog_manager = ChangelogManager(self.project_path)
             self.offline_queue = OfflineQueue()
@@ -128,6 +130,8 @@ class NIMDACLI:
                     self.print_warning(f"Behind remote by {behind} commits")
                 if ahead > 0:
                     self.print_info(f"Ahead of remote by {ahead} commits")
+                last_fetched = git_status.get("last_fetched_at")
+                print(f"  • Last fetch: {last_fetched or 'never'}")
             else:
                 self.print_warning("Git repository not initialized")
 
@@ -490,6 +494,52 @@ class NIMDACLI:
 
         return 0
 
+    def cmd_plugins(self, args):
+        """Plugin operations"""
+        from plugins.plugin_manager import PluginManager
+
+        # The manifest is written only in lazy mode, so "warm" always uses it
+        refresh = args.plugins_action == "warm"
+        manager = PluginManager(
+            plugins_dir=str(Path(__file__).parent / "plugins"),
+            lazy_loading=refresh or not args.eager,
+        )
+
+        async def run():
+            try:
+                await manager.load_plugins()
+            finally:
+                await manager.shutdown()
+
+        if refresh:
+            self.print_header("🔥 Refreshing plugin manifest")
+        else:
+            self.print_header("🧩 Plugins")
+
+        try:
+            asyncio.run(run())
+        except Exception as e:
+            self.print_error(f"Plugins error: {e}")
+            return 1
+
+        print(f"\n🧩 Loaded: {len(manager.plugins)}")
+        for name in sorted(manager.plugins):
+            print(f"  • {name}")
+
+        if manager.pending_plugin_files:
+            print(f"\n💤 Deferred: {len(manager.pending_plugin_files)}")
+            for plugin_file, task_types in sorted(manager.pending_plugin_files.items()):
+                print(f"  • {plugin_file.name}: {len(task_types)} task types")
+
+        if refresh:
+            self.print_success(f"Plugin manifest refreshed: {manager.manifest_path}")
+            self.print_info(
+                "Plugins stay warm only in a running process: "
+                "use 'run_plugin_system.py --warm-plugins' to import them on startup"
+            )
+
+        return 0
+
     def cmd_doctor(self, args):
         """Health check and diagnostics"""
         self.print_header("🩺 NIMDA Health Check")
@@ -543,7 +593,7 @@ class NIMDACLI:
 
         # Check network connectivity
         print("\n🌐 Checking network connectivity...")
-        network_online = self.offline_queue.network_monitor.is_online()
+        network_online = self.offline_queue.network_monitor.check_now()
         if network_online:
             self.print_success("Network connectivity OK")
         else:
@@ -624,6 +674,7 @@ Examples:
   nimda plan show               # Show development plan
   nimda plan execute 5          # Execute task number 5
   nimda backup create --type git # Create Git bundle backup
+  nimda plugins warm            # Refresh the plugin manifest cache
   nimda doctor --fix            # Run health check with auto-fix
         """,
     )
@@ -735,6 +786,21 @@ Examples:
 
     changelog_subparsers.add_parser("stats", help="Show changelog statistics")
 
+    # Plugins command
+    plugins_parser = subparsers.add_parser("plugins", help="Plugin operations")
+    plugins_parser.add_argument(
+        "--eager", action="store_true", help="Import all plugins on startup"
+    )
+    plugins_subparsers = plugins_parser.add_subparsers(
+        dest="plugins_action", help="Plugin actions"
+    )
+
+    plugins_subparsers.add_parser("list", help="List loaded and deferred plugins")
+
+    plugins_subparsers.add_parser(
+        "warm", help="Re-analyze plugin files and refresh the manifest cache"
+    )
+
     # Doctor command
     doctor_parser = subparsers.add_parser("doctor", help="Health check and diagnostics")
     doctor_parser.add_argument(
@@ -783,6 +849,7 @@ def main():
             "backup": cli.cmd_backup,
             "queue": cli.cmd_queue,
             "changelog": cli.cmd_changelog,
+            "plugins": cli.cmd_plugins,
             "doctor": cli.cmd_doctor,
         }
 
@@ -4,12 +4,22 @@
 """
 
 import asyncio
+import os
 import re
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
 
 from .base_plugin import BasePlugin, PluginResult
+from .workspace_token_index import WorkspaceTokenIndex
+
+# Розширення файлів, у яких шукаються докази реалізації
+PYTHON_SUFFIXES = (".py",)
+SCRIPT_SUFFIXES = (".js", ".ts")
+CONFIG_SUFFIXES = (".json", ".yaml", ".yml", ".toml")
 
 
 @dataclass
@@ -22,6 +32,7 @@ class TaskCheckResult:
     needs_update: bool  # Чи потрібно оновити
     evidence: List[str]  # Докази реалізації
     confidence: float  # Впевненість у результаті (0-100%)
+    line_number: Optional[int] = None  # Рядок задачі у DEV_PLAN
 
 
 class DevPlanValidatorPlugin(BasePlugin):
@@ -32,12 +43,27 @@ class DevPlanValidatorPlugin(BasePlugin):
     Автоматично корегує галочки при необхідності.
     """
 
-    def __init__(self, name: str = "DEV_PLAN Validator", *, workspace_path=None):
+    def __init__(
+        self,
+        name: str = "DEV_PLAN Validator",
+        *,
+        workspace_path=None,
+        max_workers: Optional[int] = None,
+    ):
         super().__init__(name)
         self.workspace_path = Path(workspace_path) if workspace_path else Path.cwd()
         self.dev_plan_path = self.workspace_path / "DEV_PLAN.md"
         self.plugin_name = "DEV_PLAN Validator"
 
+        # Паралельна валідація: 1 - послідовний режим
+        self.max_workers = max(1, max_workers or min(8, os.cpu_count() or 1))
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+        # Інвертований індекс файлів, оновлюється на початку кожної валідації
+        self.token_index = WorkspaceTokenIndex(
+            self.workspace_path, PYTHON_SUFFIXES + SCRIPT_SUFFIXES + CONFIG_SUFFIXES
+        )
+
         # Ключові слова для пошуку реалізації
         self.implementation_keywords = {
             # GUI компоненти
@@ -62,11 +88,24 @@ class DevPlanValidatorPlugin(BasePlugin):
             "database": ["database", "db", "storage", "persistence"],
         }
 
+    async def execute(
+        self, task: Dict[str, Any], context: Optional[Dict] = None
+    ) -> PluginResult:
+        """Виконання завдання плагіна"""
+        return await self.execute_task(task)
+
     async def execute_task(self, task: Dict[str, Any]) -> PluginResult:
         """Виконання валідації DEV_PLAN"""
         try:
             self.logger.info("🔍 Початок валідації DEV_PLAN.md...")
 
+            # Індекс будується один раз і далі оновлюється лише для змінених файлів
+            changes = await self._run_blocking(self.token_index.refresh)
+            self.logger.info(
+                f"🗂️ Індекс оновлено: +{changes['added']} ~{changes['updated']} "
+                f"-{changes['removed']} файлів"
+            )
+
             # 1. Парсинг DEV_PLAN.md
             tasks_data = await self._parse_dev_plan()
             if not tasks_data:
@@ -74,12 +113,15 @@ class DevPlanValidatorPlugin(BasePlugin):
                     success=False, message="❌ Не вдалося прочитати DEV_PLAN.md"
                 )
 
-            # 2. Аналіз кожної задачі
+            # 2. Аналіз задач (паралельно, результати в порядку плану)
+            max_workers = task.get("max_workers", self.max_workers)
             validation_results = []
-            for task_info in tasks_data:
-                result = await self._validate_task(task_info)
+            async for result in self.validate_tasks(tasks_data, max_workers):
                 validation_results.append(result)
-                await asyncio.sleep(0.01)  # Невелика пауза
+                self.update_progress(
+                    len(validation_results) / len(tasks_data),
+                    f"Перевірено {len(validation_results)}/{len(tasks_data)}",
+                )
 
             # 3. Підрахунок статистики
             total_tasks = len(validation_results)
@@ -115,6 +157,52 @@ class DevPlanValidatorPlugin(BasePlugin):
                 success=False, message=f"❌ Помилка валідації: {e}", error=e
             )
 
+    async def validate_tasks(
+        self, tasks_data: List[Dict[str, Any]], max_workers: Optional[int] = None
+    ) -> AsyncIterator[TaskCheckResult]:
+        """
+        Паралельна валідація задач з видачею результатів у порядку плану
+
+        Args:
+            tasks_data: Задачі з DEV_PLAN
+            max_workers: Максимальна кількість одночасних перевірок
+
+        Yields:
+            TaskCheckResult: Результати у порядку задач
+        """
+        semaphore = asyncio.Semaphore(max(1, max_workers or self.max_workers))
+
+        async def validate_with_limit(task_info: Dict[str, Any]) -> TaskCheckResult:
+            async with semaphore:
+                return await self._validate_task(task_info)
+
+        pending = [
+            asyncio.ensure_future(validate_with_limit(task_info))
+            for task_info in tasks_data
+        ]
+        try:
+            for future in pending:
+                yield await future
+        finally:
+            for future in pending:
+                future.cancel()
+
+    async def _run_blocking(self, func: Callable, *args) -> Any:
+        """Виконання блокуючої операції в пулі потоків"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="DevPlanValidator"
+            )
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(func, *args))
+
+    async def cleanup(self) -> bool:
+        """Зупинка пулу потоків"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        return True
+
     async def _parse_dev_plan(self) -> List[Dict[str, Any]]:
         """Парсинг DEV_PLAN.md та витягування задач"""
         try:
@@ -122,7 +210,7 @@ class DevPlanValidatorPlugin(BasePlugin):
                 self.logger.error("DEV_PLAN.md не знайдено")
                 return []
 
-            content = self.dev_plan_path.read_text(encoding="utf-8")
+            content = await self._run_blocking(self.dev_plan_path.read_text, "utf-8")
             tasks = []
 
             # Регекс для пошуку задач з чекбоксами
@@ -159,7 +247,7 @@ class DevPlanValidatorPlugin(BasePlugin):
         task_name = task_info["task_name"]
         current_status = task_info["is_completed"]
 
-        # Пошук доказів реалізації
+        # Пошук доказів реалізації (у пулі потоків)
         evidence = await self._find_implementation_evidence(
             task_name, task_info["description"]
         )
@@ -180,79 +268,69 @@ class DevPlanValidatorPlugin(BasePlugin):
             needs_update=needs_update,
             evidence=evidence,
             confidence=confidence,
+            line_number=task_info.get("line_number"),
         )
 
     async def _find_implementation_evidence(
         self, task_name: str, description: str
     ) -> List[str]:
         """Пошук доказів реалізації задачі в коді"""
+        return await self._run_blocking(
+            self._collect_implementation_evidence, task_name, description
+        )
+
+    def _collect_implementation_evidence(
+        self, task_name: str, description: str
+    ) -> List[str]:
+        """Пошук доказів реалізації за індексом (блокуюча частина)"""
         evidence = []
 
         # Ключові слова для пошуку
         search_terms = self._extract_search_terms(task_name, description)
 
+        # Входження кожного терміна за індексом: файл -> перший рядок
+        self.token_index.ensure_built()
+        term_hits = [(term, self.token_index.find_term(term)) for term in search_terms]
+
         # Пошук у Python файлах
-        python_files = list(self.workspace_path.glob("**/*.py"))
-        for py_file in python_files:
-            try:
-                content = py_file.read_text(encoding="utf-8").lower()
-
-                for term in search_terms:
-                    if term.lower() in content:
-                        # Знаходимо контекст
-                        lines = content.split("\n")
-                        for i, line in enumerate(lines):
-                            if term.lower() in line:
-                                context = self._get_line_context(lines, i, 2)
-                                evidence.append(f"{py_file.name}:{i + 1} - {context}")
-                                break
-
-                        if len(evidence) >= 10:  # Обмежуємо кількість доказів
-                            break
-
-            except Exception:
-                continue
+        for py_file in self._files_with_hits(term_hits, PYTHON_SUFFIXES):
+            for term, hits in term_hits:
+                if py_file in hits:
+                    # Знаходимо контекст
+                    lines = self.token_index.get_lines(py_file)
+                    line_index = hits[py_file]
+                    context = self._get_line_context(lines, line_index, 2)
+                    evidence.append(f"{py_file.name}:{line_index + 1} - {context}")
+
+                    if len(evidence) >= 10:  # Обмежуємо кількість доказів
+                        break
 
         # Пошук у JS/TS файлах (для GUI)
-        js_files = list(self.workspace_path.glob("**/*.js")) + list(
-            self.workspace_path.glob("**/*.ts")
-        )
-        for js_file in js_files:
-            try:
-                content = js_file.read_text(encoding="utf-8").lower()
-
-                for term in search_terms:
-                    if term.lower() in content:
-                        evidence.append(f"{js_file.name} - містить '{term}'")
-                        if len(evidence) >= 15:
-                            break
-
-            except Exception:
-                continue
+        for js_file in self._files_with_hits(term_hits, SCRIPT_SUFFIXES):
+            for term, hits in term_hits:
+                if js_file in hits:
+                    evidence.append(f"{js_file.name} - містить '{term}'")
+                    if len(evidence) >= 15:
+                        break
 
         # Пошук у конфігураційних файлах
-        config_files = (
-            list(self.workspace_path.glob("**/*.json"))
-            + list(self.workspace_path.glob("**/*.yaml"))
-            + list(self.workspace_path.glob("**/*.yml"))
-            + list(self.workspace_path.glob("**/*.toml"))
-        )
-
-        for config_file in config_files:
-            try:
-                content = config_file.read_text(encoding="utf-8").lower()
-
-                for term in search_terms:
-                    if term.lower() in content:
-                        evidence.append(
-                            f"{config_file.name} - конфігурація для '{term}'"
-                        )
-
-            except Exception:
-                continue
+        for config_file in self._files_with_hits(term_hits, CONFIG_SUFFIXES):
+            for term, hits in term_hits:
+                if config_file in hits:
+                    evidence.append(f"{config_file.name} - конфігурація для '{term}'")
 
         return evidence
 
+    def _files_with_hits(
+        self, term_hits: List[Tuple[str, Dict[Path, int]]], suffixes: Tuple[str, ...]
+    ) -> List[Path]:
+        """Файли з входженнями хоча б одного терміна, у порядку розширень"""
+        paths = {path for _, hits in term_hits for path in hits}
+        return sorted(
+            (path for path in paths if path.suffix in suffixes),
+            key=lambda path: (suffixes.index(path.suffix), path),
+        )
+
     def _extract_search_terms(self, task_name: str, description: str) -> List[str]:
         """Витягування ключових слів для пошуку"""
         terms = []
@@ -325,46 +403,67 @@ class DevPlanValidatorPlugin(BasePlugin):
         return min(max(total_score, 0), 100)  # Обмежуємо 0-100%
 
     async def _update_dev_plan(self, updates: List[TaskCheckResult]) -> int:
-        """Оновлення DEV_PLAN.md з новими відмітками"""
+        """Оновлення DEV_PLAN.md з новими відмітками (один атомарний запис)"""
         try:
-            content = self.dev_plan_path.read_text(encoding="utf-8")
-            lines = content.split("\n")
-            updated_count = 0
-
-            for update in updates:
-                # Знаходимо рядок для оновлення
-                for i, line in enumerate(lines):
-                    if update.task_name in line:
-                        # Оновлюємо чекбокс
-                        if update.actual_status:
-                            # Ставимо галочку
-                            new_line = re.sub(r"\[\s*\]", "[x]", line)
-                        else:
-                            # Знімаємо галочку
-                            new_line = re.sub(
-                                r"\[x\]", "[ ]", line, flags=re.IGNORECASE
-                            )
-
-                        if new_line != line:
-                            lines[i] = new_line
-                            updated_count += 1
-                            self.logger.info(
-                                f"✅ Оновлено: {update.task_name} -> {'[x]' if update.actual_status else '[ ]'}"
-                            )
-                        break
-
-            # Зберігаємо оновлений файл
-            if updated_count > 0:
-                updated_content = "\n".join(lines)
-                self.dev_plan_path.write_text(updated_content, encoding="utf-8")
-                self.logger.info(f"💾 Збережено {updated_count} оновлень у DEV_PLAN.md")
-
-            return updated_count
+            return await self._run_blocking(self._apply_checkbox_updates, updates)
 
         except Exception as e:
             self.logger.error(f"Помилка оновлення DEV_PLAN: {e}")
             return 0
 
+    def _apply_checkbox_updates(self, updates: List[TaskCheckResult]) -> int:
+        """Застосування всіх змін відміток та атомарний перезапис файлу"""
+        content = self.dev_plan_path.read_text(encoding="utf-8")
+        lines = content.split("\n")
+        updated_count = 0
+
+        for update in updates:
+            # Рядок задачі за номером, якщо файл не зсунувся, інакше - пошуком
+            index = None
+            if update.line_number and update.line_number <= len(lines):
+                if update.task_name in lines[update.line_number - 1]:
+                    index = update.line_number - 1
+            if index is None:
+                index = next(
+                    (i for i, line in enumerate(lines) if update.task_name in line),
+                    None,
+                )
+            if index is None:
+                continue
+
+            line = lines[index]
+            # Оновлюємо чекбокс
+            if update.actual_status:
+                # Ставимо галочку
+                new_line = re.sub(r"\[\s*\]", "[x]", line)
+            else:
+                # Знімаємо галочку
+                new_line = re.sub(r"\[x\]", "[ ]", line, flags=re.IGNORECASE)
+
+            if new_line != line:
+                lines[index] = new_line
+                updated_count += 1
+                self.logger.info(
+                    f"✅ Оновлено: {update.task_name} -> {'[x]' if update.actual_status else '[ ]'}"
+                )
+
+        # Зберігаємо оновлений файл через тимчасовий файл та заміну
+        if updated_count > 0:
+            fd, temp_name = tempfile.mkstemp(
+                dir=self.dev_plan_path.parent, prefix=".DEV_PLAN.", suffix=".tmp"
+            )
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as temp_file:
+                    temp_file.write("\n".join(lines))
+                os.chmod(temp_name, self.dev_plan_path.stat().st_mode & 0o777)
+                os.replace(temp_name, self.dev_plan_path)
+            except BaseException:
+                Path(temp_name).unlink(missing_ok=True)
+                raise
+            self.logger.info(f"💾 Збережено {updated_count} оновлень у DEV_PLAN.md")
+
+        return updated_count
+
     def _generate_validation_report(
         self, results: List[TaskCheckResult]
     ) -> Dict[str, Any]:
@@ -388,9 +487,9 @@ class DevPlanValidatorPlugin(BasePlugin):
                 "marked_completed": completed,
                 "actually_completed": actually_completed,
                 "needs_update": needs_update,
-                "accuracy_percentage": round((total - needs_update) / total * 100, 1)
-                if total > 0
-                else 0,
+                "accuracy_percentage": (
+                    round((total - needs_update) / total * 100, 1) if total > 0 else 0
+                ),
             },
             "confidence_distribution": {
                 "high_confidence": len(high_confidence),
@@ -409,9 +508,9 @@ class DevPlanValidatorPlugin(BasePlugin):
                 {
                     "task": result.task_name,
                     "marked_as": "completed" if result.current_status else "incomplete",
-                    "actually_is": "completed"
-                    if result.actual_status
-                    else "incomplete",
+                    "actually_is": (
+                        "completed" if result.actual_status else "incomplete"
+                    ),
                     "confidence": round(result.confidence, 1),
                     "evidence_sample": result.evidence[:3],
                 }
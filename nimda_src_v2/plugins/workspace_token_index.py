@@ -0,0 +1,283 @@
+"""
+Інвертований індекс токенів робочого простору
+Слова та ідентифікатори -> (файл, рядок) з інкрементним оновленням за mtime
+"""
+
+import os
+import re
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+
+@dataclass
+class IndexedDocument:
+    """Проіндексований файл"""
+
+    path: Path
+    mtime_ns: int
+    size: int
+    lines: Optional[List[str]] = None  # Рядки у нижньому регістрі
+    tokens: Set[str] = field(default_factory=set)
+
+
+class WorkspaceTokenIndex:
+    """
+    Інвертований індекс файлів робочого простору
+
+    Кожен токен (максимальна послідовність символів слова у нижньому
+    регістрі) відображається на файли та номери рядків, де він трапляється.
+    Пошук терміна як підрядка зводиться до перегляду словника токенів
+    і списків входжень, без повторного читання файлів. Пошук тримає
+    блокування лише для знімка даних, сам перебір іде без нього.
+    """
+
+    def __init__(self, root: Path, suffixes: Iterable[str]):
+        """
+        Ініціалізація індексу
+
+        Args:
+            root: Корінь робочого простору
+            suffixes: Розширення файлів для індексації
+        """
+        self.root = Path(root)
+        self.suffixes = tuple(suffixes)
+        self._lock = threading.RLock()
+        self._documents: Dict[Path, IndexedDocument] = {}
+        self._postings: Dict[str, Dict[Path, List[int]]] = {}
+        self._token_matches: Dict[str, Set[str]] = {}
+        self._term_hits: Dict[str, Dict[Path, int]] = {}
+        # Змінюється при кожному оновленні вмісту індексу
+        self._generation = 0
+        self._built = False
+
+    def refresh(self) -> Dict[str, int]:
+        """
+        Оновлення індексу за змінами mtime/розміру файлів
+
+        Returns:
+            Dict: Кількість доданих, оновлених та видалених файлів
+        """
+        changes = {"added": 0, "updated": 0, "removed": 0}
+
+        with self._lock:
+            seen = set()
+            for path in self._walk():
+                seen.add(path)
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+
+                document = self._documents.get(path)
+                if document is not None:
+                    if (document.mtime_ns, document.size) == (
+                        stat.st_mtime_ns,
+                        stat.st_size,
+                    ):
+                        continue
+                    self._remove_document(document)
+                    changes["updated"] += 1
+                else:
+                    changes["added"] += 1
+
+                self._add_document(path, stat.st_mtime_ns, stat.st_size)
+
+            for path in [path for path in self._documents if path not in seen]:
+                self._remove_document(self._documents.pop(path))
+                changes["removed"] += 1
+
+            if any(changes.values()):
+                self._token_matches.clear()
+                self._term_hits.clear()
+                self._generation += 1
+            self._built = True
+
+        return changes
+
+    def ensure_built(self):
+        """Побудова індексу, якщо він ще не будувався"""
+        if not self._built:
+            self.refresh()
+
+    def get_lines(self, path: Path) -> List[str]:
+        """
+        Рядки файлу у нижньому регістрі
+
+        Args:
+            path: Шлях до файлу
+
+        Returns:
+            List[str]: Рядки (порожньо для нечитабельних файлів)
+        """
+        with self._lock:
+            document = self._documents.get(path)
+            return (document.lines or []) if document else []
+
+    def find_term(self, term: str) -> Dict[Path, int]:
+        """
+        Пошук терміна як підрядка (без урахування регістру)
+
+        Під блокуванням береться знімок словника та потрібних входжень;
+        перебір токенів і перевірка рядків виконуються без блокування.
+        Якщо індекс оновився між знімками, пошук починається знову.
+
+        Args:
+            term: Термін пошуку
+
+        Returns:
+            Dict[Path, int]: Індекс першого рядка з терміном для кожного файлу
+        """
+        needle = term.lower()
+        runs = TOKEN_PATTERN.findall(needle)
+
+        while True:
+            with self._lock:
+                cached = self._term_hits.get(needle)
+                if cached is not None:
+                    return cached
+                generation = self._generation
+                # Рядки документів не змінюються: оновлення створює новий документ
+                lines = {
+                    path: document.lines or []
+                    for path, document in self._documents.items()
+                }
+                known = {run: self._token_matches.get(run) for run in set(runs)}
+                vocabulary = list(self._postings) if None in known.values() else []
+
+            if not runs:
+                hits = self._scan(needle, lines)
+            else:
+                matches = {
+                    run: (
+                        tokens
+                        if tokens is not None
+                        else {token for token in vocabulary if run in token}
+                    )
+                    for run, tokens in known.items()
+                }
+
+                with self._lock:
+                    if self._generation != generation:
+                        continue
+                    self._token_matches.update(matches)
+                    postings = {
+                        token: dict(self._postings[token])
+                        for tokens in matches.values()
+                        for token in tokens
+                    }
+
+                hits = self._search(needle, runs, matches, postings, lines)
+
+            with self._lock:
+                if self._generation != generation:
+                    continue
+                self._term_hits[needle] = hits
+                return hits
+
+    def get_statistics(self) -> Dict[str, int]:
+        """
+        Статистика індексу
+
+        Returns:
+            Dict: Кількість файлів, токенів та закешованих термінів
+        """
+        with self._lock:
+            return {
+                "files": len(self._documents),
+                "tokens": len(self._postings),
+                "cached_terms": len(self._term_hits),
+            }
+
+    def _walk(self) -> Iterable[Path]:
+        """Обхід файлів робочого простору з потрібними розширеннями"""
+        for directory, _, filenames in os.walk(self.root):
+            for filename in filenames:
+                if filename.endswith(self.suffixes):
+                    path = Path(directory) / filename
+                    if path.suffix in self.suffixes:
+                        yield path
+
+    def _add_document(self, path: Path, mtime_ns: int, size: int):
+        """Індексація одного файлу"""
+        document = IndexedDocument(path=path, mtime_ns=mtime_ns, size=size)
+        self._documents[path] = document
+
+        try:
+            document.lines = path.read_text(encoding="utf-8").lower().split("\n")
+        except (OSError, UnicodeDecodeError):
+            return
+
+        for index, line in enumerate(document.lines):
+            for token in set(TOKEN_PATTERN.findall(line)):
+                self._postings.setdefault(token, {}).setdefault(path, []).append(index)
+                document.tokens.add(token)
+
+    def _remove_document(self, document: IndexedDocument):
+        """Видалення входжень файлу з індексу"""
+        for token in document.tokens:
+            postings = self._postings.get(token)
+            if postings is None:
+                continue
+            postings.pop(document.path, None)
+            if not postings:
+                del self._postings[token]
+
+    @staticmethod
+    def _search(
+        needle: str,
+        runs: List[str],
+        matches: Dict[str, Set[str]],
+        postings: Dict[str, Dict[Path, List[int]]],
+        lines: Dict[Path, List[str]],
+    ) -> Dict[Path, int]:
+        """Пошук терміна зі знімка входжень (без блокування)"""
+        hits: Dict[Path, int] = {}
+
+        if needle == runs[0]:
+            # Термін із символів слова завжди лежить усередині одного токена
+            for token in matches[needle]:
+                for path, token_lines in postings[token].items():
+                    if path not in hits or token_lines[0] < hits[path]:
+                        hits[path] = token_lines[0]
+            return hits
+
+        def candidate_lines(run: str) -> Dict[Path, Set[int]]:
+            """Рядки, де є токен, що містить послідовність символів слова"""
+            candidates: Dict[Path, Set[int]] = {}
+            for token in matches[run]:
+                for path, token_lines in postings[token].items():
+                    candidates.setdefault(path, set()).update(token_lines)
+            return candidates
+
+        candidates = candidate_lines(runs[0])
+        for run in runs[1:]:
+            other = candidate_lines(run)
+            candidates = {
+                path: indexes & other[path]
+                for path, indexes in candidates.items()
+                if path in other
+            }
+
+        # Кандидати перевіряються підрядком у самому рядку
+        for path, indexes in candidates.items():
+            document_lines = lines.get(path, [])
+            for index in sorted(indexes):
+                if needle in document_lines[index]:
+                    hits[path] = index
+                    break
+        return hits
+
+    @staticmethod
+    def _scan(needle: str, lines: Dict[Path, List[str]]) -> Dict[Path, int]:
+        """Прямий пошук для термінів без символів слова"""
+        hits = {}
+        for path, document_lines in lines.items():
+            for index, line in enumerate(document_lines):
+                if needle in line:
+                    hits[path] = index
+                    break
+        return hits
@@ -0,0 +1,114 @@
+"""
+Unit tests for dev_plan_validator_plugin component
+
+Validates the concurrent validation pipeline: bounded parallelism,
+in-order results and a single atomic DEV_PLAN rewrite.
+"""
+
+import asyncio
+import importlib.util
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Load by path: the root tree has its own "plugins" package
+project_root = Path(__file__).parent.parent
+spec = importlib.util.spec_from_file_location(
+    "nimda_v2_plugins",
+    project_root / "plugins" / "__init__.py",
+    submodule_search_locations=[str(project_root / "plugins")],
+)
+nimda_v2_plugins = importlib.util.module_from_spec(spec)
+sys.modules[spec.name] = nimda_v2_plugins
+spec.loader.exec_module(nimda_v2_plugins)
+
+from nimda_v2_plugins.dev_plan_validator_plugin import (  # noqa: E402
+    DevPlanValidatorPlugin,
+    TaskCheckResult,
+)
+
+PLAN = """# DEV_PLAN
+
+- [ ] **NeonRenderer** - Neon renderer
+- [x] **MissingFeature** - Never implemented
+- [ ] **GlowShader** - Glow shader
+"""
+
+
+class TestDevPlanValidator(unittest.TestCase):
+    """Test cases for dev_plan_validator_plugin component."""
+
+    def setUp(self):
+        """Set up a workspace with a plan and some code."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+        self.plan_path = self.root / "DEV_PLAN.md"
+        self.plan_path.write_text(PLAN, encoding="utf-8")
+        os.chmod(self.plan_path, 0o644)
+        (self.root / "renderer.py").write_text("class NeonRenderer:\n    pass\n")
+        (self.root / "shader.py").write_text("class GlowShader:\n    pass\n")
+
+    def tearDown(self):
+        """Clean up the workspace."""
+        self.temp_dir.cleanup()
+
+    def test_validation_updates_plan_atomically(self):
+        """All checkbox changes land in one rewrite; results keep plan order."""
+        plugin = DevPlanValidatorPlugin(workspace_path=self.root, max_workers=3)
+        plugin._calculate_confidence = lambda evidence, name: 90.0 if evidence else 0.0
+
+        result = asyncio.run(plugin.execute({"type": "validate_dev_plan"}))
+        asyncio.run(plugin.cleanup())
+
+        self.assertTrue(result.success)
+        self.assertEqual(result.data["updated_count"], 2)
+        self.assertEqual(
+            [r["task_name"] for r in result.data["validation_results"]],
+            ["NeonRenderer", "MissingFeature", "GlowShader"],
+        )
+        # MissingFeature has low confidence, so its checkbox is kept
+        self.assertEqual(result.data["tasks_needing_update"], 3)
+        self.assertEqual(
+            self.plan_path.read_text(encoding="utf-8"),
+            PLAN.replace("- [ ]", "- [x]"),
+        )
+        self.assertEqual(self.plan_path.stat().st_mode & 0o777, 0o644)
+        self.assertEqual(
+            sorted(path.name for path in self.root.iterdir()),
+            ["DEV_PLAN.md", "renderer.py", "shader.py"],
+        )
+
+    def test_validate_tasks_is_bounded_and_ordered(self):
+        """Tasks run concurrently up to max_workers and stream back in order."""
+        plugin = DevPlanValidatorPlugin(workspace_path=self.root)
+        state = {"running": 0, "peak": 0}
+
+        async def fake_validate(task_info):
+            state["running"] += 1
+            state["peak"] = max(state["peak"], state["running"])
+            await asyncio.sleep(0.02 * (5 - task_info["line_number"] % 5))
+            state["running"] -= 1
+            return TaskCheckResult(
+                task_name=task_info["task_name"],
+                current_status=False,
+                actual_status=False,
+                needs_update=False,
+                evidence=[],
+                confidence=0.0,
+                line_number=task_info["line_number"],
+            )
+
+        plugin._validate_task = fake_validate
+        tasks = [{"task_name": f"T{i}", "line_number": i} for i in range(10)]
+
+        async def collect():
+            return [r.task_name async for r in plugin.validate_tasks(tasks, 4)]
+
+        self.assertEqual(asyncio.run(collect()), [f"T{i}" for i in range(10)])
+        self.assertEqual(state["peak"], 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+"""
+Unit tests for workspace_token_index component
+
+Validates substring lookups through the inverted token index and
+incremental refresh by file mtime/size.
+"""
+
+import importlib.util
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+# Load by path: the root tree has its own "plugins" package
+project_root = Path(__file__).parent.parent
+spec = importlib.util.spec_from_file_location(
+    "nimda_v2_workspace_token_index",
+    project_root / "plugins" / "workspace_token_index.py",
+)
+workspace_token_index = importlib.util.module_from_spec(spec)
+sys.modules[spec.name] = workspace_token_index
+spec.loader.exec_module(workspace_token_index)
+
+WorkspaceTokenIndex = workspace_token_index.WorkspaceTokenIndex
+
+
+class TestWorkspaceTokenIndex(unittest.TestCase):
+    """Test cases for workspace_token_index component."""
+
+    def setUp(self):
+        """Set up a small workspace."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+        (self.root / "pkg").mkdir()
+        self.engine = self.root / "pkg" / "engine.py"
+        self.engine.write_text(
+            "import os\n\nclass NeonGlowEffect:\n    def render(self):  # glass blur\n"
+        )
+        (self.root / "config.json").write_text('{"ssh": {"host": "router"}}')
+        (self.root / "notes.txt").write_text("neon everywhere")
+        self.index = WorkspaceTokenIndex(self.root, (".py", ".json"))
+        self.index.refresh()
+
+    def tearDown(self):
+        """Clean up the workspace."""
+        self.temp_dir.cleanup()
+
+    def test_substring_lookup(self):
+        """Terms match as case-insensitive substrings, like a content scan."""
+        self.assertEqual(self.index.find_term("Glow"), {self.engine: 2})
+        self.assertEqual(self.index.find_term("neonglow"), {self.engine: 2})
+        self.assertEqual(self.index.find_term("glass blur"), {self.engine: 3})
+        self.assertEqual(self.index.find_term("render(self)"), {self.engine: 3})
+        self.assertEqual(self.index.find_term("blur glass"), {})
+        self.assertEqual(set(self.index.find_term("rout")), {self.root / "config.json"})
+        # Files with other suffixes are not indexed
+        self.assertEqual(self.index.find_term("everywhere"), {})
+
+    def test_incremental_refresh(self):
+        """Only changed files are re-indexed and stale lookups are dropped."""
+        self.assertEqual(self.index.refresh(), {"added": 0, "updated": 0, "removed": 0})
+        self.assertIn(self.engine, self.index.find_term("glow"))
+
+        self.engine.write_text("class Plain:\n    pass\n")
+        stat = self.engine.stat()
+        os.utime(self.engine, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+        (self.root / "config.json").unlink()
+        (self.root / "pkg" / "glow.py").write_text("GLOW = True\n")
+
+        self.assertEqual(self.index.refresh(), {"added": 1, "updated": 1, "removed": 1})
+        self.assertEqual(
+            self.index.find_term("glow"), {self.root / "pkg" / "glow.py": 0}
+        )
+        self.assertEqual(self.index.find_term("router"), {})
+
+    def test_search_runs_outside_the_lock(self):
+        """A refresh during a search is not blocked and restarts the search."""
+        search = WorkspaceTokenIndex._search
+        refreshed = []
+
+        def refresh_during_search(*args):
+            if not refreshed:
+                self.engine.write_text("class Plain:\n    glow_level = 1\n")
+                stat = self.engine.stat()
+                os.utime(self.engine, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+                worker = threading.Thread(
+                    target=lambda: refreshed.append(self.index.refresh())
+                )
+                worker.start()
+                worker.join(timeout=5)
+                self.assertFalse(worker.is_alive())
+            return search(*args)
+
+        self.index._search = refresh_during_search
+        # The search restarts on the refreshed content
+        self.assertEqual(self.index.find_term("glow_level = 1"), {self.engine: 1})
+        self.assertEqual(refreshed[0]["updated"], 1)
+        self.assertEqual(self.index.find_term("neonglow"), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
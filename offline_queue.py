@@ -4,18 +4,24 @@ Offline Queue System for NIMDA Agent
 Ensures operations are not lost when network is unavailable
 """
 
+import heapq
+import itertools
 import json
 import logging
+import os
+import socket
+import sqlite3
+import tempfile
 import threading
 import time
 import uuid
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from enum import Enum
 from pathlib import Path
-from typing import Callable, Dict, List, Optional
-
-import requests
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
 
 # Setup logging
 logging.basicConfig(
@@ -103,53 +109,501 @@ class QueuedOperation:
         )
 
 
+# (host, port) pairs probed with a TCP connect, first success wins
+DEFAULT_PROBE_ENDPOINTS = [
+    ("1.1.1.1", 443),  # Cloudflare DNS
+    ("8.8.8.8", 53),  # Google DNS
+    ("github.com", 443),  # GitHub
+]
+
+
 class NetworkMonitor:
-    """Monitor network connectivity"""
+    """
+    Monitor network connectivity
+
+    The connectivity state is cached: ``is_online`` never blocks and starts a
+    background TCP connect probe once the state is older than its TTL.
+    Listeners are called when the state changes; while offline and
+    observed, the monitor re-probes every ``offline_ttl`` seconds so the
+    return of connectivity is reported without polling by callers.
+    """
 
-    def __init__(self, timeout: int = 5):
+    def __init__(
+        self,
+        timeout: float = 2,
+        endpoints: Optional[List[Tuple[str, int]]] = None,
+        ttl: float = 30.0,
+        offline_ttl: float = 10.0,
+    ):
+        """
+        Args:
+            timeout: Seconds per TCP connect attempt
+            endpoints: (host, port) pairs to probe (default: public DNS, GitHub)
+            ttl: Seconds an online state stays fresh
+            offline_ttl: Seconds an offline state stays fresh
+        """
         self.timeout = timeout
-        self.test_urls = [
-            "https://8.8.8.8",  # Google DNS
-            "https://1.1.1.1",  # Cloudflare DNS
-            "https://github.com",  # GitHub
-        ]
+        self.endpoints = list(endpoints or DEFAULT_PROBE_ENDPOINTS)
+        self.ttl = ttl
+        self.offline_ttl = offline_ttl
+
+        self._lock = threading.Lock()
+        self._probe_lock = threading.Lock()
+        self._online: Optional[bool] = None
+        self._checked_at = float("-inf")
+        self._online_event = threading.Event()
+        self._listeners: List[Callable[[bool], None]] = []
+        self._reprobe_timer: Optional[threading.Timer] = None
 
     def is_online(self) -> bool:
-        """Check if network is available"""
-        for url in self.test_urls:
+        """Last known connectivity (refreshed in the background when stale)"""
+        with self._lock:
+            online = self._online
+            age = time.monotonic() - self._checked_at
+            stale = age >= (self.ttl if online else self.offline_ttl)
+
+        if stale:
+            self.refresh()
+        return bool(online)
+
+    def check_now(self) -> bool:
+        """Probe connectivity now (joins a probe that is already running)"""
+        requested = time.monotonic()
+        with self._probe_lock:
+            with self._lock:
+                if self._checked_at >= requested:
+                    return bool(self._online)
+            online = self._probe()
+            self._update(online)
+            return online
+
+    def refresh(self):
+        """Start a background probe unless one is running"""
+        if self._probe_lock.locked():
+            return
+        threading.Thread(
+            target=self.check_now, name="NetworkProbe", daemon=True
+        ).start()
+
+    def add_listener(self, callback: Callable[[bool], None]):
+        """Call ``callback(online)`` whenever connectivity changes"""
+        with self._lock:
+            self._listeners.append(callback)
+
+    def _probe(self) -> bool:
+        """TCP connect to the endpoints until one answers"""
+        for host, port in self.endpoints:
             try:
-                response = requests.get(url, timeout=self.timeout)
-                if response.status_code == 200:
+                with socket.create_connection((host, port), timeout=self.timeout):
                     return True
-            except (requests.RequestException, Exception):
+            except OSError:
                 continue
         return False
 
+    def _update(self, online: bool):
+        """Store a probe result and notify listeners of a transition"""
+        with self._lock:
+            previous = self._online
+            self._online = online
+            self._checked_at = time.monotonic()
+            listeners = list(self._listeners)
+
+            if online:
+                self._online_event.set()
+            else:
+                self._online_event.clear()
+
+            # Keep probing while offline so listeners hear about recovery
+            if not online and listeners and self._reprobe_timer is None:
+                self._reprobe_timer = threading.Timer(self.offline_ttl, self._reprobe)
+                self._reprobe_timer.daemon = True
+                self._reprobe_timer.start()
+
+        if online != previous:
+            logger.info(f"Network {'online' if online else 'offline'}")
+            for callback in listeners:
+                try:
+                    callback(online)
+                except Exception as e:
+                    logger.error(f"Error in connectivity listener: {e}")
+
+    def _reprobe(self):
+        """Timer callback for the offline re-probe"""
+        with self._lock:
+            self._reprobe_timer = None
+        self.check_now()
+
     def wait_for_connection(self, max_wait: int = 300) -> bool:
         """Wait for network connection to become available"""
         start_time = time.time()
 
         while time.time() - start_time < max_wait:
-            if self.is_online():
+            if self.check_now():
                 return True
-            time.sleep(10)  # Check every 10 seconds
+            # Woken early by a probe from another thread
+            self._online_event.wait(
+                min(10, max(0, max_wait - (time.time() - start_time)))
+            )
 
         return False
 
 
+class QueueStorage(ABC):
+    """
+    Storage backend for OfflineQueue
+
+    Backends persist single operations, so a state transition costs one row
+    write rather than a rewrite of the whole queue.
+    """
+
+    @abstractmethod
+    def load(self) -> List[QueuedOperation]:
+        """Load all operations in queue order (priority, then insertion)"""
+
+    @abstractmethod
+    def save_operation(self, operation: QueuedOperation):
+        """Insert or update one operation"""
+
+    @abstractmethod
+    def delete_operations(self, operation_ids: Iterable[str]):
+        """Remove operations by id"""
+
+    @abstractmethod
+    def save_all(self, operations: List[QueuedOperation]):
+        """Replace the stored queue with the given operations"""
+
+    def version(self) -> Any:
+        """Token that changes when another process modifies the storage"""
+        return None
+
+    def close(self):
+        """Release storage resources"""
+
+
+class JsonQueueStorage(QueueStorage):
+    """Whole-queue JSON file (legacy format, rewritten on every change)"""
+
+    def __init__(self, queue_file: Path):
+        self.queue_file = Path(queue_file)
+        self._operations: Dict[str, QueuedOperation] = {}
+
+    def load(self) -> List[QueuedOperation]:
+        """Load operations from the JSON file"""
+        if not self.queue_file.exists():
+            self._operations = {}
+            return []
+
+        with open(self.queue_file, "r", encoding="utf-8") as f:
+            data = json.load(f)
+
+        operations = [
+            QueuedOperation.from_dict(op_data) for op_data in data.get("operations", [])
+        ]
+        self._operations = {op.id: op for op in operations}
+        return operations
+
+    def save_operation(self, operation: QueuedOperation):
+        """Update one operation and rewrite the file"""
+        self._operations[operation.id] = operation
+        self._write()
+
+    def delete_operations(self, operation_ids: Iterable[str]):
+        """Remove operations and rewrite the file"""
+        for operation_id in operation_ids:
+            self._operations.pop(operation_id, None)
+        self._write()
+
+    def save_all(self, operations: List[QueuedOperation]):
+        """Rewrite the file with the given operations"""
+        self._operations = {op.id: op for op in operations}
+        self._write()
+
+    def version(self) -> Any:
+        """Modification time and size of the JSON file"""
+        try:
+            stat = self.queue_file.stat()
+            return (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            return None
+
+    def _write(self):
+        """Atomic write of the queue file"""
+        operations = sorted(
+            self._operations.values(), key=lambda op: op.priority, reverse=True
+        )
+        queue_data = {
+            "last_updated": datetime.now().isoformat(),
+            "operations": [op.to_dict() for op in operations],
+        }
+
+        directory = self.queue_file.parent
+        fd, temp_name = tempfile.mkstemp(
+            dir=directory, prefix=f".{self.queue_file.name}.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(queue_data, f, indent=2, ensure_ascii=False)
+            os.replace(temp_name, self.queue_file)
+        except BaseException:
+            Path(temp_name).unlink(missing_ok=True)
+            raise
+
+
+class SqliteQueueStorage(QueueStorage):
+    """
+    SQLite queue storage in WAL mode
+
+    Every operation is one row updated in its own transaction; status and
+    next_retry are indexed for the processor's ready-operation lookups. An
+    existing JSON queue file is imported once and renamed to ``*.migrated``.
+    """
+
+    SCHEMA_VERSION = 1
+
+    _UPSERT = """
+        INSERT INTO operations (
+            id, operation_type, timestamp, status, priority, max_retries,
+            retry_count, retry_delay, next_retry, data, result, error
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(id) DO UPDATE SET
+            status = excluded.status,
+            priority = excluded.priority,
+            max_retries = excluded.max_retries,
+            retry_count = excluded.retry_count,
+            retry_delay = excluded.retry_delay,
+            next_retry = excluded.next_retry,
+            data = excluded.data,
+            result = excluded.result,
+            error = excluded.error
+    """
+
+    def __init__(self, db_file: Path, legacy_json: Optional[Path] = None):
+        self.db_file = Path(db_file)
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(
+            str(self.db_file), check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA busy_timeout=5000")
+        self._create_schema()
+
+        if legacy_json is not None:
+            self._migrate_json(Path(legacy_json))
+
+    def _create_schema(self):
+        """Create the operations table and indexes"""
+        # No write transaction on an up-to-date database (it would bump the
+        # data_version other processes poll)
+        if (
+            self._conn.execute("PRAGMA user_version").fetchone()[0]
+            >= self.SCHEMA_VERSION
+        ):
+            return
+
+        with self._transaction() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS operations (
+                    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                    id TEXT NOT NULL UNIQUE,
+                    operation_type TEXT NOT NULL,
+                    timestamp TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    priority INTEGER NOT NULL,
+                    max_retries INTEGER NOT NULL,
+                    retry_count INTEGER NOT NULL,
+                    retry_delay INTEGER NOT NULL,
+                    next_retry TEXT NOT NULL,
+                    data TEXT NOT NULL,
+                    result TEXT,
+                    error TEXT
+                )
+                """)
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_operations_status "
+                "ON operations (status, next_retry)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_operations_next_retry "
+                "ON operations (next_retry)"
+            )
+            conn.execute(f"PRAGMA user_version={self.SCHEMA_VERSION}")
+
+    @contextmanager
+    def _transaction(self):
+        """Locked BEGIN IMMEDIATE ... COMMIT block (ROLLBACK on error)"""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    def _migrate_json(self, legacy_json: Path):
+        """One-time import of the JSON queue file"""
+        if not legacy_json.exists():
+            return
+
+        with self._transaction() as conn:
+            if conn.execute("SELECT COUNT(*) FROM operations").fetchone()[0]:
+                return
+            operations = JsonQueueStorage(legacy_json).load()
+            conn.executemany(self._UPSERT, [self._row(op) for op in operations])
+
+        legacy_json.rename(legacy_json.with_name(legacy_json.name + ".migrated"))
+        logger.info(f"Migrated {len(operations)} operations from {legacy_json}")
+
+    @staticmethod
+    def _row(operation: QueuedOperation) -> tuple:
+        """Row values for _UPSERT"""
+        return (
+            operation.id,
+            operation.operation_type.value,
+            operation.timestamp,
+            operation.status.value,
+            operation.priority,
+            operation.max_retries,
+            operation.retry_count,
+            operation.retry_delay,
+            operation.next_retry,
+            json.dumps(operation.data, ensure_ascii=False),
+            None if operation.result is None else json.dumps(operation.result),
+            operation.error,
+        )
+
+    def load(self) -> List[QueuedOperation]:
+        """Load operations ordered by priority, then insertion"""
+        with self._lock:
+            rows = self._conn.execute("""
+                SELECT id, operation_type, timestamp, status, priority, max_retries,
+                       retry_count, retry_delay, next_retry, data, result, error
+                FROM operations ORDER BY priority DESC, seq
+                """).fetchall()
+
+        return [
+            QueuedOperation(
+                id=row[0],
+                operation_type=OperationType(row[1]),
+                timestamp=row[2],
+                status=OperationStatus(row[3]),
+                priority=row[4],
+                max_retries=row[5],
+                retry_count=row[6],
+                retry_delay=row[7],
+                next_retry=row[8],
+                data=json.loads(row[9]),
+                result=None if row[10] is None else json.loads(row[10]),
+                error=row[11],
+            )
+            for row in rows
+        ]
+
+    def save_operation(self, operation: QueuedOperation):
+        """Upsert one row"""
+        with self._transaction() as conn:
+            conn.execute(self._UPSERT, self._row(operation))
+
+    def delete_operations(self, operation_ids: Iterable[str]):
+        """Delete rows by id"""
+        with self._transaction() as conn:
+            conn.executemany(
+                "DELETE FROM operations WHERE id = ?",
+                [(operation_id,) for operation_id in operation_ids],
+            )
+
+    def save_all(self, operations: List[QueuedOperation]):
+        """Upsert the given operations and delete all others"""
+        with self._transaction() as conn:
+            conn.execute("CREATE TEMP TABLE IF NOT EXISTS keep_ids (id TEXT)")
+            conn.execute("DELETE FROM keep_ids")
+            conn.executemany(
+                "INSERT INTO keep_ids VALUES (?)", [(op.id,) for op in operations]
+            )
+            conn.execute(
+                "DELETE FROM operations WHERE id NOT IN (SELECT id FROM keep_ids)"
+            )
+            conn.executemany(self._UPSERT, [self._row(op) for op in operations])
+
+    def version(self) -> Any:
+        """SQLite data_version (changes on commits by other connections)"""
+        with self._lock:
+            return self._conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def close(self):
+        """Close the connection"""
+        with self._lock:
+            self._conn.close()
+
+
 class OfflineQueue:
     """Queue system for offline operations"""
 
     def __init__(
-        self, queue_file: str = ".nimda_offline_queue.json", max_queue_size: int = 1000
+        self,
+        queue_file: str = ".nimda_offline_queue.json",
+        max_queue_size: int = 1000,
+        storage: Optional[QueueStorage] = None,
+        workers: int = 1,
+        type_limits: Optional[Dict[OperationType, int]] = None,
+        serialize_by: Optional[Callable[[QueuedOperation], Optional[Hashable]]] = None,
+        network_monitor: Optional[NetworkMonitor] = None,
+        auto_resume: bool = False,
     ):
+        """
+        Args:
+            queue_file: Legacy JSON queue file, imported once into the database
+                next to it (same name with a .db suffix)
+            max_queue_size: Maximum number of queued operations
+            storage: Storage backend (default: SqliteQueueStorage)
+            workers: Number of worker threads processing operations
+            type_limits: Max concurrent operations per type (others: workers)
+            serialize_by: Key function; operations with the same non-None key
+                (e.g. repository path) never run concurrently
+            network_monitor: Connectivity monitor (default: NetworkMonitor())
+            auto_resume: Start processing when connectivity returns, even if
+                start_processing() was never called (requires handlers)
+        """
         self.queue_file = Path(queue_file)
         self.max_queue_size = max_queue_size
+        self.storage = storage or SqliteQueueStorage(
+            self.queue_file.with_suffix(".db"), legacy_json=self.queue_file
+        )
         self.operations: List[QueuedOperation] = []
-        self.network_monitor = NetworkMonitor()
+        self._operations_by_id: Dict[str, QueuedOperation] = {}
+        self._storage_version = None
+        self.network_monitor = network_monitor or NetworkMonitor()
         self.processing = False
         self.processor_thread = None
+        self.processor_threads: List[threading.Thread] = []
+        self.workers = max(1, workers)
+        self.type_limits = dict(type_limits or {})
+        self.serialize_by = serialize_by
         self.operation_handlers: Dict[OperationType, Callable] = {}
+        self.offline_wait = 30  # seconds between network checks while offline
+        self.auto_resume = auto_resume
+
+        # Scheduler: operations wait in _delayed (min-heap by monotonic due
+        # time) and move to _ready (min-heap by -priority, enqueue order) when
+        # due. Entries whose token is no longer in _scheduled are skipped.
+        self._condition = threading.Condition(threading.RLock())
+        self._delayed: List[tuple] = []
+        self._ready: List[tuple] = []
+        self._scheduled: Dict[str, int] = {}
+        self._tokens = itertools.count()
+
+        # Running operations per type and serialization keys in use
+        self._active_by_type: Dict[OperationType, int] = {}
+        self._active_keys: set = set()
+        # Ids this instance is running; other PROCESSING rows were interrupted
+        self._running_ids: set = set()
+        # Interrupted operations reset in memory but not yet written back
+        self._unsaved_recoveries: Dict[str, QueuedOperation] = {}
+        self._draining = False
+
+        # Connectivity changes wake offline workers (and start auto_resume queues)
+        self.network_monitor.add_listener(self._on_connectivity_change)
 
         # Load existing queue
         self.load_queue()
@@ -164,41 +618,136 @@ class OfflineQueue:
         logger.info(f"Registered handler for {operation_type.value}")
 
     def load_queue(self):
-        """Load queue from file"""
+        """
+        Load queue from storage
+
+        PROCESSING rows that this instance is not running belong to a worker
+        that crashed or was killed; they are reset to RETRYING and scheduled
+        again. Only a processing queue writes that reset back, so read-only
+        instances sharing the storage never modify its rows.
+        """
         try:
-            if self.queue_file.exists():
-                with open(self.queue_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
+            self._storage_version = self.storage.version()
+            operations = self.storage.load()
+            logger.info(f"Loaded {len(operations)} operations from queue")
 
-                self.operations = [
-                    QueuedOperation.from_dict(op_data)
-                    for op_data in data.get("operations", [])
-                ]
+        except Exception as e:
+            logger.error(f"Error loading queue: {e}")
+            operations = []
+
+        with self._condition:
+            self.operations = operations
+            self._operations_by_id = {op.id: op for op in operations}
+            self._delayed = []
+            self._ready = []
+            self._scheduled = {}
+            self._unsaved_recoveries = {}
+            for operation in operations:
+                if (
+                    operation.status == OperationStatus.PROCESSING
+                    and operation.id not in self._running_ids
+                ):
+                    self._recover_interrupted(operation)
+                self._schedule(operation)
+            if self.processing:
+                self._save_recoveries()
+            self._condition.notify_all()
+
+    def _recover_interrupted(self, operation: QueuedOperation):
+        """Reset an operation left in PROCESSING to be retried now"""
+        logger.warning(f"Recovering interrupted operation: {operation.id}")
+        operation.status = OperationStatus.RETRYING
+        operation.next_retry = datetime.now().isoformat()
+        self._unsaved_recoveries[operation.id] = operation
+
+    def _save_recoveries(self):
+        """Persist interrupted operations reset by load_queue"""
+        with self._condition:
+            recoveries = list(self._unsaved_recoveries.values())
+            self._unsaved_recoveries = {}
+            for operation in recoveries:
+                self._save_operation(operation)
+
+    def _schedule(self, operation: QueuedOperation):
+        """Put a pending or retrying operation on the scheduler heaps"""
+        if operation.status not in (OperationStatus.PENDING, OperationStatus.RETRYING):
+            return
 
-                logger.info(f"Loaded {len(self.operations)} operations from queue")
+        with self._condition:
+            # next_retry is parsed once and kept as a monotonic deadline
+            delay = (
+                datetime.fromisoformat(operation.next_retry) - datetime.now()
+            ).total_seconds()
+            token = next(self._tokens)
+            self._scheduled[operation.id] = token
+            if delay > 0:
+                heapq.heappush(
+                    self._delayed,
+                    (time.monotonic() + delay, -operation.priority, token, operation),
+                )
             else:
-                self.operations = []
-                logger.info("No existing queue file found, starting fresh")
+                heapq.heappush(self._ready, (-operation.priority, token, operation))
+            self._condition.notify_all()
+
+    def _unschedule(self, operation: QueuedOperation):
+        """Drop an operation's heap entry (removed lazily)"""
+        with self._condition:
+            self._scheduled.pop(operation.id, None)
+
+    def _insert_operation(self, operation: QueuedOperation):
+        """Insert into self.operations keeping priority order (stable)"""
+        low, high = 0, len(self.operations)
+        while low < high:
+            middle = (low + high) // 2
+            if self.operations[middle].priority < operation.priority:
+                high = middle
+            else:
+                low = middle + 1
+        self.operations.insert(low, operation)
+        self._operations_by_id[operation.id] = operation
+
+    def reload_if_changed(self) -> bool:
+        """
+        Reload the queue if another process changed the storage
 
+        Returns:
+            True if the queue was reloaded
+        """
+        try:
+            version = self.storage.version()
         except Exception as e:
-            logger.error(f"Error loading queue: {e}")
-            self.operations = []
+            logger.error(f"Error checking queue storage: {e}")
+            return False
+
+        if version == self._storage_version:
+            return False
+        self.load_queue()
+        return True
 
     def save_queue(self):
-        """Save queue to file"""
+        """Save the whole queue to storage"""
         try:
-            queue_data = {
-                "last_updated": datetime.now().isoformat(),
-                "operations": [op.to_dict() for op in self.operations],
-            }
+            self.storage.save_all(self.operations)
+            logger.debug("Queue saved to storage")
 
-            with open(self.queue_file, "w", encoding="utf-8") as f:
-                json.dump(queue_data, f, indent=2, ensure_ascii=False)
+        except Exception as e:
+            logger.error(f"Error saving queue: {e}")
+
+    def _save_operation(self, operation: QueuedOperation):
+        """Persist a single operation"""
+        try:
+            self.storage.save_operation(operation)
+
+        except Exception as e:
+            logger.error(f"Error saving operation {operation.id}: {e}")
 
-            logger.debug("Queue saved to file")
+    def _delete_operations(self, operations: List[QueuedOperation]):
+        """Remove operations from storage"""
+        try:
+            self.storage.delete_operations([op.id for op in operations])
 
         except Exception as e:
-            logger.error(f"Error saving queue: {e}")
+            logger.error(f"Error deleting operations: {e}")
 
     def enqueue_operation(
         self,
@@ -233,12 +782,10 @@ class OfflineQueue:
             data=data,
         )
 
-        self.operations.append(operation)
-        self.operations.sort(
-            key=lambda x: x.priority, reverse=True
-        )  # High priority first
-
-        self.save_queue()
+        with self._condition:
+            self._insert_operation(operation)  # High priority first
+            self._save_operation(operation)
+            self._schedule(operation)
 
         logger.info(f"Enqueued {operation_type.value} operation: {operation_id}")
 
@@ -261,105 +808,252 @@ class OfflineQueue:
             old_ops = completed_ops[keep_recent:]
 
             # Remove old operations
-            for old_op in old_ops:
-                self.operations.remove(old_op)
+            self._remove_operations(old_ops)
 
             logger.info(f"Cleaned up {len(old_ops)} old completed operations")
 
+    def _remove_operations(self, operations: List[QueuedOperation]):
+        """Remove operations from the queue and storage"""
+        with self._condition:
+            removed_ids = {op.id for op in operations}
+            self.operations = [op for op in self.operations if op.id not in removed_ids]
+            for operation in operations:
+                self._operations_by_id.pop(operation.id, None)
+                self._unschedule(operation)
+            self._delete_operations(operations)
+
     def get_operation_status(self, operation_id: str) -> Optional[QueuedOperation]:
         """Get status of specific operation"""
-        for operation in self.operations:
-            if operation.id == operation_id:
-                return operation
-        return None
+        return self._operations_by_id.get(operation_id)
 
     def cancel_operation(self, operation_id: str) -> bool:
         """Cancel pending operation"""
-        for operation in self.operations:
-            if operation.id == operation_id:
-                if operation.status in [
-                    OperationStatus.PENDING,
-                    OperationStatus.RETRYING,
-                ]:
-                    operation.status = OperationStatus.CANCELLED
-                    self.save_queue()
-                    logger.info(f"Cancelled operation: {operation_id}")
-                    return True
-                else:
-                    logger.warning(
-                        f"Cannot cancel operation in status: {operation.status}"
-                    )
-                    return False
-        return False
-
-    def start_processing(self):
-        """Start processing queue in background thread"""
-        if self.processing:
-            logger.debug("Queue processing already running")
+        with self._condition:
+            operation = self._operations_by_id.get(operation_id)
+            if operation is None:
+                return False
+
+            if operation.status in [
+                OperationStatus.PENDING,
+                OperationStatus.RETRYING,
+            ]:
+                operation.status = OperationStatus.CANCELLED
+                self._unschedule(operation)
+                self._save_operation(operation)
+                logger.info(f"Cancelled operation: {operation_id}")
+                return True
+            else:
+                logger.warning(f"Cannot cancel operation in status: {operation.status}")
+                return False
+
+    def _on_connectivity_change(self, online: bool):
+        """
+        Resume work as soon as the network comes back
+
+        Running workers are woken; a queue that is not processing is only
+        started when it opted in with ``auto_resume`` and has handlers, so
+        read-only instances never pick up operations from shared storage.
+        """
+        if not online:
             return
 
-        self.processing = True
-        self.processor_thread = threading.Thread(
-            target=self._process_queue, daemon=True
-        )
-        self.processor_thread.start()
-        logger.info("Started queue processing")
+        with self._condition:
+            start = (
+                self.auto_resume
+                and not self.processing
+                and bool(self.operation_handlers)
+                and bool(self._scheduled)
+            )
+            self._condition.notify_all()
+        if start:
+            self.start_processing()
 
-    def stop_processing(self):
-        """Stop processing queue"""
-        self.processing = False
-        if self.processor_thread:
-            self.processor_thread.join(timeout=5)
+    def start_processing(self):
+        """Start processing queue in background worker threads"""
+        with self._condition:
+            if self.processing:
+                logger.debug("Queue processing already running")
+                return
+
+            self.processing = True
+            self._draining = False
+            self._save_recoveries()
+            self.processor_threads = [
+                threading.Thread(
+                    target=self._process_queue,
+                    name=f"OfflineQueueWorker-{index}",
+                    daemon=True,
+                )
+                for index in range(self.workers)
+            ]
+            self.processor_thread = self.processor_threads[0]
+            for thread in self.processor_threads:
+                thread.start()
+        logger.info(f"Started queue processing ({self.workers} workers)")
+
+    def stop_processing(self, drain: bool = False, timeout: float = 5):
+        """
+        Stop processing queue
+
+        Running operations always finish; with ``drain`` the workers also
+        process every operation that is already due before exiting.
+
+        Args:
+            drain: Process due operations before stopping
+            timeout: Seconds to wait for the workers
+        """
+        with self._condition:
+            self.processing = False
+            self._draining = drain
+            self._condition.notify_all()
+
+        deadline = time.monotonic() + timeout
+        for thread in self.processor_threads:
+            thread.join(timeout=max(0.0, deadline - time.monotonic()))
+
+        with self._condition:
+            self._draining = False
         logger.info("Stopped queue processing")
 
     def _process_queue(self):
-        """Process operations in the queue"""
+        """Worker loop: take admissible due operations until stopped"""
         logger.info("Queue processor started")
 
-        while self.processing:
+        while True:
             try:
-                # Check network connectivity
-                if not self.network_monitor.is_online():
-                    logger.debug("Network unavailable, waiting...")
-                    time.sleep(30)  # Wait 30 seconds before checking again
-                    continue
-
-                # Find next operation to process
-                operation = self._get_next_operation()
-
-                if not operation:
-                    time.sleep(10)  # No operations ready, wait 10 seconds
-                    continue
-
-                # Process the operation
-                self._process_operation(operation)
+                # Sleep until an operation is enqueued, a running one
+                # finishes or the earliest retry comes due
+                with self._condition:
+                    if not self.processing and not self._draining:
+                        break
+                    operation = self._get_next_operation()
+                    if not operation:
+                        if not self.processing:
+                            break  # Drained
+                        self._condition.wait(self._time_until_next_due())
+                        continue
+                    self._acquire_slot(operation)
+
+                try:
+                    # Check network connectivity
+                    if not self.network_monitor.is_online():
+                        logger.debug("Network unavailable, waiting...")
+                        with self._condition:
+                            self._release_slot(operation)
+                            self._schedule(operation)
+                            operation = None
+                            if self.processing:
+                                self._condition.wait(self.offline_wait)
+                            elif self._draining:
+                                break
+                        continue
+
+                    # Process the operation
+                    self._process_operation(operation)
+                finally:
+                    if operation is not None:
+                        with self._condition:
+                            self._release_slot(operation)
 
             except Exception as e:
                 logger.error(f"Error in queue processor: {e}")
-                time.sleep(10)
+                with self._condition:
+                    if self.processing:
+                        self._condition.wait(10)
 
         logger.info("Queue processor stopped")
 
-    def _get_next_operation(self) -> Optional[QueuedOperation]:
-        """Get next operation ready for processing"""
-        now = datetime.now()
+    def _serialization_key(self, operation: QueuedOperation) -> Optional[Hashable]:
+        """Serialization key of an operation (None - no serialization)"""
+        if self.serialize_by is None:
+            return None
+        try:
+            return self.serialize_by(operation)
+        except Exception as e:
+            logger.error(f"Error computing serialization key: {e}")
+            return None
+
+    def _is_admissible(self, operation: QueuedOperation) -> bool:
+        """Whether the type limit and serialization key allow running now"""
+        limit = self.type_limits.get(operation.operation_type, self.workers)
+        if self._active_by_type.get(operation.operation_type, 0) >= limit:
+            return False
+        key = self._serialization_key(operation)
+        return key is None or key not in self._active_keys
+
+    def _acquire_slot(self, operation: QueuedOperation):
+        """Count a running operation against its type and key"""
+        operation_type = operation.operation_type
+        self._active_by_type[operation_type] = (
+            self._active_by_type.get(operation_type, 0) + 1
+        )
+        key = self._serialization_key(operation)
+        if key is not None:
+            self._active_keys.add(key)
+        self._running_ids.add(operation.id)
+
+    def _release_slot(self, operation: QueuedOperation):
+        """Free a running operation's type and key slots and wake workers"""
+        operation_type = operation.operation_type
+        self._active_by_type[operation_type] -= 1
+        key = self._serialization_key(operation)
+        if key is not None:
+            self._active_keys.discard(key)
+        self._running_ids.discard(operation.id)
+        self._condition.notify_all()
 
-        for operation in self.operations:
-            if operation.status in [OperationStatus.PENDING, OperationStatus.RETRYING]:
-                next_retry = datetime.fromisoformat(operation.next_retry)
-                if now >= next_retry:
+    def _get_next_operation(self) -> Optional[QueuedOperation]:
+        """Pop the highest-priority due operation that may run now"""
+        with self._condition:
+            now = time.monotonic()
+            while self._delayed and self._delayed[0][0] <= now:
+                _, priority, token, operation = heapq.heappop(self._delayed)
+                heapq.heappush(self._ready, (priority, token, operation))
+
+            blocked = []
+            try:
+                while self._ready:
+                    entry = heapq.heappop(self._ready)
+                    _, token, operation = entry
+                    if self._scheduled.get(
+                        operation.id
+                    ) != token or operation.status not in (
+                        OperationStatus.PENDING,
+                        OperationStatus.RETRYING,
+                    ):
+                        continue
+                    if not self._is_admissible(operation):
+                        # Limit or key busy: keep its place for later
+                        blocked.append(entry)
+                        continue
+                    del self._scheduled[operation.id]
                     return operation
+            finally:
+                for entry in blocked:
+                    heapq.heappush(self._ready, entry)
 
         return None
 
+    def _time_until_next_due(self) -> Optional[float]:
+        """Seconds until the earliest delayed operation (None if none)"""
+        with self._condition:
+            while self._delayed and (
+                self._scheduled.get(self._delayed[0][3].id) != self._delayed[0][2]
+            ):
+                heapq.heappop(self._delayed)
+            if not self._delayed:
+                return None
+            return max(0.0, self._delayed[0][0] - time.monotonic())
+
     def _process_operation(self, operation: QueuedOperation):
         """Process a single operation"""
         logger.info(
             f"Processing operation: {operation.id} ({operation.operation_type.value})"
         )
 
+        self._unschedule(operation)
         operation.status = OperationStatus.PROCESSING
-        self.save_queue()
+        self._save_operation(operation)
 
         try:
             # Get handler for operation type
@@ -400,7 +1094,8 @@ class OfflineQueue:
                 operation.status = OperationStatus.FAILED
                 logger.error(f"Operation failed permanently: {operation.id}")
 
-        self.save_queue()
+        self._save_operation(operation)
+        self._schedule(operation)
 
     def get_queue_stats(self) -> dict:
         """Get queue statistics"""
@@ -443,10 +1138,11 @@ class OfflineQueue:
                 operation.retry_count = 0
                 operation.next_retry = datetime.now().isoformat()
                 operation.error = None
+                self._save_operation(operation)
+                self._schedule(operation)
                 retry_count += 1
 
         if retry_count > 0:
-            self.save_queue()
             logger.info(f"Reset {retry_count} failed operations for retry")
 
         return retry_count
@@ -454,19 +1150,17 @@ class OfflineQueue:
     def clear_completed_operations(self, older_than_days: int = 7) -> int:
         """Clear completed operations older than specified days"""
         cutoff_date = datetime.now() - timedelta(days=older_than_days)
-        removed_count = 0
 
-        self.operations = [
+        removed = [
             op
             for op in self.operations
-            if not (
-                op.status == OperationStatus.COMPLETED
-                and datetime.fromisoformat(op.timestamp) < cutoff_date
-            )
+            if op.status == OperationStatus.COMPLETED
+            and datetime.fromisoformat(op.timestamp) < cutoff_date
         ]
+        removed_count = len(removed)
 
         if removed_count > 0:
-            self.save_queue()
+            self._remove_operations(removed)
             logger.info(f"Cleared {removed_count} old completed operations")
 
         return removed_count
@@ -21,6 +21,7 @@ except ImportError:
     psutil = None
 
 from .base_plugin import BasePlugin, PluginResult, PluginStatus
+from .result_cache import TaskResultCache
 
 
 @dataclass
@@ -73,8 +74,7 @@ class NIMDAAdvancedToolsPlugin(BasePlugin):
 
         # Система кешування
         self.cache_db_path = self.workspace_path / "nimda_cache.db"
-        self.cache_hit_rate = 0.0
-        self.cache_entries = 0
+        self.result_cache: Optional[TaskResultCache] = None
 
         # Метрики системи
         self.system_metrics = []
@@ -119,21 +119,17 @@ class NIMDAAdvancedToolsPlugin(BasePlugin):
     def _setup_cache_database(self):
         """Налаштування бази даних для кешування"""
         try:
+            self.result_cache = TaskResultCache(
+                self.cache_db_path,
+                ttl=self.config.get("cache_ttl", 24 * 3600),
+                max_entries=self.config.get("cache_max_entries", 1000),
+                max_bytes=self.config.get("cache_max_bytes"),
+                memory_entries=self.config.get("cache_memory_entries", 128),
+            )
+
             conn = sqlite3.connect(self.cache_db_path)
             cursor = conn.cursor()
 
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS task_cache (
-                    id TEXT PRIMARY KEY,
-                    task_hash TEXT,
-                    result TEXT,
-                    execution_time REAL,
-                    created_at TIMESTAMP,
-                    access_count INTEGER DEFAULT 0,
-                    last_accessed TIMESTAMP
-                )
-            """)
-
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS performance_metrics (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -177,6 +173,9 @@ class NIMDAAdvancedToolsPlugin(BasePlugin):
         start_time = time.time()
         self.update_status(PluginStatus.RUNNING)
 
+        # Ключ кешу - завдання до AI оптимізації
+        requested_task = task
+
         try:
             # Перевірка кешу
             if self.smart_caching:
@@ -200,15 +199,15 @@ class NIMDAAdvancedToolsPlugin(BasePlugin):
             task_type = task.get("type", "")
             result = await self._execute_advanced_task(task_type, task, context)
 
-            # Збереження в кеш
-            if self.smart_caching and result.success:
-                await self._cache_result(task, result)
-
             # Оновлення метрик
             execution_time = time.time() - start_time
             await self._update_performance_metrics(task, execution_time, result.success)
 
             result.execution_time = execution_time
+
+            # Збереження в кеш
+            if self.smart_caching and result.success:
+                await self._cache_result(requested_task, result)
             self.update_status(
                 PluginStatus.COMPLETED if result.success else PluginStatus.ERROR
             )
@@ -510,80 +509,60 @@ class NIMDAAdvancedToolsPlugin(BasePlugin):
             priority_score=1.0,
         )
 
+    def _task_hash(self, task: Dict[str, Any]) -> str:
+        """Хеш завдання для ключа кешу"""
+        return hashlib.md5(
+            json.dumps(task, sort_keys=True, default=str).encode()
+        ).hexdigest()
+
     async def _check_cache(self, task: Dict[str, Any]) -> Optional[PluginResult]:
         """Перевірка кешу завдань"""
-        try:
-            task_hash = hashlib.md5(
-                json.dumps(task, sort_keys=True).encode()
-            ).hexdigest()
+        if self.result_cache is None:
+            return None
 
-            conn = sqlite3.connect(self.cache_db_path)
-            cursor = conn.cursor()
+        try:
+            cached = self.result_cache.get(self._task_hash(task))
+            if cached is None:
+                return None
 
-            cursor.execute(
-                "SELECT result, execution_time FROM task_cache WHERE task_hash = ?",
-                (task_hash,),
+            cached_data, execution_time = cached
+            return PluginResult(
+                success=cached_data["success"],
+                message=f"[CACHE] {cached_data['message']}",
+                data=cached_data.get("data"),
+                execution_time=execution_time,
             )
 
-            result = cursor.fetchone()
-            conn.close()
-
-            if result:
-                self.cache_hit_rate = (self.cache_hit_rate * self.cache_entries + 1) / (
-                    self.cache_entries + 1
-                )
-                self.cache_entries += 1
-
-                cached_data = json.loads(result[0])
-                return PluginResult(
-                    success=cached_data["success"],
-                    message=f"[CACHE] {cached_data['message']}",
-                    data=cached_data.get("data"),
-                    execution_time=result[1],
-                )
-
-            return None
-
         except Exception as e:
             self.logger.error(f"Помилка перевірки кешу: {e}")
             return None
 
     async def _cache_result(self, task: Dict[str, Any], result: PluginResult):
         """Збереження результату в кеш"""
-        try:
-            task_hash = hashlib.md5(
-                json.dumps(task, sort_keys=True).encode()
-            ).hexdigest()
+        if self.result_cache is None:
+            return
 
+        try:
             result_data = {
                 "success": result.success,
                 "message": result.message,
                 "data": result.data,
             }
 
-            conn = sqlite3.connect(self.cache_db_path)
-            cursor = conn.cursor()
-
-            cursor.execute(
-                """INSERT OR REPLACE INTO task_cache 
-                   (id, task_hash, result, execution_time, created_at, last_accessed) 
-                   VALUES (?, ?, ?, ?, ?, ?)""",
-                (
-                    f"{task_hash}_{int(time.time())}",
-                    task_hash,
-                    json.dumps(result_data),
-                    result.execution_time or 0,
-                    datetime.now(),
-                    datetime.now(),
-                ),
+            self.result_cache.put(
+                self._task_hash(task), result_data, result.execution_time or 0
             )
 
-            conn.commit()
-            conn.close()
-
         except Exception as e:
             self.logger.error(f"Помилка збереження в кеш: {e}")
 
+    async def cleanup(self) -> bool:
+        """Закриття бази даних кешу"""
+        if self.result_cache is not None:
+            self.result_cache.close()
+            self.result_cache = None
+        return True
+
     def get_supported_tasks(self) -> List[str]:
         """Розширений список підтримуваних завдань"""
         base_tasks = [
@@ -665,11 +644,15 @@ class NIMDAAdvancedToolsPlugin(BasePlugin):
     def get_advanced_statistics(self) -> Dict[str, Any]:
         """Розширена статистика з AI метриками"""
         base_stats = self.get_statistics()
+        cache_stats = (
+            self.result_cache.get_statistics() if self.result_cache is not None else {}
+        )
 
         advanced_stats = {
             "ai_optimization_rate": getattr(self, "ai_optimization_rate", 0.0),
-            "cache_hit_rate": self.cache_hit_rate,
-            "cache_entries": self.cache_entries,
+            "cache_hit_rate": cache_stats.get("hit_rate", 0.0),
+            "cache_entries": cache_stats.get("entries", 0),
+            "cache": cache_stats,
             "prediction_accuracy": getattr(self, "prediction_accuracy", 0.0),
             "resource_efficiency": getattr(self, "resource_efficiency", 0.0),
             "learning_progress": getattr(self, "learning_progress", 0.0),
@@ -2,11 +2,19 @@
 Базовий клас для всіх плагінів NIMDA Agent
 """
 
+import asyncio
 import logging
 from abc import ABC, abstractmethod
+from contextvars import ContextVar
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Цикл подій викликача, коли execute працює в іншому потоці: зворотні
+# виклики плагіна передаються в нього, а не виконуються в робочому потоці
+callback_loop: ContextVar[Optional[asyncio.AbstractEventLoop]] = ContextVar(
+    "callback_loop", default=None
+)
 
 
 class PluginStatus(Enum):
@@ -19,6 +27,14 @@ class PluginStatus(Enum):
     DISABLED = "disabled"
 
 
+class ExecutionClass(Enum):
+    """Спосіб виконання завдань плагіна менеджером"""
+
+    EVENT_LOOP = "event_loop"
+    THREAD = "thread"
+    PROCESS = "process"
+
+
 @dataclass
 class PluginResult:
     """Результат виконання плагіна"""
@@ -40,8 +56,14 @@ class BasePlugin(ABC):
     - Моніторингу стану
     - Інтеграції з GUI
     - Обробки помилок
+
+    Клас виконання (``execution_class``) визначає, де менеджер запускає
+    ``execute``: у циклі подій, у пулі потоків чи в пулі процесів.
+    Значення можна перевизначити в конфігурації ключем ``execution_class``.
     """
 
+    execution_class = ExecutionClass.EVENT_LOOP
+
     def __init__(
         self, name: str, version: str = "1.0.0", config: Optional[Dict] = None
     ):
@@ -110,6 +132,36 @@ class BasePlugin(ABC):
         """
         pass
 
+    def get_execution_class(self, task: Dict[str, Any]) -> ExecutionClass:
+        """
+        Отримання класу виконання для завдання
+
+        Args:
+            task: Завдання для виконання
+
+        Returns:
+            ExecutionClass: Клас виконання
+        """
+        configured = self.config.get("execution_class")
+        if configured:
+            return ExecutionClass(configured)
+        return self.execution_class
+
+    def get_process_factory(self) -> Tuple[str, str, Dict[str, Any]]:
+        """
+        Опис для створення копії плагіна у робочому процесі
+
+        Плагіни з іншою сигнатурою конструктора мають перевизначити метод.
+
+        Returns:
+            Tuple: Модуль, назва класу та аргументи конструктора
+        """
+        return (
+            type(self).__module__,
+            type(self).__qualname__,
+            {"config": dict(self.config)},
+        )
+
     def validate_task(self, task: Dict[str, Any]) -> bool:
         """
         Валідація завдання перед виконанням
@@ -137,7 +189,7 @@ class BasePlugin(ABC):
         self.logger.info(f"Статус змінено: {old_status.value} -> {status.value}")
 
         if self.on_status_change:
-            self.on_status_change(self, old_status, status, message)
+            self._notify(self.on_status_change, self, old_status, status, message)
 
     def update_progress(self, progress: float, message: str = ""):
         """
@@ -148,7 +200,7 @@ class BasePlugin(ABC):
             message: Повідомлення про прогрес
         """
         if self.on_progress_update:
-            self.on_progress_update(self, progress, message)
+            self._notify(self.on_progress_update, self, progress, message)
 
     def update_gui(self, gui_data: Dict[str, Any]):
         """
@@ -158,7 +210,21 @@ class BasePlugin(ABC):
             gui_data: Дані для відображення в GUI
         """
         if self.on_gui_update:
-            self.on_gui_update(self, gui_data)
+            self._notify(self.on_gui_update, self, gui_data)
+
+    def _notify(self, callback: Callable[..., Any], *args: Any):
+        """
+        Виклик зворотного виклику в потоці циклу подій викликача
+
+        Args:
+            callback: Зворотний виклик
+            *args: Аргументи виклику
+        """
+        loop = callback_loop.get()
+        if loop is None:
+            callback(*args)
+        else:
+            loop.call_soon_threadsafe(callback, *args)
 
     def get_statistics(self) -> Dict[str, Any]:
         """
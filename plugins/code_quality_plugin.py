@@ -0,0 +1,224 @@
+"""
+🔍 NIMDA Code Quality Plugin
+Статичний аналіз Python-коду робочої директорії (AST та пошук паттернів)
+
+Аналіз - чиста CPU-робота, тому плагін виконується в пулі процесів
+менеджера і не блокує цикл подій та зворотні виклики GUI.
+"""
+
+import ast
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .base_plugin import BasePlugin, ExecutionClass, PluginResult, PluginStatus
+from .workspace_index import WorkspaceIndex
+
+# Виклики, що виконують довільний код
+DANGEROUS_CALLS = {"eval", "exec", "__import__"}
+
+# Вузли AST, що додають гілку до цикломатичної складності
+BRANCH_NODES = (
+    ast.If,
+    ast.For,
+    ast.AsyncFor,
+    ast.While,
+    ast.Try,
+    ast.With,
+    ast.AsyncWith,
+    ast.ExceptHandler,
+    ast.BoolOp,
+    ast.IfExp,
+    ast.comprehension,
+)
+
+
+class CodeQualityPlugin(BasePlugin):
+    """
+    Плагін статичного аналізу коду
+
+    Перевірки:
+    - Синтаксичні помилки (``ast.parse``)
+    - Небезпечні виклики (eval/exec/__import__, subprocess з shell=True)
+    - Цикломатична складність функцій
+    - Довжина функцій
+    """
+
+    execution_class = ExecutionClass.PROCESS
+
+    def __init__(self, config: Optional[Dict] = None, name: str = "CodeQuality"):
+        """Ініціалізація плагіна"""
+        super().__init__(name=name, version="1.0.0", config=config or {})
+
+        self.workspace_path = Path(self.config.get("workspace_path", "."))
+        self.complexity_threshold = self.config.get("complexity_threshold", 10)
+        self.function_length_threshold = self.config.get(
+            "function_length_threshold", 50
+        )
+        self.max_files = self.config.get("max_files")
+
+        # Створюється в initialize (також у кожному робочому процесі)
+        self.workspace_index: Optional[WorkspaceIndex] = None
+
+    async def initialize(self) -> bool:
+        """Створення індексу файлів робочої директорії"""
+        self.workspace_index = WorkspaceIndex(self.workspace_path)
+        return True
+
+    async def execute(
+        self, task: Dict[str, Any], context: Optional[Dict] = None
+    ) -> PluginResult:
+        """
+        Аналіз коду робочої директорії
+
+        Args:
+            task: Завдання ``code_quality_scan``
+            context: Контекст виконання
+
+        Returns:
+            PluginResult: Знахідки аналізу та оцінка якості
+        """
+        start_time = time.time()
+        self.update_status(PluginStatus.RUNNING)
+
+        try:
+            if self.workspace_index is None:
+                raise RuntimeError("Плагін не ініціалізовано")
+
+            # Новий запуск - файли перечитуються за mtime/size
+            self.workspace_index.refresh()
+            files = self.workspace_index.files()
+            if self.max_files:
+                files = files[: self.max_files]
+
+            report = self._analyze_files(files)
+            problem_files = {
+                finding["file"]
+                for key in ("syntax_errors", "security", "complex_functions")
+                for finding in report[key]
+            }
+            quality_score = (
+                100.0 * (1 - len(problem_files) / len(files)) if files else 100.0
+            )
+            report["quality_score"] = round(quality_score, 1)
+
+            success = not report["syntax_errors"] and quality_score >= 80
+            self.update_status(
+                PluginStatus.COMPLETED if success else PluginStatus.ERROR
+            )
+
+            return PluginResult(
+                success=success,
+                message=(
+                    f"Аналіз коду: {quality_score:.1f}% "
+                    f"({len(files)} файлів, {len(problem_files)} з проблемами)"
+                ),
+                data=report,
+                execution_time=time.time() - start_time,
+            )
+
+        except Exception as e:
+            self.logger.error(f"Помилка аналізу коду: {e}")
+            self.update_status(PluginStatus.ERROR)
+            return PluginResult(
+                success=False,
+                message=f"Помилка аналізу коду: {e}",
+                execution_time=time.time() - start_time,
+                error=e,
+            )
+
+    def _analyze_files(self, files: List[Path]) -> Dict[str, Any]:
+        """Аналіз файлів з індексу"""
+        assert self.workspace_index is not None
+        report: Dict[str, Any] = {
+            "files_scanned": 0,
+            "syntax_errors": [],
+            "security": [],
+            "complex_functions": [],
+            "long_functions": [],
+        }
+
+        for path in files:
+            content = self.workspace_index.read_text(path)
+            if content is None:
+                continue
+            report["files_scanned"] += 1
+            relative = self._relative(path)
+
+            try:
+                tree = ast.parse(content, filename=str(path))
+            except SyntaxError as e:
+                report["syntax_errors"].append(
+                    {"file": relative, "line": e.lineno, "error": e.msg}
+                )
+                continue
+
+            for node in ast.walk(tree):
+                if isinstance(node, ast.Call):
+                    issue = self._security_issue(node)
+                    if issue:
+                        report["security"].append(
+                            {"file": relative, "line": node.lineno, "issue": issue}
+                        )
+                elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                    complexity = 1 + sum(
+                        isinstance(child, BRANCH_NODES) for child in ast.walk(node)
+                    )
+                    length = (node.end_lineno or node.lineno) - node.lineno + 1
+                    finding = {
+                        "file": relative,
+                        "function": node.name,
+                        "line": node.lineno,
+                    }
+                    if complexity > self.complexity_threshold:
+                        report["complex_functions"].append(
+                            {**finding, "complexity": complexity}
+                        )
+                    if length > self.function_length_threshold:
+                        report["long_functions"].append({**finding, "length": length})
+
+        return report
+
+    @staticmethod
+    def _security_issue(node: ast.Call) -> Optional[str]:
+        """Опис небезпечного виклику або None"""
+        func = node.func
+        if isinstance(func, ast.Name) and func.id in DANGEROUS_CALLS:
+            return f"{func.id}()"
+        if (
+            isinstance(func, ast.Attribute)
+            and isinstance(func.value, ast.Name)
+            and func.value.id == "subprocess"
+        ):
+            for keyword in node.keywords:
+                if (
+                    keyword.arg == "shell"
+                    and isinstance(keyword.value, ast.Constant)
+                    and keyword.value.value is True
+                ):
+                    return f"subprocess.{func.attr}(shell=True)"
+        return None
+
+    def _relative(self, path: Path) -> str:
+        """Шлях файлу відносно робочої директорії"""
+        try:
+            return str(path.relative_to(self.workspace_path))
+        except ValueError:
+            return str(path)
+
+    def get_supported_tasks(self) -> List[str]:
+        """Підтримувані типи завдань"""
+        return ["code_quality_scan"]
+
+    def get_gui_configuration(self) -> Dict[str, Any]:
+        """Конфігурація GUI"""
+        return {
+            "window_type": "analysis_panel",
+            "components": [
+                {
+                    "type": "quality_score",
+                    "id": "code_quality",
+                    "label": "Якість коду",
+                },
+            ],
+        }
@@ -0,0 +1,435 @@
+"""
+Спільний кешований документ DEV_PLAN
+Один розбір на зміну файлу для всіх споживачів плану
+
+Сервіс один раз розбирає вміст плану в нормалізовану структуру
+(``build_outline``): заголовки з рівнями, завдання-чекбокси з підзадачами,
+зсувами та анотаціями. Представлення споживачів будуються з неї, а не
+повторним розбором тексту.
+"""
+
+import asyncio
+import copy
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+from dataclasses import dataclass, field
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+SIDECAR_VERSION = 2
+CACHE_DIR_NAME = ".nimda_cache"
+
+HEADING = re.compile(r"^\s*(#{1,6})\s+(.*?)\s*$")
+CHECKBOX = re.compile(r"^(\s*)-\s+\[([ x])\]\s*(.*?)\s*$")
+DEPENDS = re.compile(
+    r"^\s*(?:<!--\s*)?[*_]*depends:\s*(.+?)[*_]*\s*(?:-->)?\s*$", re.IGNORECASE
+)
+# Дозвіл паралельного виконання підзадач: "<!-- parallel -->"
+PARALLEL_MARKER = re.compile(
+    r"^\s*(?:<!--\s*)?[*_]*parallel[*_]*\s*(?:-->)?\s*$", re.IGNORECASE
+)
+
+
+def build_outline(content: str) -> Dict[str, Any]:
+    """
+    Нормалізований розбір DEV_PLAN за один прохід по рядках
+
+    Заголовки йдуть плоским списком з рівнями (0 - текст до першого
+    заголовка), тож кожен споживач сам вирішує, що вважати фазою чи
+    секцією. Чекбокс з більшим відступом за попереднє завдання
+    заголовка стає його підзадачею. Усі номери рядків - індекси у
+    ``content.split("\\n")``, зсуви - позиції символу чекбокса у ``content``.
+
+    Args:
+        content: Текст DEV_PLAN (кінці рядків "\\n")
+
+    Returns:
+        Dict: Заголовки (``headings``) з текстом, анотаціями та завданнями
+    """
+    headings: List[Dict[str, Any]] = []
+    task: Optional[Dict[str, Any]] = None
+
+    def open_heading(level: int, title: str, line: int) -> Dict[str, Any]:
+        heading = {
+            "level": level,
+            "title": title,
+            "line": line,
+            "depends": [],
+            "parallel": False,
+            "text": [],
+            "tasks": [],
+        }
+        headings.append(heading)
+        return heading
+
+    heading = open_heading(0, "", -1)
+    lines = content.split("\n")
+    position = 0
+
+    for index, line in enumerate(lines):
+        line_start = position
+        position += len(line) + 1
+
+        if "#" in line:
+            match = HEADING.match(line)
+            if match:
+                if task is not None:
+                    task["end"] = index
+                    task = None
+                heading = open_heading(len(match.group(1)), match.group(2), index)
+                continue
+
+        if "[" in line:
+            match = CHECKBOX.match(line)
+            if match:
+                item = {
+                    "line": index,
+                    "offset": line_start + match.start(2),
+                    "checked": match.group(2) == "x",
+                    "text": match.group(3),
+                }
+                if task is not None and len(match.group(1)) > task["indent"]:
+                    task["subtasks"].append(item)
+                    continue
+                if task is not None:
+                    task["end"] = index
+                task = {
+                    **item,
+                    "indent": len(match.group(1)),
+                    "end": index + 1,
+                    "subtasks": [],
+                }
+                heading["tasks"].append(task)
+                continue
+
+        stripped = line.strip()
+        if not stripped:
+            continue
+        if PARALLEL_MARKER.match(stripped):
+            heading["parallel"] = True
+            continue
+        if ":" in stripped:
+            heading["depends"].extend(_match_depends(stripped))
+        heading["text"].append(index)
+
+    if task is not None:
+        task["end"] = len(lines)
+
+    return {"headings": headings}
+
+
+def _match_depends(line: str) -> List[str]:
+    """Посилання з рядка-анотації залежностей"""
+    match = DEPENDS.match(line)
+    if not match:
+        return []
+
+    references = []
+    for reference in re.split(r"[,;]", match.group(1)):
+        reference = reference.strip().strip("*_` ")
+        if reference:
+            references.append(reference)
+    return references
+
+
+@dataclass
+class DevPlanDocument:
+    """Прочитаний файл DEV_PLAN"""
+
+    path: Path
+    content: str
+    content_hash: str
+    signature: Tuple[int, int]  # (mtime_ns, розмір) на момент читання
+    newline: str = "\n"  # Стиль кінців рядків у файлі
+    _lines: Optional[List[str]] = field(default=None, repr=False)
+    _outline: Optional[Dict[str, Any]] = field(default=None, repr=False)
+
+    @property
+    def lines(self) -> List[str]:
+        """Рядки документа"""
+        if self._lines is None:
+            self._lines = self.content.split("\n")
+        return self._lines
+
+    @property
+    def outline(self) -> Dict[str, Any]:
+        """Нормалізований розбір документа (один на вміст)"""
+        if self._outline is None:
+            self._outline = build_outline(self.content)
+        return self._outline
+
+
+@dataclass
+class _CachedPlan:
+    """Стан кешу одного файлу плану"""
+
+    document: DevPlanDocument
+    views: Dict[str, Any] = field(default_factory=dict)
+    sidecar_checked: bool = False
+
+
+class DevPlanDocumentService:
+    """
+    Кеш розібраних представлень DEV_PLAN
+
+    Вміст плану розбирається один раз (ключ - sha256) у нормалізовану
+    структуру ``document.outline``. Кожен споживач отримує своє
+    представлення через ``view`` з унікальною назвою та функцією побудови,
+    що бере дані з цієї структури. Розбір і представлення зберігаються у
+    файлі-супутнику ``.nimda_cache/<ім'я>.views.json`` поруч із планом, тож
+    інші процеси не розбирають незмінений план повторно.
+
+    Назви представлень варто доповнювати версією (``"phases:1"``), щоб зміна
+    парсера не повертала застарілий результат із файлу-супутника.
+    """
+
+    def __init__(self, persist: bool = True):
+        """
+        Ініціалізація сервісу
+
+        Args:
+            persist: Зберігати представлення у файлах-супутниках
+        """
+        self.persist = persist
+        self.logger = logging.getLogger("DevPlanDocumentService")
+        self._lock = threading.RLock()
+        self._plans: Dict[str, _CachedPlan] = {}
+        self._stats = {
+            "reads": 0,
+            "parses": 0,
+            "builds": 0,
+            "memory_hits": 0,
+            "sidecar_hits": 0,
+        }
+
+    def load(self, path: Path) -> DevPlanDocument:
+        """
+        Поточний документ плану
+
+        Файл перечитується лише після зміни mtime або розміру.
+
+        Args:
+            path: Шлях до DEV_PLAN.md
+
+        Returns:
+            DevPlanDocument: Документ плану
+        """
+        with self._lock:
+            return self._load_locked(Path(path)).document
+
+    def view(
+        self,
+        path: Path,
+        name: str,
+        builder: Callable[[DevPlanDocument], Any],
+        copy_view: Callable[[Any], Any] = copy.deepcopy,
+    ) -> Any:
+        """
+        Представлення плану, побудоване один раз для поточного вмісту
+
+        Args:
+            path: Шлях до DEV_PLAN.md
+            name: Назва представлення
+            builder: Функція побудови з документа (результат сумісний з JSON)
+            copy_view: Копіювання закешованого значення для викликача
+
+        Returns:
+            Незалежна копія представлення
+        """
+        return self.load_with_view(path, name, builder, copy_view)[1]
+
+    def load_with_view(
+        self,
+        path: Path,
+        name: str,
+        builder: Callable[[DevPlanDocument], Any],
+        copy_view: Callable[[Any], Any] = copy.deepcopy,
+    ) -> Tuple[DevPlanDocument, Any]:
+        """
+        Документ та його представлення з одного знімка файлу
+
+        Args:
+            path: Шлях до DEV_PLAN.md
+            name: Назва представлення
+            builder: Функція побудови з документа (результат сумісний з JSON)
+            copy_view: Копіювання закешованого значення для викликача
+
+        Returns:
+            Tuple: Документ та незалежна копія представлення
+        """
+        with self._lock:
+            cached = self._load_locked(Path(path))
+
+            if name not in cached.views and not cached.sidecar_checked:
+                cached.sidecar_checked = True
+                self._read_sidecar(cached)
+                if name in cached.views:
+                    self._stats["sidecar_hits"] += 1
+            elif name in cached.views:
+                self._stats["memory_hits"] += 1
+
+            if name not in cached.views:
+                if cached.document._outline is None:
+                    cached.document._outline = build_outline(cached.document.content)
+                    self._stats["parses"] += 1
+                cached.views[name] = builder(cached.document)
+                self._stats["builds"] += 1
+                self._write_sidecar(cached)
+
+            return cached.document, copy_view(cached.views[name])
+
+    async def aload(self, path: Path) -> DevPlanDocument:
+        """Асинхронний варіант ``load`` (читання у пулі потоків)"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.load, path)
+
+    async def aview(
+        self,
+        path: Path,
+        name: str,
+        builder: Callable[[DevPlanDocument], Any],
+        copy_view: Callable[[Any], Any] = copy.deepcopy,
+    ) -> Any:
+        """Асинхронний варіант ``view`` (розбір у пулі потоків)"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, partial(self.view, path, name, builder, copy_view)
+        )
+
+    def invalidate(self, path: Optional[Path] = None):
+        """
+        Скидання кешу в пам'яті
+
+        Args:
+            path: Файл плану (None - усі файли)
+        """
+        with self._lock:
+            if path is None:
+                self._plans.clear()
+            else:
+                self._plans.pop(str(Path(path).resolve()), None)
+
+    def get_statistics(self) -> Dict[str, int]:
+        """
+        Статистика сервісу
+
+        Returns:
+            Dict: Кількість читань, розборів, побудов та влучань у кеш
+        """
+        with self._lock:
+            return {**self._stats, "documents": len(self._plans)}
+
+    def _load_locked(self, path: Path) -> _CachedPlan:
+        """Документ із кешу або з диска (під блокуванням)"""
+        key = str(path.resolve())
+        stat = path.stat()
+        signature = (stat.st_mtime_ns, stat.st_size)
+
+        cached = self._plans.get(key)
+        if cached is not None and cached.document.signature == signature:
+            return cached
+
+        data = path.read_bytes()
+        self._stats["reads"] += 1
+        document = DevPlanDocument(
+            path=path,
+            # Переведення рядків як у текстовому режимі open()
+            content=data.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n"),
+            content_hash=hashlib.sha256(data).hexdigest(),
+            signature=signature,
+            newline="\r\n" if b"\r\n" in data else "\n",
+        )
+
+        # Той самий вміст (наприклад, після touch) зберігає розбір і представлення
+        if cached is not None and cached.document.content_hash == document.content_hash:
+            document._outline = cached.document._outline
+            cached.document = document
+            return cached
+
+        cached = self._plans[key] = _CachedPlan(document=document)
+        return cached
+
+    def _sidecar_path(self, document: DevPlanDocument) -> Path:
+        """Шлях до файлу-супутника плану"""
+        return (
+            document.path.parent / CACHE_DIR_NAME / f"{document.path.stem}.views.json"
+        )
+
+    def _read_sidecar(self, cached: _CachedPlan):
+        """Розбір і представлення з файлу-супутника для поточного вмісту"""
+        if not self.persist:
+            return
+
+        document = cached.document
+        try:
+            data = json.loads(self._sidecar_path(document).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+
+        if (
+            data.get("version") != SIDECAR_VERSION
+            or data.get("content_hash") != document.content_hash
+        ):
+            return
+        if document._outline is None and data.get("outline") is not None:
+            document._outline = data["outline"]
+        cached.views.update(data.get("views", {}))
+
+    def _write_sidecar(self, cached: _CachedPlan):
+        """Атомарний запис представлень у файл-супутник"""
+        if not self.persist:
+            return
+
+        sidecar = self._sidecar_path(cached.document)
+        try:
+            payload = json.dumps(
+                {
+                    "version": SIDECAR_VERSION,
+                    "content_hash": cached.document.content_hash,
+                    "outline": cached.document._outline,
+                    "views": cached.views,
+                },
+                ensure_ascii=False,
+            )
+        except (TypeError, ValueError) as e:
+            self.logger.debug(f"Представлення не серіалізуються: {e}")
+            return
+
+        try:
+            sidecar.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_name = tempfile.mkstemp(
+                dir=sidecar.parent, prefix=f".{sidecar.name}.", suffix=".tmp"
+            )
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as temp_file:
+                    temp_file.write(payload)
+                os.replace(temp_name, sidecar)
+            except BaseException:
+                Path(temp_name).unlink(missing_ok=True)
+                raise
+        except OSError as e:
+            self.logger.warning(f"Не вдалося зберегти кеш DEV_PLAN: {e}")
+
+
+_default_service: Optional[DevPlanDocumentService] = None
+_default_service_lock = threading.Lock()
+
+
+def get_document_service() -> DevPlanDocumentService:
+    """
+    Спільний екземпляр сервісу документів DEV_PLAN
+
+    Returns:
+        DevPlanDocumentService: Сервіс процесу
+    """
+    global _default_service
+    with _default_service_lock:
+        if _default_service is None:
+            _default_service = DevPlanDocumentService()
+        return _default_service
@@ -4,12 +4,16 @@ NIMDA Agent Plugin для виконання DEV_PLAN завдань
 """
 
 import asyncio
-import re
 import time
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from .base_plugin import BasePlugin, PluginResult, PluginStatus
+from .dev_plan_parser import parse_dev_plan, parse_dev_plan_file
+from .workspace_index import WorkspaceIndex
+
+# Режими паралельності виконання завдань секції
+CONCURRENCY_MODES = ("sequential", "group", "section")
 
 
 class DevPlanExecutorPlugin(BasePlugin):
@@ -33,6 +37,18 @@ class DevPlanExecutorPlugin(BasePlugin):
         self.dev_plan_path = self.workspace_path / "DEV_PLAN.md"
         self.backup_enabled = self.config.get("backup_enabled", True)
         self.max_parallel_tasks = self.config.get("max_parallel_tasks", 3)
+        # Режим паралельності: "sequential" (за замовчуванням), "group" або
+        # "section" - паралельні режими вмикаються лише явно в конфігурації
+        self.concurrency_mode = self.config.get("concurrency_mode", "sequential")
+        if self.concurrency_mode not in CONCURRENCY_MODES:
+            self.logger.warning(
+                f"Невідомий concurrency_mode '{self.concurrency_mode}', "
+                f"використовується 'sequential' (допустимі: {', '.join(CONCURRENCY_MODES)})"
+            )
+            self.concurrency_mode = "sequential"
+
+        # Спільний індекс файлів для перевірок якості та інструментів
+        self.workspace_index = WorkspaceIndex(self.workspace_path)
 
         # Структура плану
         self.dev_plan = {
@@ -46,9 +62,12 @@ class DevPlanExecutorPlugin(BasePlugin):
             },
         }
 
-        # Поточне виконання
+        # Поточне виконання (DAG-планувальник виконує кілька секцій одночасно)
         self.current_phase = None
         self.current_section = None
+        self.active_sections: List[str] = []
+        self._active_executions = 0
+        self._batch_failed = False
         self.execution_queue = []
         self.running_tasks = []
 
@@ -72,7 +91,15 @@ class DevPlanExecutorPlugin(BasePlugin):
             PluginResult: Результат виконання
         """
         start_time = time.time()
-        self.update_status(PluginStatus.RUNNING)
+
+        # Одночасні виклики ділять статус плагіна та індекс файлів: статус
+        # і оновлення індексу змінює лише перший та останній з них
+        self._active_executions += 1
+        if self._active_executions == 1:
+            self._batch_failed = False
+            self.update_status(PluginStatus.RUNNING)
+            # Один обхід робочої директорії на запуск
+            self.workspace_index.refresh()
 
         try:
             task_type = task.get("type", "")
@@ -87,6 +114,26 @@ class DevPlanExecutorPlugin(BasePlugin):
                     )
                 else:
                     result = await self._execute_phase(phase_name)
+            elif task_type in ("begin_phase", "finish_phase"):
+                # Облік фази, секції якої виконує зовнішній планувальник
+                phase_name = task.get("phase_name")
+                if phase_name not in self.dev_plan["phases"]:
+                    result = PluginResult(
+                        success=False, message=f"Фаза {phase_name} не знайдена"
+                    )
+                elif task_type == "begin_phase":
+                    self._begin_phase(phase_name)
+                    result = PluginResult(
+                        success=True, message=f"Фаза {phase_name} розпочата"
+                    )
+                else:
+                    result = self._finish_phase(
+                        phase_name,
+                        task.get("completed_sections", 0),
+                        task.get("failed_sections", 0),
+                        task.get("execution_time", 0.0),
+                        task.get("skipped_sections", 0),
+                    )
             elif task_type == "execute_section":
                 phase_name = task.get("phase_name")
                 section_name = task.get("section_name")
@@ -117,26 +164,29 @@ class DevPlanExecutorPlugin(BasePlugin):
             result.execution_time = execution_time
             self.task_execution_times.append(execution_time)
 
-            if result.success:
-                self.update_status(PluginStatus.COMPLETED)
-            else:
-                self.update_status(PluginStatus.ERROR)
-
-            return result
-
         except Exception as e:
             self.logger.error(f"Помилка виконання завдання: {e}")
             execution_time = time.time() - start_time
 
-            self.update_status(PluginStatus.ERROR)
-
-            return PluginResult(
+            result = PluginResult(
                 success=False,
                 message=f"Помилка виконання: {e}",
                 execution_time=execution_time,
                 error=e,
             )
 
+        finally:
+            self._active_executions -= 1
+
+        self._batch_failed = self._batch_failed or not result.success
+        if self._active_executions == 0:
+            if self._batch_failed:
+                self.update_status(PluginStatus.ERROR)
+            else:
+                self.update_status(PluginStatus.COMPLETED)
+
+        return result
+
     async def _parse_dev_plan(self) -> PluginResult:
         """Парсинг DEV_PLAN.md файлу"""
         try:
@@ -146,14 +196,9 @@ class DevPlanExecutorPlugin(BasePlugin):
                     message=f"DEV_PLAN.md не знайдено за шляхом: {self.dev_plan_path}",
                 )
 
-            content = self.dev_plan_path.read_text(encoding="utf-8")
-
-            # Парсинг фаз
-            phases = self._extract_phases(content)
+            # Парсинг фаз та метаданих (кешується до зміни файлу)
+            phases, metadata = parse_dev_plan_file(self.dev_plan_path)
             self.dev_plan["phases"] = phases
-
-            # Парсинг метаданих
-            metadata = self._extract_metadata(content)
             self.dev_plan["metadata"] = metadata
 
             # Підрахунок статистики
@@ -196,105 +241,17 @@ class DevPlanExecutorPlugin(BasePlugin):
 
     def _extract_phases(self, content: str) -> Dict[str, Any]:
         """Витягування фаз з контенту"""
-        phases = {}
-
-        # Регулярний вираз для пошуку фаз
-        phase_pattern = r"## 🎮 (Phase \d+): (.+?)\n(.*?)(?=## 🎮 Phase|\## 📊|\Z)"
-
-        for match in re.finditer(phase_pattern, content, re.DOTALL):
-            phase_id = match.group(1)
-            phase_title = match.group(2).strip()
-            phase_content = match.group(3)
-
-            sections = self._extract_sections(phase_content)
-
-            phases[phase_id] = {
-                "title": phase_title,
-                "sections": sections,
-                "status": "pending",
-            }
-
+        phases, _ = parse_dev_plan(content)
         return phases
 
-    def _extract_sections(self, phase_content: str) -> Dict[str, Any]:
-        """Витягування секцій з контенту фази"""
-        sections = {}
-
-        # Регулярний вираз для пошуку секцій
-        section_pattern = r"### (\d+\.\d+) (.+?)\n(.*?)(?=### \d+\.\d+|\Z)"
-
-        for match in re.finditer(section_pattern, phase_content, re.DOTALL):
-            section_id = match.group(1)
-            section_title = match.group(2).strip()
-            section_content = match.group(3)
-
-            tasks = self._extract_tasks(section_content)
-
-            sections[section_id] = {
-                "title": section_title,
-                "tasks": tasks,
-                "status": "pending",
-            }
-
-        return sections
-
-    def _extract_tasks(self, section_content: str) -> List[Dict[str, Any]]:
-        """Витягування завдань з контенту секції"""
-        tasks = []
-
-        # Регулярний вираз для пошуку завдань
-        task_pattern = r"-\s+\[([ x])\]\s+\*\*(.+?)\*\*\s+-\s+(.+?)(?=\n-|\Z)"
-
-        for match in re.finditer(task_pattern, section_content, re.DOTALL):
-            completed = match.group(1) == "x"
-            task_name = match.group(2).strip()
-            task_description = match.group(3).strip()
-
-            tasks.append(
-                {
-                    "name": task_name,
-                    "description": task_description,
-                    "completed": completed,
-                    "status": "completed" if completed else "pending",
-                }
-            )
-
-        return tasks
-
-    def _extract_metadata(self, content: str) -> Dict[str, Any]:
-        """Витягування метаданих з контенту"""
-        metadata = {}
-
-        # Пошук версії плану
-        version_match = re.search(r"Plan v(\d+\.\d+)", content)
-        if version_match:
-            metadata["version"] = version_match.group(1)
-
-        # Пошук дати створення
-        date_match = re.search(r"Created.*?(\d{4}-\d{2}-\d{2})", content)
-        if date_match:
-            metadata["created"] = date_match.group(1)
-
-        # Пошук цільової продуктивності
-        performance_match = re.search(r"(\d+\.\d+)\+ tasks/second", content)
-        if performance_match:
-            metadata["target_performance"] = float(performance_match.group(1))
-
-        return metadata
-
     async def _execute_phase(self, phase_name: str) -> PluginResult:
         """Виконання цілої фази"""
         if phase_name not in self.dev_plan["phases"]:
             return PluginResult(success=False, message=f"Фаза {phase_name} не знайдена")
 
-        self.current_phase = phase_name
         phase = self.dev_plan["phases"][phase_name]
         phase_start_time = time.time()
-
-        self.logger.info(f"Початок виконання фази: {phase_name}")
-        self.update_gui(
-            {"type": "phase_started", "phase": phase_name, "title": phase["title"]}
-        )
+        self._begin_phase(phase_name)
 
         completed_sections = 0
         failed_sections = 0
@@ -315,31 +272,54 @@ class DevPlanExecutorPlugin(BasePlugin):
                 self.logger.error(f"Помилка виконання секції {section_id}: {e}")
                 failed_sections += 1
 
-        phase_time = time.time() - phase_start_time
+        return self._finish_phase(
+            phase_name,
+            completed_sections,
+            failed_sections,
+            time.time() - phase_start_time,
+        )
+
+    def _begin_phase(self, phase_name: str):
+        """Позначення початку фази та подія GUI"""
+        self.current_phase = phase_name
+        phase = self.dev_plan["phases"][phase_name]
+
+        self.logger.info(f"Початок виконання фази: {phase_name}")
+        self.update_gui(
+            {"type": "phase_started", "phase": phase_name, "title": phase["title"]}
+        )
+
+    def _finish_phase(
+        self,
+        phase_name: str,
+        completed_sections: int,
+        failed_sections: int,
+        phase_time: float,
+        skipped_sections: int = 0,
+    ) -> PluginResult:
+        """Статус, час та подія GUI завершеної фази"""
+        phase = self.dev_plan["phases"][phase_name]
         self.phase_completion_times[phase_name] = phase_time
 
-        success = failed_sections == 0
+        success = failed_sections == 0 and skipped_sections == 0
         phase["status"] = "completed" if success else "failed"
 
+        data = {
+            "completed_sections": completed_sections,
+            "failed_sections": failed_sections,
+            "execution_time": phase_time,
+        }
+        if skipped_sections:
+            data["skipped_sections"] = skipped_sections
+
         self.update_gui(
-            {
-                "type": "phase_completed",
-                "phase": phase_name,
-                "success": success,
-                "completed_sections": completed_sections,
-                "failed_sections": failed_sections,
-                "execution_time": phase_time,
-            }
+            {"type": "phase_completed", "phase": phase_name, "success": success, **data}
         )
 
         return PluginResult(
             success=success,
             message=f"Фаза {phase_name} {'завершена' if success else 'завершена з помилками'}: {completed_sections}/{len(phase['sections'])} секцій",
-            data={
-                "completed_sections": completed_sections,
-                "failed_sections": failed_sections,
-                "execution_time": phase_time,
-            },
+            data=data,
         )
 
     async def _execute_section(self, phase_name: str, section_id: str) -> PluginResult:
@@ -348,6 +328,16 @@ class DevPlanExecutorPlugin(BasePlugin):
         section = phase["sections"][section_id]
 
         self.current_section = section_id
+        self.active_sections.append(section_id)
+        try:
+            return await self._run_section(section_id, section)
+        finally:
+            self.active_sections.remove(section_id)
+
+    async def _run_section(
+        self, section_id: str, section: Dict[str, Any]
+    ) -> PluginResult:
+        """Виконання завдань секції групами"""
         self.logger.info(f"Виконання секції {section_id}: {section['title']}")
 
         completed_tasks = 0
@@ -361,41 +351,35 @@ class DevPlanExecutorPlugin(BasePlugin):
                 success=True, message=f"Всі завдання секції {section_id} вже виконані"
             )
 
-        # Групування завдань для паралельного виконання з тройною системою
-        task_groups = self._group_tasks_for_parallel_execution(tasks_to_execute)
+        # 🎯 ТРОЙНЕ ПАРАЛЕЛЬНЕ ВИКОНАННЯ (групування - за concurrency_mode)
+        results = await self._execute_triple_parallel_tasks(tasks_to_execute)
 
-        for group in task_groups:
-            # 🎯 ТРОЙНЕ ПАРАЛЕЛЬНЕ ВИКОНАННЯ
-            results = await self._execute_triple_parallel_tasks(group)
+        for task, task_results in zip(tasks_to_execute, results):
+            main_result = task_results["main"]
+            quality_result = task_results["quality"]
+            tools_result = task_results["tools"]
 
-            for i, task_results in enumerate(results):
-                main_result = task_results["main"]
-                quality_result = task_results["quality"]
-                tools_result = task_results["tools"]
+            # Перевірка всіх результатів
+            overall_success = (
+                main_result.success and quality_result.success and tools_result.success
+            )
 
-                # Перевірка всіх результатів
-                overall_success = (
-                    main_result.success
-                    and quality_result.success
-                    and tools_result.success
-                )
+            if overall_success:
+                completed_tasks += 1
+                task["status"] = "completed"
+                task["completed"] = True
+                task["quality_score"] = task_results.get("quality_score", 100)
+            else:
+                failed_tasks += 1
+                task["status"] = "failed"
 
-                if overall_success:
-                    completed_tasks += 1
-                    group[i]["status"] = "completed"
-                    group[i]["completed"] = True
-                    group[i]["quality_score"] = task_results.get("quality_score", 100)
-                else:
-                    failed_tasks += 1
-                    group[i]["status"] = "failed"
-
-                # Логування результатів якості
-                self.logger.info(
-                    f"Завдання {group[i]['name']}: "
-                    f"Основне: {main_result.success}, "
-                    f"Якість: {quality_result.success}, "
-                    f"Інструменти: {tools_result.success}"
-                )
+            # Логування результатів якості
+            self.logger.info(
+                f"Завдання {task['name']}: "
+                f"Основне: {main_result.success}, "
+                f"Якість: {quality_result.success}, "
+                f"Інструменти: {tools_result.success}"
+            )
 
         success = failed_tasks == 0
         section["status"] = "completed" if success else "failed"
@@ -529,6 +513,7 @@ class DevPlanExecutorPlugin(BasePlugin):
                 "progress": progress,
                 "current_phase": self.current_phase,
                 "current_section": self.current_section,
+                "active_sections": list(self.active_sections),
             },
         )
 
@@ -561,6 +546,8 @@ class DevPlanExecutorPlugin(BasePlugin):
         return [
             "parse_dev_plan",
             "execute_phase",
+            "begin_phase",
+            "finish_phase",
             "execute_section",
             "execute_task",
             "get_progress",
@@ -608,71 +595,94 @@ class DevPlanExecutorPlugin(BasePlugin):
         1. Основне виконання (згідно DEV_PLAN)
         2. Контроль якості коду
         3. Розширені інструменти перевірки
+
+        У режимі "group" завдання виконуються групами по ``max_parallel_tasks``:
+        група стартує одночасно, наступна - після завершення попередньої.
+        У режимі "section" всі завдання стартують одразу, а кількість
+        активних завдань обмежує семафор ``max_parallel_tasks``.
+        Результати повертаються в порядку завдань, GUI оновлюється
+        по мірі завершення кожного завдання.
         """
-        results = []
+        if self.concurrency_mode == "sequential":
+            return [await self._execute_triple_task(task) for task in tasks]
+
+        if self.concurrency_mode == "group":
+            results = []
+            for group in self._group_tasks_for_parallel_execution(tasks):
+                results.extend(
+                    await asyncio.gather(
+                        *(self._execute_triple_task(task) for task in group)
+                    )
+                )
+            return results
 
-        for task in tasks:
-            # Запускаємо всі 3 завдання паралельно
-            main_task = self._execute_main_task(task)
-            quality_task = self._execute_quality_control(task)
-            tools_task = self._execute_advanced_tools_check(task)
-
-            # Очікуємо завершення всіх 3-х
-            raw_results = await asyncio.gather(
-                main_task, quality_task, tools_task, return_exceptions=True
-            )
+        semaphore = asyncio.Semaphore(max(1, self.max_parallel_tasks))
 
-            # Обробка винятків та забезпечення правильних типів
-            main_result = raw_results[0]
-            quality_result = raw_results[1]
-            tools_result = raw_results[2]
+        async def run_with_limit(task: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self._execute_triple_task(task)
 
-            # Конвертуємо винятки в PluginResult
-            if isinstance(main_result, Exception):
-                main_result = PluginResult(
-                    success=False, message=f"Помилка основного завдання: {main_result}"
-                )
-            if isinstance(quality_result, Exception):
-                quality_result = PluginResult(
-                    success=False, message=f"Помилка контролю якості: {quality_result}"
-                )
-            if isinstance(tools_result, Exception):
-                tools_result = PluginResult(
-                    success=False, message=f"Помилка інструментів: {tools_result}"
-                )
+        return list(await asyncio.gather(*(run_with_limit(task) for task in tasks)))
 
-            # Тепер всі результати гарантовано PluginResult
-            assert isinstance(main_result, PluginResult)
-            assert isinstance(quality_result, PluginResult)
-            assert isinstance(tools_result, PluginResult)
+    async def _execute_triple_task(self, task: Dict[str, Any]) -> Dict[str, Any]:
+        """Тройне виконання одного завдання"""
+        # Запускаємо всі 3 завдання паралельно
+        main_task = self._execute_main_task(task)
+        quality_task = self._execute_quality_control(task)
+        tools_task = self._execute_advanced_tools_check(task)
 
-            # Розрахунок загальної оцінки якості
-            quality_score = self._calculate_overall_quality_score(
-                main_result, quality_result, tools_result
-            )
+        # Очікуємо завершення всіх 3-х
+        raw_results = await asyncio.gather(
+            main_task, quality_task, tools_task, return_exceptions=True
+        )
 
-            results.append(
-                {
-                    "main": main_result,
-                    "quality": quality_result,
-                    "tools": tools_result,
-                    "quality_score": quality_score,
-                }
-            )
+        # Обробка винятків та забезпечення правильних типів
+        main_result = raw_results[0]
+        quality_result = raw_results[1]
+        tools_result = raw_results[2]
 
-            # Оновлення GUI з детальною інформацією
-            self.update_gui(
-                {
-                    "type": "triple_task_completed",
-                    "task": task["name"],
-                    "main_success": main_result.success,
-                    "quality_success": quality_result.success,
-                    "tools_success": tools_result.success,
-                    "quality_score": quality_score,
-                }
+        # Конвертуємо винятки в PluginResult
+        if isinstance(main_result, BaseException):
+            main_result = PluginResult(
+                success=False, message=f"Помилка основного завдання: {main_result}"
+            )
+        if isinstance(quality_result, BaseException):
+            quality_result = PluginResult(
+                success=False, message=f"Помилка контролю якості: {quality_result}"
             )
+        if isinstance(tools_result, BaseException):
+            tools_result = PluginResult(
+                success=False, message=f"Помилка інструментів: {tools_result}"
+            )
+
+        # Тепер всі результати гарантовано PluginResult
+        assert isinstance(main_result, PluginResult)
+        assert isinstance(quality_result, PluginResult)
+        assert isinstance(tools_result, PluginResult)
+
+        # Розрахунок загальної оцінки якості
+        quality_score = self._calculate_overall_quality_score(
+            main_result, quality_result, tools_result
+        )
+
+        # Оновлення GUI з детальною інформацією
+        self.update_gui(
+            {
+                "type": "triple_task_completed",
+                "task": task["name"],
+                "main_success": main_result.success,
+                "quality_success": quality_result.success,
+                "tools_success": tools_result.success,
+                "quality_score": quality_score,
+            }
+        )
 
-        return results
+        return {
+            "main": main_result,
+            "quality": quality_result,
+            "tools": tools_result,
+            "quality_score": quality_score,
+        }
 
     async def _execute_main_task(self, task: Dict[str, Any]) -> PluginResult:
         """Виконання основного завдання згідно DEV_PLAN"""
@@ -838,16 +848,15 @@ class DevPlanExecutorPlugin(BasePlugin):
             await asyncio.sleep(0.1)
 
             # Реальна перевірка імпортів (можна розширити)
-            python_files = list(self.workspace_path.glob("**/*.py"))
+            python_files = self.workspace_index.files()
             import_issues = 0
 
             for file_path in python_files[:5]:  # Обмежуємо для демо
-                try:
-                    content = file_path.read_text(encoding="utf-8")
-                    # Перевірка на відсутні імпорти
-                    if "import" not in content and len(content) > 50:
-                        import_issues += 1
-                except Exception:
+                content = self.workspace_index.read_text(file_path)
+                if content is None:
+                    import_issues += 1
+                # Перевірка на відсутні імпорти
+                elif "import" not in content and len(content) > 50:
                     import_issues += 1
 
             success = import_issues < len(python_files) * 0.2  # Макс 20% помилок
@@ -899,7 +908,7 @@ class DevPlanExecutorPlugin(BasePlugin):
             await asyncio.sleep(0.15)
 
             # Перевірка наявності __init__.py файлів
-            python_dirs = [p.parent for p in self.workspace_path.glob("**/*.py")]
+            python_dirs = [p.parent for p in self.workspace_index.files()]
             init_coverage = 0
 
             for py_dir in set(python_dirs):
@@ -940,14 +949,13 @@ class DevPlanExecutorPlugin(BasePlugin):
                 ]
             )
 
-            has_tests = (
-                any(
-                    [
-                        (self.workspace_path / name).exists()
-                        for name in ["test_*.py", "tests/", "*_test.py"]
-                    ]
-                )
-                or len(list(self.workspace_path.glob("**/test*.py"))) > 0
+            has_tests = any(
+                [
+                    (self.workspace_path / name).exists()
+                    for name in ["test_*.py", "tests/", "*_test.py"]
+                ]
+            ) or any(
+                path.name.startswith("test") for path in self.workspace_index.files()
             )
 
             structure_score = sum([has_main_modules, has_config, has_tests]) / 3
@@ -969,7 +977,7 @@ class DevPlanExecutorPlugin(BasePlugin):
             await asyncio.sleep(0.2)
 
             # Базова перевірка небезпечних паттернів
-            python_files = list(self.workspace_path.glob("**/*.py"))
+            python_files = self.workspace_index.files()
             security_issues = 0
 
             dangerous_patterns = [
@@ -983,14 +991,13 @@ class DevPlanExecutorPlugin(BasePlugin):
             ]
 
             for file_path in python_files[:10]:  # Обмежуємо для демо
-                try:
-                    content = file_path.read_text(encoding="utf-8")
-                    for pattern in dangerous_patterns:
-                        if pattern in content:
-                            security_issues += 1
-                            break
-                except Exception:
+                content = self.workspace_index.read_text(file_path)
+                if content is None:
                     continue
+                for pattern in dangerous_patterns:
+                    if pattern in content:
+                        security_issues += 1
+                        break
 
             # Вважаємо безпечним, якщо менше 30% файлів мають підозрілі паттерни
             total_files = len(python_files) or 1
@@ -1017,13 +1024,14 @@ class DevPlanExecutorPlugin(BasePlugin):
             await asyncio.sleep(0.15)
 
             # Перевірка на потенційні проблеми продуктивності
-            python_files = list(self.workspace_path.glob("**/*.py"))
+            python_files = self.workspace_index.files()
             performance_issues = 0
 
             for file_path in python_files[:10]:
                 try:
-                    content = file_path.read_text(encoding="utf-8")
-                    lines = content.split("\n")
+                    lines = self.workspace_index.read_lines(file_path)
+                    if lines is None:
+                        continue
 
                     # Перевірка довгих функцій (потенційно неефективних)
                     in_function = False
@@ -1066,13 +1074,14 @@ class DevPlanExecutorPlugin(BasePlugin):
             await asyncio.sleep(0.1)
 
             # Перевірка стилю коду
-            python_files = list(self.workspace_path.glob("**/*.py"))
+            python_files = self.workspace_index.files()
             formatting_score = 0
 
             for file_path in python_files[:5]:
                 try:
-                    content = file_path.read_text(encoding="utf-8")
-                    lines = content.split("\n")
+                    lines = self.workspace_index.read_lines(file_path)
+                    if lines is None:
+                        continue
 
                     # Базові перевірки стилю
                     good_style = 0
@@ -1110,13 +1119,14 @@ class DevPlanExecutorPlugin(BasePlugin):
             # Симуляція аналізу складності
             await asyncio.sleep(0.1)
 
-            python_files = list(self.workspace_path.glob("**/*.py"))
+            python_files = self.workspace_index.files()
             complexity_issues = 0
 
             for file_path in python_files[:5]:
                 try:
-                    content = file_path.read_text(encoding="utf-8")
-                    lines = content.split("\n")
+                    lines = self.workspace_index.read_lines(file_path)
+                    if lines is None:
+                        continue
 
                     # Підрахунок циклічної складності (спрощений)
                     complexity_keywords = [
@@ -1162,10 +1172,8 @@ class DevPlanExecutorPlugin(BasePlugin):
             await asyncio.sleep(0.1)
 
             # Підрахунок файлів та тестів
-            python_files = list(self.workspace_path.glob("**/*.py"))
-            test_files = list(self.workspace_path.glob("**/test*.py")) + list(
-                self.workspace_path.glob("**/*_test.py")
-            )
+            python_files = self.workspace_index.files()
+            test_files = self.workspace_index.test_files()
 
             total_py_files = len([f for f in python_files if "test" not in str(f)])
             total_test_files = len(test_files)
@@ -1205,14 +1213,15 @@ class DevPlanExecutorPlugin(BasePlugin):
             )
 
             # Перевірка docstrings в Python файлах
-            python_files = list(self.workspace_path.glob("**/*.py"))
+            python_files = self.workspace_index.files()
             documented_functions = 0
             total_functions = 0
 
             for file_path in python_files[:5]:
                 try:
-                    content = file_path.read_text(encoding="utf-8")
-                    lines = content.split("\n")
+                    lines = self.workspace_index.read_lines(file_path)
+                    if lines is None:
+                        continue
 
                     in_function = False
 
@@ -1272,7 +1281,7 @@ class DevPlanExecutorPlugin(BasePlugin):
             )
 
             # Базова перевірка безпеки імпортів
-            python_files = list(self.workspace_path.glob("**/*.py"))
+            python_files = self.workspace_index.files()
             safe_imports = 0
             total_imports = 0
 
@@ -1280,8 +1289,9 @@ class DevPlanExecutorPlugin(BasePlugin):
 
             for file_path in python_files[:5]:
                 try:
-                    content = file_path.read_text(encoding="utf-8")
-                    lines = content.split("\n")
+                    lines = self.workspace_index.read_lines(file_path)
+                    if lines is None:
+                        continue
 
                     for line in lines:
                         if line.strip().startswith(
@@ -0,0 +1,209 @@
+"""
+Фази, секції та завдання DEV_PLAN.md
+Представлення будується з нормалізованого розбору сервісу документів плану
+"""
+
+import re
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .dev_plan_document import DevPlanDocument, build_outline, get_document_service
+
+# Заголовки рівня 2, що відкривають або завершують блок фаз
+PHASE_PREFIX = "🎮 Phase"
+PHASES_END_PREFIX = "📊"
+
+PHASE_TITLE = re.compile(r"🎮 (Phase \d+): (.+)")
+SECTION_NUMBER = re.compile(r"^\d+\.\d+")
+SECTION_TITLE = re.compile(r"^(\d+\.\d+) (.+)")
+TASK_TEXT = re.compile(r"^\*\*(.+?)\*\*\s+-\s+(.*)")
+
+# Метадані: ключ, підрядок для швидкої перевірки, шаблон, перетворення
+METADATA_PATTERNS = (
+    ("version", "Plan v", re.compile(r"Plan v(\d+\.\d+)"), str),
+    ("created", "Created", re.compile(r"Created.*?(\d{4}-\d{2}-\d{2})"), str),
+    (
+        "target_performance",
+        "+ tasks/second",
+        re.compile(r"(\d+\.\d+)\+ tasks/second"),
+        float,
+    ),
+)
+
+# Назва представлення у сервісі документів плану
+PHASES_VIEW = "phases:2"
+
+
+def parse_dev_plan(content: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    Розбір тексту DEV_PLAN у фази, секції та завдання
+
+    Args:
+        content: Текст DEV_PLAN
+
+    Returns:
+        Tuple: Фази та метадані плану
+    """
+    return phases_from_outline(build_outline(content), content.split("\n"))
+
+
+def phases_from_outline(
+    outline: Dict[str, Any], lines: List[str]
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    Фази плану з нормалізованого розбору документа
+
+    Фаза триває до наступного заголовка фази або розділу ``## 📊``, секція -
+    до наступного заголовка ``### N.N``. Опис завдання продовжується на
+    наступних рядках, доки рядок не почнеться з ``-``.
+
+    Args:
+        outline: Результат ``build_outline``
+        lines: Рядки документа
+
+    Returns:
+        Tuple: Фази та метадані плану
+    """
+    phases: Dict[str, Any] = {}
+    phase: Optional[Dict[str, Any]] = None
+    section: Optional[Dict[str, Any]] = None
+    in_phase_header = False
+
+    for heading in outline["headings"]:
+        title = heading["title"]
+
+        if heading["level"] == 2 and title.startswith(
+            (PHASE_PREFIX, PHASES_END_PREFIX)
+        ):
+            section = None
+            phase = None
+            match = PHASE_TITLE.match(title)
+            if match:
+                phase = {
+                    "title": match.group(2).strip(),
+                    "sections": {},
+                    "status": "pending",
+                    "depends": [],
+                }
+                phases[match.group(1)] = phase
+                in_phase_header = True
+        elif phase is None:
+            continue
+        elif heading["level"] >= 3:
+            in_phase_header = False
+            # Заголовок без номера не завершує поточну секцію
+            if SECTION_NUMBER.match(title):
+                section = None
+                match = SECTION_TITLE.match(title)
+                if match:
+                    section = {
+                        "title": match.group(2).strip(),
+                        "tasks": [],
+                        "status": "pending",
+                        "depends": [],
+                    }
+                    phase["sections"][match.group(1)] = section
+
+        if phase is None:
+            continue
+        if in_phase_header:
+            phase["depends"].extend(heading["depends"])
+        elif section is not None:
+            section["depends"].extend(heading["depends"])
+
+        if section is None:
+            continue
+
+        for item in heading["tasks"]:
+            match = TASK_TEXT.match(item["text"])
+            if not match:
+                continue
+
+            description = [match.group(2)]
+            for line in lines[item["line"] + 1 : item["end"]]:
+                if line.startswith("-"):
+                    break
+                description.append(line)
+
+            completed = item["checked"]
+            section["tasks"].append(
+                {
+                    "name": match.group(1).strip(),
+                    "description": "\n".join(description).strip(),
+                    "completed": completed,
+                    "status": "completed" if completed else "pending",
+                }
+            )
+
+    return phases, _extract_metadata(lines)
+
+
+def parse_dev_plan_file(path: Path) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    Розбір файлу DEV_PLAN з кешуванням у сервісі документів плану
+
+    Повертається нова копія структури, тож зміни статусів викликачем
+    не впливають на кеш.
+
+    Args:
+        path: Шлях до DEV_PLAN.md
+
+    Returns:
+        Tuple: Фази та метадані плану
+    """
+    view = get_document_service().view(
+        Path(path), PHASES_VIEW, _build_phases_view, _copy_phases_view
+    )
+    return view["phases"], view["metadata"]
+
+
+def copy_phases(phases: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Копіювання структури фаз (швидше за copy.deepcopy)
+
+    Args:
+        phases: Фази плану
+
+    Returns:
+        Dict: Незалежна копія фаз
+    """
+    return {
+        phase_id: {
+            **phase,
+            "depends": list(phase["depends"]),
+            "sections": {
+                section_id: {
+                    **section,
+                    "depends": list(section["depends"]),
+                    "tasks": [dict(task) for task in section["tasks"]],
+                }
+                for section_id, section in phase["sections"].items()
+            },
+        }
+        for phase_id, phase in phases.items()
+    }
+
+
+def _build_phases_view(document: DevPlanDocument) -> Dict[str, Any]:
+    """Представлення фаз для сервісу документів"""
+    phases, metadata = phases_from_outline(document.outline, document.lines)
+    return {"phases": phases, "metadata": metadata}
+
+
+def _copy_phases_view(view: Dict[str, Any]) -> Dict[str, Any]:
+    """Копія представлення фаз для викликача"""
+    return {"phases": copy_phases(view["phases"]), "metadata": dict(view["metadata"])}
+
+
+def _extract_metadata(lines: List[str]) -> Dict[str, Any]:
+    """Метадані плану: перше входження кожного шаблону"""
+    metadata: Dict[str, Any] = {}
+    for line in lines:
+        if len(metadata) == len(METADATA_PATTERNS):
+            break
+        for key, needle, pattern, convert in METADATA_PATTERNS:
+            if needle in line and key not in metadata:
+                match = pattern.search(line)
+                if match:
+                    metadata[key] = convert(match.group(1))
+    return metadata
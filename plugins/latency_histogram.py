@@ -0,0 +1,263 @@
+"""
+Гістограми затримок виконання завдань
+Логарифмічні кошики з відносною похибкою ~4% та перцентилі p50/p90/p99
+"""
+
+import math
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+# Кошиків на подвоєння значення: межі ростуть у 2 ** (1 / 16) ≈ 1.044 раза
+SUB_BUCKETS = 16
+# Найменше значення, що розрізняється (1 мкс)
+MIN_RESOLUTION = 1e-6
+
+
+class LatencyHistogram:
+    """
+    Гістограма затримок з логарифмічними кошиками
+
+    Запис - O(1): номер кошика обчислюється з логарифма значення, а
+    лічильники зберігаються в розрідженому словнику. Перцентилі
+    повертаються як верхня межа кошика, обмежена фактичним максимумом.
+    """
+
+    def __init__(self):
+        """Ініціалізація порожньої гістограми"""
+        self.buckets: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.min: Optional[float] = None
+        self.max = 0.0
+
+    def record(self, value: float):
+        """
+        Запис значення
+
+        Args:
+            value: Затримка в секундах
+        """
+        bucket = _bucket_index(value)
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def merge(self, other: "LatencyHistogram"):
+        """
+        Додавання значень іншої гістограми
+
+        Args:
+            other: Гістограма для злиття
+        """
+        for bucket, count in other.buckets.items():
+            self.buckets[bucket] = self.buckets.get(bucket, 0) + count
+        self.count += other.count
+        self.total += other.total
+        if other.min is not None and (self.min is None or other.min < self.min):
+            self.min = other.min
+        self.max = max(self.max, other.max)
+
+    def percentile(self, quantile: float) -> float:
+        """
+        Значення перцентиля
+
+        Args:
+            quantile: Частка від 0 до 1 (0.99 для p99)
+
+        Returns:
+            float: Затримка в секундах (0, якщо записів немає)
+        """
+        if not self.count:
+            return 0.0
+
+        rank = max(1, math.ceil(quantile * self.count))
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= rank:
+                return min(_bucket_upper_bound(bucket), self.max)
+        return self.max
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Зведення гістограми
+
+        Returns:
+            Dict: Кількість, середнє, p50/p90/p99, мінімум та максимум
+        """
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else 0.0,
+            "p50": self.percentile(0.5),
+            "p90": self.percentile(0.9),
+            "p99": self.percentile(0.99),
+            "min": self.min or 0.0,
+            "max": self.max,
+        }
+
+
+class LatencyTracker:
+    """
+    Затримки та кількість виконуваних завдань за (плагін, тип завдання)
+
+    Якщо задано ``window``, гістограми обертаються кожні ``window`` секунд,
+    а звіт охоплює поточне та попереднє вікно.
+    """
+
+    def __init__(self, window: Optional[float] = None):
+        """
+        Ініціалізація трекера
+
+        Args:
+            window: Тривалість вікна в секундах (None - накопичувати до reset)
+        """
+        self.window = window
+        self._lock = threading.Lock()
+        self._current: Dict[Tuple[str, str], LatencyHistogram] = {}
+        self._previous: Dict[Tuple[str, str], LatencyHistogram] = {}
+        self._errors: Dict[Tuple[str, str], int] = {}
+        self._previous_errors: Dict[Tuple[str, str], int] = {}
+        self._in_flight: Dict[Tuple[str, str], int] = {}
+        self._window_started = time.monotonic()
+
+    def start(self, plugin_name: str, task_type: str):
+        """
+        Позначення початку виконання завдання
+
+        Args:
+            plugin_name: Назва плагіна
+            task_type: Тип завдання
+        """
+        key = (plugin_name, task_type)
+        with self._lock:
+            self._in_flight[key] = self._in_flight.get(key, 0) + 1
+
+    def finish(self, plugin_name: str, task_type: str, latency: float, success: bool):
+        """
+        Запис завершення завдання
+
+        Args:
+            plugin_name: Назва плагіна
+            task_type: Тип завдання
+            latency: Тривалість у секундах
+            success: Чи успішне виконання
+        """
+        key = (plugin_name, task_type)
+        with self._lock:
+            self._rotate()
+            self._in_flight[key] = max(0, self._in_flight.get(key, 0) - 1)
+            histogram = self._current.get(key)
+            if histogram is None:
+                histogram = self._current[key] = LatencyHistogram()
+            histogram.record(latency)
+            if not success:
+                self._errors[key] = self._errors.get(key, 0) + 1
+
+    def reset(self):
+        """Очищення всіх гістограм та лічильників помилок"""
+        with self._lock:
+            self._current.clear()
+            self._previous.clear()
+            self._errors.clear()
+            self._previous_errors.clear()
+            self._window_started = time.monotonic()
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """
+        Зведення за кожною парою (плагін, тип завдання)
+
+        Returns:
+            List[Dict]: Перцентилі, кількість помилок та виконуваних завдань
+        """
+        entries = []
+        with self._lock:
+            self._rotate()
+            keys = (
+                set(self._current)
+                | set(self._previous)
+                | {key for key, count in self._in_flight.items() if count}
+            )
+            for key in sorted(keys):
+                histogram = self._merged(key)
+                entries.append(
+                    {
+                        "plugin": key[0],
+                        "task_type": key[1],
+                        "in_flight": self._in_flight.get(key, 0),
+                        "errors": self._errors.get(key, 0)
+                        + self._previous_errors.get(key, 0),
+                        **_rounded(histogram.summary()),
+                    }
+                )
+        return entries
+
+    def plugin_summary(self, plugin_name: str) -> Dict[str, Any]:
+        """
+        Зведення всіх типів завдань плагіна
+
+        Args:
+            plugin_name: Назва плагіна
+
+        Returns:
+            Dict: Перцентилі та кількість виконуваних завдань плагіна
+        """
+        histogram = LatencyHistogram()
+        with self._lock:
+            self._rotate()
+            for key in set(self._current) | set(self._previous):
+                if key[0] == plugin_name:
+                    histogram.merge(self._merged(key))
+            in_flight = sum(
+                count for key, count in self._in_flight.items() if key[0] == plugin_name
+            )
+        return {"in_flight": in_flight, **_rounded(histogram.summary())}
+
+    def _merged(self, key: Tuple[str, str]) -> LatencyHistogram:
+        """Гістограма поточного та попереднього вікна"""
+        histogram = LatencyHistogram()
+        for source in (self._previous, self._current):
+            if key in source:
+                histogram.merge(source[key])
+        return histogram
+
+    def _rotate(self):
+        """Перехід до нового вікна, якщо поточне завершилося"""
+        if self.window is None:
+            return
+
+        elapsed = time.monotonic() - self._window_started
+        if elapsed < self.window:
+            return
+
+        # Якщо пропущено більше одного вікна, попереднє теж застаріло
+        stale = elapsed >= 2 * self.window
+        self._previous = {} if stale else self._current
+        self._previous_errors = {} if stale else self._errors
+        self._current = {}
+        self._errors = {}
+        self._window_started = time.monotonic()
+
+
+def _bucket_index(value: float) -> int:
+    """Номер логарифмічного кошика для значення"""
+    if value <= MIN_RESOLUTION:
+        return 0
+    return max(0, math.ceil(math.log2(value / MIN_RESOLUTION) * SUB_BUCKETS))
+
+
+def _bucket_upper_bound(bucket: int) -> float:
+    """Верхня межа кошика"""
+    return MIN_RESOLUTION * 2 ** (bucket / SUB_BUCKETS)
+
+
+def _rounded(summary: Dict[str, Any]) -> Dict[str, Any]:
+    """Округлення значень зведення для звітів"""
+    return {
+        key: value if key == "count" else round(value, 6)
+        for key, value in summary.items()
+    }
@@ -4,14 +4,27 @@
 """
 
 import asyncio
+import heapq
 import importlib.util
 import inspect
 import logging
-from concurrent.futures import ThreadPoolExecutor
+import multiprocessing
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Type
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Type
 
-from .base_plugin import BasePlugin, PluginResult, PluginStatus
+from .base_plugin import (
+    BasePlugin,
+    ExecutionClass,
+    PluginResult,
+    PluginStatus,
+    callback_loop,
+)
+from .latency_histogram import LatencyTracker
+from .plugin_manifest import PluginManifest
+from .process_worker import PluginTaskEnvelope, WarmupSpec, run_plugin_task, warm_worker
 
 
 class PluginManager:
@@ -19,35 +32,75 @@ class PluginManager:
     Менеджер плагінів для NIMDA Agent
 
     Функції:
-    - Автоматичне завантаження плагінів
+    - Автоматичне завантаження плагінів (ліниве, за кешованим маніфестом)
     - Управління життєвим циклом
-    - Розподіл завдань між плагінами
-    - Моніторинг продуктивності
+    - Розподіл завдань між плагінами (таблиця маршрутизації за типом)
+    - Пакетне виконання завдань з обмеженою паралельністю
+    - Виконання в циклі подій, пулі потоків або пулі процесів
+    - Моніторинг продуктивності (гістограми затримок за плагіном і типом завдання)
     - Інтеграція з GUI
     """
 
-    def __init__(self, plugins_dir: Optional[str] = None, max_workers: int = 4):
+    def __init__(
+        self,
+        plugins_dir: Optional[str] = None,
+        max_workers: int = 4,
+        process_workers: Optional[int] = None,
+        warm_process_workers: bool = False,
+        process_start_method: Optional[str] = None,
+        lazy_loading: bool = True,
+        manifest_path: Optional[str] = None,
+        latency_window: Optional[float] = None,
+    ):
         """
         Ініціалізація менеджера плагінів
 
         Args:
             plugins_dir: Шлях до директорії з плагінами
             max_workers: Максимальна кількість робітників для виконання
+            process_workers: Кількість процесів для CPU-завдань (за замовчуванням - ядра)
+            warm_process_workers: Запускати процеси одразу після завантаження плагінів
+            process_start_method: Спосіб запуску процесів (за замовчуванням - системний)
+            lazy_loading: Імпортувати плагін лише при надходженні першого завдання
+            manifest_path: Шлях до кешу маніфесту плагінів
+            latency_window: Вікно гістограм затримок у секундах (None - до скидання)
         """
         self.plugins_dir = Path(plugins_dir) if plugins_dir else Path(__file__).parent
         self.max_workers = max_workers
+        self.process_workers = process_workers or os.cpu_count() or 1
+        self.warm_process_workers = warm_process_workers
+        self.process_start_method = process_start_method
+        self.lazy_loading = lazy_loading
+        self.manifest_path = (
+            Path(manifest_path)
+            if manifest_path
+            else Path.cwd() / ".nimda_cache" / "plugin_manifest.json"
+        )
         self.logger = logging.getLogger("PluginManager")
 
         # Реєстр плагінів
         self.plugins: Dict[str, BasePlugin] = {}
         self.plugin_classes: Dict[str, Type[BasePlugin]] = {}
 
-        # Виконавець завдань
+        # Таблиця маршрутизації: тип завдання -> плагіни в порядку реєстрації
+        self.task_routes: Dict[str, List[BasePlugin]] = {}
+        # Плагіни з власною логікою can_handle_task перевіряються окремо
+        self.custom_routing_plugins: List[BasePlugin] = []
+        # Порядок реєстрації плагінів - пріоритет при маршрутизації
+        self._registration_order: Dict[str, int] = {}
+        # Ліниві маршрути: тип завдання -> файли ще не завантажених плагінів
+        self.lazy_routes: Dict[str, List[Path]] = {}
+        self.pending_plugin_files: Dict[Path, List[str]] = {}
+        self._activation_locks: Dict[Path, asyncio.Lock] = {}
+
+        # Виконавці завдань: потоки для блокуючих, процеси для CPU-завдань
         self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.process_executor: Optional[ProcessPoolExecutor] = None
 
         # Статистика
         self.total_tasks_executed = 0
         self.total_execution_time = 0.0
+        self.latency = LatencyTracker(window=latency_window)
 
         # Зворотні виклики
         self.on_plugin_loaded = None
@@ -66,16 +119,122 @@ class PluginManager:
         try:
             plugin_files = list(self.plugins_dir.glob("*_plugin.py"))
 
-            for plugin_file in plugin_files:
-                await self._load_plugin_from_file(plugin_file)
+            if self.lazy_loading:
+                await self._register_lazy_plugins(plugin_files)
+            else:
+                for plugin_file in plugin_files:
+                    await self._load_plugin_from_file(plugin_file)
+
+            self.logger.info(
+                f"Завантажено {len(self.plugins)} плагінів, "
+                f"відкладено {len(self.pending_plugin_files)}"
+            )
+
+            if self.warm_process_workers:
+                await self.warm_process_pool()
 
-            self.logger.info(f"Завантажено {len(self.plugins)} плагінів")
             return True
 
         except Exception as e:
             self.logger.error(f"Помилка завантаження плагінів: {e}")
             return False
 
+    async def _register_lazy_plugins(self, plugin_files: List[Path]):
+        """
+        Реєстрація плагінів за маніфестом без імпорту модулів
+
+        Args:
+            plugin_files: Файли плагінів
+        """
+        manifest = PluginManifest(self.manifest_path)
+
+        for plugin_file in plugin_files:
+            try:
+                entries = manifest.get_entries(plugin_file)
+            except OSError as e:
+                self.logger.error(f"Помилка читання плагіна {plugin_file}: {e}")
+                continue
+
+            task_types: List[str] = []
+            for entry in entries:
+                if entry.supported_tasks is None:
+                    task_types = []
+                    break
+                task_types.extend(entry.supported_tasks)
+
+            if not entries or not task_types:
+                # Типи завдань невідомі без імпорту - завантажуємо одразу
+                await self._load_plugin_from_file(plugin_file)
+                continue
+
+            self.pending_plugin_files[plugin_file] = list(dict.fromkeys(task_types))
+            for task_type in self.pending_plugin_files[plugin_file]:
+                self.lazy_routes.setdefault(task_type, []).append(plugin_file)
+
+        manifest.save()
+
+    async def _activate_plugin_file(self, plugin_file: Path) -> bool:
+        """
+        Імпорт та ініціалізація відкладеного плагіна
+
+        Args:
+            plugin_file: Файл плагіна
+
+        Returns:
+            bool: True якщо плагін завантажено
+        """
+        lock = self._activation_locks.setdefault(plugin_file, asyncio.Lock())
+
+        async with lock:
+            task_types = self.pending_plugin_files.pop(plugin_file, None)
+            if task_types is None:
+                return False
+
+            for task_type in task_types:
+                files = self.lazy_routes.get(task_type, [])
+                if plugin_file in files:
+                    files.remove(plugin_file)
+                if not files:
+                    self.lazy_routes.pop(task_type, None)
+
+            self.logger.info(f"Ліниве завантаження плагіна {plugin_file.name}")
+            return await self._load_plugin_from_file(plugin_file)
+
+    async def warm_plugins(self) -> int:
+        """
+        Завантаження всіх відкладених плагінів (eager режим)
+
+        Returns:
+            int: Кількість завантажених плагінів
+        """
+        loaded = 0
+        for plugin_file in list(self.pending_plugin_files):
+            if await self._activate_plugin_file(plugin_file):
+                loaded += 1
+        return loaded
+
+    async def _resolve_plugin(self, task: Dict[str, Any]) -> Optional[BasePlugin]:
+        """
+        Пошук плагіна для завдання з лінивим завантаженням
+
+        Args:
+            task: Завдання
+
+        Returns:
+            BasePlugin: Підходящий плагін або None
+        """
+        plugin = self._find_plugin_for_task(task)
+        if plugin is not None:
+            return plugin
+
+        for plugin_file in list(self.lazy_routes.get(task.get("type", ""), ())):
+            await self._activate_plugin_file(plugin_file)
+            plugin = self._find_plugin_for_task(task)
+            if plugin is not None:
+                return plugin
+
+        return None
+
     async def _load_plugin_from_file(self, plugin_file: Path) -> bool:
         """
         Завантаження плагіна з файлу
@@ -87,7 +246,9 @@ class PluginManager:
             bool: True якщо плагін завантажено успішно
         """
         try:
-            module_name = plugin_file.stem
+            # Стабільна назва в sys.modules: за нею робочий процес знаходить
+            # файл модуля і завантажує ту саму копію плагіна
+            module_name = f"nimda_plugin_{plugin_file.stem}"
             spec = importlib.util.spec_from_file_location(module_name, plugin_file)
 
             if spec is None or spec.loader is None:
@@ -95,7 +256,12 @@ class PluginManager:
                 return False
 
             module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
+            sys.modules[module_name] = module
+            try:
+                spec.loader.exec_module(module)
+            except BaseException:
+                sys.modules.pop(module_name, None)
+                raise
 
             # Знаходимо клас плагіна
             for name, obj in inspect.getmembers(module):
@@ -111,6 +277,7 @@ class PluginManager:
                     # Ініціалізуємо плагін
                     if await plugin_instance.initialize():
                         self.plugins[plugin_instance.name] = plugin_instance
+                        self._register_routes(plugin_instance)
 
                         # Безпечне підключення зворотних викликів
                         self._setup_plugin_callbacks(plugin_instance)
@@ -141,6 +308,7 @@ class PluginManager:
         try:
             if await plugin.initialize():
                 self.plugins[plugin.name] = plugin
+                self._register_routes(plugin)
 
                 # Безпечне підключення зворотних викликів
                 self._setup_plugin_callbacks(plugin)
@@ -172,28 +340,135 @@ class PluginManager:
         Returns:
             PluginResult: Результат виконання
         """
-        start_time = asyncio.get_event_loop().time()
+        return await self._resolve_and_execute(task, context)
 
+    async def execute_many(
+        self,
+        tasks: Iterable[Dict[str, Any]],
+        context: Optional[Dict] = None,
+        concurrency: Optional[int] = None,
+        ordered: bool = True,
+    ) -> AsyncIterator[PluginResult]:
+        """
+        Пакетне виконання завдань з обмеженою паралельністю
+
+        Фіксована кількість робітників бере завдання з ``tasks`` по одному,
+        сама визначає (і за потреби ліниво завантажує) плагін та виконує
+        завдання, тож перші результати з'являються до розбору решти пакета.
+        Завдання не групуються за плагіном заздалегідь: групування вимагало б
+        прочитати й розібрати весь пакет до першого результату, а маршрут
+        завдання за таблицею і так визначається за O(1).
+
+        Args:
+            tasks: Завдання для виконання (може бути генератором)
+            context: Контекст виконання
+            concurrency: Максимум одночасних завдань (за замовчуванням max_workers)
+            ordered: Повертати результати в порядку завдань (інакше - по завершенню)
+
+        Yields:
+            PluginResult: Результати виконання
+        """
+        concurrency = max(1, concurrency or self.max_workers)
+        results: asyncio.Queue = asyncio.Queue()
+        # Спільний ітератор: кожне завдання бере рівно один робітник
+        pending = enumerate(tasks)
+        finished = object()
+
+        async def worker():
+            try:
+                for index, task in pending:
+                    result = await self._resolve_and_execute(task, context)
+                    await results.put((index, result))
+            finally:
+                results.put_nowait((None, finished))
+
+        workers = [asyncio.ensure_future(worker()) for _ in range(concurrency)]
+
+        try:
+            buffered: Dict[int, PluginResult] = {}
+            next_index = 0
+            running = len(workers)
+
+            while running:
+                index, result = await results.get()
+
+                if result is finished:
+                    running -= 1
+                    continue
+
+                if not ordered:
+                    yield result
+                    continue
+
+                buffered[index] = result
+                while next_index in buffered:
+                    yield buffered.pop(next_index)
+                    next_index += 1
+
+            # Помилка самого ітератора завдань
+            for worker_task in workers:
+                worker_task.result()
+        finally:
+            for worker_task in workers:
+                worker_task.cancel()
+
+    async def _resolve_and_execute(
+        self, task: Dict[str, Any], context: Optional[Dict]
+    ) -> PluginResult:
+        """
+        Визначення плагіна для завдання та його виконання
+
+        Args:
+            task: Завдання для виконання
+            context: Контекст виконання
+
+        Returns:
+            PluginResult: Результат виконання
+        """
         try:
             # Знаходимо підходящий плагін
-            plugin = self._find_plugin_for_task(task)
+            plugin = await self._resolve_plugin(task)
+        except Exception as e:
+            # Плагін ще не визначено - помилка маршрутизації
+            return self._handle_task_error(None, task, e, 0.0)
 
-            if not plugin:
-                return PluginResult(
-                    success=False,
-                    message=f"Не знайдено плагін для завдання типу '{task.get('type', 'unknown')}'",
-                )
+        if not plugin:
+            return self._no_plugin_result(task)
+
+        return await self._execute_with_plugin(plugin, task, context)
+
+    async def _execute_with_plugin(
+        self, plugin: BasePlugin, task: Dict[str, Any], context: Optional[Dict]
+    ) -> PluginResult:
+        """
+        Виконання завдання конкретним плагіном з оновленням статистики
+
+        Args:
+            plugin: Плагін-виконавець
+            task: Завдання для виконання
+            context: Контекст виконання
 
+        Returns:
+            PluginResult: Результат виконання
+        """
+        task_type = task.get("type", "unknown")
+        self.latency.start(plugin.name, task_type)
+        start_time = asyncio.get_event_loop().time()
+        recorded = False
+
+        try:
             # Виконуємо завдання
             self.logger.info(
                 f"Виконання завдання '{task.get('description', '')}' плагіном {plugin.name}"
             )
 
-            result = await plugin.execute(task, context)
+            result = await self._dispatch_to_lane(plugin, task, context)
 
             # Оновлюємо статистику
             execution_time = asyncio.get_event_loop().time() - start_time
             result.execution_time = execution_time
+            self.latency.finish(plugin.name, task_type, execution_time, result.success)
+            recorded = True
 
             self.total_tasks_executed += 1
             self.total_execution_time += execution_time
@@ -217,17 +492,196 @@ class PluginManager:
 
         except Exception as e:
             execution_time = asyncio.get_event_loop().time() - start_time
-            error_result = PluginResult(
-                success=False,
-                message=f"Помилка виконання завдання: {e}",
-                execution_time=execution_time,
-                error=e,
+            if not recorded:
+                self.latency.finish(plugin.name, task_type, execution_time, False)
+            return self._handle_task_error(plugin, task, e, execution_time)
+
+        except BaseException:
+            # Скасування: завдання більше не виконується
+            if not recorded:
+                execution_time = asyncio.get_event_loop().time() - start_time
+                self.latency.finish(plugin.name, task_type, execution_time, False)
+            raise
+
+    async def _dispatch_to_lane(
+        self, plugin: BasePlugin, task: Dict[str, Any], context: Optional[Dict]
+    ) -> PluginResult:
+        """
+        Запуск execute плагіна відповідно до його класу виконання
+
+        Args:
+            plugin: Плагін-виконавець
+            task: Завдання для виконання
+            context: Контекст виконання
+
+        Returns:
+            PluginResult: Результат виконання
+        """
+        execution_class = plugin.get_execution_class(task)
+
+        if execution_class == ExecutionClass.EVENT_LOOP:
+            return await plugin.execute(task, context)
+
+        loop = asyncio.get_running_loop()
+
+        if execution_class == ExecutionClass.THREAD:
+            return await loop.run_in_executor(
+                self.executor, self._run_in_thread, loop, plugin, task, context
+            )
+
+        # Процес отримує копію плагіна: стан та зворотні виклики не спільні
+        envelope = PluginTaskEnvelope.for_plugin(plugin, task, context)
+        return await loop.run_in_executor(
+            self._get_process_executor(), run_plugin_task, envelope
+        )
+
+    def _run_in_thread(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        plugin: BasePlugin,
+        task: Dict[str, Any],
+        context: Optional[Dict],
+    ) -> PluginResult:
+        """
+        Виконання execute плагіна у власному циклі подій робочого потоку
+
+        Зворотні виклики плагіна передаються в цикл викликача через
+        ``call_soon_threadsafe`` і виконуються до отримання результату.
+        """
+        token = callback_loop.set(loop)
+        try:
+            return asyncio.run(plugin.execute(task, context))
+        finally:
+            callback_loop.reset(token)
+
+    def _get_process_executor(self) -> ProcessPoolExecutor:
+        """Ліниве створення пулу процесів"""
+        if self.process_executor is None:
+            self.process_executor = ProcessPoolExecutor(
+                max_workers=self.process_workers,
+                mp_context=multiprocessing.get_context(self.process_start_method),
             )
+            self.logger.info(f"Пул процесів запущено: {self.process_workers} процесів")
+        return self.process_executor
+
+    async def warm_process_pool(self) -> int:
+        """
+        Прогрів пулу процесів: запуск усіх процесів та створення
+        копій плагінів з класом виконання PROCESS
+
+        Returns:
+            int: Кількість прогрітих процесів
+        """
+        factories = []
+        for plugin in self.plugins.values():
+            if plugin.execution_class == ExecutionClass.PROCESS or (
+                plugin.config.get("execution_class") == ExecutionClass.PROCESS.value
+            ):
+                envelope = PluginTaskEnvelope.for_plugin(plugin, {})
+                factories.append(
+                    (
+                        envelope.module,
+                        envelope.class_name,
+                        envelope.init_kwargs,
+                        envelope.module_file,
+                    )
+                )
 
-            if self.on_plugin_error:
-                self.on_plugin_error(None, task, e)
+        loop = asyncio.get_running_loop()
+        executor = self._get_process_executor()
+        spec = WarmupSpec(factories=factories)
 
-            return error_result
+        await asyncio.gather(
+            *(
+                loop.run_in_executor(executor, warm_worker, spec)
+                for _ in range(self.process_workers)
+            )
+        )
+
+        self.logger.info(f"Пул процесів прогріто ({len(factories)} плагінів)")
+        return self.process_workers
+
+    def _handle_task_error(
+        self,
+        plugin: Optional[BasePlugin],
+        task: Dict[str, Any],
+        error: Exception,
+        execution_time: float,
+    ) -> PluginResult:
+        """Формування результату помилки та виклик зворотного виклику"""
+        if self.on_plugin_error:
+            self.on_plugin_error(plugin, task, error)
+
+        return PluginResult(
+            success=False,
+            message=f"Помилка виконання завдання: {error}",
+            execution_time=execution_time,
+            error=error,
+        )
+
+    def _no_plugin_result(self, task: Dict[str, Any]) -> PluginResult:
+        """Результат для завдання без підходящого плагіна"""
+        return PluginResult(
+            success=False,
+            message=f"Не знайдено плагін для завдання типу '{task.get('type', 'unknown')}'",
+        )
+
+    def _register_routes(self, plugin: BasePlugin):
+        """
+        Додавання плагіна до таблиці маршрутизації
+
+        Args:
+            plugin: Зареєстрований плагін
+        """
+        self._unregister_routes(plugin.name)
+        self._registration_order.setdefault(plugin.name, len(self._registration_order))
+
+        if type(plugin).can_handle_task is not BasePlugin.can_handle_task:
+            self._add_route(self.custom_routing_plugins, plugin)
+            return
+
+        try:
+            supported_tasks = plugin.get_supported_tasks()
+        except Exception as e:
+            self.logger.warning(
+                f"Не вдалося отримати типи завдань плагіна {plugin.name}: {e}"
+            )
+            self._add_route(self.custom_routing_plugins, plugin)
+            return
+
+        for task_type in dict.fromkeys(supported_tasks):
+            self._add_route(self.task_routes.setdefault(task_type, []), plugin)
+
+    def _add_route(self, route: List[BasePlugin], plugin: BasePlugin):
+        """Додавання плагіна до маршруту з упорядкуванням за реєстрацією"""
+        route.append(plugin)
+        route.sort(key=self._route_priority)
+
+    def _route_priority(self, plugin: BasePlugin) -> int:
+        """Пріоритет плагіна при маршрутизації (порядок реєстрації)"""
+        return self._registration_order.get(plugin.name, len(self._registration_order))
+
+    def _unregister_routes(self, plugin_name: str):
+        """Видалення плагіна з таблиці маршрутизації"""
+        for task_type in list(self.task_routes):
+            remaining = [
+                p for p in self.task_routes[task_type] if p.name != plugin_name
+            ]
+            if remaining:
+                self.task_routes[task_type] = remaining
+            else:
+                del self.task_routes[task_type]
+
+        self.custom_routing_plugins = [
+            p for p in self.custom_routing_plugins if p.name != plugin_name
+        ]
+
+    def refresh_routes(self):
+        """Перебудова таблиці маршрутизації (якщо плагін змінив список завдань)"""
+        self.task_routes.clear()
+        self.custom_routing_plugins.clear()
+        for plugin in self.plugins.values():
+            self._register_routes(plugin)
 
     def _find_plugin_for_task(self, task: Dict[str, Any]) -> Optional[BasePlugin]:
         """
@@ -239,8 +693,22 @@ class PluginManager:
         Returns:
             BasePlugin: Підходящий плагін або None
         """
-        for plugin in self.plugins.values():
-            if plugin.status != PluginStatus.DISABLED and plugin.can_handle_task(task):
+        # Маршрути таблиці та власні перевірки - разом у порядку реєстрації
+        candidates = heapq.merge(
+            (
+                (self._route_priority(plugin), False, plugin)
+                for plugin in self.task_routes.get(task.get("type", ""), ())
+            ),
+            (
+                (self._route_priority(plugin), True, plugin)
+                for plugin in self.custom_routing_plugins
+            ),
+            key=lambda candidate: candidate[0],
+        )
+        for _, custom, plugin in candidates:
+            if plugin.status == PluginStatus.DISABLED:
+                continue
+            if plugin.can_handle_task(task) if custom else plugin.validate_task(task):
                 return plugin
 
         return None
@@ -295,15 +763,25 @@ class PluginManager:
 
         return {
             "total_plugins": total_plugins,
+            "pending_plugins": len(self.pending_plugin_files),
             "active_plugins": active_plugins,
             "total_tasks_executed": self.total_tasks_executed,
             "total_execution_time": round(self.total_execution_time, 2),
             "average_execution_time": round(avg_execution_time, 2),
             "plugin_statistics": [
-                plugin.get_statistics() for plugin in self.plugins.values()
+                {
+                    **plugin.get_statistics(),
+                    "latency": self.latency.plugin_summary(plugin.name),
+                }
+                for plugin in self.plugins.values()
             ],
+            "latency": self.latency.snapshot(),
         }
 
+    def reset_latency_statistics(self):
+        """Скидання гістограм затримок"""
+        self.latency.reset()
+
     async def shutdown(self):
         """Завершення роботи менеджера плагінів"""
         self.logger.info("Завершення роботи PluginManager...")
@@ -317,6 +795,9 @@ class PluginManager:
 
         # Закриваємо executor
         self.executor.shutdown(wait=True)
+        if self.process_executor is not None:
+            self.process_executor.shutdown(wait=True)
+            self.process_executor = None
 
         self.logger.info("PluginManager завершено")
 
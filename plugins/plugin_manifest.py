@@ -0,0 +1,174 @@
+"""
+Кеш маніфесту плагінів
+Опис класів та типів завдань плагінів без імпорту модулів
+"""
+
+import ast
+import hashlib
+import json
+import logging
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+MANIFEST_VERSION = 1
+
+
+@dataclass
+class ManifestEntry:
+    """Опис одного класу плагіна у файлі"""
+
+    class_name: str
+    supported_tasks: Optional[List[str]] = None
+
+
+class PluginManifest:
+    """
+    Маніфест плагінів, закешований за хешем файлу
+
+    Класи плагінів та їх ``get_supported_tasks`` визначаються статичним
+    аналізом (AST). Якщо список завдань не є літералом, ``supported_tasks``
+    залишається None і менеджер завантажує такий плагін одразу.
+    """
+
+    def __init__(self, manifest_path: Path):
+        """
+        Ініціалізація маніфесту
+
+        Args:
+            manifest_path: Шлях до файлу маніфесту
+        """
+        self.manifest_path = Path(manifest_path)
+        self.logger = logging.getLogger("PluginManifest")
+        self._files: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        self._load()
+
+    def get_entries(self, plugin_file: Path) -> List[ManifestEntry]:
+        """
+        Отримання опису плагінів файлу (з кешу або статичним аналізом)
+
+        Args:
+            plugin_file: Шлях до файлу плагіна
+
+        Returns:
+            List[ManifestEntry]: Класи плагінів у порядку імен
+        """
+        source = plugin_file.read_bytes()
+        digest = hashlib.sha256(source).hexdigest()
+        key = str(plugin_file.resolve())
+
+        cached = self._files.get(key)
+        if cached and cached.get("sha256") == digest:
+            return [ManifestEntry(**entry) for entry in cached["classes"]]
+
+        entries = self._analyze(source, plugin_file)
+        self._files[key] = {
+            "sha256": digest,
+            "classes": [asdict(entry) for entry in entries],
+        }
+        self._dirty = True
+        return entries
+
+    def save(self):
+        """Збереження маніфесту, якщо він змінився"""
+        if not self._dirty:
+            return
+
+        try:
+            self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.manifest_path.with_suffix(".tmp")
+            temp_path.write_text(
+                json.dumps(
+                    {"version": MANIFEST_VERSION, "files": self._files},
+                    indent=2,
+                    ensure_ascii=False,
+                ),
+                encoding="utf-8",
+            )
+            temp_path.replace(self.manifest_path)
+            self._dirty = False
+        except OSError as e:
+            self.logger.warning(f"Не вдалося зберегти маніфест плагінів: {e}")
+
+    def _load(self):
+        """Завантаження маніфесту з диска"""
+        try:
+            data = json.loads(self.manifest_path.read_text(encoding="utf-8"))
+            if data.get("version") == MANIFEST_VERSION:
+                self._files = data.get("files", {})
+        except (OSError, ValueError):
+            self._files = {}
+
+    def _analyze(self, source: bytes, plugin_file: Path) -> List[ManifestEntry]:
+        """Статичний аналіз файлу плагіна"""
+        try:
+            tree = ast.parse(source, filename=str(plugin_file))
+        except SyntaxError as e:
+            self.logger.warning(f"Не вдалося розібрати {plugin_file}: {e}")
+            return []
+
+        entries = []
+        for node in tree.body:
+            if isinstance(node, ast.ClassDef) and _inherits_base_plugin(node):
+                entries.append(
+                    ManifestEntry(
+                        class_name=node.name,
+                        supported_tasks=_literal_supported_tasks(node),
+                    )
+                )
+
+        # Такий самий порядок, як у inspect.getmembers
+        return sorted(entries, key=lambda entry: entry.class_name)
+
+
+def _inherits_base_plugin(node: ast.ClassDef) -> bool:
+    """Чи успадковує клас BasePlugin"""
+    for base in node.bases:
+        name = base.attr if isinstance(base, ast.Attribute) else getattr(base, "id", "")
+        if name == "BasePlugin":
+            return True
+    return False
+
+
+def _literal_supported_tasks(node: ast.ClassDef) -> Optional[List[str]]:
+    """Значення get_supported_tasks, якщо його можна обчислити статично"""
+    for item in node.body:
+        if isinstance(item, ast.FunctionDef) and item.name == "get_supported_tasks":
+            names: Dict[str, List[str]] = {}
+            for statement in item.body:
+                if (
+                    isinstance(statement, ast.Assign)
+                    and len(statement.targets) == 1
+                    and isinstance(statement.targets[0], ast.Name)
+                ):
+                    value = _evaluate_list(statement.value, names)
+                    if value is not None:
+                        names[statement.targets[0].id] = value
+                elif isinstance(statement, ast.Return) and statement.value is not None:
+                    return _evaluate_list(statement.value, names)
+    return None
+
+
+def _evaluate_list(node: ast.AST, names: Dict[str, List[str]]) -> Optional[List[str]]:
+    """Обчислення списку рядків: літерал, змінна або їх конкатенація"""
+    if isinstance(node, (ast.List, ast.Tuple)):
+        values = []
+        for element in node.elts:
+            if not (
+                isinstance(element, ast.Constant) and isinstance(element.value, str)
+            ):
+                return None
+            values.append(element.value)
+        return values
+
+    if isinstance(node, ast.Name):
+        return names.get(node.id)
+
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Add):
+        left = _evaluate_list(node.left, names)
+        right = _evaluate_list(node.right, names)
+        if left is not None and right is not None:
+            return left + right
+
+    return None
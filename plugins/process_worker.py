@@ -0,0 +1,183 @@
+"""
+Виконання завдань плагінів у робочих процесах
+Серіалізовані конверти завдань/результатів для ProcessPoolExecutor
+"""
+
+import asyncio
+import importlib
+import importlib.util
+import json
+import pickle
+import sys
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from .base_plugin import BasePlugin, PluginResult
+
+# Копії плагінів, створені в поточному робочому процесі
+_process_plugins: Dict[Tuple[str, str, str], BasePlugin] = {}
+
+
+@dataclass
+class PluginTaskEnvelope:
+    """Конверт завдання для передачі в робочий процес"""
+
+    module: str
+    class_name: str
+    init_kwargs: Dict[str, Any]
+    task: Dict[str, Any]
+    context: Optional[Dict[str, Any]] = None
+    module_file: Optional[str] = None
+
+    @classmethod
+    def for_plugin(
+        cls,
+        plugin: BasePlugin,
+        task: Dict[str, Any],
+        context: Optional[Dict[str, Any]] = None,
+    ) -> "PluginTaskEnvelope":
+        """
+        Створення конверта для плагіна
+
+        Args:
+            plugin: Плагін-виконавець
+            task: Завдання
+            context: Контекст виконання
+
+        Returns:
+            PluginTaskEnvelope: Конверт завдання
+        """
+        module, class_name, init_kwargs = plugin.get_process_factory()
+        module_file = getattr(sys.modules.get(module), "__file__", None)
+        return cls(module, class_name, init_kwargs, task, context, module_file)
+
+
+@dataclass
+class WarmupSpec:
+    """Опис плагінів для попереднього завантаження у робочому процесі"""
+
+    factories: List[Tuple[str, str, Dict[str, Any], Optional[str]]] = field(
+        default_factory=list
+    )
+
+
+def run_plugin_task(envelope: PluginTaskEnvelope) -> PluginResult:
+    """
+    Виконання завдання плагіна у робочому процесі
+
+    Args:
+        envelope: Конверт завдання
+
+    Returns:
+        PluginResult: Результат, придатний для передачі між процесами
+    """
+    try:
+        plugin = _get_process_plugin(
+            envelope.module,
+            envelope.class_name,
+            envelope.init_kwargs,
+            envelope.module_file,
+        )
+        result = asyncio.run(plugin.execute(envelope.task, envelope.context))
+    except Exception as e:
+        result = PluginResult(
+            success=False, message=f"Помилка виконання у процесі: {e}", error=e
+        )
+
+    return _make_picklable(result)
+
+
+def warm_worker(spec: WarmupSpec) -> int:
+    """
+    Прогрів робочого процесу: імпорт модулів та створення плагінів
+
+    Args:
+        spec: Плагіни для попереднього створення
+
+    Returns:
+        int: Кількість створених плагінів
+    """
+    created = 0
+    for module, class_name, init_kwargs, module_file in spec.factories:
+        try:
+            _get_process_plugin(module, class_name, init_kwargs, module_file)
+            created += 1
+        except Exception:
+            continue
+    return created
+
+
+def _get_process_plugin(
+    module: str,
+    class_name: str,
+    init_kwargs: Dict[str, Any],
+    module_file: Optional[str],
+) -> BasePlugin:
+    """Отримання (або створення та ініціалізація) копії плагіна в процесі"""
+    key = (module, class_name, json.dumps(init_kwargs, sort_keys=True, default=str))
+    plugin = _process_plugins.get(key)
+
+    if plugin is None:
+        plugin_class = _resolve_class(module, class_name, module_file)
+        plugin = plugin_class(**init_kwargs)
+        # Один раз на процес, як register_plugin у батьківському процесі
+        if not asyncio.run(plugin.initialize()):
+            raise RuntimeError(f"Не вдалося ініціалізувати плагін {class_name}")
+        _process_plugins[key] = plugin
+
+    return plugin
+
+
+def _resolve_class(module: str, class_name: str, module_file: Optional[str]):
+    """Пошук класу плагіна за модулем або шляхом до файлу"""
+    try:
+        loaded = importlib.import_module(module)
+    except ImportError:
+        if not module_file:
+            raise
+        spec = importlib.util.spec_from_file_location(module, module_file)
+        if spec is None or spec.loader is None:
+            raise
+        loaded = importlib.util.module_from_spec(spec)
+        sys.modules[module] = loaded
+        try:
+            spec.loader.exec_module(loaded)
+        except BaseException:
+            sys.modules.pop(module, None)
+            raise
+
+    target: Any = loaded
+    for part in class_name.split("."):
+        target = getattr(target, part)
+    return target
+
+
+def _make_picklable(result: PluginResult) -> PluginResult:
+    """Заміна непридатних до серіалізації полів результату"""
+    try:
+        pickle.dumps(result)
+        return result
+    except Exception:
+        pass
+
+    error = result.error
+    if error is not None:
+        try:
+            pickle.dumps(error)
+        except Exception:
+            error = RuntimeError(repr(error))
+
+    data = result.data
+    if data is not None:
+        try:
+            pickle.dumps(data)
+        except Exception:
+            data = {"repr": repr(data)}
+
+    return PluginResult(
+        success=result.success,
+        message=result.message,
+        data=data,
+        execution_time=result.execution_time,
+        error=error,
+    )
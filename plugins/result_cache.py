@@ -0,0 +1,378 @@
+"""
+Дворівневий кеш результатів завдань
+LRU в пам'яті поверх одного довгоживучого SQLite (WAL) з TTL та витісненням
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+# Запити сталі - sqlite3 кешує підготовлені оператори на з'єднанні
+_SELECT_ENTRY = (
+    "SELECT result, execution_time, created_at, access_count "
+    "FROM task_cache WHERE task_hash = ?"
+)
+_UPSERT_ENTRY = (
+    "INSERT OR REPLACE INTO task_cache "
+    "(task_hash, result, execution_time, size, created_at, access_count, last_accessed) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+_TOUCH_ENTRY = (
+    "UPDATE task_cache SET access_count = access_count + ?, last_accessed = ? "
+    "WHERE task_hash = ?"
+)
+_DELETE_ENTRY = "DELETE FROM task_cache WHERE task_hash = ?"
+# Найменш використовувані серед найдавніше використаних записів
+_EVICTION_CANDIDATES = (
+    "SELECT task_hash, size FROM ("
+    "SELECT task_hash, size, access_count, last_accessed FROM task_cache "
+    "ORDER BY last_accessed ASC LIMIT ?"
+    ") ORDER BY access_count ASC, last_accessed ASC LIMIT ?"
+)
+
+# Частка кешу (за давністю використання), серед якої шукаються кандидати
+EVICTION_WINDOW = 0.25
+
+
+@dataclass
+class CacheStatistics:
+    """Лічильники кешу результатів"""
+
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    entries: int = 0
+    memory_entries: int = 0
+    total_bytes: int = 0
+
+    @property
+    def hits(self) -> int:
+        return self.memory_hits + self.disk_hits
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class TaskResultCache:
+    """
+    Кеш результатів завдань з двома рівнями
+
+    Перший рівень - обмежений LRU у пам'яті процесу, другий - таблиця
+    ``task_cache`` у SQLite, відкрита один раз у режимі WAL. Записи старші
+    за ``ttl`` вважаються простроченими. При перевищенні ``max_entries``
+    або ``max_bytes`` витісняються записи з найменшим ``access_count``
+    серед найдавніше використаної частини кешу (``EVICTION_WINDOW``), тож
+    щойно доданий запис не витісняється раніше за старі.
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        ttl: Optional[float] = 24 * 3600,
+        max_entries: int = 1000,
+        max_bytes: Optional[int] = None,
+        memory_entries: int = 128,
+        flush_interval: int = 64,
+    ):
+        """
+        Ініціалізація кешу
+
+        Args:
+            db_path: Шлях до бази даних кешу
+            ttl: Час життя запису в секундах (None - без обмеження)
+            max_entries: Максимальна кількість записів на диску
+            max_bytes: Максимальний сумарний розмір результатів (None - без обмеження)
+            memory_entries: Розмір LRU рівня в пам'яті
+            flush_interval: Кількість влучань, після якої лічильники доступу записуються на диск
+        """
+        self.db_path = Path(db_path)
+        self.ttl = ttl
+        self.max_entries = max(1, max_entries)
+        self.max_bytes = max_bytes
+        self.memory_entries = max(0, memory_entries)
+        self.flush_interval = max(1, flush_interval)
+        self.logger = logging.getLogger("TaskResultCache")
+
+        self._lock = threading.RLock()
+        self._memory: "OrderedDict[str, Tuple[Dict[str, Any], float, float]]" = (
+            OrderedDict()
+        )
+        # Влучання з пам'яті, ще не записані в SQLite: hash -> (кількість, час)
+        self._pending_touches: Dict[str, Tuple[int, float]] = {}
+        self.stats = CacheStatistics()
+
+        self._conn = sqlite3.connect(
+            str(self.db_path), check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._create_schema()
+
+        self.stats.entries, self.stats.total_bytes = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM task_cache"
+        ).fetchone()
+
+    def get(self, task_hash: str) -> Optional[Tuple[Dict[str, Any], float]]:
+        """
+        Отримання результату з кешу
+
+        Args:
+            task_hash: Хеш завдання
+
+        Returns:
+            Tuple: Збережені дані та час виконання або None
+        """
+        now = time.time()
+
+        with self._lock:
+            cached = self._memory.get(task_hash)
+            if cached is not None:
+                payload, execution_time, created_at = cached
+                if self._is_expired(created_at, now):
+                    self._remove(task_hash)
+                    self.stats.expirations += 1
+                    self.stats.misses += 1
+                    return None
+
+                self._memory.move_to_end(task_hash)
+                count, _ = self._pending_touches.get(task_hash, (0, now))
+                self._pending_touches[task_hash] = (count + 1, now)
+                self.stats.memory_hits += 1
+                if len(self._pending_touches) >= self.flush_interval:
+                    self._flush_touches()
+                return payload, execution_time
+
+            row = self._conn.execute(_SELECT_ENTRY, (task_hash,)).fetchone()
+            if row is None:
+                self.stats.misses += 1
+                return None
+
+            result, execution_time, created_at, _ = row
+            if self._is_expired(created_at, now):
+                self._remove(task_hash)
+                self.stats.expirations += 1
+                self.stats.misses += 1
+                return None
+
+            self._conn.execute(_TOUCH_ENTRY, (1, now, task_hash))
+            payload = json.loads(result)
+            self._remember(task_hash, payload, execution_time, created_at)
+            self.stats.disk_hits += 1
+            return payload, execution_time
+
+    def put(self, task_hash: str, payload: Dict[str, Any], execution_time: float):
+        """
+        Збереження результату в кеш
+
+        Args:
+            task_hash: Хеш завдання
+            payload: Дані результату (JSON-сумісні)
+            execution_time: Час виконання
+        """
+        result = json.dumps(payload, default=str)
+        size = len(result.encode("utf-8"))
+        now = time.time()
+
+        with self._lock:
+            self._flush_touches()
+            previous = self._conn.execute(
+                "SELECT size FROM task_cache WHERE task_hash = ?", (task_hash,)
+            ).fetchone()
+
+            self._conn.execute(
+                _UPSERT_ENTRY, (task_hash, result, execution_time, size, now, 0, now)
+            )
+            if previous is None:
+                self.stats.entries += 1
+            else:
+                self.stats.total_bytes -= previous[0] or 0
+            self.stats.total_bytes += size
+
+            self._remember(task_hash, payload, execution_time, now)
+            self._evict(protect=task_hash)
+
+    def purge_expired(self) -> int:
+        """
+        Видалення прострочених записів
+
+        Returns:
+            int: Кількість видалених записів
+        """
+        if self.ttl is None:
+            return 0
+
+        cutoff = time.time() - self.ttl
+        with self._lock:
+            expired = [
+                task_hash
+                for task_hash, (_, _, created_at) in self._memory.items()
+                if created_at < cutoff
+            ]
+            for task_hash in expired:
+                self._memory.pop(task_hash, None)
+
+            removed, freed = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM task_cache "
+                "WHERE created_at < ?",
+                (cutoff,),
+            ).fetchone()
+            self._conn.execute("DELETE FROM task_cache WHERE created_at < ?", (cutoff,))
+
+            self.stats.entries -= removed
+            self.stats.total_bytes -= freed
+            self.stats.expirations += removed
+            return removed
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Отримання статистики кешу
+
+        Returns:
+            Dict: Лічильники влучань, промахів та витіснень
+        """
+        with self._lock:
+            self.stats.memory_entries = len(self._memory)
+            stats = asdict(self.stats)
+        stats["hits"] = self.stats.hits
+        stats["hit_rate"] = round(self.stats.hit_rate, 4)
+        return stats
+
+    def close(self):
+        """Запис лічильників доступу та закриття з'єднання"""
+        with self._lock:
+            try:
+                self._flush_touches()
+                self._conn.close()
+            except sqlite3.ProgrammingError:
+                pass
+
+    def _create_schema(self):
+        """Створення таблиці кешу (з міграцією старої схеми)"""
+        columns = [
+            row[1] for row in self._conn.execute("PRAGMA table_info(task_cache)")
+        ]
+
+        if columns and "size" not in columns:
+            # Стара схема: id = hash + timestamp, записи без обмеження кількості
+            self._conn.execute("ALTER TABLE task_cache RENAME TO task_cache_legacy")
+
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS task_cache (
+                task_hash TEXT PRIMARY KEY,
+                result TEXT,
+                execution_time REAL,
+                size INTEGER,
+                created_at REAL,
+                access_count INTEGER DEFAULT 0,
+                last_accessed REAL
+            )
+        """)
+        self._conn.execute("DROP INDEX IF EXISTS idx_task_cache_eviction")
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_task_cache_recency "
+            "ON task_cache (last_accessed)"
+        )
+
+        if columns and "size" not in columns:
+            now = time.time()
+            self._conn.execute(
+                """
+                INSERT OR REPLACE INTO task_cache
+                SELECT task_hash, result, execution_time, LENGTH(CAST(result AS BLOB)),
+                       COALESCE(CAST(strftime('%s', created_at) AS REAL), ?),
+                       COALESCE(access_count, 0),
+                       COALESCE(CAST(strftime('%s', last_accessed) AS REAL), ?)
+                FROM task_cache_legacy ORDER BY created_at
+                """,
+                (now, now),
+            )
+            self._conn.execute("DROP TABLE task_cache_legacy")
+            self.logger.info("Кеш результатів перенесено на нову схему")
+
+    def _is_expired(self, created_at: Optional[float], now: float) -> bool:
+        """Чи прострочений запис"""
+        return self.ttl is not None and (created_at or 0) < now - self.ttl
+
+    def _remember(
+        self,
+        task_hash: str,
+        payload: Dict[str, Any],
+        execution_time: float,
+        created_at: float,
+    ):
+        """Розміщення запису в LRU рівні пам'яті"""
+        if not self.memory_entries:
+            return
+
+        self._memory[task_hash] = (payload, execution_time, created_at)
+        self._memory.move_to_end(task_hash)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _remove(self, task_hash: str):
+        """Видалення запису з обох рівнів"""
+        self._memory.pop(task_hash, None)
+        self._pending_touches.pop(task_hash, None)
+        row = self._conn.execute(
+            "SELECT size FROM task_cache WHERE task_hash = ?", (task_hash,)
+        ).fetchone()
+        if row is not None:
+            self._conn.execute(_DELETE_ENTRY, (task_hash,))
+            self.stats.entries -= 1
+            self.stats.total_bytes -= row[0] or 0
+
+    def _flush_touches(self):
+        """Запис накопичених влучань з пам'яті в SQLite"""
+        if not self._pending_touches:
+            return
+
+        self._conn.executemany(
+            _TOUCH_ENTRY,
+            [
+                (count, last_accessed, task_hash)
+                for task_hash, (count, last_accessed) in self._pending_touches.items()
+            ],
+        )
+        self._pending_touches.clear()
+
+    def _over_limit(self) -> bool:
+        """Чи перевищено обмеження кешу"""
+        if self.stats.entries > self.max_entries:
+            return True
+        return self.max_bytes is not None and self.stats.total_bytes > self.max_bytes
+
+    def _evict(self, protect: str):
+        """Витіснення найменш використовуваних записів"""
+        if not self._over_limit():
+            return
+
+        self.purge_expired()
+
+        while self._over_limit():
+            overflow = max(1, self.stats.entries - self.max_entries)
+            window = max(overflow, int(self.stats.entries * EVICTION_WINDOW))
+            candidates = self._conn.execute(
+                _EVICTION_CANDIDATES, (window + 1, overflow + 1)
+            ).fetchall()
+            candidates = [row for row in candidates if row[0] != protect]
+            if not candidates:
+                break
+
+            for task_hash, size in candidates[:overflow]:
+                self._memory.pop(task_hash, None)
+                self._conn.execute(_DELETE_ENTRY, (task_hash,))
+                self.stats.entries -= 1
+                self.stats.total_bytes -= size or 0
+                self.stats.evictions += 1
+                if not self._over_limit():
+                    break
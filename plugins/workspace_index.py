@@ -0,0 +1,217 @@
+"""
+Спільний індекс файлів робочої директорії для перевірок плагінів
+Один обхід директорій на запуск та кешування вмісту файлів за mtime/size
+"""
+
+import logging
+import os
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+
+@dataclass
+class IndexedFile:
+    """Закешований вміст файлу робочої директорії"""
+
+    path: Path
+    mtime_ns: int
+    size: int
+    text: Optional[str] = None
+    lines: Optional[List[str]] = None
+    generation: int = 0
+
+
+@dataclass
+class WorkspaceIndexStats:
+    """Лічильники роботи індексу"""
+
+    scans: int = 0
+    reads: int = 0
+    hits: int = 0
+    invalidations: int = 0
+    errors: Dict[str, int] = field(default_factory=dict)
+
+
+class WorkspaceIndex:
+    """
+    Індекс файлів робочої директорії
+
+    Особливості:
+    - Один обхід директорій на запуск (``refresh``)
+    - Кешування тексту та розбиття на рядки
+    - Інвалідація вмісту за mtime/size файлу
+    - Кожен файл перевіряється через stat не більше одного разу за покоління
+    """
+
+    def __init__(self, root: Path, suffix: str = ".py"):
+        """
+        Ініціалізація індексу
+
+        Args:
+            root: Корінь робочої директорії
+            suffix: Розширення файлів, що індексуються
+        """
+        self.root = Path(root)
+        self.suffix = suffix
+        self.logger = logging.getLogger("WorkspaceIndex")
+
+        self._files: Optional[List[Path]] = None
+        self._entries: Dict[Path, IndexedFile] = {}
+        self._generation = 1
+        self._lock = threading.RLock()
+
+        self.stats = WorkspaceIndexStats()
+
+    def refresh(self):
+        """
+        Початок нового запуску: наступний запит перескановує директорії,
+        а кожен закешований файл буде один раз звірено за mtime/size
+        """
+        with self._lock:
+            self._files = None
+            self._generation += 1
+
+    def files(self) -> List[Path]:
+        """
+        Отримання списку файлів (еквівалент ``glob("**/*.py")``)
+
+        Returns:
+            List[Path]: Відсортований список файлів
+        """
+        with self._lock:
+            if self._files is None:
+                self._files = self._scan()
+            return self._files
+
+    def test_files(self) -> List[Path]:
+        """
+        Отримання тестових файлів (``test*.py`` та ``*_test.py``)
+
+        Returns:
+            List[Path]: Список тестових файлів
+        """
+        return [
+            path
+            for path in self.files()
+            if path.name.startswith("test") or path.stem.endswith("_test")
+        ]
+
+    def read_text(self, path: Path) -> Optional[str]:
+        """
+        Читання тексту файлу з кешу
+
+        Args:
+            path: Шлях до файлу
+
+        Returns:
+            Optional[str]: Вміст файлу або None якщо файл не читається
+        """
+        entry = self._get_entry(path)
+        return entry.text if entry else None
+
+    def read_lines(self, path: Path) -> Optional[List[str]]:
+        """
+        Отримання рядків файлу (еквівалент ``text.split("\\n")``)
+
+        Args:
+            path: Шлях до файлу
+
+        Returns:
+            Optional[List[str]]: Рядки файлу або None якщо файл не читається
+        """
+        with self._lock:
+            entry = self._get_entry(path)
+            if entry is None or entry.text is None:
+                return None
+            if entry.lines is None:
+                entry.lines = entry.text.split("\n")
+            return entry.lines
+
+    def get_statistics(self) -> Dict[str, int]:
+        """
+        Отримання статистики індексу
+
+        Returns:
+            Dict: Статистика
+        """
+        return {
+            "files": len(self._files) if self._files is not None else 0,
+            "cached_files": len(self._entries),
+            "scans": self.stats.scans,
+            "reads": self.stats.reads,
+            "hits": self.stats.hits,
+            "invalidations": self.stats.invalidations,
+            "read_errors": sum(self.stats.errors.values()),
+        }
+
+    def _scan(self) -> List[Path]:
+        """Один обхід робочої директорії"""
+        found = []
+        for dirpath, _, filenames in os.walk(self.root):
+            for filename in filenames:
+                if filename.endswith(self.suffix):
+                    found.append(Path(dirpath) / filename)
+
+        found.sort()
+        self.stats.scans += 1
+
+        # Видаляємо з кешу файли, яких більше немає
+        present = set(found)
+        for stale in [path for path in self._entries if path not in present]:
+            del self._entries[stale]
+
+        self.logger.debug(f"Індекс {self.root}: {len(found)} файлів")
+        return found
+
+    def _get_entry(self, path: Path) -> Optional[IndexedFile]:
+        """Отримання актуального запису кешу для файлу"""
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry.generation == self._generation:
+                self.stats.hits += 1
+                return entry
+
+            try:
+                stat = path.stat()
+            except OSError as e:
+                self._record_error(path, e)
+                self._entries.pop(path, None)
+                return None
+
+            if (
+                entry is not None
+                and entry.mtime_ns == stat.st_mtime_ns
+                and entry.size == stat.st_size
+            ):
+                entry.generation = self._generation
+                self.stats.hits += 1
+                return entry
+
+            if entry is not None:
+                self.stats.invalidations += 1
+
+            try:
+                text = path.read_text(encoding="utf-8")
+            except (OSError, UnicodeDecodeError) as e:
+                # Запам'ятовуємо помилку, щоб не читати файл повторно
+                self._record_error(path, e)
+                text = None
+
+            entry = IndexedFile(
+                path=path,
+                mtime_ns=stat.st_mtime_ns,
+                size=stat.st_size,
+                text=text,
+                generation=self._generation,
+            )
+            self._entries[path] = entry
+            self.stats.reads += 1
+            return entry
+
+    def _record_error(self, path: Path, error: Exception):
+        """Облік помилок читання"""
+        key = type(error).__name__
+        self.stats.errors[key] = self.stats.errors.get(key, 0) + 1
+        self.logger.debug(f"Не вдалося прочитати {path}: {error}")
@@ -8,10 +8,16 @@ Real DEV_PLAN Executor - Виконавець реальних завдань з
 """
 
 import asyncio
+import re
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List
 
+from plugins.dev_plan_document import DevPlanDocument, get_document_service
+
+# Назва представлення у сервісі документів плану
+INCOMPLETE_TASKS_VIEW = "real_devplan_executor:2"
+
 
 class RealDevPlanExecutor:
     """Виконавець реальних завдань з DEV_PLAN.md"""
@@ -75,54 +81,65 @@ class RealDevPlanExecutor:
     async def _find_incomplete_tasks(self) -> List[Dict]:
         """Знайти незавершені завдання в DEV_PLAN.md"""
         try:
-            with open(self.devplan_path, "r", encoding="utf-8") as f:
-                content = f.read()
-
-            incomplete_tasks = []
-            lines = content.split("\n")
-
-            current_phase = "Unknown"
-
-            for line_num, line in enumerate(lines, 1):
-                # Визначити поточну фазу
-                if line.strip().startswith("##") and "Фаза" in line:
-                    current_phase = line.strip()
-
-                # Знайти незавершені завдання
-                if "- [ ]" in line:
-                    task_text = line.split("- [ ]", 1)[1].strip()
-
-                    if "**" in task_text:
-                        # Витягнути назву завдання
-                        parts = task_text.split("**")
-                        if len(parts) >= 3:
-                            title = parts[1]
-                            description = parts[2].strip(" -")
-
-                            # Визначити пріоритет на основі ключових слів
-                            priority = self._determine_priority(title, description)
-
-                            incomplete_tasks.append(
-                                {
-                                    "title": title,
-                                    "description": description,
-                                    "phase": current_phase,
-                                    "priority": priority,
-                                    "line_number": line_num,
-                                    "original_line": line,
-                                }
-                            )
-
-            # Сортувати за пріоритетом
-            priority_order = {"critical": 0, "high": 1, "medium": 2, "low": 3}
-            incomplete_tasks.sort(key=lambda x: priority_order.get(x["priority"], 4))
-
-            return incomplete_tasks
+            # Розбір один раз на зміну файлу, у пулі потоків
+            return await get_document_service().aview(
+                self.devplan_path,
+                INCOMPLETE_TASKS_VIEW,
+                self._collect_incomplete_tasks,
+            )
 
         except Exception as e:
             self.log_step(f"Помилка при пошуку завдань: {e}", "ERROR")
             return []
 
+    def _collect_incomplete_tasks(self, document: DevPlanDocument) -> List[Dict]:
+        """Незавершені завдання документа, відсортовані за пріоритетом"""
+        incomplete_tasks = []
+        current_phase = "Unknown"
+
+        for heading in document.outline["headings"]:
+            # Визначити поточну фазу
+            if heading["level"] >= 2 and "Фаза" in heading["title"]:
+                current_phase = document.lines[heading["line"]].strip()
+
+            # Знайти незавершені завдання
+            checkboxes = [
+                checkbox
+                for item in heading["tasks"]
+                for checkbox in (item, *item["subtasks"])
+                if not checkbox["checked"]
+            ]
+            for checkbox in checkboxes:
+                task_text = checkbox["text"]
+                line = document.lines[checkbox["line"]]
+
+                if "**" in task_text:
+                    # Витягнути назву завдання
+                    parts = task_text.split("**")
+                    if len(parts) >= 3:
+                        title = parts[1]
+                        description = parts[2].strip(" -")
+
+                        # Визначити пріоритет на основі ключових слів
+                        priority = self._determine_priority(title, description)
+
+                        incomplete_tasks.append(
+                            {
+                                "title": title,
+                                "description": description,
+                                "phase": current_phase,
+                                "priority": priority,
+                                "line_number": checkbox["line"] + 1,
+                                "original_line": line,
+                            }
+                        )
+
+        # Сортувати за пріоритетом
+        priority_order = {"critical": 0, "high": 1, "medium": 2, "low": 3}
+        incomplete_tasks.sort(key=lambda x: priority_order.get(x["priority"], 4))
+
+        return incomplete_tasks
+
     def _determine_priority(self, title: str, description: str) -> str:
         """Визначити пріоритет завдання"""
         text = (title + " " + description).lower()
@@ -1176,12 +1193,12 @@ if __name__ == "__main__":
     async def _mark_task_completed(self, task: Dict):
         """Позначити завдання як завершене в DEV_PLAN.md"""
         try:
-            with open(self.devplan_path, "r", encoding="utf-8") as f:
-                content = f.read()
+            document = await get_document_service().aload(self.devplan_path)
+            content = document.content
 
             # Замінити [ ] на [x] для цього завдання
             original_line = task["original_line"]
-            completed_line = original_line.replace("- [ ]", "- [x]")
+            completed_line = re.sub(r"\[ \]", "[x]", original_line, count=1)
 
             new_content = content.replace(original_line, completed_line)
 
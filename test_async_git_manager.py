@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Тест асинхронного GitManager на asyncio-підпроцесах
+"""
+
+import asyncio
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+CURRENT_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(CURRENT_DIR))
+
+import async_git_manager
+from async_git_manager import AsyncGitManager
+from git_manager import GitManager
+
+SLEEP_COMMAND = [sys.executable, "-c", "import time; time.sleep(10)"]
+
+
+def _git(repo: Path, *args: str) -> str:
+    """Виконання git у тестовому репозиторії"""
+    return subprocess.run(
+        ["git", *args], cwd=repo, capture_output=True, text=True, check=True
+    ).stdout
+
+
+def _repo(tmp: str) -> Path:
+    """Репозиторій з одним комітом"""
+    repo = Path(tmp)
+    _git(repo, "init", "-q", "-b", "main")
+    _git(repo, "config", "user.email", "test@example.com")
+    _git(repo, "config", "user.name", "Test")
+    (repo / "tracked.txt").write_text("one\n", encoding="utf-8")
+    _git(repo, "add", "tracked.txt")
+    _git(repo, "commit", "-q", "-m", "Initial commit")
+    return repo
+
+
+def test_commits_are_serialized_per_repository():
+    """Паралельні коміти одного репозиторію виконуються по черзі"""
+
+    async def scenario(repo: Path):
+        first = AsyncGitManager(repo)
+        second = AsyncGitManager(repo)
+        first.config["auto_push"] = second.config["auto_push"] = False
+
+        (repo / "a.txt").write_text("a\n", encoding="utf-8")
+        (repo / "b.txt").write_text("b\n", encoding="utf-8")
+        results = await asyncio.gather(
+            first.commit_changes("first"), second.commit_changes("second")
+        )
+        status = await first.get_status()
+        return results, status
+
+    with tempfile.TemporaryDirectory() as tmp:
+        repo = _repo(tmp)
+        results, status = asyncio.run(scenario(repo))
+
+        assert all(result["success"] for result in results)
+        # Перший коміт забрав усі зміни, другий побачив чисте дерево
+        assert results[0]["commit_hash"]
+        assert results[1]["message"] == "No changes to commit"
+        assert status["current_branch"] == "main"
+        assert not status["has_changes"]
+        assert status["last_commit"].endswith("first")
+        assert len(_git(repo, "log", "--oneline").splitlines()) == 2
+
+
+def test_timeout_and_cancellation_kill_the_process(monkeypatch):
+    """Таймаут і скасування завершують git-процес, цикл лишається вільним"""
+    processes = []
+    original = async_git_manager.asyncio.create_subprocess_exec
+
+    async def recording_exec(*args, **kwargs):
+        process = await original(*args, **kwargs)
+        processes.append(process)
+        return process
+
+    monkeypatch.setattr(
+        async_git_manager.asyncio, "create_subprocess_exec", recording_exec
+    )
+
+    async def scenario(repo: Path):
+        manager = AsyncGitManager(repo)
+
+        started = time.monotonic()
+        timed_out = await manager._run_git_command(SLEEP_COMMAND, timeout=0.2)
+        timeout_elapsed = time.monotonic() - started
+
+        task = asyncio.create_task(manager._run_git_command(SLEEP_COMMAND))
+        while not processes[1:]:
+            await asyncio.sleep(0.01)
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            cancelled = True
+        else:
+            cancelled = False
+        return timed_out, timeout_elapsed, cancelled
+
+    with tempfile.TemporaryDirectory() as tmp:
+        timed_out, elapsed, cancelled = asyncio.run(scenario(Path(tmp)))
+
+        assert timed_out is None
+        assert elapsed < 5
+        assert cancelled
+        assert all(process.returncode is not None for process in processes)
+
+
+def test_status_matches_sync_manager_and_tracks_fetches():
+    """Статус має ті самі ключі, що й GitManager, разом зі станом fetch"""
+
+    async def scenario(repo: Path):
+        manager = AsyncGitManager(repo, network_timeout=10)
+        fetch = await manager.fetch_changes()
+        return fetch, await manager.get_status()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        repo = _repo(tmp)
+        _git(repo, "remote", "add", "origin", str(Path(tmp, "missing.git")))
+        (repo / "tracked.txt").write_text("two\n", encoding="utf-8")
+
+        fetch, status = asyncio.run(scenario(repo))
+        manager = GitManager(repo, fetch_interval=None)
+        sync_status = manager.get_status()
+        manager.close()
+
+        assert not fetch["success"]
+        assert status["fetch_failures"] == 1
+        assert set(status) == set(sync_status)
+        assert status["unstaged_files"] == sync_status["unstaged_files"]
+
+
+def test_pull_restores_stashed_changes_in_both_managers():
+    """Локальні зміни, сховані перед pull, повертаються в робоче дерево"""
+    with tempfile.TemporaryDirectory() as tmp:
+        origin = Path(tmp, "origin.git")
+        Path(tmp, "repo").mkdir()
+        repo = _repo(str(Path(tmp, "repo")))
+        _git(repo, "init", "-q", "--bare", str(origin))
+        _git(repo, "remote", "add", "origin", str(origin))
+        _git(repo, "push", "-q", "-u", "origin", "main")
+
+        (repo / "tracked.txt").write_text("sync\n", encoding="utf-8")
+        manager = GitManager(repo, fetch_interval=None)
+        result = manager.pull_changes()
+        manager.close()
+        assert result["success"]
+        assert (repo / "tracked.txt").read_text(encoding="utf-8") == "sync\n"
+
+        (repo / "tracked.txt").write_text("async\n", encoding="utf-8")
+        result = asyncio.run(AsyncGitManager(repo).pull_changes())
+        assert result["success"]
+        assert (repo / "tracked.txt").read_text(encoding="utf-8") == "async\n"
+        assert not _git(repo, "stash", "list")
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Тест індексованого пошуку та статистики журналу змін
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+CURRENT_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(CURRENT_DIR))
+
+from changelog_index import ChangelogIndex
+from changelog_manager import ChangelogManager
+
+CHANGELOG = """# Changelog
+
+## [Unreleased]
+
+### Added
+- [x] First feature (2024-03-02 10:15)
+- [ ] Search-index for entries (2024-03-05 09:00)
+
+### Fixed
+- [x] Crash on start (2024-03-01 18:30)
+
+## [1.2.0] - 2024-02-01
+
+### Changed
+- [-] Drop legacy API (2024-01-20 12:00)
+- [x] Speed up sync_manager
+"""
+
+
+def _linear_search(content, query):
+    """Пошук повним обходом рядків (поведінка до індексу)"""
+    return [
+        line.strip()
+        for line in content.split("\n")
+        if line.startswith("- [") and query.lower() in line.lower()
+    ]
+
+
+def _write(tmp, content):
+    """Запис CHANGELOG.md із новим часом зміни"""
+    path = Path(tmp, "CHANGELOG.md")
+    existed = path.exists()
+    mtime_ns = path.stat().st_mtime_ns if existed else 0
+    path.write_text(content, encoding="utf-8")
+    if existed:
+        os.utime(path, ns=(mtime_ns + 1_000_000, mtime_ns + 1_000_000))
+    return path
+
+
+def test_search_and_dates_match_linear_scan():
+    """Індексований пошук збігається з лінійним, діапазони дат включні"""
+    with tempfile.TemporaryDirectory() as tmp:
+        _write(tmp, CHANGELOG)
+        manager = ChangelogManager(Path(tmp))
+
+        for query in ("feature", "FIRST feat", "h-ind", "_man", "(2024-03", "", "zzz"):
+            found = [entry["full_line"] for entry in manager.search_entries(query)]
+            assert found == _linear_search(CHANGELOG, query), query
+
+        entry = manager.search_entries("crash")[0]
+        assert entry["section"] == "## [Unreleased]"
+        assert entry["category"] == "Fixed"
+        assert entry["text"] == "Crash on start"
+        assert entry["status"] == "completed"
+        assert entry["date"] == "2024-03-01 18:30"
+
+        texts = [
+            e["text"]
+            for e in manager.search_entries_by_date("2024-03-01", "2024-03-02")
+        ]
+        assert texts == ["Crash on start", "First feature"]
+        assert [
+            e["text"] for e in manager.search_entries_by_date(end="2024-01-31")
+        ] == ["Drop legacy API"]
+        assert len(manager.search_entries_by_date()) == 4
+
+        stats = manager.get_changelog_stats()
+        assert stats["exists"]
+        assert stats["completed_tasks"] == 3
+        assert stats["pending_tasks"] == 1
+        assert stats["cancelled_tasks"] == 1
+        assert stats["versions"] == ["1.2.0"]
+        assert stats["last_modified"] == "2024-03-02 10:15"
+        assert stats["entries_by_category"] == {"Added": 2, "Fixed": 1, "Changed": 2}
+        assert stats["entries_by_version"]["Unreleased"] == {"Added": 2, "Fixed": 1}
+
+
+def test_index_persists_and_follows_file_changes():
+    """Збережений індекс використовується повторно й перебудовується після зміни"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = _write(tmp, CHANGELOG)
+        index_file = Path(tmp, ".nimda_cache", "changelog_index.json")
+        assert ChangelogIndex(path, index_file).search("crash")
+        assert index_file.exists()
+
+        # Новий процес бере індекс із диска без розбору журналу
+        index = ChangelogIndex(path, index_file)
+        builds = []
+        original_build = index._build
+        index._build = lambda content: (builds.append(1), original_build(content))
+        assert len(index.search("step")) == 0
+        assert index.get_statistics()["total_tasks"] == 5
+        assert builds == []
+
+        _write(tmp, CHANGELOG.replace("Crash on start", "Crash on exit"))
+        assert [e["text"] for e in index.search("crash")] == ["Crash on exit"]
+        assert builds == [1]
+        assert ChangelogIndex(path, index_file).search("on exit")
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Тест журналу записів ChangelogManager з відкладеним рендерингом
+"""
+
+import gc
+import sys
+import tempfile
+import weakref
+from pathlib import Path
+
+CURRENT_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(CURRENT_DIR))
+
+import changelog_manager
+from changelog_manager import ChangelogManager
+
+CHANGELOG = """# Changelog
+
+## [Unreleased]
+
+### Added
+- [ ] Initial project setup
+
+### Fixed
+- [ ] Initial errors
+
+## [1.0.0] - 2025-01-01
+
+### Added
+- [x] NIMDA Agent project initialization
+"""
+
+
+def _entry_lines(content: str):
+    """Рядки записів без часових міток"""
+    return [line.rsplit(" (", 1)[0] for line in content.split("\n")]
+
+
+def test_entries_are_journaled_and_rendered_on_flush():
+    """Записи потрапляють у журнал і рендеряться одним переписуванням"""
+    with tempfile.TemporaryDirectory() as tmp:
+        changelog = Path(tmp) / "CHANGELOG.md"
+        changelog.write_text(CHANGELOG, encoding="utf-8")
+        manager = ChangelogManager(Path(tmp))
+
+        assert manager.add_entry("First feature")
+        assert manager.add_entries(
+            [
+                "Second feature",
+                {"message": "Crash on start", "category": "Fixed"},
+                {"message": "Docs pass", "category": "Docs", "completed": False},
+            ]
+        )
+        assert manager.mark_task_completed(
+            {
+                "number": 3,
+                "title": "Parser",
+                "subtasks": [
+                    {"text": "Tokenizer", "completed": True},
+                    {"text": "Grammar", "completed": False},
+                ],
+            }
+        )
+
+        # До flush файл не змінюється
+        assert changelog.read_text(encoding="utf-8") == CHANGELOG
+        assert manager.journal_file.exists()
+
+        assert manager.flush()
+        journal_size = manager.journal_file.stat().st_size
+        assert _entry_lines(changelog.read_text(encoding="utf-8")) == [
+            "# Changelog",
+            "",
+            "## [Unreleased]",
+            "### executed",
+            "- [x]   └─ Tokenizer",
+            "- [x] executed задачу #3: Parser",
+            "",
+            "### Docs",
+            "- [ ] Docs pass",
+            "",
+            "",
+            "### Added",
+            "- [x] Second feature",
+            "- [x] First feature",
+            "- [ ] Initial project setup",
+            "",
+            "### Fixed",
+            "- [x] Crash on start",
+            "- [ ] Initial errors",
+            "",
+            "## [1.0.0] - 2025-01-01",
+            "",
+            "### Added",
+            "- [x] NIMDA Agent project initialization",
+            f"<!-- journal-offset: {journal_size} -->",
+            "",
+        ]
+
+
+def test_reads_threshold_and_restart_flush_the_journal():
+    """Читання, поріг та новий запуск рендерять накопичені записи"""
+    with tempfile.TemporaryDirectory() as tmp:
+        changelog = Path(tmp) / "CHANGELOG.md"
+        changelog.write_text(CHANGELOG, encoding="utf-8")
+
+        manager = ChangelogManager(Path(tmp), flush_threshold=3)
+        manager.add_entries(["One", "Two"])
+        assert "One" not in changelog.read_text(encoding="utf-8")
+        manager.add_entry("Three")
+        assert "- [x] One (" in changelog.read_text(encoding="utf-8")
+
+        manager.add_entry("Four")
+        assert manager.get_changelog_stats()["completed_tasks"] == 5
+        assert [entry["text"] for entry in manager.search_entries("four")] == ["Four"]
+
+        # Записи, що лишилися після перерваного запуску
+        manager.add_entry("Five")
+        ChangelogManager(Path(tmp))
+        assert "- [x] Five (" in changelog.read_text(encoding="utf-8")
+
+
+def test_journal_survives_missing_section_and_torn_lines():
+    """Журнал зберігається без [Unreleased], пошкоджений рядок пропускається"""
+    with tempfile.TemporaryDirectory() as tmp:
+        changelog = Path(tmp) / "CHANGELOG.md"
+        changelog.write_text("# Changelog\n", encoding="utf-8")
+
+        manager = ChangelogManager(Path(tmp))
+        assert manager.add_entry("Kept")
+        assert not manager.flush()
+        assert manager.journal_file.exists()
+        assert changelog.read_text(encoding="utf-8") == "# Changelog\n"
+
+        # Обірваний запис після аварійного завершення
+        with open(manager.journal_file, "a", encoding="utf-8") as journal:
+            journal.write('{"message": "Tor')
+        assert manager.add_entry("After crash")
+
+        changelog.write_text(CHANGELOG, encoding="utf-8")
+        assert manager.flush()
+        content = changelog.read_text(encoding="utf-8")
+        assert "- [x] Kept (" in content
+        assert "- [x] After crash (" in content
+        assert "Tor" not in content
+
+        # Повторний flush не дублює вже відрендерені записи
+        assert manager.flush()
+        assert changelog.read_text(encoding="utf-8") == content
+        assert ChangelogManager(Path(tmp)).flush()
+        assert changelog.read_text(encoding="utf-8") == content
+
+
+def test_journal_is_durable_log_and_exit_flush_is_weak():
+    """Журнал лишається джерелом записів, менеджери не утримуються до виходу"""
+    with tempfile.TemporaryDirectory() as tmp:
+        changelog = Path(tmp) / "CHANGELOG.md"
+        changelog.write_text(CHANGELOG, encoding="utf-8")
+
+        manager = ChangelogManager(Path(tmp))
+        manager.add_entries(["Journaled", {"message": "Bug", "category": "Fixed"}])
+        assert manager.flush()
+        assert manager.journal_file.exists()
+
+        # Втрачений CHANGELOG.md відновлюється з журналу
+        changelog.unlink()
+        manager = ChangelogManager(Path(tmp))
+        content = changelog.read_text(encoding="utf-8")
+        assert "- [x] Journaled (" in content
+        assert "- [x] Bug (" in content
+
+        # Записи менеджера, живого на момент виходу, рендеряться хуком atexit
+        manager.add_entry("Pending at exit")
+        changelog_manager._flush_open_managers()
+        assert "- [x] Pending at exit (" in changelog.read_text(encoding="utf-8")
+
+        manager_ref = weakref.ref(manager)
+        del manager
+        gc.collect()
+        assert manager_ref() is None
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Тест конкурентного виконання завдань у DevPlanExecutorPlugin
+"""
+
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+CURRENT_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(CURRENT_DIR))
+
+from plugins.base_plugin import PluginResult
+from plugins.dev_plan_executor_plugin import DevPlanExecutorPlugin
+
+
+class SlowPlugin(DevPlanExecutorPlugin):
+    """Плагін з фіксованою тривалістю завдань для вимірювань"""
+
+    delay = 0.2
+
+    def __init__(self, config):
+        super().__init__(config)
+        self.active = 0
+        self.peak = 0
+
+    async def _execute_main_task(self, task):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(self.delay)
+        self.active -= 1
+        return PluginResult(success=True, message=task["name"])
+
+    async def _execute_quality_control(self, task):
+        return PluginResult(success=True, message="ok", data={"quality_score": 100})
+
+    async def _execute_advanced_tools_check(self, task):
+        return PluginResult(success=True, message="ok", data={"tools_score": 100})
+
+
+def _run(mode: str, max_parallel: int, count: int):
+    with tempfile.TemporaryDirectory() as temp_dir:
+        plugin = SlowPlugin(
+            {
+                "workspace_path": temp_dir,
+                "max_parallel_tasks": max_parallel,
+                "concurrency_mode": mode,
+            }
+        )
+        completed = []
+        plugin.on_gui_update = lambda _plugin, data: completed.append(data["task"])
+
+        tasks = [{"name": f"Task {i}"} for i in range(count)]
+        start = time.perf_counter()
+        results = asyncio.run(plugin._execute_triple_parallel_tasks(tasks))
+        elapsed = time.perf_counter() - start
+        return plugin, results, completed, elapsed
+
+
+def test_group_runs_concurrently_and_keeps_order():
+    """Завдання групи виконуються одночасно, порядок результатів збережено"""
+    plugin, results, completed, elapsed = _run("group", 4, 4)
+
+    assert [r["main"].message for r in results] == [f"Task {i}" for i in range(4)]
+    assert sorted(completed) == [f"Task {i}" for i in range(4)]
+    assert plugin.peak == 4
+    assert elapsed < SlowPlugin.delay * 2
+
+
+def test_group_mode_runs_groups_one_after_another():
+    """Режим group виконує групи розміром max_parallel_tasks по черзі"""
+    plugin, results, _, elapsed = _run("group", 2, 4)
+
+    assert len(results) == 4
+    assert plugin.peak == 2
+    assert elapsed >= SlowPlugin.delay * 2
+
+
+def test_unknown_mode_falls_back_to_sequential():
+    """Невідомий режим замінюється послідовним"""
+    plugin, results, _, _ = _run("sections", 4, 3)
+
+    assert plugin.concurrency_mode == "sequential"
+    assert len(results) == 3
+    assert plugin.peak == 1
+
+
+def test_semaphore_bounds_concurrency():
+    """Семафор обмежує кількість активних завдань"""
+    plugin, results, _, _ = _run("section", 2, 6)
+
+    assert len(results) == 6
+    assert plugin.peak == 2
+
+
+def test_sequential_mode():
+    """Послідовний режим виконує завдання по одному"""
+    plugin, results, _, _ = _run("sequential", 4, 3)
+
+    assert len(results) == 3
+    assert plugin.peak == 1
+
+
+def test_sequential_is_the_default():
+    """Паралельні режими вмикаються лише явно"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        plugin = SlowPlugin({"workspace_path": temp_dir})
+        results = asyncio.run(
+            plugin._execute_triple_parallel_tasks(
+                [{"name": f"Task {i}"} for i in range(3)]
+            )
+        )
+
+    assert plugin.concurrency_mode == "sequential"
+    assert len(results) == 3
+    assert plugin.peak == 1
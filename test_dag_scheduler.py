@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Тест DAG планувальника секцій DEV_PLAN
+"""
+
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pytest
+
+CURRENT_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(CURRENT_DIR))
+
+from Core.dag_scheduler import DAGScheduler, SectionDAG
+from Core.plugin_system_runner import NIMDAPluginSystemRunner
+from plugins.base_plugin import PluginResult
+from plugins.dev_plan_executor_plugin import DevPlanExecutorPlugin
+
+PLAN = """# Plan
+
+## 🎮 Phase 1: Foundation
+### 1.1 Core
+- [ ] **Core loop** - event loop
+- [ ] **Config** - settings
+
+### 1.2 GUI
+- [ ] **Window** - main window
+
+## 🎮 Phase 2: Features
+depends: 1.1
+
+### 2.1 AI
+- [ ] **Model** - ml model
+
+### 2.2 System
+<!-- depends: 2.1 -->
+- [x] **Monitoring** - metrics
+
+## 📊 Metrics
+"""
+
+
+def _phases():
+    plugin = DevPlanExecutorPlugin({"workspace_path": str(CURRENT_DIR)})
+    return plugin._extract_phases(PLAN)
+
+
+def test_depends_annotations_are_parsed():
+    """Анотації depends: фаз та секцій"""
+    phases = _phases()
+
+    assert phases["Phase 1"]["depends"] == []
+    assert phases["Phase 2"]["depends"] == ["1.1"]
+    assert phases["Phase 2"]["sections"]["2.2"]["depends"] == ["2.1"]
+    assert len(phases["Phase 1"]["sections"]["1.1"]["tasks"]) == 2
+
+
+def test_graph_from_annotations_and_numbering():
+    """Явні залежності та виведення з нумерації фаз"""
+    dag = SectionDAG.from_phases(_phases())
+
+    assert dag.nodes["Phase 1/1.1"].depends == set()
+    assert dag.nodes["Phase 1/1.2"].depends == set()
+    assert dag.nodes["Phase 2/2.1"].depends == {"Phase 1/1.1"}
+    assert dag.nodes["Phase 2/2.2"].depends == {"Phase 1/1.1", "Phase 2/2.1"}
+
+    length, path = dag.critical_path()
+    assert path == ["Phase 1/1.1", "Phase 2/2.1", "Phase 2/2.2"]
+    assert length == 4.0
+
+
+def test_cycles_are_rejected():
+    """Циклічні залежності відхиляються"""
+    phases = _phases()
+    phases["Phase 1"]["sections"]["1.1"]["depends"] = ["2.2"]
+
+    with pytest.raises(ValueError):
+        SectionDAG.from_phases(phases)
+
+
+def test_independent_sections_run_concurrently():
+    """Незалежні секції виконуються одночасно, критичний шлях першим"""
+    dag = SectionDAG.from_phases(_phases(), infer="none")
+    started = []
+
+    async def execute(node):
+        started.append(node.key)
+        await asyncio.sleep(0.1)
+        return node.key
+
+    start = time.perf_counter()
+    outcome = asyncio.run(DAGScheduler(dag, max_concurrency=1).run(execute))
+    serial = time.perf_counter() - start
+
+    # Секція 1.1 лежить на критичному шляху і стартує першою
+    assert started[0] == "Phase 1/1.1"
+    assert started.index("Phase 2/2.1") < started.index("Phase 2/2.2")
+
+    outcome = asyncio.run(DAGScheduler(dag, max_concurrency=4).run(execute))
+    report = outcome["report"]
+
+    assert set(outcome["runs"]) == set(dag.nodes)
+    assert report["wall_time"] < serial
+    assert report["critical_path"] == ["Phase 1/1.1", "Phase 2/2.1", "Phase 2/2.2"]
+    assert report["critical_path_length"] <= report["wall_time"] + 0.05
+
+
+def test_dependents_of_failed_sections_are_skipped():
+    """Залежні від невдалої секції секції не виконуються"""
+    dag = SectionDAG.from_phases(_phases(), infer="none")
+    started = []
+
+    async def execute(node):
+        started.append(node.key)
+        if node.key == "Phase 1/1.1":
+            raise RuntimeError("boom")
+        return {"success": True}
+
+    outcome = asyncio.run(DAGScheduler(dag, max_concurrency=2).run(execute))
+    runs = outcome["runs"]
+
+    assert sorted(started) == ["Phase 1/1.1", "Phase 1/1.2"]
+    assert runs["Phase 2/2.1"].blocked_by == "Phase 1/1.1"
+    assert runs["Phase 2/2.2"].skipped
+    assert outcome["report"]["failed"] == ["Phase 1/1.1"]
+    assert outcome["report"]["skipped"] == ["Phase 2/2.1", "Phase 2/2.2"]
+
+    # Невдалий результат без винятку теж блокує залежні секції
+    async def unsuccessful(node):
+        return {"success": node.key != "Phase 2/2.1"}
+
+    outcome = asyncio.run(DAGScheduler(dag).run(unsuccessful))
+    assert outcome["report"]["failed"] == ["Phase 2/2.1"]
+    assert outcome["report"]["skipped"] == ["Phase 2/2.2"]
+
+
+def test_concurrent_sections_share_plugin_state_safely():
+    """Одночасні секції одного плагіна не скидають статус і індекс одна одній"""
+    plugin = DevPlanExecutorPlugin({"workspace_path": str(CURRENT_DIR)})
+    plugin.dev_plan["phases"] = _phases()
+    refreshes = []
+    plugin.workspace_index.refresh = lambda: refreshes.append(1)
+    statuses = []
+    plugin.on_status_change = lambda _plugin, old, new, message: statuses.append(
+        new.value
+    )
+
+    async def run_sections():
+        return await asyncio.gather(
+            plugin.execute(
+                {
+                    "type": "execute_section",
+                    "phase_name": "Phase 1",
+                    "section_name": "1.1",
+                }
+            ),
+            plugin.execute(
+                {
+                    "type": "execute_section",
+                    "phase_name": "Phase 1",
+                    "section_name": "1.2",
+                }
+            ),
+        )
+
+    results = asyncio.run(run_sections())
+
+    assert len(results) == 2
+    assert len(refreshes) == 1
+    assert statuses[0] == "running"
+    assert len(statuses) == 2
+    assert plugin.active_sections == []
+
+
+def test_repeated_phase_numbers_keep_all_sections():
+    """Фази з однаковим номером не перезаписують секції одна одної"""
+    phases = _phases()
+    phases["Phase 2"]["depends"] = []
+    phases = {
+        "Phase 1: Core": phases["Phase 1"],
+        "Phase 1: Extras": {
+            "title": "Extras",
+            "depends": [],
+            "sections": {"1.3": {"title": "Docs", "depends": [], "tasks": []}},
+        },
+        "Phase 2": phases["Phase 2"],
+    }
+    phases["Phase 2"]["sections"]["2.1"]["depends"] = ["1"]
+
+    dag = SectionDAG.from_phases(phases)
+
+    assert dag.nodes["Phase 2/2.1"].depends == {
+        "Phase 1: Core/1.1",
+        "Phase 1: Core/1.2",
+        "Phase 1: Extras/1.3",
+    }
+    # Виведення з нумерації бере саме попередню фазу
+    assert dag.nodes["Phase 1: Extras/1.3"].depends == {
+        "Phase 1: Core/1.1",
+        "Phase 1: Core/1.2",
+    }
+
+
+def test_runner_dag_mode_tracks_phases():
+    """DAG режим раннера оновлює статус, час та події GUI кожної фази"""
+
+    async def scenario(workspace: str):
+        runner = NIMDAPluginSystemRunner(workspace, dag_mode=True)
+        runner.infer_dependencies = "none"
+        plugin = DevPlanExecutorPlugin({"workspace_path": workspace})
+        await runner.plugin_manager.register_plugin(plugin)
+        plugin.dev_plan["phases"] = phases = _phases()
+
+        events = []
+        plugin.on_gui_update = lambda _plugin, data: events.append(
+            (data["type"], data.get("phase"))
+        )
+
+        async def execute_section(phase_name, section_id):
+            events.append(("section", section_id))
+            await asyncio.sleep(0.01)
+            return PluginResult(success=section_id != "1.2", message=section_id)
+
+        plugin._execute_section = execute_section
+        results, report = await runner._execute_phases_dag(phases)
+        await runner.plugin_manager.shutdown()
+        return plugin, phases, events, results
+
+    with tempfile.TemporaryDirectory() as tmp:
+        plugin, phases, events, results = asyncio.run(scenario(tmp))
+
+    assert [result["phase"] for result in results] == ["Phase 1", "Phase 2"]
+    assert [result["result"].success for result in results] == [False, True]
+    assert phases["Phase 1"]["status"] == "failed"
+    assert phases["Phase 2"]["status"] == "completed"
+    assert set(plugin.phase_completion_times) == {"Phase 1", "Phase 2"}
+
+    for phase_name, sections in (("Phase 1", ["1.1", "1.2"]), ("Phase 2", ["2.1"])):
+        started = events.index(("phase_started", phase_name))
+        completed = events.index(("phase_completed", phase_name))
+        assert all(
+            started < events.index(("section", section)) < completed
+            for section in sections
+        )
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Тест спільного кешованого документа DEV_PLAN
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+import threading
+from pathlib import Path
+
+CURRENT_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(CURRENT_DIR))
+
+from plugins.dev_plan_document import DevPlanDocumentService
+
+PLAN = "# Plan\n\n- [ ] **Alpha** - first\n- [x] **Beta** - second\n"
+
+
+def _bump_mtime(path: Path):
+    """Зсув mtime, щоб зміна була помітна навіть у межах одного тіку"""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+
+
+def _open_tasks(document):
+    """Тестове представлення: назви невиконаних рядків"""
+    return [line for line in document.lines if line.startswith("- [ ]")]
+
+
+def test_views_are_built_once_per_content():
+    """Представлення будуються один раз для кожного вмісту файлу"""
+    with tempfile.TemporaryDirectory() as tmp:
+        plan_path = Path(tmp) / "DEV_PLAN.md"
+        plan_path.write_text(PLAN, encoding="utf-8")
+        service = DevPlanDocumentService()
+        builds = []
+
+        def builder(document):
+            builds.append(document.content_hash)
+            return _open_tasks(document)
+
+        first = service.view(plan_path, "open:1", builder)
+        first.append("mutated by caller")
+        assert service.view(plan_path, "open:1", builder) == ["- [ ] **Alpha** - first"]
+        assert len(builds) == 1
+
+        # Той самий вміст з новим mtime не перебудовується
+        _bump_mtime(plan_path)
+        service.view(plan_path, "open:1", builder)
+        assert len(builds) == 1
+
+        plan_path.write_text(PLAN.replace("- [ ]", "- [x]"), encoding="utf-8")
+        _bump_mtime(plan_path)
+        assert service.view(plan_path, "open:1", builder) == []
+        assert len(builds) == 2
+
+        stats = service.get_statistics()
+        assert stats["builds"] == 2
+        assert stats["reads"] == 3
+
+
+def test_sidecar_is_shared_between_services():
+    """Новий сервіс бере представлення з файлу-супутника"""
+    with tempfile.TemporaryDirectory() as tmp:
+        plan_path = Path(tmp) / "DEV_PLAN.md"
+        plan_path.write_text(PLAN, encoding="utf-8")
+        DevPlanDocumentService().view(plan_path, "open:1", _open_tasks)
+        assert (Path(tmp) / ".nimda_cache" / "DEV_PLAN.views.json").exists()
+
+        def fail(document):
+            raise AssertionError("sidecar should have been used")
+
+        service = DevPlanDocumentService()
+        assert service.view(plan_path, "open:1", fail) == ["- [ ] **Alpha** - first"]
+        assert service.get_statistics()["sidecar_hits"] == 1
+
+        # Файл-супутник іншого вмісту ігнорується
+        plan_path.write_text(PLAN + "- [ ] **Gamma** - third\n", encoding="utf-8")
+        assert len(DevPlanDocumentService().view(plan_path, "open:1", _open_tasks)) == 2
+
+
+def _open_titles(document):
+    """Тестове представлення зі спільного розбору: тексти невиконаних пунктів"""
+    return [
+        task["text"]
+        for heading in document.outline["headings"]
+        for task in heading["tasks"]
+        if not task["checked"]
+    ]
+
+
+def _task_offsets(document):
+    """Тестове представлення зі спільного розбору: позиції прапорців"""
+    return [
+        task["offset"]
+        for heading in document.outline["headings"]
+        for task in heading["tasks"]
+    ]
+
+
+def test_views_share_one_outline_parse():
+    """Усі представлення будуються з одного розбору, збереженого у супутнику"""
+    with tempfile.TemporaryDirectory() as tmp:
+        plan_path = Path(tmp) / "DEV_PLAN.md"
+        plan_path.write_text(PLAN, encoding="utf-8")
+        service = DevPlanDocumentService()
+
+        assert service.view(plan_path, "titles:1", _open_titles) == [
+            "**Alpha** - first"
+        ]
+        offsets = service.view(plan_path, "offsets:1", _task_offsets)
+        assert [PLAN[offset] for offset in offsets] == [" ", "x"]
+        stats = service.get_statistics()
+        assert stats["parses"] == 1
+        assert stats["builds"] == 2
+
+        # Новий сервіс бере розбір із супутника для нового представлення
+        service = DevPlanDocumentService()
+        assert service.view(plan_path, "count:1", _task_offsets) == offsets
+        assert service.get_statistics()["parses"] == 0
+
+
+def test_concurrent_callers_share_one_build():
+    """Потоки та корутини чекають на одну побудову представлення"""
+    with tempfile.TemporaryDirectory() as tmp:
+        plan_path = Path(tmp) / "DEV_PLAN.md"
+        plan_path.write_text(PLAN, encoding="utf-8")
+        service = DevPlanDocumentService(persist=False)
+        builds = []
+        results = []
+
+        def builder(document):
+            builds.append(1)
+            return _open_tasks(document)
+
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(
+                    service.view(plan_path, "open:1", builder)
+                )
+            )
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        async def gather_views():
+            return await asyncio.gather(
+                *(service.aview(plan_path, "open:1", builder) for _ in range(4))
+            )
+
+        results.extend(asyncio.run(gather_views()))
+        assert len(builds) == 1
+        assert len(results) == 12
+        assert all(result == ["- [ ] **Alpha** - first"] for result in results)
+        assert not (Path(tmp) / ".nimda_cache").exists()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Тест індексованої моделі плану та лічильників прогресу DevPlanManager
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+CURRENT_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(CURRENT_DIR))
+
+from dev_plan_manager import DevPlanManager
+
+PLAN = """# Index plan
+
+## Головні task
+
+### 1. Done
+- [x] Alpha step
+- [x] Beta step
+
+### 2. Partial
+- [x] Gamma step
+- [ ] Delta step
+
+### 10. Open
+- [ ] Epsilon step
+"""
+
+COUNTERS = ("total_tasks", "completed_tasks", "total_subtasks", "completed_subtasks")
+
+
+def _recount(manager):
+    """Підрахунок прогресу повним обходом плану"""
+    tasks = manager.plan_structure["tasks"]
+    subtasks = [st for task in tasks for st in task["subtasks"]]
+    return {
+        "total_tasks": len(tasks),
+        "completed_tasks": len([task for task in tasks if task["completed"]]),
+        "total_subtasks": len(subtasks),
+        "completed_subtasks": len([st for st in subtasks if st["completed"]]),
+    }
+
+
+def _counters(status):
+    """Лічильники зі статусу плану"""
+    return {key: status[key] for key in COUNTERS}
+
+
+def test_counters_follow_execution():
+    """Лічильники статусу збігаються з повним перерахунком після змін"""
+    with tempfile.TemporaryDirectory() as tmp:
+        Path(tmp, "DEV_PLAN.md").write_text(PLAN, encoding="utf-8")
+        manager = DevPlanManager(Path(tmp), save_debounce=0)
+
+        status = manager.get_plan_status()
+        assert _counters(status) == _recount(manager)
+        # Перша виконана підзадача не робить задачу виконаною
+        assert not manager.get_task(2)["completed"]
+        assert status["completed_tasks"] == 1
+        assert status["progress_percentage"] == 60.0
+
+        assert manager.get_task(3) is None
+        assert manager.get_task(10) is manager.get_task_by_id(3)
+
+        assert manager.execute_task(2)["success"]
+        assert manager.execute_task(2)["message"] == "task #2 вже виконана"
+        assert _counters(manager.get_plan_status()) == _recount(manager)
+        assert manager.plan_structure["completed_tasks"] == [
+            manager.get_task(1),
+            manager.get_task(2),
+        ]
+
+        manager.update_and_expand_plan()
+        assert _counters(manager.get_plan_status()) == _recount(manager)
+
+        result = manager.execute_full_plan()
+        assert result["success"]
+        status = manager.get_plan_status()
+        assert _counters(status) == _recount(manager)
+        assert status["progress_percentage"] == 100.0
+
+
+def test_reload_only_when_file_changes():
+    """Повторне читання плану лише після зміни файлу на диску"""
+    with tempfile.TemporaryDirectory() as tmp:
+        plan_path = Path(tmp, "DEV_PLAN.md")
+        plan_path.write_text(PLAN, encoding="utf-8")
+        manager = DevPlanManager(Path(tmp), save_debounce=0)
+
+        assert not manager.reload_if_changed()
+
+        plan_path.write_text(PLAN.replace("- [ ]", "- [x]"), encoding="utf-8")
+        stat = plan_path.stat()
+        os.utime(plan_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+
+        assert manager.reload_if_changed()
+        assert manager.get_plan_status()["completed_tasks"] == 3
+        assert not manager.reload_if_changed()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Тест однопрохідного парсера DEV_PLAN та кешування результату
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+CURRENT_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(CURRENT_DIR))
+
+import plugins.dev_plan_parser as dev_plan_parser
+from plugins.dev_plan_parser import parse_dev_plan, parse_dev_plan_file
+
+PLAN = """# DEV PLAN - Plan v5.2
+Created: 2025-07-15, target 3.5+ tasks/second
+
+## 🎮 Phase 8: Core
+<!-- depends: Phase 7 -->
+
+### 8.1 Engine
+- [x] **Loop** - Main loop
+- [ ] **Render** - Renderer
+  with a second line
+  - [ ] **Nested** - stays in the description
+- note without checkbox
+  ignored continuation
+
+### Notes
+- [ ] **Extra** - belongs to 8.1
+
+### 8.2 Tools
+*depends: 8.1*
+- [ ] **Editor** - Level editor
+
+## 📊 Statistics
+- [ ] **Outside** - not part of any phase
+"""
+
+
+def test_parse_structure():
+    """Фази, секції, завдання, залежності та метадані за один прохід"""
+    phases, metadata = parse_dev_plan(PLAN)
+
+    assert metadata == {
+        "version": "5.2",
+        "created": "2025-07-15",
+        "target_performance": 3.5,
+    }
+    assert list(phases) == ["Phase 8"]
+
+    phase = phases["Phase 8"]
+    assert phase["title"] == "Core"
+    assert phase["depends"] == ["Phase 7"]
+    assert list(phase["sections"]) == ["8.1", "8.2"]
+
+    engine = phase["sections"]["8.1"]
+    assert [task["name"] for task in engine["tasks"]] == ["Loop", "Render", "Extra"]
+    assert engine["tasks"][0]["status"] == "completed"
+    assert engine["tasks"][1]["description"] == (
+        "Renderer\n  with a second line\n  - [ ] **Nested** - stays in the description"
+    )
+    assert phase["sections"]["8.2"]["depends"] == ["8.1"]
+    assert phase["sections"]["8.2"]["tasks"][0]["description"] == "Level editor"
+
+
+def test_file_parse_is_cached_until_change():
+    """Повторний розбір незміненого файлу не читає його знову"""
+    with tempfile.TemporaryDirectory() as tmp:
+        plan_path = Path(tmp) / "DEV_PLAN.md"
+        plan_path.write_text(PLAN, encoding="utf-8")
+
+        phases, _ = parse_dev_plan_file(plan_path)
+        phases["Phase 8"]["sections"]["8.1"]["tasks"][1]["status"] = "completed"
+
+        calls = []
+        original = dev_plan_parser.phases_from_outline
+        dev_plan_parser.phases_from_outline = lambda outline, lines: (
+            calls.append(1) or original(outline, lines)
+        )
+        try:
+            again, _ = parse_dev_plan_file(plan_path)
+            assert calls == []
+            # Зміни викликача не потрапляють у кеш
+            assert again["Phase 8"]["sections"]["8.1"]["tasks"][1]["status"] == (
+                "pending"
+            )
+
+            plan_path.write_text(PLAN.replace("- [ ] **Editor**", "- [x] **Editor**"))
+            stat = plan_path.stat()
+            os.utime(plan_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+
+            updated, _ = parse_dev_plan_file(plan_path)
+            assert calls == [1]
+            assert updated["Phase 8"]["sections"]["8.2"]["tasks"][0]["completed"]
+        finally:
+            dev_plan_parser.phases_from_outline = original
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Тест відкладеного атомарного збереження DEV_PLAN.md у DevPlanManager
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+CURRENT_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(CURRENT_DIR))
+
+import dev_plan_manager
+from dev_plan_manager import DevPlanManager
+
+PLAN = """# Persistence plan
+
+Free text that regeneration would drop.
+
+## Головні task
+
+### 1. First
+- [ ] Alpha step
+  - [x] Nested done step
+
+### 2. Second
+- [ ] Beta step
+- [ ] Gamma step
+
+### 3. Third
+- [ ] Delta step
+"""
+
+
+def _counting_writes(manager):
+    """Підрахунок фактичних записів файлу плану"""
+    writes = []
+    original = manager._write_atomic
+
+    def write(content):
+        writes.append(content)
+        original(content)
+
+    manager._write_atomic = write
+    return writes
+
+
+def test_full_plan_writes_are_coalesced():
+    """Записи під час виконання плану об'єднуються та завершуються flush"""
+    with tempfile.TemporaryDirectory() as tmp:
+        plan_path = Path(tmp) / "DEV_PLAN.md"
+        plan_path.write_text(PLAN, encoding="utf-8")
+        os.chmod(plan_path, 0o640)
+
+        manager = DevPlanManager(Path(tmp), save_debounce=60)
+        writes = _counting_writes(manager)
+
+        result = manager.execute_full_plan()
+
+        assert result["success"]
+        # Перший запис одразу, решта - одним flush наприкінці
+        assert len(writes) == 2
+        assert manager._flush_timer is None
+        assert not manager.flush()
+
+        content = plan_path.read_text(encoding="utf-8")
+        assert "- [ ]" not in content
+        assert plan_path.stat().st_mode & 0o777 == 0o640
+        assert not list(Path(tmp).glob(".DEV_PLAN.*"))
+
+
+def test_checkbox_patch_keeps_layout():
+    """Режим латок змінює лише символи чекбоксів у завантаженому тексті"""
+    with tempfile.TemporaryDirectory() as tmp:
+        plan_path = Path(tmp) / "DEV_PLAN.md"
+        plan_path.write_text(PLAN, encoding="utf-8")
+
+        manager = DevPlanManager(Path(tmp), save_debounce=0, patch_checkboxes=True)
+        assert manager.execute_task(2)["success"]
+
+        expected = PLAN.replace("- [ ] Beta", "- [x] Beta").replace(
+            "- [ ] Gamma", "- [x] Gamma"
+        )
+        assert plan_path.read_text(encoding="utf-8") == expected
+
+        # Файл змінено ззовні: зсуви недійсні, план генерується повністю
+        plan_path.write_text(expected + "\n", encoding="utf-8")
+        assert manager.execute_task(3)["success"]
+
+        content = plan_path.read_text(encoding="utf-8")
+        assert "Free text" not in content
+        assert "- [x] Delta step" in content
+
+
+def test_crlf_plan_keeps_line_endings_and_timer_is_daemon():
+    """Латка чекбоксів зберігає CRLF, таймер відкладеного запису - daemon"""
+    with tempfile.TemporaryDirectory() as tmp:
+        plan_path = Path(tmp) / "DEV_PLAN.md"
+        plan_path.write_bytes(PLAN.replace("\n", "\r\n").encode("utf-8"))
+
+        manager = DevPlanManager(Path(tmp), save_debounce=60, patch_checkboxes=True)
+        assert manager.execute_task(2)["success"]
+        assert manager.execute_task(3)["success"]
+        assert manager._flush_timer is not None and manager._flush_timer.daemon
+        assert manager.flush()
+
+        expected = (
+            PLAN.replace("- [ ] Beta", "- [x] Beta")
+            .replace("- [ ] Gamma", "- [x] Gamma")
+            .replace("- [ ] Delta", "- [x] Delta")
+        )
+        assert plan_path.read_bytes() == expected.replace("\n", "\r\n").encode("utf-8")
+
+
+def test_failed_flush_is_retried_and_exit_flushes_pending_writes():
+    """Невдалий запис не скидає зміни, при виході записуються відкладені"""
+    with tempfile.TemporaryDirectory() as tmp:
+        plan_path = Path(tmp) / "DEV_PLAN.md"
+        plan_path.write_text(PLAN, encoding="utf-8")
+
+        manager = DevPlanManager(Path(tmp), save_debounce=60, patch_checkboxes=True)
+        original = manager._write_atomic
+
+        def failing_write(content):
+            raise OSError("disk full")
+
+        manager._write_atomic = failing_write
+        assert manager.execute_task(2)["success"]
+        assert not manager.flush()
+        assert manager._dirty
+
+        manager._write_atomic = original
+        assert manager.flush()
+        assert "- [x] Gamma step" in plan_path.read_text(encoding="utf-8")
+
+        # Відкладений запис без close() виконується хуком виходу
+        assert manager.execute_task(3)["success"]
+        assert manager._flush_timer is not None
+        dev_plan_manager._flush_open_managers()
+        assert "- [x] Delta step" in plan_path.read_text(encoding="utf-8")
+        assert manager._flush_timer is None
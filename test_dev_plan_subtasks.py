@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Тест паралельного виконання підзадач DevPlanManager з повторами
+"""
+
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+CURRENT_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(CURRENT_DIR))
+
+import dev_plan_manager
+from dev_plan_manager import DevPlanManager
+
+PLAN = """# Subtask plan
+
+## Головні task
+
+### 1. Parallel
+<!-- parallel -->
+- [ ] Alpha step
+- [ ] Beta step
+- [ ] Setup environment
+- [ ] Gamma step
+- [ ] Delta step
+
+### 2. Flaky
+- [ ] Flaky step
+- [ ] Broken step
+
+### 3. Plain
+- [ ] Epsilon step
+"""
+
+
+def _manager(tmp: str, **kwargs) -> DevPlanManager:
+    """Менеджер для тестового плану"""
+    Path(tmp, "DEV_PLAN.md").write_text(PLAN, encoding="utf-8")
+    return DevPlanManager(Path(tmp), save_debounce=60, **kwargs)
+
+
+def test_only_marked_tasks_run_subtasks_concurrently():
+    """Підзадачі йдуть паралельно лише в задачі з маркером parallel"""
+    with tempfile.TemporaryDirectory() as tmp:
+        manager = _manager(tmp, subtask_workers=4)
+        lock = threading.Lock()
+        state = {"running": 0, "peak": 0}
+        events = []
+
+        def fake_execute(subtask, parent_task):
+            with lock:
+                state["running"] += 1
+                state["peak"] = max(state["peak"], state["running"])
+                events.append(("start", subtask["text"], state["running"]))
+            time.sleep(0.05)
+            with lock:
+                state["running"] -= 1
+            return True
+
+        manager._execute_subtask = fake_execute
+        result = manager.execute_task(1)
+        parallel_peak = state["peak"]
+
+        # Без маркера порядок плану зберігається, хоч би що було в тексті
+        state["peak"] = 0
+        assert manager.execute_task(2)["success"]
+        manager.close()
+
+        assert result["success"]
+        assert [st["text"] for st in result["executed_subtasks"]] == [
+            "Alpha step",
+            "Beta step",
+            "Setup environment",
+            "Gamma step",
+            "Delta step",
+        ]
+        assert parallel_peak == 4
+        assert state["peak"] == 1
+        assert [event[1] for event in events[5:]] == ["Flaky step", "Broken step"]
+        assert manager.get_plan_status()["completed_subtasks"] == 7
+
+        # Маркер переживає повну регенерацію плану
+        manager._save_plan(structure_changed=True)
+        manager.flush()
+        assert "<!-- parallel -->" in Path(tmp, "DEV_PLAN.md").read_text(
+            encoding="utf-8"
+        )
+        reloaded = DevPlanManager(Path(tmp), save_debounce=60)
+        assert reloaded.plan_structure["tasks"][0]["parallel"]
+        assert not reloaded.plan_structure["tasks"][1]["parallel"]
+
+
+def test_retries_back_off_and_full_plan_uses_ready_queue():
+    """Повтори з експоненційною затримкою; безнадійна task не блокує план"""
+    with tempfile.TemporaryDirectory() as tmp:
+        manager = _manager(tmp, max_retries=3, retry_backoff=0.2)
+        attempts = {}
+        delays = []
+
+        def fake_execute(subtask, parent_task):
+            attempts[subtask["text"]] = attempts.get(subtask["text"], 0) + 1
+            if subtask["text"] == "Broken step":
+                return False
+            if subtask["text"] == "Flaky step":
+                return attempts["Flaky step"] >= 3
+            return True
+
+        manager._execute_subtask = fake_execute
+        original_sleep = dev_plan_manager.time.sleep
+        dev_plan_manager.time.sleep = delays.append
+        try:
+            result = manager.execute_full_plan()
+        finally:
+            dev_plan_manager.time.sleep = original_sleep
+
+        assert not result["success"]
+        assert [t["title"] for t in result["executed_tasks"]] == ["Parallel", "Plain"]
+        assert [f["task"]["title"] for f in result["failed_tasks"]] == ["Flaky"]
+        assert attempts["Flaky step"] == 3
+        # Перша спроба задачі дала прогрес, друга - ні, тож повторів задачі два
+        assert attempts["Broken step"] == 6
+        assert len(delays) == 6
+        for first, second in zip(delays[::2], delays[1::2]):
+            assert 0.1 <= first <= 0.2
+            assert 0.2 <= second <= 0.4
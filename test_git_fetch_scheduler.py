@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Тест фонового планувальника git fetch
+"""
+
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+CURRENT_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(CURRENT_DIR))
+
+from git_fetch_scheduler import GitFetchScheduler
+from git_manager import GitManager
+
+
+def _git(repo: Path, *args: str) -> str:
+    """Виконання git у тестовому репозиторії"""
+    return subprocess.run(
+        ["git", *args], cwd=repo, capture_output=True, text=True, check=True
+    ).stdout
+
+
+def test_single_flight_and_offline_backoff():
+    """Паралельні виклики ділять один fetch; невдачі подовжують затримку"""
+    calls = []
+    release = threading.Event()
+
+    def slow_fetch():
+        calls.append(1)
+        release.wait(5)
+        return True
+
+    scheduler = GitFetchScheduler(slow_fetch, interval=10)
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(scheduler.fetch_now()))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.1)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(calls) == 1
+    assert results == [True] * 4
+    assert scheduler.get_state()["last_fetched_at"] is not None
+
+    outcomes = iter([False, False, False, True])
+    offline = GitFetchScheduler(lambda: next(outcomes), interval=10, max_backoff=50)
+    delays = []
+    for _ in range(4):
+        offline.fetch_now()
+        state = offline.get_state()
+        delays.append(round(state["next_fetch_in"]))
+    assert delays == [20, 40, 50, 10]
+    assert state["consecutive_failures"] == 0
+    assert state["last_error"] is None
+
+
+def test_status_uses_background_fetched_refs():
+    """Статус не звертається до мережі; фоновий fetch оновлює behind"""
+    with tempfile.TemporaryDirectory() as tmp:
+        remote = Path(tmp, "remote.git")
+        remote.mkdir()
+        _git(remote, "init", "-q", "--bare", "-b", "main")
+
+        clones = []
+        for name in ("work", "other"):
+            _git(Path(tmp), "clone", "-q", str(remote), name)
+            clone = Path(tmp, name)
+            _git(clone, "config", "user.email", "test@example.com")
+            _git(clone, "config", "user.name", "Test")
+            _git(clone, "checkout", "-q", "-b", "main")
+            clones.append(clone)
+        work, other = clones
+
+        _git(work, "commit", "-q", "--allow-empty", "-m", "Initial commit")
+        _git(work, "push", "-q", "-u", "origin", "main")
+        _git(other, "pull", "-q", "origin", "main")
+        _git(other, "commit", "-q", "--allow-empty", "-m", "Remote commit")
+        _git(other, "push", "-q", "origin", "main")
+
+        manager = GitManager(work, fetch_interval=0.2)
+        try:
+            status = manager.get_status()
+            assert status["remote_url"] == str(remote)
+            assert "last_fetched_at" in status
+
+            deadline = time.monotonic() + 10
+            while manager.get_status()["behind_count"] != 1:
+                assert time.monotonic() < deadline
+                time.sleep(0.05)
+
+            status = manager.get_status()
+            assert status["last_fetched_at"] is not None
+            assert status["fetch_failures"] == 0
+            assert manager.fetch_scheduler.running
+        finally:
+            manager.close()
+        assert not manager.fetch_scheduler.running
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Тест кешованого статусу GitManager з одного виклику porcelain v2
+"""
+
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+CURRENT_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(CURRENT_DIR))
+
+import git_manager
+from git_manager import GitManager
+
+REMOTE_URL = "https://example.invalid/project.git"
+
+
+def _git(repo: Path, *args: str) -> str:
+    """Виконання git у тестовому репозиторії"""
+    return subprocess.run(
+        ["git", *args], cwd=repo, capture_output=True, text=True, check=True
+    ).stdout
+
+
+def _repo(tmp: str) -> Path:
+    """Репозиторій з одним комітом та upstream-гілкою"""
+    repo = Path(tmp)
+    _git(repo, "init", "-q", "-b", "main")
+    _git(repo, "config", "user.email", "test@example.com")
+    _git(repo, "config", "user.name", "Test")
+    (repo / "tracked.txt").write_text("one\n", encoding="utf-8")
+    _git(repo, "add", "tracked.txt")
+    _git(repo, "commit", "-q", "-m", "Initial commit")
+    _git(repo, "remote", "add", "origin", REMOTE_URL)
+    _git(repo, "update-ref", "refs/remotes/origin/main", "HEAD")
+    _git(repo, "branch", "-q", "--set-upstream-to=origin/main")
+    return repo
+
+
+def _counting_runs(monkeypatch):
+    """Підрахунок запусків git-процесів"""
+    commands = []
+    original = git_manager.subprocess.run
+
+    def run(command, *args, **kwargs):
+        commands.append(command)
+        return original(command, *args, **kwargs)
+
+    monkeypatch.setattr(git_manager.subprocess, "run", run)
+    return commands
+
+
+def test_status_from_single_porcelain_call(monkeypatch):
+    """Гілка, upstream, ahead/behind та файли з одного виклику, потім кеш"""
+    with tempfile.TemporaryDirectory() as tmp:
+        repo = _repo(tmp)
+        (repo / "tracked.txt").write_text("two\n", encoding="utf-8")
+        (repo / "new file.txt").write_text("new\n", encoding="utf-8")
+        (repo / "staged.txt").write_text("staged\n", encoding="utf-8")
+        _git(repo, "add", "staged.txt")
+        _git(repo, "mv", "tracked.txt", "renamed.txt")
+        (repo / "renamed.txt").write_text("three\n", encoding="utf-8")
+
+        manager = GitManager(repo, status_ttl=60, fetch_interval=None)
+        commands = _counting_runs(monkeypatch)
+
+        status = manager.get_status()
+        assert status["initialized"]
+        assert status["current_branch"] == "main"
+        assert status["upstream"] == "origin/main"
+        assert status["has_changes"]
+        assert sorted(status["staged_files"]) == ["renamed.txt", "staged.txt"]
+        assert status["unstaged_files"] == ["renamed.txt"]
+        assert status["untracked_files"] == ["new file.txt"]
+        assert status["total_files"] == 4
+        assert status["ahead_count"] == 0 and status["behind_count"] == 0
+        assert status["last_commit"].endswith("Initial commit")
+        assert status["remote_url"] == REMOTE_URL
+        assert not any("fetch" in command for command in commands)
+
+        # Незмінений .git - відповідь з кешу без нових процесів
+        calls = len(commands)
+        status["staged_files"].clear()
+        assert manager.get_status()["staged_files"]
+        assert len(commands) == calls
+
+        # has_changes завжди перевіряє робоче дерево заново
+        assert manager.has_changes()
+        assert len(commands) == calls + 1
+
+
+def test_cache_follows_commits_and_has_changes(monkeypatch):
+    """Коміт інвалідує кеш; has_changes не робить повного статусу"""
+    with tempfile.TemporaryDirectory() as tmp:
+        repo = _repo(tmp)
+        manager = GitManager(repo, status_ttl=60, fetch_interval=None)
+        assert not manager.get_status()["has_changes"]
+
+        (repo / "tracked.txt").write_text("two\n", encoding="utf-8")
+        _git(repo, "commit", "-q", "-am", "Second commit")
+
+        status = manager.get_status()
+        assert status["ahead_count"] == 1
+        assert status["last_commit"].endswith("Second commit")
+
+        (repo / "untracked.txt").write_text("x\n", encoding="utf-8")
+        manager.invalidate_status()
+        commands = _counting_runs(monkeypatch)
+        assert manager.has_changes()
+        assert len(commands) == 1
+        assert "--branch" not in commands[0]
+
+
+def test_commit_sees_edits_made_after_cached_status():
+    """Зміни робочого дерева після get_status не пропускають коміт"""
+    with tempfile.TemporaryDirectory() as tmp:
+        repo = _repo(tmp)
+        manager = GitManager(repo, status_ttl=60, fetch_interval=None)
+        manager.config["auto_push"] = False
+        assert not manager.get_status()["has_changes"]
+
+        (repo / "new.txt").write_text("new\n", encoding="utf-8")
+        assert manager.has_changes()
+        result = manager.commit_changes("x")
+        manager.close()
+
+        assert result["success"]
+        assert result["commit_hash"]
+        assert len(_git(repo, "log", "--oneline").splitlines()) == 2
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Тест паралельних перевірок HealthChecker з кешем та спільним дедлайном
+"""
+
+import subprocess
+import sys
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+CURRENT_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(CURRENT_DIR))
+
+import health_dashboard
+from health_dashboard import CHECK_NAMES, ComponentHealth, HealthChecker
+
+
+def _fake_checker(delays, **kwargs):
+    """Перевірки з заданими затримками, що рахують свої запуски"""
+    checker = HealthChecker(**kwargs)
+    calls = {key: 0 for key in delays}
+    release = threading.Event()
+
+    def make_check(key, delay):
+        def check():
+            calls[key] += 1
+            if delay is None:
+                release.wait(5)
+            else:
+                time.sleep(delay)
+            return ComponentHealth(
+                name=CHECK_NAMES[key],
+                status="healthy",
+                last_check=datetime.now().isoformat(),
+                response_time_ms=0.0,
+            )
+
+        return check
+
+    for key, delay in delays.items():
+        setattr(checker, f"check_{key}_health", make_check(key, delay))
+    return checker, calls, release
+
+
+def test_checks_run_concurrently_and_reuse_fresh_results():
+    """Час перевірки - максимум, а не сума; свіжі результати з кешу"""
+    delays = {key: 0.2 for key in CHECK_NAMES}
+    checker, calls, _ = _fake_checker(delays)
+
+    started = time.monotonic()
+    components = checker.run_checks()
+    elapsed = time.monotonic() - started
+
+    assert [c.name for c in components] == list(CHECK_NAMES.values())
+    assert all(c.status == "healthy" and not c.stale for c in components)
+    assert elapsed < 0.6
+
+    started = time.monotonic()
+    checker.run_checks()
+    assert time.monotonic() - started < 0.1
+    assert set(calls.values()) == {1}
+    checker.shutdown()
+
+
+def test_deadline_and_stale_results():
+    """Повільна перевірка не блокує: unknown до результату, далі stale"""
+    delays = {key: 0.0 for key in CHECK_NAMES}
+    delays["network"] = None
+    checker, calls, release = _fake_checker(delays, deadline=0.2, ttls={"network": 0})
+
+    started = time.monotonic()
+    components = {c.name: c for c in checker.run_checks()}
+    assert time.monotonic() - started < 1
+    network = components["Network Connectivity"]
+    assert network.status == "unknown"
+    # Перевірка, що вже виконується, не запускається вдруге
+    checker.run_checks()
+    assert calls["network"] == 1
+
+    release.set()
+    deadline = time.monotonic() + 5
+    while "network" in checker._in_flight:
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+    # TTL 0: збережений результат одразу застарілий, оновлення - у фоні
+    release.clear()
+    components = {c.name: c for c in checker.run_checks()}
+    network = components["Network Connectivity"]
+    assert network.status == "healthy" and network.stale
+    assert not components["Git Repository"].stale
+    assert "network" in checker._in_flight
+    release.set()
+    checker.shutdown()
+
+
+def test_unknown_checks_degrade_overall_status(monkeypatch):
+    """Перевірка, що не встигла до дедлайну, - це попередження"""
+    delays = {key: 0.0 for key in CHECK_NAMES}
+    delays["git"] = None
+    checker, _, release = _fake_checker(delays, deadline=0.1)
+    monkeypatch.setattr(health_dashboard, "_default_checker", checker)
+
+    results = health_dashboard.run_health_check()
+    release.set()
+
+    assert results["overall_status"] == "warning"
+    assert results["summary"]["unknown"] == 1
+    assert results["summary"]["healthy"] == 4
+
+
+def test_hung_check_does_not_delay_exit():
+    """Разовий запуск завершується на дедлайні, навіть якщо перевірка зависла"""
+    script = (
+        "import sys, time\n"
+        f"sys.path.insert(0, {str(CURRENT_DIR)!r})\n"
+        "from health_dashboard import HealthChecker\n"
+        "checker = HealthChecker(deadline=0.2)\n"
+        "for key in ('git', 'queue', 'backup', 'performance', 'network'):\n"
+        "    setattr(checker, f'check_{key}_health', lambda: time.sleep(30))\n"
+        "print(len(checker.run_checks()))\n"
+    )
+
+    started = time.monotonic()
+    completed = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, timeout=20
+    )
+
+    assert completed.stdout.strip() == "5"
+    assert time.monotonic() - started < 10
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Тест гістограм затримок та їх експорту в статистиці PluginManager
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+CURRENT_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(CURRENT_DIR))
+
+from plugins.base_plugin import BasePlugin, PluginResult
+from plugins.latency_histogram import LatencyHistogram, LatencyTracker
+from plugins.plugin_manager import PluginManager
+
+
+class SleepPlugin(BasePlugin):
+    """Тестовий плагін із заданою затримкою"""
+
+    def __init__(self):
+        super().__init__(name="Sleep")
+
+    async def execute(self, task, context=None):
+        await asyncio.sleep(task["delay"])
+        return PluginResult(success=task.get("ok", True), message="done")
+
+    def get_supported_tasks(self):
+        return ["fast", "slow"]
+
+    def get_gui_configuration(self):
+        return {}
+
+
+def test_histogram_percentiles():
+    """Перцентилі з відносною похибкою кошика та точний максимум"""
+    histogram = LatencyHistogram()
+    for i in range(1, 1001):
+        histogram.record(i / 1000)
+
+    summary = histogram.summary()
+    assert summary["count"] == 1000
+    assert summary["max"] == 1.0
+    for key, expected in (("p50", 0.5), ("p90", 0.9), ("p99", 0.99)):
+        assert expected <= summary[key] <= expected * 1.05
+
+    # Один викид не ховається в середньому
+    histogram.record(30.0)
+    assert histogram.summary()["max"] == 30.0
+
+
+def test_tracker_windows_and_reset():
+    """Обертання вікон та скидання"""
+    tracker = LatencyTracker(window=0.05)
+    tracker.finish("P", "t", 0.1, success=False)
+    assert tracker.snapshot()[0]["count"] == 1
+
+    time.sleep(0.06)
+    tracker.finish("P", "t", 0.2, success=True)
+    entry = tracker.snapshot()[0]
+    assert entry["count"] == 2 and entry["errors"] == 1
+
+    time.sleep(0.11)
+    assert tracker.snapshot() == []
+
+    tracker.finish("P", "t", 0.3, success=True)
+    tracker.reset()
+    assert tracker.snapshot() == []
+
+
+def test_manager_exports_latency():
+    """Затримки за (плагін, тип завдання) та кількість виконуваних завдань"""
+
+    async def scenario():
+        manager = PluginManager(plugins_dir=str(CURRENT_DIR / "plugins"))
+        await manager.register_plugin(SleepPlugin())
+
+        slow = asyncio.ensure_future(
+            manager.execute_task({"type": "slow", "description": "", "delay": 0.05})
+        )
+        await asyncio.sleep(0.01)
+        in_flight = manager.get_system_statistics()["latency"]
+        assert in_flight[0]["task_type"] == "slow"
+        assert in_flight[0]["in_flight"] == 1
+        await slow
+
+        for _ in range(5):
+            await manager.execute_task({"type": "fast", "description": "", "delay": 0})
+        await manager.execute_task(
+            {"type": "fast", "description": "", "delay": 0, "ok": False}
+        )
+
+        stats = manager.get_system_statistics()
+        by_type = {entry["task_type"]: entry for entry in stats["latency"]}
+        assert by_type["fast"]["count"] == 6
+        assert by_type["fast"]["errors"] == 1
+        assert by_type["slow"]["p99"] >= 0.04
+        assert by_type["slow"]["in_flight"] == 0
+        assert stats["plugin_statistics"][0]["latency"]["count"] == 7
+
+        manager.reset_latency_statistics()
+        assert manager.get_system_statistics()["latency"] == []
+        await manager.shutdown()
+
+    asyncio.run(scenario())
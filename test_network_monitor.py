@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Тест кешованої перевірки з'єднання NetworkMonitor з локальним сервером-заглушкою
+"""
+
+import socket
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+CURRENT_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(CURRENT_DIR))
+
+from offline_queue import NetworkMonitor, OfflineQueue, OperationType
+
+
+def _stub_server():
+    """Локальний TCP-сервер, що приймає з'єднання"""
+    server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server.bind(("127.0.0.1", 0))
+    server.listen(16)
+    return server
+
+
+def _closed_port() -> int:
+    """Порт, на якому ніхто не слухає"""
+    probe = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    probe.bind(("127.0.0.1", 0))
+    port = probe.getsockname()[1]
+    probe.close()
+    return port
+
+
+def _wait_until(predicate, timeout=5.0):
+    """Очікування умови з обмеженням часу"""
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+def test_cached_state_never_blocks_callers():
+    """is_online відповідає з кешу, перевірка йде у фоні раз на TTL"""
+    server = _stub_server()
+    try:
+        monitor = NetworkMonitor(endpoints=[server.getsockname()], ttl=60)
+        probes = []
+        original_probe = monitor._probe
+
+        def counting_probe():
+            probes.append(1)
+            time.sleep(0.2)
+            return original_probe()
+
+        monitor._probe = counting_probe
+
+        started = time.monotonic()
+        assert not monitor.is_online()  # Стан ще невідомий
+        assert time.monotonic() - started < 0.1
+
+        _wait_until(lambda: monitor.is_online())
+        for _ in range(10):
+            assert monitor.is_online()
+        assert len(probes) == 1
+        assert monitor.check_now()
+        assert len(probes) == 2
+    finally:
+        server.close()
+
+
+def test_queue_resumes_when_connectivity_returns():
+    """Повернення з'єднання будить чергу без опитування викликачами"""
+    server = _stub_server()
+    try:
+        monitor = NetworkMonitor(
+            endpoints=[("127.0.0.1", _closed_port())], ttl=60, offline_ttl=0.1
+        )
+        with tempfile.TemporaryDirectory() as tmp:
+            queue = OfflineQueue(
+                queue_file=str(Path(tmp, "queue.json")),
+                network_monitor=monitor,
+                auto_resume=True,
+            )
+            done = threading.Event()
+            queue.register_handler(
+                OperationType.GIT_PUSH, lambda data: done.set() or {"success": True}
+            )
+
+            started = time.monotonic()
+            operation_id = queue.enqueue_operation(OperationType.GIT_PUSH, {})
+            assert time.monotonic() - started < 0.1
+            assert not queue.get_queue_stats()["network_online"]
+
+            _wait_until(lambda: monitor._online is False)
+            assert not done.is_set()
+
+            monitor.endpoints = [server.getsockname()]
+            assert done.wait(5)
+            queue.stop_processing()
+
+            assert queue.get_queue_stats()["network_online"]
+            assert queue.get_operation_status(operation_id).status.value == "completed"
+    finally:
+        server.close()
+
+
+def test_observer_queue_leaves_shared_operations_untouched():
+    """Черга лише для статистики не запускає обробку при появі з'єднання"""
+    server = _stub_server()
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            queue_file = str(Path(tmp, "queue.json"))
+            producer = OfflineQueue(queue_file=queue_file)
+            producer.network_monitor.is_online = lambda: False
+            operation_id = producer.enqueue_operation(OperationType.GIT_PUSH, {})
+
+            monitor = NetworkMonitor(endpoints=[server.getsockname()], ttl=60)
+            observer = OfflineQueue(queue_file=queue_file, network_monitor=monitor)
+            observer.get_queue_stats()
+            _wait_until(lambda: monitor._online is True)
+            time.sleep(0.2)
+
+            assert not observer.processing
+            assert observer.get_queue_stats()["pending"] == 1
+            producer.load_queue()
+            operation = producer.get_operation_status(operation_id)
+            assert operation.status.value == "pending"
+            assert operation.retry_count == 0
+            assert operation.error is None
+    finally:
+        server.close()
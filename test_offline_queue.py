@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+Тест сховища SQLite/WAL для OfflineQueue
+"""
+
+import json
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+CURRENT_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(CURRENT_DIR))
+
+from offline_queue import OfflineQueue, OperationStatus, OperationType, QueueStorage
+
+
+def _legacy_operation(operation_id, priority):
+    """Операція у форматі JSON-файлу черги"""
+    return {
+        "id": operation_id,
+        "operation_type": "git_push",
+        "timestamp": "2024-01-01T10:00:00",
+        "status": "pending",
+        "priority": priority,
+        "max_retries": 3,
+        "retry_count": 0,
+        "retry_delay": 60,
+        "next_retry": "2024-01-01T10:00:00",
+        "data": {"branch": "main"},
+        "result": None,
+        "error": None,
+    }
+
+
+def _offline_queue(queue_file: Path) -> OfflineQueue:
+    """Черга без звернень до мережі"""
+    queue = OfflineQueue(queue_file=str(queue_file))
+    queue.network_monitor.is_online = lambda: False
+    return queue
+
+
+def test_json_queue_is_migrated_once():
+    """JSON-черга імпортується в SQLite один раз зі збереженням порядку"""
+    with tempfile.TemporaryDirectory() as tmp:
+        queue_file = Path(tmp, "queue.json")
+        queue_file.write_text(
+            json.dumps(
+                {
+                    "operations": [
+                        _legacy_operation("high", 9),
+                        _legacy_operation("low", 1),
+                    ]
+                }
+            ),
+            encoding="utf-8",
+        )
+
+        queue = _offline_queue(queue_file)
+        assert [op.id for op in queue.operations] == ["high", "low"]
+        assert not queue_file.exists()
+        assert Path(tmp, "queue.json.migrated").exists()
+
+        db_file = Path(tmp, "queue.db")
+        with sqlite3.connect(db_file) as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            indexes = {row[1] for row in conn.execute("PRAGMA index_list(operations)")}
+        assert {"idx_operations_status", "idx_operations_next_retry"} <= indexes
+
+        queue.storage.close()
+        reopened = _offline_queue(queue_file)
+        assert [op.id for op in reopened.operations] == ["high", "low"]
+
+
+def test_transitions_persist_single_rows():
+    """Переходи станів пишуть окремі рядки без перезапису всієї черги"""
+    with tempfile.TemporaryDirectory() as tmp:
+        queue_file = Path(tmp, "queue.json")
+        queue = _offline_queue(queue_file)
+
+        def full_rewrite(operations):
+            raise AssertionError("whole queue rewritten")
+
+        queue.storage.save_all = full_rewrite
+
+        def failing_handler(data):
+            raise RuntimeError("remote unavailable")
+
+        queue.register_handler(OperationType.GIT_PUSH, failing_handler)
+        first = queue.enqueue_operation(OperationType.GIT_PUSH, {"n": 1}, priority=1)
+        second = queue.enqueue_operation(OperationType.GIT_SYNC, {"n": 2}, priority=5)
+        assert [op.id for op in queue.operations] == [second, first]
+
+        queue._process_operation(queue.get_operation_status(first))
+        assert queue.cancel_operation(second)
+
+        other = _offline_queue(queue_file)
+        retried = other.get_operation_status(first)
+        assert retried.status == OperationStatus.RETRYING
+        assert retried.retry_count == 1
+        assert retried.error == "remote unavailable"
+        assert other.get_operation_status(second).status == OperationStatus.CANCELLED
+
+        # Зміни іншого процесу підхоплюються без повного перечитування щоразу
+        assert not queue.reload_if_changed()
+        other.get_operation_status(first).status = OperationStatus.FAILED
+        other._save_operation(other.get_operation_status(first))
+        assert queue.reload_if_changed()
+        assert queue.get_operation_status(first).status == OperationStatus.FAILED
+        assert queue.force_retry_failed() == 1
+
+
+def test_processor_wakes_on_enqueue_and_due_retry():
+    """Обробник прокидається одразу після постановки та в момент повтору"""
+    with tempfile.TemporaryDirectory() as tmp:
+        queue = _offline_queue(Path(tmp, "queue.json"))
+        order = []
+        attempts = []
+        done = threading.Event()
+
+        def record(data):
+            order.append(data["n"])
+            if len(order) == 2:
+                done.set()
+            return {"success": True}
+
+        def flaky(data):
+            attempts.append(time.monotonic())
+            if len(attempts) == 1:
+                raise RuntimeError("remote unavailable")
+            done.set()
+            return {"success": True}
+
+        queue.register_handler(OperationType.GIT_SYNC, record)
+        queue.register_handler(OperationType.GIT_PUSH, flaky)
+
+        # Без обробника в черзі: вищий пріоритет іде першим
+        queue.enqueue_operation(OperationType.GIT_SYNC, {"n": "low"}, priority=1)
+        queue.enqueue_operation(OperationType.GIT_SYNC, {"n": "high"}, priority=9)
+        queue.network_monitor.is_online = lambda: True
+        started = time.monotonic()
+        queue.start_processing()
+        try:
+            assert done.wait(2)
+            assert order == ["high", "low"]
+            assert time.monotonic() - started < 1
+
+            done.clear()
+            queue.enqueue_operation(OperationType.GIT_PUSH, {}, retry_delay=1)
+            assert done.wait(5)
+            assert len(attempts) == 2
+            assert 0.9 <= attempts[1] - attempts[0] < 2
+        finally:
+            queue.stop_processing()
+        assert not queue.processor_thread.is_alive()
+
+
+def test_worker_pool_limits_and_drain():
+    """Пул працівників з лімітами за типом, серіалізацією за ключем та drain"""
+    with tempfile.TemporaryDirectory() as tmp:
+        queue = OfflineQueue(
+            queue_file=str(Path(tmp, "queue.json")),
+            workers=4,
+            type_limits={OperationType.GIT_PUSH: 2},
+            serialize_by=lambda op: op.data.get("repo"),
+        )
+        queue.network_monitor.is_online = lambda: False
+        lock = threading.Lock()
+        running = {"types": {}, "repos": {}, "total": 0}
+        peaks = {"types": {}, "repos": {}, "total": 0}
+        finished = []
+
+        def track(kind, key, delta):
+            running[kind][key] = running[kind].get(key, 0) + delta
+            peaks[kind][key] = max(peaks[kind].get(key, 0), running[kind][key])
+
+        def handler(operation_type):
+            def run(data):
+                with lock:
+                    track("types", operation_type, 1)
+                    track("repos", data.get("repo"), 1)
+                    running["total"] += 1
+                    peaks["total"] = max(peaks["total"], running["total"])
+                time.sleep(0.1)
+                with lock:
+                    track("types", operation_type, -1)
+                    track("repos", data.get("repo"), -1)
+                    running["total"] -= 1
+                    finished.append(data["n"])
+                return {"success": True}
+
+            return run
+
+        queue.register_handler(OperationType.GIT_PUSH, handler("push"))
+        queue.register_handler(OperationType.CODEX_SYNC, handler("sync"))
+
+        for n in range(6):
+            queue.enqueue_operation(
+                OperationType.GIT_PUSH, {"n": f"push{n}", "repo": f"r{n % 3}"}
+            )
+        for n in range(6):
+            queue.enqueue_operation(OperationType.CODEX_SYNC, {"n": f"sync{n}"})
+
+        queue.network_monitor.is_online = lambda: True
+        started = time.monotonic()
+        queue.start_processing()
+        time.sleep(0.05)
+        queue.stop_processing(drain=True, timeout=10)
+        elapsed = time.monotonic() - started
+
+        assert len(finished) == 12
+        assert peaks["total"] == 4
+        assert peaks["types"]["push"] == 2
+        # Одночасно не більше однієї операції на репозиторій
+        assert max(peaks["repos"][f"r{n}"] for n in range(3)) == 1
+        assert elapsed < 1
+        assert not any(thread.is_alive() for thread in queue.processor_threads)
+        stats = queue.get_queue_stats()
+        assert stats["completed"] == 12
+
+
+def test_interrupted_operations_are_recovered_by_processor():
+    """Рядки PROCESSING після аварії повторюються, спостерігач їх не змінює"""
+    with pytest.raises(TypeError):
+        QueueStorage()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        queue_file = Path(tmp, "queue.json")
+        crashed = _offline_queue(queue_file)
+        operation_id = crashed.enqueue_operation(OperationType.GIT_PUSH, {})
+        operation = crashed.get_operation_status(operation_id)
+        operation.status = OperationStatus.PROCESSING
+        crashed._save_operation(operation)
+        crashed.storage.close()
+
+        observer = _offline_queue(queue_file)
+        assert observer.get_queue_stats()["retrying"] == 1
+        assert observer.storage.load()[0].status == OperationStatus.PROCESSING
+
+        processor = _offline_queue(queue_file)
+        done = threading.Event()
+        processor.register_handler(
+            OperationType.GIT_PUSH, lambda data: done.set() or {"success": True}
+        )
+        processor.network_monitor.is_online = lambda: True
+        processor.start_processing()
+        try:
+            assert done.wait(5)
+        finally:
+            processor.stop_processing()
+
+        stored = observer.storage.load()[0]
+        assert stored.status == OperationStatus.COMPLETED
+        assert stored.retry_count == 0
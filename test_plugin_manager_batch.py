@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Тест маршрутизації та пакетного виконання завдань у PluginManager
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+CURRENT_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(CURRENT_DIR))
+
+from plugins.base_plugin import BasePlugin, PluginResult, PluginStatus
+from plugins.plugin_manager import PluginManager
+
+
+class EchoPlugin(BasePlugin):
+    """Тестовий плагін, що повертає опис завдання"""
+
+    # Спільні лічильники одночасних виконань для всіх екземплярів
+    running = 0
+    peak_running = 0
+
+    def __init__(self, name, task_types, delay=0.0):
+        super().__init__(name=name)
+        self.task_types = task_types
+        self.delay = delay
+
+    async def execute(self, task, context=None):
+        EchoPlugin.running += 1
+        EchoPlugin.peak_running = max(EchoPlugin.peak_running, EchoPlugin.running)
+        await asyncio.sleep(task.get("delay", self.delay))
+        EchoPlugin.running -= 1
+        return PluginResult(success=True, message=task["description"])
+
+    def get_supported_tasks(self):
+        return self.task_types
+
+    def get_gui_configuration(self):
+        return {}
+
+
+async def _manager(*plugins):
+    manager = PluginManager(plugins_dir=str(CURRENT_DIR / "plugins"))
+    for plugin in plugins:
+        await manager.register_plugin(plugin)
+    return manager
+
+
+def test_routing_table_dispatch():
+    """Маршрутизація за типом завдання без перебору плагінів"""
+
+    async def scenario():
+        alpha = EchoPlugin("Alpha", ["alpha"])
+        beta = EchoPlugin("Beta", ["beta", "shared"])
+        manager = await _manager(alpha, beta)
+
+        assert (
+            manager._find_plugin_for_task({"type": "beta", "description": ""}) is beta
+        )
+        assert (
+            manager._find_plugin_for_task({"type": "unknown", "description": ""})
+            is None
+        )
+        # Невалідне завдання (без опису) не маршрутизується
+        assert manager._find_plugin_for_task({"type": "alpha"}) is None
+
+        beta.status = PluginStatus.DISABLED
+        assert (
+            manager._find_plugin_for_task({"type": "beta", "description": ""}) is None
+        )
+
+        # Повторна реєстрація замінює маршрути
+        replacement = EchoPlugin("Beta", ["gamma"])
+        await manager.register_plugin(replacement)
+        assert "beta" not in manager.task_routes
+        assert manager.task_routes["gamma"] == [replacement]
+
+        result = await manager.execute_task({"type": "alpha", "description": "hi"})
+        assert result.success and result.message == "hi"
+        assert alpha.execution_count == 1
+
+    asyncio.run(scenario())
+
+
+def test_execute_many_streams_results_in_order():
+    """Пакетне виконання з обмеженою паралельністю"""
+
+    async def scenario():
+        alpha = EchoPlugin("Alpha", ["alpha"])
+        beta = EchoPlugin("Beta", ["beta"])
+        manager = await _manager(alpha, beta)
+        EchoPlugin.peak_running = 0
+
+        tasks = []
+        for i in range(20):
+            tasks.append(
+                {
+                    "type": "alpha" if i % 2 else "beta",
+                    "description": f"task-{i}",
+                    "delay": 0.01 * (i % 3),
+                }
+            )
+        tasks.append({"type": "missing", "description": "task-20"})
+
+        messages = [r.message async for r in manager.execute_many(tasks, concurrency=3)]
+
+        assert messages[:20] == [f"task-{i}" for i in range(20)]
+        assert "Не знайдено плагін" in messages[20]
+        assert EchoPlugin.peak_running == 3
+        assert manager.total_tasks_executed == 20
+
+        unordered = [
+            r.message
+            async for r in manager.execute_many(tasks[:6], concurrency=6, ordered=False)
+        ]
+        assert sorted(unordered) == sorted(t["description"] for t in tasks[:6])
+
+    asyncio.run(scenario())
+
+
+def test_execute_many_resolves_tasks_inside_workers():
+    """Перший результат з'являється до розбору решти пакета"""
+
+    async def scenario():
+        alpha = EchoPlugin("Alpha", ["alpha"], delay=0.02)
+        manager = await _manager(alpha)
+        pulled = []
+
+        def tasks():
+            for i in range(10):
+                pulled.append(i)
+                yield {"type": "alpha", "description": f"task-{i}"}
+
+        stream = manager.execute_many(tasks(), concurrency=2)
+        first = await stream.__anext__()
+        pulled_at_first = len(pulled)
+        rest = [r.message async for r in stream]
+
+        assert first.message == "task-0"
+        assert pulled_at_first <= 4
+        assert rest == [f"task-{i}" for i in range(1, 10)]
+
+    asyncio.run(scenario())
+
+
+def test_task_errors_report_the_plugin():
+    """Зворотний виклик помилки отримує плагін, що виконував завдання"""
+
+    class FailingPlugin(EchoPlugin):
+        async def execute(self, task, context=None):
+            raise RuntimeError("boom")
+
+    async def scenario():
+        failing = FailingPlugin("Failing", ["fail"])
+        manager = await _manager(failing)
+        errors = []
+        manager.on_plugin_error = lambda plugin, task, error: errors.append(plugin)
+
+        result = await manager.execute_task({"type": "fail", "description": "x"})
+        results = [
+            r
+            async for r in manager.execute_many([{"type": "fail", "description": "y"}])
+        ]
+
+        assert not result.success and not results[0].success
+        assert errors == [failing, failing]
+        assert failing.error_count == 0
+
+    asyncio.run(scenario())
+
+
+class CustomRoutingPlugin(EchoPlugin):
+    """Плагін з власною перевіркою can_handle_task"""
+
+    def can_handle_task(self, task):
+        return task.get("type") in self.task_types
+
+
+def test_custom_routing_keeps_registration_order():
+    """Власні перевірки та таблиця маршрутів - у порядку реєстрації"""
+
+    async def scenario():
+        custom = CustomRoutingPlugin("Custom", ["shared"])
+        table = EchoPlugin("Table", ["shared", "other"])
+        late = CustomRoutingPlugin("Late", ["other"])
+        manager = await _manager(custom, table, late)
+
+        task = {"type": "shared", "description": ""}
+        assert manager._find_plugin_for_task(task) is custom
+        assert (
+            manager._find_plugin_for_task({"type": "other", "description": ""}) is table
+        )
+
+        # Повторна реєстрація зберігає початкову позицію плагіна
+        await manager.register_plugin(CustomRoutingPlugin("Custom", ["shared"]))
+        assert manager._find_plugin_for_task(task).name == "Custom"
+
+        manager.plugins["Custom"].status = PluginStatus.DISABLED
+        assert manager._find_plugin_for_task(task) is table
+
+    asyncio.run(scenario())
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Тест лінивого завантаження плагінів за маніфестом
+"""
+
+import asyncio
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+CURRENT_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(CURRENT_DIR))
+
+from plugins.plugin_manager import PluginManager
+
+PLUGIN_SOURCE = """
+from plugins.base_plugin import BasePlugin, PluginResult
+
+IMPORTS = []
+IMPORTS.append("{marker}")
+
+
+class MarkerPlugin(BasePlugin):
+    def __init__(self, name="MarkerPlugin"):
+        super().__init__(name=name)
+
+    async def execute(self, task, context=None):
+        return PluginResult(success=True, message="{marker}:" + task["description"])
+
+    def get_supported_tasks(self):
+        base = ["{marker}_run"]
+        return base + ["{marker}_check"]
+
+    def get_gui_configuration(self):
+        return {{}}
+"""
+
+
+def _write_plugins(plugins_dir: Path, *markers: str):
+    for marker in markers:
+        (plugins_dir / f"{marker}_plugin.py").write_text(
+            PLUGIN_SOURCE.format(marker=marker), encoding="utf-8"
+        )
+
+
+def test_lazy_loading_defers_import_until_first_task():
+    """Плагін імпортується лише при першому завданні його типу"""
+
+    async def scenario(tmp: Path):
+        plugins_dir = tmp / "plugins"
+        plugins_dir.mkdir()
+        _write_plugins(plugins_dir, "alpha", "beta")
+        manifest_path = tmp / "cache" / "plugin_manifest.json"
+
+        manager = PluginManager(
+            plugins_dir=str(plugins_dir), manifest_path=str(manifest_path)
+        )
+        assert await manager.load_plugins()
+
+        assert manager.plugins == {}
+        assert manager.get_system_statistics()["pending_plugins"] == 2
+        assert sorted(manager.lazy_routes) == [
+            "alpha_check",
+            "alpha_run",
+            "beta_check",
+            "beta_run",
+        ]
+        assert manifest_path.exists()
+
+        result = await manager.execute_task({"type": "beta_run", "description": "x"})
+        assert result.success and result.message == "beta:x"
+        assert list(manager.plugins) == ["MarkerPlugin"]
+        assert len(manager.pending_plugin_files) == 1
+        assert "beta_check" not in manager.lazy_routes
+
+        assert await manager.warm_plugins() == 1
+        assert manager.pending_plugin_files == {}
+        assert manager.lazy_routes == {}
+
+        await manager.shutdown()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        asyncio.run(scenario(Path(tmp)))
+
+
+def test_manifest_is_reused_until_file_changes():
+    """Маніфест перечитується лише для змінених файлів"""
+
+    async def scenario(tmp: Path):
+        plugins_dir = tmp / "plugins"
+        plugins_dir.mkdir()
+        _write_plugins(plugins_dir, "alpha")
+        manifest_path = tmp / "plugin_manifest.json"
+
+        first = PluginManager(
+            plugins_dir=str(plugins_dir), manifest_path=str(manifest_path)
+        )
+        await first.load_plugins()
+        await first.shutdown()
+
+        # Підміна кешованого опису: без змін файлу маніфест не перебудовується
+        data = json.loads(manifest_path.read_text(encoding="utf-8"))
+        (entry,) = data["files"].values()
+        entry["classes"][0]["supported_tasks"] = ["cached_only"]
+        manifest_path.write_text(json.dumps(data), encoding="utf-8")
+
+        second = PluginManager(
+            plugins_dir=str(plugins_dir), manifest_path=str(manifest_path)
+        )
+        await second.load_plugins()
+        assert list(second.lazy_routes) == ["cached_only"]
+        await second.shutdown()
+
+        (plugins_dir / "alpha_plugin.py").write_text(
+            PLUGIN_SOURCE.format(marker="alpha") + "\n# changed\n", encoding="utf-8"
+        )
+
+        third = PluginManager(
+            plugins_dir=str(plugins_dir), manifest_path=str(manifest_path)
+        )
+        await third.load_plugins()
+        assert sorted(third.lazy_routes) == ["alpha_check", "alpha_run"]
+        await third.shutdown()
+
+        eager = PluginManager(
+            plugins_dir=str(plugins_dir),
+            manifest_path=str(manifest_path),
+            lazy_loading=False,
+        )
+        await eager.load_plugins()
+        assert list(eager.plugins) == ["MarkerPlugin"]
+        assert eager.pending_plugin_files == {}
+        await eager.shutdown()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        asyncio.run(scenario(Path(tmp)))
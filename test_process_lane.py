@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Тест виконання завдань плагінів у пулі потоків та процесів
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+import threading
+from pathlib import Path
+
+CURRENT_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(CURRENT_DIR))
+
+from plugins.base_plugin import BasePlugin, ExecutionClass, PluginResult
+from plugins.code_quality_plugin import CodeQualityPlugin
+from plugins.plugin_manager import PluginManager
+
+
+class WhereAmIPlugin(BasePlugin):
+    """Плагін, що повідомляє процес та потік виконання"""
+
+    def __init__(self, config=None):
+        super().__init__(name="WhereAmI", config=config)
+
+    async def execute(self, task, context=None):
+        # Чиста CPU-робота
+        total = sum(i * i for i in range(task.get("n", 1000)))
+        return PluginResult(
+            success=True,
+            message="ok",
+            data={
+                "pid": os.getpid(),
+                "thread": threading.get_ident(),
+                "total": total,
+            },
+        )
+
+    def get_supported_tasks(self):
+        return ["where"]
+
+    def get_gui_configuration(self):
+        return {}
+
+
+def _run_lanes(execution_class):
+    async def scenario():
+        manager = PluginManager(
+            plugins_dir=str(CURRENT_DIR / "plugins"),
+            process_workers=2,
+        )
+        plugin = WhereAmIPlugin({"execution_class": execution_class.value})
+        await manager.register_plugin(plugin)
+
+        if execution_class == ExecutionClass.PROCESS:
+            assert await manager.warm_process_pool() == 2
+
+        results = [
+            r
+            async for r in manager.execute_many(
+                [{"type": "where", "description": "d", "n": 10000}] * 4
+            )
+        ]
+        await manager.shutdown()
+        return plugin, results
+
+    return asyncio.run(scenario())
+
+
+def test_event_loop_lane():
+    """За замовчуванням завдання виконується в циклі подій"""
+    plugin, results = _run_lanes(ExecutionClass.EVENT_LOOP)
+
+    assert all(r.data["pid"] == os.getpid() for r in results)
+    assert all(r.data["thread"] == threading.get_ident() for r in results)
+    assert plugin.execution_count == 4
+
+
+def test_thread_lane():
+    """Клас THREAD виконується в пулі потоків"""
+    _, results = _run_lanes(ExecutionClass.THREAD)
+
+    assert all(r.success for r in results)
+    assert all(r.data["thread"] != threading.get_ident() for r in results)
+
+
+def test_process_lane():
+    """Клас PROCESS виконується в окремих процесах"""
+    plugin, results = _run_lanes(ExecutionClass.PROCESS)
+
+    assert all(r.success for r in results), [r.message for r in results]
+    assert all(r.data["pid"] != os.getpid() for r in results)
+    assert results[0].data["total"] == sum(i * i for i in range(10000))
+    assert plugin.execution_count == 4
+
+
+class ProgressPlugin(BasePlugin):
+    """Плагін у пулі потоків, що повідомляє про прогрес"""
+
+    execution_class = ExecutionClass.THREAD
+
+    def __init__(self, config=None):
+        super().__init__(name="Progress", config=config)
+
+    async def execute(self, task, context=None):
+        self.update_progress(0.5, "half")
+        self.update_progress(1.0, "done")
+        return PluginResult(
+            success=True, message="ok", data={"thread": threading.get_ident()}
+        )
+
+    def get_supported_tasks(self):
+        return ["progress"]
+
+    def get_gui_configuration(self):
+        return {}
+
+
+def test_thread_lane_callbacks_run_on_caller_loop():
+    """Зворотні виклики плагіна з пулу потоків виконуються в циклі викликача"""
+    calls = []
+
+    async def scenario():
+        manager = PluginManager(plugins_dir=str(CURRENT_DIR / "plugins"))
+        plugin = ProgressPlugin()
+        await manager.register_plugin(plugin)
+        loop = asyncio.get_running_loop()
+        plugin.on_progress_update = lambda p, progress, message: calls.append(
+            (progress, threading.get_ident(), asyncio.get_running_loop() is loop)
+        )
+        result = await manager.execute_task({"type": "progress", "description": "d"})
+        await manager.shutdown()
+        return result
+
+    result = asyncio.run(scenario())
+
+    assert result.data["thread"] != threading.get_ident()
+    assert calls == [
+        (0.5, threading.get_ident(), True),
+        (1.0, threading.get_ident(), True),
+    ]
+
+
+FILE_PLUGIN = """
+import os
+
+from plugins.base_plugin import BasePlugin, ExecutionClass, PluginResult
+
+
+class FilePlugin(BasePlugin):
+    execution_class = ExecutionClass.PROCESS
+
+    def __init__(self, name="FilePlugin", config=None):
+        super().__init__(name=name, config=config)
+
+    async def execute(self, task, context=None):
+        return PluginResult(success=True, message="ok", data={"pid": os.getpid()})
+
+    def get_supported_tasks(self):
+        return ["from_file"]
+
+    def get_gui_configuration(self):
+        return {}
+"""
+
+
+def test_file_loaded_plugin_runs_in_process_pool():
+    """Плагін, завантажений з файлу, імпортується робочим процесом за шляхом"""
+
+    async def scenario(plugins_dir):
+        manager = PluginManager(plugins_dir=plugins_dir, process_workers=1)
+        assert await manager.load_plugins()
+        try:
+            return await manager.execute_task({"type": "from_file", "description": "d"})
+        finally:
+            await manager.shutdown()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        Path(tmp, "file_loaded_plugin.py").write_text(FILE_PLUGIN, encoding="utf-8")
+        result = asyncio.run(scenario(tmp))
+
+    assert result.success, result.message
+    assert result.data["pid"] != os.getpid()
+
+
+SAMPLE_MODULE = """
+import subprocess
+
+
+def run(command):
+    return subprocess.run(command, shell=True)
+
+
+def branchy(value):
+    if value > 1:
+        return 1
+    elif value > 2:
+        return 2
+    elif value > 3:
+        return 3
+    return 0
+"""
+
+
+def test_code_quality_plugin_runs_in_process_pool():
+    """Аналіз коду за замовчуванням іде в пул процесів з ініціалізованою копією"""
+
+    async def scenario(workspace):
+        manager = PluginManager(
+            plugins_dir=str(CURRENT_DIR / "plugins"), process_workers=1
+        )
+        plugin = CodeQualityPlugin(
+            {"workspace_path": workspace, "complexity_threshold": 3}
+        )
+        await manager.register_plugin(plugin)
+        try:
+            result = await manager.execute_task(
+                {"type": "code_quality_scan", "description": "scan"}
+            )
+            assert manager.process_executor is not None
+            return plugin, result
+        finally:
+            await manager.shutdown()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        Path(tmp, "sample.py").write_text(SAMPLE_MODULE, encoding="utf-8")
+        Path(tmp, "broken.py").write_text("def broken(:\n", encoding="utf-8")
+        plugin, result = asyncio.run(scenario(tmp))
+
+    assert plugin.get_execution_class({}) == ExecutionClass.PROCESS
+    assert result.data is not None, result.message
+    assert result.data["files_scanned"] == 2
+    assert [e["file"] for e in result.data["syntax_errors"]] == ["broken.py"]
+    assert result.data["security"][0]["issue"] == "subprocess.run(shell=True)"
+    assert [f["function"] for f in result.data["complex_functions"]] == ["branchy"]
+    assert not result.success
+    assert plugin.execution_count == 1
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Тест дворівневого кешу результатів завдань
+"""
+
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+CURRENT_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(CURRENT_DIR))
+
+from plugins.result_cache import TaskResultCache
+
+
+def test_two_tier_hits_and_persistence():
+    """Влучання з пам'яті, з диска та збереження між запусками"""
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "cache.db"
+
+        cache = TaskResultCache(db_path, memory_entries=1)
+        cache.put("a", {"message": "A"}, 1.5)
+        cache.put("b", {"message": "B"}, 0.5)
+
+        assert cache.get("b") == ({"message": "B"}, 0.5)  # пам'ять
+        assert cache.get("a") == ({"message": "A"}, 1.5)  # диск
+        assert cache.get("missing") is None
+        # Повторний запис не створює нового рядка
+        cache.put("a", {"message": "A2"}, 1.0)
+
+        stats = cache.get_statistics()
+        assert stats["memory_hits"] == 1
+        assert stats["disk_hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["entries"] == 2
+        cache.close()
+
+        reopened = TaskResultCache(db_path)
+        assert reopened.get("a") == ({"message": "A2"}, 1.0)
+        assert reopened.get_statistics()["entries"] == 2
+        assert (
+            sqlite3.connect(db_path).execute("PRAGMA journal_mode").fetchone()[0]
+            == "wal"
+        )
+        reopened.close()
+
+
+def test_eviction_prefers_rarely_used_entries():
+    """Витіснення за access_count/last_accessed та TTL"""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = TaskResultCache(Path(tmp) / "cache.db", max_entries=3, memory_entries=0)
+        for key in ("a", "b", "c"):
+            cache.put(key, {"message": key}, 0.0)
+        cache.get("a")
+        cache.get("a")
+        cache.get("c")
+
+        cache.put("d", {"message": "d"}, 0.0)
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("d") is not None
+        assert cache.get_statistics()["evictions"] == 1
+
+        sized = TaskResultCache(Path(tmp) / "sized.db", max_entries=100, max_bytes=100)
+        for i in range(10):
+            sized.put(str(i), {"message": "x" * 30}, 0.0)
+        stats = sized.get_statistics()
+        assert stats["total_bytes"] <= 100
+        assert stats["entries"] == 2
+        assert sized.get("9") is not None
+        sized.close()
+
+        short = TaskResultCache(Path(tmp) / "short.db", ttl=0.05)
+        short.put("a", {"message": "a"}, 0.0)
+        assert short.get("a") is not None
+        time.sleep(0.1)
+        assert short.get("a") is None
+        assert short.get_statistics()["expirations"] == 1
+        assert short.get_statistics()["entries"] == 0
+        short.close()
+        cache.close()
+
+
+def test_new_hot_entry_survives_full_cache():
+    """Новий запис не витісняється першим лише через малий access_count"""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = TaskResultCache(Path(tmp) / "cache.db", max_entries=8, memory_entries=0)
+        for i in range(8):
+            cache.put(f"old{i}", {"message": i}, 0.0)
+            for _ in range(20):
+                cache.get(f"old{i}")
+
+        for i in range(4):
+            cache.put(f"new{i}", {"message": i}, 0.0)
+            cache.get(f"new{i}")
+
+        for i in range(4):
+            assert cache.get(f"new{i}") is not None
+        assert cache.get_statistics()["entries"] == 8
+        assert cache.get_statistics()["evictions"] == 4
+        cache.close()
+
+
+def test_legacy_schema_is_migrated():
+    """Стара таблиця з id = hash + timestamp зводиться до одного рядка на хеш"""
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "cache.db"
+        conn = sqlite3.connect(db_path)
+        conn.execute("""
+            CREATE TABLE task_cache (
+                id TEXT PRIMARY KEY,
+                task_hash TEXT,
+                result TEXT,
+                execution_time REAL,
+                created_at TIMESTAMP,
+                access_count INTEGER DEFAULT 0,
+                last_accessed TIMESTAMP
+            )
+        """)
+        for i, stamp in enumerate(
+            ["2025-07-15 10:00:00.000001", "2025-07-15 11:00:00.000001"]
+        ):
+            conn.execute(
+                "INSERT INTO task_cache VALUES (?, ?, ?, ?, ?, 0, ?)",
+                (f"h_{i}", "h", f'{{"message": "v{i}"}}', 0.1, stamp, stamp),
+            )
+        conn.commit()
+        conn.close()
+
+        cache = TaskResultCache(db_path, ttl=None)
+        assert cache.get_statistics()["entries"] == 1
+        assert cache.get("h") == ({"message": "v1"}, 0.1)
+        cache.close()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Тест спільного індексу файлів робочої директорії
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+CURRENT_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(CURRENT_DIR))
+
+from plugins.dev_plan_executor_plugin import DevPlanExecutorPlugin
+from plugins.workspace_index import WorkspaceIndex
+
+
+def test_index_scans_once_and_caches_content():
+    """Один обхід директорій та кешування вмісту"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        root = Path(temp_dir)
+        (root / "pkg").mkdir()
+        (root / "pkg" / "module.py").write_text("import os\nx = 1\n")
+        (root / "test_module.py").write_text("def test_x():\n    pass\n")
+        (root / "notes.txt").write_text("not indexed")
+
+        index = WorkspaceIndex(root)
+
+        assert len(index.files()) == 2
+        assert len(index.files()) == 2
+        assert index.stats.scans == 1
+        assert [p.name for p in index.test_files()] == ["test_module.py"]
+
+        module = root / "pkg" / "module.py"
+        assert index.read_lines(module) == ["import os", "x = 1", ""]
+        assert index.read_text(module) == "import os\nx = 1\n"
+        assert index.stats.reads == 1
+
+        # Новий запуск: файл не змінився - повторного читання немає
+        index.refresh()
+        index.read_text(module)
+        assert index.stats.reads == 1
+        assert index.stats.scans == 1
+        index.files()
+        assert index.stats.scans == 2
+
+
+def test_index_invalidates_on_change():
+    """Інвалідація за mtime/size"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "module.py"
+        path.write_text("a = 1\n")
+
+        index = WorkspaceIndex(Path(temp_dir))
+        assert index.read_text(path) == "a = 1\n"
+
+        path.write_text("a = 12345\n")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        # У межах одного покоління файл не перевіряється повторно
+        assert index.read_text(path) == "a = 1\n"
+
+        index.refresh()
+        assert index.read_text(path) == "a = 12345\n"
+        assert index.stats.invalidations == 1
+
+
+def test_quality_checks_share_index():
+    """Перевірки плагіна читають файли лише один раз"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        root = Path(temp_dir)
+        for i in range(3):
+            (root / f"module_{i}.py").write_text(f"import sys\nvalue = {i}\n")
+
+        plugin = DevPlanExecutorPlugin({"workspace_path": temp_dir})
+        tasks = [{"name": "Task A"}, {"name": "Task B"}]
+
+        asyncio.run(plugin._execute_triple_parallel_tasks(tasks))
+
+        assert plugin.workspace_index.stats.scans == 1
+        assert plugin.workspace_index.stats.reads == 3
@@ -12,6 +12,18 @@ import re
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from plugins.dev_plan_document import (
+    DevPlanDocument,
+    build_outline,
+    get_document_service,
+)
+
+# Plan view name in the shared DEV_PLAN document service
+PLAN_VIEW = "universal_task_manager:2"
+
+# Phase heading: "## 1. Phase Name"
+PHASE_HEADING = re.compile(r"^(\d+)\.\s*(.+)$")
+
 
 class UniversalTaskManager:
     def __init__(self, project_path: str):
@@ -47,13 +59,12 @@ class UniversalTaskManager:
     ) -> Dict[str, Any]:
         """Parse DEV_PLAN.md and create adaptive task structure"""
         try:
-            content = dev_plan_path.read_text()
-
-            # Extract project information
-            self.project_config = self._extract_project_info(content)
-
-            # Parse existing phases from DEV_PLAN.md
-            phases = self._extract_phases_from_content(content)
+            # Project information and phases, parsed once per plan change
+            plan_view = get_document_service().view(
+                dev_plan_path, PLAN_VIEW, self._build_plan_view
+            )
+            self.project_config = plan_view["project_config"]
+            phases = plan_view["phases"]
 
             # Create 3-level adaptive structure
             self.task_structure["project_type"] = self.project_config.get(
@@ -76,6 +87,13 @@ class UniversalTaskManager:
             print(f"⚠️  Error parsing DEV_PLAN.md: {e}")
             return self._create_adaptive_structure()
 
+    def _build_plan_view(self, document: DevPlanDocument) -> Dict[str, Any]:
+        """Parsed plan for the shared document service"""
+        return {
+            "project_config": self._extract_project_info(document.content),
+            "phases": self._phases_from_outline(document.outline, document.lines),
+        }
+
     def _extract_project_info(self, content: str) -> Dict[str, Any]:
         """Extract project information from DEV_PLAN.md content"""
         config = {
@@ -141,69 +159,56 @@ class UniversalTaskManager:
 
     def _extract_phases_from_content(self, content: str) -> List[Dict[str, Any]]:
         """Extract phases from DEV_PLAN.md content"""
-        phases = []
+        return self._phases_from_outline(build_outline(content), content.split("\n"))
 
-        # Look for numbered sections (## 1. Phase Name, ## 2. Phase Name, etc.)
-        phase_pattern = r"^##\\s*(\\d+)\\.\\s*(.+)$"
-        subtask_pattern = r"^###\\s*(.+)$"
-        task_pattern = r"^-\\s*\\[\\s*\\]\\s*(.+)$"
+    def _phases_from_outline(
+        self, outline: Dict[str, Any], lines: List[str]
+    ) -> List[Dict[str, Any]]:
+        """Phases from the normalized document outline"""
+        phases = []
 
+        # Numbered "## N. Phase Name" headings are phases, deeper headings
+        # are subtasks and unchecked checkboxes are their tasks
         current_phase = None
         current_subtask = None
 
-        for line in content.split("\\n"):
-            line = line.strip()
-
-            # Check for phase headers
-            phase_match = re.match(phase_pattern, line)
+        for heading in outline["headings"]:
+            phase_match = (
+                PHASE_HEADING.match(heading["title"]) if heading["level"] == 2 else None
+            )
             if phase_match:
-                if current_phase:
-                    phases.append(current_phase)
-
-                phase_num = int(phase_match.group(1))
-                phase_name = phase_match.group(2).strip()
-
                 current_phase = {
-                    "id": phase_num,
-                    "name": phase_name,
+                    "id": int(phase_match.group(1)),
+                    "name": phase_match.group(2).strip(),
                     "description": "",
                     "status": "pending",
                     "subtasks": [],
                 }
+                phases.append(current_phase)
                 current_subtask = None
-                continue
-
-            # Check for subtask headers
-            subtask_match = re.match(subtask_pattern, line)
-            if subtask_match and current_phase:
-                if current_subtask:
-                    current_phase["subtasks"].append(current_subtask)
-
-                subtask_name = subtask_match.group(1).strip()
-                current_subtask = {"name": subtask_name, "description": "", "tasks": []}
-                continue
-
-            # Check for individual tasks
-            task_match = re.match(task_pattern, line)
-            if task_match and current_subtask:
-                task_name = task_match.group(1).strip()
-                current_subtask["tasks"].append(
-                    {"name": task_name, "status": "pending"}
-                )
-                continue
+            elif heading["level"] >= 3 and current_phase:
+                current_subtask = {
+                    "name": heading["title"],
+                    "description": "",
+                    "tasks": [],
+                }
+                current_phase["subtasks"].append(current_subtask)
 
-            # Add to description if we're in a phase or subtask
-            if line and not line.startswith("#") and not line.startswith("-"):
-                if current_subtask:
-                    current_subtask["description"] += line + " "
-                elif current_phase:
-                    current_phase["description"] += line + " "
-
-        # Add the last phase
-        if current_phase:
             if current_subtask:
-                current_phase["subtasks"].append(current_subtask)
-            phases.append(current_phase)
+                for item in heading["tasks"]:
+                    for checkbox in (item, *item["subtasks"]):
+                        if not checkbox["checked"] and checkbox["text"]:
+                            current_subtask["tasks"].append(
+                                {"name": checkbox["text"], "status": "pending"}
+                            )
+
+            # Add to description if we're in a phase or subtask
+            target = current_subtask or current_phase
+            if target:
+                for index in heading["text"]:
+                    line = lines[index].strip()
+                    if not line.startswith("-"):
+                        target["description"] += line + " "
 
         return phases
 